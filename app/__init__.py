@@ -4,21 +4,30 @@ Initializes the app and sets up all the routes
 
 import os
 
-## Sentry ##
-import sentry_sdk
-from sentry_sdk.integrations.flask import FlaskIntegration
-
 ## App
 from flask import Flask
 # from werkzeug.middleware.proxy_fix import ProxyFix
 from config import *
 from app.api import blueprint as api
+from app.helpers.uploads import UploadRequest
+
+def init_sentry():
+    '''
+    Set up Sentry. It is only used in production and staging, so it is imported here instead of
+    at the top, where it would add to the startup time of every other environment
+    '''
+    # pylint: disable=import-outside-toplevel
+    import sentry_sdk
+    from sentry_sdk.integrations.flask import FlaskIntegration
+
+    sentry_sdk.init(os.environ.get('SENTRY_DSN'), integrations=[FlaskIntegration()])
 
 def create_app(testing=False):
     '''
     Create and configure the app
     '''
     app = Flask(__name__)
+    app.request_class = UploadRequest
     environment = app.config['ENV']
 
     # Load in some extra configs
@@ -26,14 +35,14 @@ def create_app(testing=False):
         app.config.from_object(TestingConfig())
     elif environment == 'production':
         app.config.from_object(ProductionConfig())
-        # Set up Sentry
-        sentry_sdk.init(os.environ.get('SENTRY_DSN'), integrations=[FlaskIntegration()])
+        init_sentry()
     elif environment == 'staging':
         app.config.from_object(StagingConfig())
-        # Set up Sentry
-        sentry_sdk.init(os.environ.get('SENTRY_DSN'), integrations=[FlaskIntegration()])
+        init_sentry()
     elif environment == 'development':
         app.config.from_object(DevelopmentConfig())
+    elif environment == 'stand_in':
+        app.config.from_object(StandInConfig())
     else:
         # Load the defaults
         app.config.from_object(Config())
@@ -11,7 +11,9 @@ from app.helpers.exceptions import EnergysystemParseError
 
 # Import namespaces (parts of Api)
 from .create_scenario import api as ns_create_scenario
+from .create_scenarios import api as ns_create_scenarios
 from .export_esdl import api as ns_export
+from .jobs import api as ns_jobs
 from .kpis import api as ns_kpis
 
 # Setup the blueprint and route for the api
@@ -25,8 +27,10 @@ api = Api(
 
 # Add all the namespaces that we want to be visisble to the api
 api.add_namespace(ns_create_scenario)
+api.add_namespace(ns_create_scenarios)
 api.add_namespace(ns_export)
 api.add_namespace(ns_kpis)
+api.add_namespace(ns_jobs)
 
 @api.errorhandler(EnergysystemParseError)
 def handle_api_error(error):
@@ -1,17 +1,25 @@
 '''
-Api namespace that transforms an uploaded ESDL file into ETM slider settings.
+Api namespace that transforms an uploaded ESDL file into ETM slider settings. The ESDL is posted
+as a URL encoded string, or as a (gzip compressed) file in a multipart/form-data request.
 Responds with an ETE scenario id.
 Only: post
 '''
 
-from flask_restx import Namespace, Resource, fields
+from flask import current_app, url_for
+from flask_restx import Namespace, Resource, fields, inputs
+from werkzeug.datastructures import FileStorage
 
 # TODO: This needs to be nicer - create a Service or model of some kind
 from app.interface import (
-    setup_esh_from_energy_system, translate_esdl_to_slider_settings, add_kpis_to_esdl
+    setup_esh_from_energy_system, setup_esh_from_energy_system_async,
+    translate_esdl_to_slider_settings, translate_esdl_to_slider_settings_async, add_kpis_to_esdl
 )
 from app.services.attach_esdl_to_etengine import AttachEsdlToEtengine
+from app.services.etengine_service import run_concurrently
+from app.services.jobs import job_queue
+from app.helpers.energy_system_handler import EnergySystemHandler
 from app.helpers.exceptions import EnergysystemParseError
+from app.helpers.uploads import open_upload, upload_title
 from app.constants.errors import messages
 
 api = Namespace('create_scenario', description='Transform ESDL into ETM scenario settings')
@@ -29,20 +37,35 @@ energy_system = api.model('energy_system', {
 ## Setup the parser for the request parameters
 import_parser = api.parser()
 import_parser.add_argument(
-    'energy_system', type=str, required=True,
+    'energy_system', type=str, required=False,
     help='The energy system definition (URL encoded ESDL string)',
     location='form'
 )
+import_parser.add_argument(
+    'energy_system_file', type=FileStorage, required=False,
+    help='The energy system definition as an .esdl file (may be gzip compressed), instead of \
+    the energy_system string',
+    location='files'
+)
 import_parser.add_argument(
     'environment', type=str, required=True,
     help='The environment of the Energy Transition Model ("beta" or "pro")',
     location='form'
 )
 import_parser.add_argument('energy_system_title', type=str, required=False, location='form')
+import_parser.add_argument(
+    'async', type=inputs.boolean, required=False, default=False,
+    help='Create the scenario in the background: responds with a job that can be polled at /jobs',
+    location='form'
+)
 
 ## Controller
 @api.route('/')
-@api.doc(responses={422: 'Energy system could not be made into a scenario'})
+@api.doc(responses={
+    202: 'The scenario is being created by a job',
+    422: 'Energy system could not be made into a scenario',
+    503: 'Too many jobs are waiting'
+})
 class EnergySystem(Resource):
     """
     Transform ESDL energy system description into an ETM scenario
@@ -56,33 +79,75 @@ class EnergySystem(Resource):
         args = import_parser.parse_args()
 
         # TODO: clean the args up
-        es = args['energy_system']
-        energy_system_title = args['energy_system_title'] or 'original.esdl'
+        upload = args['energy_system_file']
+        energy_system_title = args['energy_system_title']
         env = args['environment']
 
-        esh = setup_esh_from_energy_system(es)
-
-        etm_config, response = translate_esdl_to_slider_settings(esh, env)
-        add_kpis_to_esdl(esh, env, etm_config.scenario_id)
-
-        result = AttachEsdlToEtengine(env, etm_config.scenario_id)(
-            esh.get_as_stream(), energy_system_title
-        )
-        if not result.successful:
-            handle_failure(result)
-
-        return {
-            'show_url': {
-                'description': 'Click on this link to open the created ETM scenario:',
-                'url': (
-                    'https://{environment}.energytransitionmodel.com/scenarios/{scenario_id}'.format(
-                    environment='beta-pro' if env == 'beta' else 'pro',
-                    scenario_id=etm_config.scenario_id)),
-                'link_text': 'Open ETM',
-                'response': response
-            },
-            'scenario_id': etm_config.scenario_id
-        }
+        if upload is not None:
+            # Parsed straight from the upload, which is gone once the request is done
+            es = setup_esh_from_energy_system(open_upload(upload))
+            energy_system_title = energy_system_title or upload_title(upload)
+        elif args['energy_system']:
+            es = args['energy_system']
+        else:
+            raise EnergysystemParseError('No energy system was given')
+
+        energy_system_title = energy_system_title or 'original.esdl'
+
+        if args['async']:
+            job = job_queue().submit(create_scenario, es, energy_system_title, env)
+            return dict(
+                job.to_dict(), status_url=url_for('api.jobs_job', job_id=job.id)
+            ), 202
+
+        return create_scenario(es, energy_system_title, env)
+
+
+def create_scenario(es, energy_system_title, env):
+    '''
+    Creates the scenario of the (URL encoded) energy system, or of the handler it was loaded
+    into, and attaches the energy system with its KPIs to it. Returns the scenario id and the url
+    to show the scenario. With ESDL_EXTRACT_TRANSLATION the slider settings are translated from
+    an extraction of the energy system, which is then parsed a second time, entirely, while
+    ETEngine creates the scenario
+    '''
+    if isinstance(es, EnergySystemHandler):
+        esh, extract = es, False
+    else:
+        extract = current_app.config['ESDL_EXTRACT_TRANSLATION']
+        esh = setup_esh_from_energy_system(es, extract=extract)
+
+    # Creates the scenario with its sliders set and queries the KPIs
+    if extract:
+        # The extracted energy system misses everything that was not translated, so the energy
+        # system is loaded entirely while ETEngine creates the scenario
+        result, esh = run_concurrently(
+            translate_esdl_to_slider_settings_async(esh, env),
+            setup_esh_from_energy_system_async(es))
+    else:
+        result = translate_esdl_to_slider_settings(esh, env)
+
+    if not result.successful:
+        handle_failure(result)
+
+    scenario_id = result.value['scenario_id']
+    add_kpis_to_esdl(esh, env, scenario_id, result.value['gqueries'])
+
+    result = AttachEsdlToEtengine(env, scenario_id)(esh, energy_system_title)
+    if not result.successful:
+        handle_failure(result)
+
+    return {
+        'show_url': {
+            'description': 'Click on this link to open the created ETM scenario:',
+            'url': (
+                'https://{environment}.energytransitionmodel.com/scenarios/{scenario_id}'.format(
+                environment='beta-pro' if env == 'beta' else 'pro',
+                scenario_id=scenario_id)),
+            'link_text': 'Open ETM'
+        },
+        'scenario_id': scenario_id
+    }
 
 # TODO: better placement and handling
 def handle_failure(result):
@@ -0,0 +1,154 @@
+'''
+Api namespace that transforms many ESDL files into ETM scenarios at once, for example all
+municipalities of a region. The energy systems are converted in parallel, each on its own.
+Responds with the scenario id or the errors of each energy system.
+Only: post
+'''
+
+import tarfile
+import zipfile
+from os.path import basename
+
+from flask import current_app, url_for
+from flask_restx import Namespace, Resource, inputs
+from werkzeug.datastructures import FileStorage
+
+from app.api.v1.create_scenario import create_scenario
+from app.helpers.exceptions import EnergysystemParseError
+from app.helpers.uploads import upload_file
+from app.services.jobs import job_queue
+from app.services.process_pool import run_in_processes
+
+api = Namespace('create_scenarios', description='Transform many ESDLs into ETM scenarios')
+
+## Setup the parser for the request parameters
+bulk_parser = api.parser()
+bulk_parser.add_argument(
+    'energy_system', type=str, action='append', required=False,
+    help='The energy system definitions (URL encoded ESDL strings), repeat for each system',
+    location='form'
+)
+bulk_parser.add_argument(
+    'archive', type=FileStorage, required=False,
+    help='A zip or tar archive of .esdl files, instead of or next to the energy_system fields',
+    location='files'
+)
+bulk_parser.add_argument(
+    'environment', type=str, required=True,
+    help='The environment of the Energy Transition Model ("beta" or "pro")',
+    location='form'
+)
+bulk_parser.add_argument(
+    'async', type=inputs.boolean, required=False, default=False,
+    help='Create the scenarios in the background: responds with a job that can be polled at /jobs',
+    location='form'
+)
+
+## Controller
+@api.route('/')
+@api.doc(responses={
+    202: 'The scenarios are being created by a job',
+    422: 'No energy systems, too many or an unreadable archive'
+})
+class EnergySystems(Resource):
+    """
+    Transform ESDL energy system descriptions into ETM scenarios
+    """
+    @api.expect(bulk_parser)
+    def post(self):
+        """
+        Transform ESDL energy system descriptions into ETM scenarios, one per energy system
+        """
+        args = bulk_parser.parse_args()
+        items = energy_systems(args)
+        env = args['environment']
+
+        if not items:
+            raise EnergysystemParseError('No energy systems were given')
+
+        if len(items) > current_app.config['BULK_MAX_ITEMS']:
+            raise EnergysystemParseError(
+                f'At most {current_app.config["BULK_MAX_ITEMS"]} energy systems can be '
+                'converted at once')
+
+        if args['async']:
+            job = job_queue().submit(create_scenarios, items, env)
+            return dict(
+                job.to_dict(), status_url=url_for('api.jobs_job', job_id=job.id)
+            ), 202
+
+        return create_scenarios(items, env)
+
+
+def energy_systems(args):
+    '''The (title, energy system) of the posted energy systems and of those in the archive'''
+    items = [
+        (f'energy_system_{number}.esdl', es)
+        for number, es in enumerate(args['energy_system'] or [], 1)
+    ]
+
+    if args['archive']:
+        items.extend(read_archive(args['archive']))
+
+    return items
+
+
+def read_archive(archive):
+    '''
+    The (title, ESDL bytes) of the .esdl files in the zip or tar archive. The number of files and
+    their (declared) size are checked before any of them is extracted
+    '''
+    archive_file = upload_file(archive)
+
+    try:
+        if zipfile.is_zipfile(archive_file):
+            archive_file.seek(0)
+            with zipfile.ZipFile(archive_file) as zipped:
+                members = sorted(
+                    (info for info in zipped.infolist() if info.filename.endswith('.esdl')),
+                    key=lambda info: info.filename)
+                check_archive_members([info.file_size for info in members])
+
+                return [(basename(info.filename), zipped.read(info)) for info in members]
+
+        archive_file.seek(0)
+        with tarfile.open(fileobj=archive_file) as tarred:
+            members = sorted(
+                (member for member in tarred.getmembers()
+                 if member.isfile() and member.name.endswith('.esdl')),
+                key=lambda member: member.name)
+            check_archive_members([member.size for member in members])
+
+            return [
+                (basename(member.name), tarred.extractfile(member).read()) for member in members
+            ]
+    except (zipfile.BadZipFile, tarfile.TarError) as error:
+        raise EnergysystemParseError('The archive could not be read') from error
+
+
+def check_archive_members(sizes):
+    '''
+    Raises an EnergysystemParseError when the archive contains more than BULK_MAX_ITEMS energy
+    systems, or when they are larger than BULK_MAX_ARCHIVE_SIZE bytes together
+    '''
+    if len(sizes) > current_app.config['BULK_MAX_ITEMS']:
+        raise EnergysystemParseError(
+            f'At most {current_app.config["BULK_MAX_ITEMS"]} energy systems can be '
+            'converted at once')
+
+    if sum(sizes) > current_app.config['BULK_MAX_ARCHIVE_SIZE']:
+        raise EnergysystemParseError(
+            f'The energy systems in the archive can be at most '
+            f'{current_app.config["BULK_MAX_ARCHIVE_SIZE"]} bytes together')
+
+
+def create_scenarios(items, env):
+    '''Creates the scenarios in the process pool, returns the result of each energy system'''
+    results = run_in_processes(create_scenario, [(es, title, env) for title, es in items])
+
+    return {
+        'scenarios': [
+            dict(result, energy_system_title=title)
+            for (title, _), result in zip(items, results)
+        ]
+    }
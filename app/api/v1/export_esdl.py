@@ -1,11 +1,12 @@
 '''
 Api namespace that adjusts an ESDL file to the changes made to a ETM scenario.
-Responds with an ESDL file.
+Responds with an ESDL file: inside a JSON object, or streamed as XML with format=xml.
 Only: post
 '''
 
 # TODO: See the create api, all todo's there are also applicable here
 
+from flask import Response, request
 from flask_restx import Namespace, Resource, fields
 from app.interface import update_esdl, setup_esh_from_energy_system, setup_esh_from_scenario
 
@@ -33,9 +34,16 @@ export_parser.add_argument(
     help='The session ID of the Energy Transition Model scenario',
     location='form'
 )
+export_parser.add_argument(
+    'format', type=str, required=False, default='json', choices=('json', 'xml'),
+    help='Respond with the ESDL inside a JSON object ("json"), or stream the ESDL itself ("xml"), \
+    gzip compressed when the request accepts it (Accept-Encoding)',
+    location='form'
+)
 
 ## Controller
 @api.route('/')
+@api.produces(['application/json', 'application/xml'])
 class ETMScenario(Resource):
     """
     Update ESDL energy system description based on ETM scenario settings
@@ -56,6 +64,26 @@ class ETMScenario(Resource):
         # Call method that updates ESDL based on ETM scenario settings
         esh = update_esdl(esh, env, session_id)
 
+        if args['format'] == 'xml':
+            return xml_response(esh)
+
         return {
             'energy_system': esh.get_as_string()
         }
+
+
+def xml_response(esh):
+    '''
+    Streams the ESDL while it is serialized (chunked), gzip compressed when the request accepts it
+    '''
+    compress = request.accept_encodings['gzip'] > 0
+    headers = {'Vary': 'Accept-Encoding'}
+    if compress:
+        headers['Content-Encoding'] = 'gzip'
+
+    return Response(
+        esh.iter_chunks(compress=compress),
+        mimetype='application/xml',
+        headers=headers,
+        direct_passthrough=True
+    )
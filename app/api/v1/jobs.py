@@ -0,0 +1,28 @@
+'''
+Api namespace that reports on the jobs running in the background, like the creation of a scenario
+with create_scenario?async=true.
+Only: get
+'''
+
+from flask_restx import Namespace, Resource
+from app.helpers.exceptions import EnergysystemParseError
+from app.services.jobs import job_queue
+
+api = Namespace('jobs', description='Follow the jobs running in the background')
+
+## Controller
+@api.route('/<string:job_id>')
+@api.doc(responses={404: 'Job not found'})
+class Job(Resource):
+    """
+    The status of a job, with its result when it finished or its errors when it failed
+    """
+    def get(self, job_id):
+        """
+        The status of a job, with its result when it finished or its errors when it failed
+        """
+        job = job_queue().get(job_id)
+        if job is None:
+            raise EnergysystemParseError('Job not found (or expired)', 404)
+
+        return job.to_dict()
@@ -33,3 +33,11 @@ input_values = {
     'technical_solar_pv_efficiency': { 'value': None },
     'green_gas_total_share': { 'value': None },
 }
+
+
+def new_input_values():
+    '''
+    A copy of the input values for a single translation, so translations (in different threads)
+    do not share their values
+    '''
+    return {name: dict(settings) for name, settings in input_values.items()}
@@ -0,0 +1,174 @@
+
+from .esdl import getEClassifier, eClassifiers
+from .esdl import name, nsURI, nsPrefix, eClass
+from .esdl import EnergySystem, Area, Port, EconomicProperties, SocialProperties, Item, Measures, Instance, Carriers, EnergySystemInformation, GenericProfile, ProfileElement, GenericDistribution, Percentile, CostInformation, StringPerc, EnergyLabelPerc, FromToPerc, PItemStat, AbstractVariance, Party, Geometry, Carrier, Duration, Profiles, Parties, DataSources, SubPolygon, MobilityFuelInformation, VehicleFuelEfficiency, MobilityProperties, NumberOfVehicles, VehicleCount, Services, AbstractDataSource, KPIs, KPI, QuantityAndUnits, AbstractQuantityAndUnit, Parameters, MeasuresCollection, Sectors, Sector, AbstractInstanceDate, WeekSchedule, DaySchedule, Event, AbstractBuildingUsage, NewEClass198, BuildingUsageInformation, BuildingTypePercentage, ResidentialBuildingTypePercentage, HousingTypePercentage, InPort, OutPort, Asset, Point, Polygon, Service, Potential, EnergyCarrier, StaticProfile, ExternalProfile, PercentileDistribution, LabelDistribution, SymetricVariance, AssymetricVariance, DoubleAssymetricVariance, Line, Commodity, DataSource, MultiPolygon, QuantityAndUnitType, DataSourceReference, QuantityAndUnitReference, StringParameter, DoubleParameter, IntegerParameter, BooleanParameter, MultiLine, InstanceDate, InstancePeriod, WKT, WKB, BuildingUsage, BuildingUsageReference, EnergyAsset, Insulation, LegalArea, EnergyService, AbstractBuilding, WindPotential, DateTimeProfile, SingleValue, StringLabelDistribution, EnergyLabelDistribution, FromToDistribution, URIProfile, DatabaseProfile, GasCommodity, HeatCommodity, ElectricityCommodity, Range, SolarPotential, ProfileReference, ResidualHeatSourcePotential, EnergyCommodity, AbstractGTPotential, UTESPotential, BiomassPotential, Glass, SearchAreaWind, SearchAreaSolar, BuildingTypeDistribution, ResidentialBuildingTypeDistribution, HousingTypeDistribution, Producer, Consumer, Storage, Conversion, Transport, BuildingUnit, Building, GeothermalPotential, DemandResponseService, AggregatorService, AggregatedBuilding, InfluxDBProfile, ControlStrategy, EnergyMarket, GeothermalEnergyPotential, WindTurbine, PVPanel, Battery, AggregatedConsumer, AggregatedProducer, GenericConsumer, GenericProducer, GenericStorage, GenericTransport, GenericConversion, AggregatedTransport, AggregatedConversion, AggregatedStorage, HeatStorage, GasHeater, SourceProducer, SinkConsumer, GeothermalSource, CoGeneration, HeatPump, HeatingDemand, ElectricityDemand, GasDemand, PowerPlant, EVChargingStation, Losses, PowerToX, CCS, XToPower, CoolingDemand, Airco, EnergyDemand, SolarCollector, ResidualHeatSource, FermentationPlant, MobilityDemand, GasStorage, DrivenByDemand, GasConversion, DrivenBySupply, DrivenByProfile, WaterToPower, EnergyNetwork, AbstractConductor, AbstractSwitch, AbstractTransformer, AbstractConnection, RoomHeater, BiomassHeater, StorageStrategy, CurtailmentStrategy, PVTInstallation, ElectricityNetwork, ElectricityCable, HeatNetwork, GasNetwork, Pipe, Transformer, HeatExchange, EConnection, HConnection, GConnection, FuelCell, WindParc, PVParc, Pump, Valve, CHP, Electrolyzer, PVInstallation, CircuitBraker, UTES, WaterBuffer, Joint, CommodityEnum, AreaScopeEnum, ProfileTypeEnum, DurationUnitEnum, BuildingTypeEnum, ConsTypeEnum, SourceTypeEnum, AggrTypeEnum, AreaTypeEnum, HeatDemandTypeEnum, HousingTypeEnum, RoofTypeEnum, EnergyLabelEnum, ResidentialBuildingTypeEnum, PowerPlantFuelEnum, SectorEnum, RenewableTypeEnum, StateOfMatterEnum, CostUnitEnum, GeothermalSourceTypeEnum, CHPTypeEnum, GlassTypeEnum, VentilationTypeEnum, GasHeaterTypeEnum, InhabitantsTypeEnum, AdditionalHeatingSourceTypeEnum, GeothermalPotentialEnum, GeothermalPowerEnum, ResidualHeatSourceTypeEnum, MobilityFuelTypeEnum, VehicleTypeEnum, MultiplierEnum, PhysicalQuantityEnum, UnitEnum, TimeUnit, GasConversionTypeEnum, PVInstallationTypeEnum, WindTurbineTypeEnum, WaterToPowerTypeEnum, SolarCollectorTypeEnum, HeatRadiationDeviceTypeEnum, CoolingDeviceType, RoomHeaterTypeEnum, BiomassHeaterTypeEnum, UTESPotentialTypeEnum, UTESTypeEnum, InterpolationMethodEnum, DoubleKPI, StringItem, DistributionKPI, PVPark
+
+
+from . import esdl
+
+__all__ = ['EnergySystem', 'Area', 'Port', 'EconomicProperties', 'SocialProperties', 'Item', 'Measures', 'Instance', 'Carriers', 'EnergySystemInformation', 'GenericProfile', 'ProfileElement', 'GenericDistribution', 'Percentile', 'CostInformation', 'StringPerc', 'EnergyLabelPerc', 'FromToPerc', 'PItemStat', 'AbstractVariance', 'Party', 'Geometry', 'Carrier', 'Duration', 'Profiles', 'Parties', 'DataSources', 'SubPolygon', 'MobilityFuelInformation', 'VehicleFuelEfficiency', 'MobilityProperties', 'NumberOfVehicles', 'VehicleCount', 'Services', 'AbstractDataSource', 'KPIs', 'KPI', 'QuantityAndUnits', 'AbstractQuantityAndUnit', 'Parameters', 'MeasuresCollection', 'Sectors', 'Sector', 'AbstractInstanceDate', 'WeekSchedule', 'DaySchedule', 'Event', 'AbstractBuildingUsage', 'NewEClass198', 'BuildingUsageInformation', 'BuildingTypePercentage', 'ResidentialBuildingTypePercentage', 'HousingTypePercentage', 'InPort', 'OutPort', 'Asset', 'Point', 'Polygon', 'Service', 'Potential', 'EnergyCarrier', 'StaticProfile', 'ExternalProfile', 'PercentileDistribution', 'LabelDistribution', 'SymetricVariance', 'AssymetricVariance', 'DoubleAssymetricVariance', 'Line', 'Commodity', 'DataSource', 'MultiPolygon', 'QuantityAndUnitType', 'DataSourceReference', 'QuantityAndUnitReference', 'StringParameter', 'DoubleParameter', 'IntegerParameter', 'BooleanParameter', 'MultiLine', 'InstanceDate', 'InstancePeriod', 'WKT', 'WKB', 'BuildingUsage', 'BuildingUsageReference', 'EnergyAsset', 'Insulation', 'LegalArea', 'EnergyService', 'AbstractBuilding', 'WindPotential', 'DateTimeProfile', 'SingleValue', 'StringLabelDistribution', 'EnergyLabelDistribution', 'FromToDistribution', 'URIProfile', 'DatabaseProfile', 'GasCommodity', 'HeatCommodity', 'ElectricityCommodity', 'Range', 'SolarPotential', 'ProfileReference', 'ResidualHeatSourcePotential', 'EnergyCommodity', 'AbstractGTPotential', 'UTESPotential', 'BiomassPotential', 'Glass', 'SearchAreaWind', 'SearchAreaSolar', 'BuildingTypeDistribution', 'ResidentialBuildingTypeDistribution', 'HousingTypeDistribution', 'Producer', 'Consumer', 'Storage', 'Conversion', 'Transport', 'BuildingUnit', 'Building', 'GeothermalPotential', 'DemandResponseService', 'AggregatorService', 'AggregatedBuilding', 'InfluxDBProfile', 'ControlStrategy', 'EnergyMarket',
+           'GeothermalEnergyPotential', 'WindTurbine', 'PVPanel', 'Battery', 'AggregatedConsumer', 'AggregatedProducer', 'GenericConsumer', 'GenericProducer', 'GenericStorage', 'GenericTransport', 'GenericConversion', 'AggregatedTransport', 'AggregatedConversion', 'AggregatedStorage', 'HeatStorage', 'GasHeater', 'SourceProducer', 'SinkConsumer', 'GeothermalSource', 'CoGeneration', 'HeatPump', 'HeatingDemand', 'ElectricityDemand', 'GasDemand', 'PowerPlant', 'EVChargingStation', 'Losses', 'PowerToX', 'CCS', 'XToPower', 'CoolingDemand', 'Airco', 'EnergyDemand', 'SolarCollector', 'ResidualHeatSource', 'FermentationPlant', 'MobilityDemand', 'GasStorage', 'DrivenByDemand', 'GasConversion', 'DrivenBySupply', 'DrivenByProfile', 'WaterToPower', 'EnergyNetwork', 'AbstractConductor', 'AbstractSwitch', 'AbstractTransformer', 'AbstractConnection', 'RoomHeater', 'BiomassHeater', 'StorageStrategy', 'CurtailmentStrategy', 'PVTInstallation', 'ElectricityNetwork', 'ElectricityCable', 'HeatNetwork', 'GasNetwork', 'Pipe', 'Transformer', 'HeatExchange', 'EConnection', 'HConnection', 'GConnection', 'FuelCell', 'WindParc', 'PVParc', 'Pump', 'Valve', 'CHP', 'Electrolyzer', 'PVInstallation', 'CircuitBraker', 'UTES', 'WaterBuffer', 'Joint', 'CommodityEnum', 'AreaScopeEnum', 'ProfileTypeEnum', 'DurationUnitEnum', 'BuildingTypeEnum', 'ConsTypeEnum', 'SourceTypeEnum', 'AggrTypeEnum', 'AreaTypeEnum', 'HeatDemandTypeEnum', 'HousingTypeEnum', 'RoofTypeEnum', 'EnergyLabelEnum', 'ResidentialBuildingTypeEnum', 'PowerPlantFuelEnum', 'SectorEnum', 'RenewableTypeEnum', 'StateOfMatterEnum', 'CostUnitEnum', 'GeothermalSourceTypeEnum', 'CHPTypeEnum', 'GlassTypeEnum', 'VentilationTypeEnum', 'GasHeaterTypeEnum', 'InhabitantsTypeEnum', 'AdditionalHeatingSourceTypeEnum', 'GeothermalPotentialEnum', 'GeothermalPowerEnum', 'ResidualHeatSourceTypeEnum', 'MobilityFuelTypeEnum', 'VehicleTypeEnum', 'MultiplierEnum', 'PhysicalQuantityEnum', 'UnitEnum', 'TimeUnit', 'GasConversionTypeEnum', 'PVInstallationTypeEnum', 'WindTurbineTypeEnum', 'WaterToPowerTypeEnum', 'SolarCollectorTypeEnum', 'HeatRadiationDeviceTypeEnum', 'CoolingDeviceType', 'RoomHeaterTypeEnum', 'BiomassHeaterTypeEnum', 'UTESPotentialTypeEnum', 'UTESTypeEnum', 'InterpolationMethodEnum', 'DoubleKPI', 'StringItem', 'DistributionKPI', 'PVPark']
+
+eSubpackages = []
+eSuperPackage = None
+esdl.eSubpackages = eSubpackages
+esdl.eSuperPackage = eSuperPackage
+
+EnergySystem.measures.eType = Measures
+EnergySystem.instance.eType = Instance
+EnergySystem.energySystemInformation.eType = EnergySystemInformation
+EnergySystem.parties.eType = Parties
+EnergySystem.services.eType = Services
+Area.socialProperties.eType = SocialProperties
+Area.economicProperties.eType = EconomicProperties
+Area.asset.eType = Asset
+Area.area.eType = Area
+Area.containingArea.eType = Area
+Area.isOwnedBy.eType = Party
+Area.mobilityProperties.eType = MobilityProperties
+Area.KPIs.eType = KPIs
+Area.potential.eType = Potential
+Area.geometry.eType = Geometry
+Port.energyasset.eType = EnergyAsset
+Port.profile.eType = GenericProfile
+Port.carrier.eType = Carrier
+Item.isOwnedBy.eType = Party
+Item.dataSource.eType = AbstractDataSource
+Item.sector.eType = Sector
+Measures.asset.eType = Asset
+Measures.measuresCollection.eType = MeasuresCollection
+Instance.area.eType = Area
+Instance.date.eType = AbstractInstanceDate
+Carriers.carrier.eType = Carrier
+Carriers.dataSource.eType = AbstractDataSource
+EnergySystemInformation.carriers.eType = Carriers
+EnergySystemInformation.profiles.eType = Profiles
+EnergySystemInformation.dataSources.eType = DataSources
+EnergySystemInformation.mobilityFuelInformation.eType = MobilityFuelInformation
+EnergySystemInformation.quantityAndUnits.eType = QuantityAndUnits
+EnergySystemInformation.sectors.eType = Sectors
+EnergySystemInformation.buildingUsageInformation.eType = BuildingUsageInformation
+GenericProfile.dataSource.eType = AbstractDataSource
+GenericProfile.profileQuantityAndUnit.eType = AbstractQuantityAndUnit
+CostInformation.investmentCosts.eType = GenericProfile
+CostInformation.installationCosts.eType = GenericProfile
+CostInformation.fixedOperationalAndMaintenanceCosts.eType = GenericProfile
+CostInformation.marginalCosts.eType = GenericProfile
+CostInformation.variableOperationalAndMaintenanceCosts.eType = GenericProfile
+Party.owns.eType = Item
+Party.ownsArea.eType = Area
+Party.sector.eType = Sector
+Carrier.cost.eType = GenericProfile
+Carrier.dataSource.eType = AbstractDataSource
+Profiles.profile.eType = GenericProfile
+Parties.party.eType = Party
+DataSources.dataSource.eType = DataSource
+SubPolygon.point.eType = Point
+MobilityFuelInformation.vehicleFuelEfficiency.eType = VehicleFuelEfficiency
+MobilityFuelInformation.dataSource.eType = AbstractDataSource
+MobilityProperties.numberOfVehicles.eType = NumberOfVehicles
+NumberOfVehicles.vehicleCount.eType = VehicleCount
+Services.service.eType = Service
+KPIs.kpi.eType = KPI
+KPI.quantityAndUnit.eType = AbstractQuantityAndUnit
+QuantityAndUnits.quantityAndUnit.eType = QuantityAndUnitType
+Parameters.parameterUnit.eType = AbstractQuantityAndUnit
+MeasuresCollection.asset.eType = Asset
+MeasuresCollection.costInformation.eType = CostInformation
+MeasuresCollection.dataSource.eType = AbstractDataSource
+Sectors.sector.eType = Sector
+Sectors.dataSource.eType = AbstractDataSource
+Sector.dataSource.eType = AbstractDataSource
+WeekSchedule.mon.eType = DaySchedule
+WeekSchedule.tue.eType = DaySchedule
+WeekSchedule.wed.eType = DaySchedule
+WeekSchedule.thu.eType = DaySchedule
+WeekSchedule.fri.eType = DaySchedule
+WeekSchedule.sat.eType = DaySchedule
+WeekSchedule.sun.eType = DaySchedule
+WeekSchedule.weekdays.eType = DaySchedule
+WeekSchedule.weekenddays.eType = DaySchedule
+DaySchedule.event.eType = Event
+BuildingUsageInformation.buildingUsage.eType = BuildingUsage
+InPort.connectedTo.eType = OutPort
+OutPort.connectedTo.eType = InPort
+Asset.area.eType = Area
+Asset.containingBuilding.eType = AbstractBuilding
+Asset.geometry.eType = Geometry
+Asset.costInformation.eType = CostInformation
+Asset.KPIs.eType = KPIs
+Polygon.exterior.eType = SubPolygon
+Polygon.interior.eType = SubPolygon
+Potential.geometry.eType = Geometry
+Potential.quantityAndUnit.eType = AbstractQuantityAndUnit
+EnergyCarrier.energyContentUnit.eType = AbstractQuantityAndUnit
+EnergyCarrier.emissionUnit.eType = AbstractQuantityAndUnit
+PercentileDistribution.percentile.eType = Percentile
+Line.point.eType = Point
+MultiPolygon.polygon.eType = Polygon
+DataSourceReference.reference.eType = DataSource
+QuantityAndUnitReference.reference.eType = QuantityAndUnitType
+MultiLine.line.eType = Line
+BuildingUsage.coolingSetpoints.eType = WeekSchedule
+BuildingUsage.heatingSetpoints.eType = WeekSchedule
+BuildingUsage.openingHours.eType = WeekSchedule
+BuildingUsageReference.reference.eType = BuildingUsage
+EnergyAsset.port.eType = Port
+EnergyAsset.controlStrategy.eType = ControlStrategy
+AbstractBuilding.asset.eType = Asset
+AbstractBuilding.buildingUsage.eType = AbstractBuildingUsage
+DateTimeProfile.element.eType = ProfileElement
+StringLabelDistribution.stringPerc.eType = StringPerc
+StringLabelDistribution.stringItem.eType = StringItem
+EnergyLabelDistribution.labelPerc.eType = EnergyLabelPerc
+FromToDistribution.fromToPerc.eType = FromToPerc
+ProfileReference.reference.eType = GenericProfile
+ResidualHeatSourcePotential.associatedConversionAsset.eType = Conversion
+ResidualHeatSourcePotential.residualHeatSource.eType = ResidualHeatSource
+AbstractGTPotential.geothermalSource.eType = GeothermalSource
+UTESPotential.UTES.eType = UTES
+BuildingTypeDistribution.buildingTypePercentage.eType = BuildingTypePercentage
+ResidentialBuildingTypeDistribution.residentialBuildingTypePercentage.eType = ResidentialBuildingTypePercentage
+HousingTypeDistribution.housingTypePercentage.eType = HousingTypePercentage
+Storage.profile.eType = GenericProfile
+Conversion.residualHeatSourcePotential.eType = ResidualHeatSourcePotential
+AggregatedBuilding.aggregationOf.eType = AbstractBuilding
+AggregatedBuilding.energyLabelDistribution.eType = EnergyLabelDistribution
+AggregatedBuilding.buildingYearDistribution.eType = FromToDistribution
+AggregatedBuilding.buildingTypeDistribution.eType = BuildingTypeDistribution
+AggregatedBuilding.residentialBuildingTypeDistribution.eType = ResidentialBuildingTypeDistribution
+AggregatedBuilding.housingTypeDistribution.eType = HousingTypeDistribution
+ControlStrategy.energyAsset.eType = EnergyAsset
+EnergyMarket.asset.eType = Asset
+EnergyMarket.carrier.eType = Carrier
+EnergyMarket.parameters.eType = Parameters
+AggregatedConsumer.aggregationOf.eType = Consumer
+AggregatedProducer.aggregationOf.eType = Producer
+AggregatedTransport.aggregationOf.eType = Transport
+AggregatedConversion.aggregationOf.eType = Conversion
+AggregatedStorage.aggregationOf.eType = Storage
+GeothermalSource.geothermalPotential.eType = AbstractGTPotential
+CoGeneration.energyCarrier.eType = EnergyCarrier
+PowerPlant.energyCarrier.eType = EnergyCarrier
+PowerPlant.mustRun.eType = GenericProfile
+ResidualHeatSource.residualHeatSourcePotential.eType = ResidualHeatSourcePotential
+DrivenByDemand.outPort.eType = OutPort
+DrivenBySupply.inPort.eType = InPort
+DrivenByProfile.profile.eType = GenericProfile
+StorageStrategy.marginalChargeCosts.eType = GenericProfile
+StorageStrategy.marginalDischargeCosts.eType = GenericProfile
+UTES.UTESPotential.eType = UTESPotential
+DistributionKPI.distribution.eType = LabelDistribution
+
+otherClassifiers = [CommodityEnum, AreaScopeEnum, ProfileTypeEnum, DurationUnitEnum, BuildingTypeEnum, ConsTypeEnum, SourceTypeEnum, AggrTypeEnum, AreaTypeEnum, HeatDemandTypeEnum, HousingTypeEnum, RoofTypeEnum, EnergyLabelEnum, ResidentialBuildingTypeEnum, PowerPlantFuelEnum, SectorEnum, RenewableTypeEnum, StateOfMatterEnum, CostUnitEnum, GeothermalSourceTypeEnum, CHPTypeEnum, GlassTypeEnum, VentilationTypeEnum, GasHeaterTypeEnum, InhabitantsTypeEnum,
+                    AdditionalHeatingSourceTypeEnum, GeothermalPotentialEnum, GeothermalPowerEnum, ResidualHeatSourceTypeEnum, MobilityFuelTypeEnum, VehicleTypeEnum, MultiplierEnum, PhysicalQuantityEnum, UnitEnum, TimeUnit, GasConversionTypeEnum, PVInstallationTypeEnum, WindTurbineTypeEnum, WaterToPowerTypeEnum, SolarCollectorTypeEnum, HeatRadiationDeviceTypeEnum, CoolingDeviceType, RoomHeaterTypeEnum, BiomassHeaterTypeEnum, UTESPotentialTypeEnum, UTESTypeEnum, InterpolationMethodEnum]
+
+for classif in otherClassifiers:
+    eClassifiers[classif.name] = classif
+    classif.ePackage = eClass
+
+for classif in eClassifiers.values():
+    eClass.eClassifiers.append(classif.eClass)
+
+for subpack in eSubpackages:
+    eClass.eSubpackages.append(subpack.eClass)
@@ -16,16 +16,16 @@ CommodityEnum = EEnum('CommodityEnum', literals=[
                       'UNDEFINED', 'ELECTRICITY', 'GAS', 'HEAT', 'H2', 'BIOGAS', 'CO2', 'ENERGY'])
 
 AreaScopeEnum = EEnum('AreaScopeEnum', literals=['UNDEFINED', 'BUILDING', 'STREET', 'ZIPCODE', 'NEIGHBOURHOOD',
-                                                 'DISTRICT', 'VILLAGE', 'CITY', 'MUNICIPALITY', 'REGION', 'PROVINCE', 'STATE', 'COUNTRY', 'CONTINENT'])
+                      'DISTRICT', 'VILLAGE', 'CITY', 'MUNICIPALITY', 'REGION', 'PROVINCE', 'STATE', 'COUNTRY', 'CONTINENT'])
 
 ProfileTypeEnum = EEnum('ProfileTypeEnum', literals=['UNDEFINED', 'SOLARIRRADIANCE_IN_W_PER_M2', 'WINDSPEED_IN_M_PER_S', 'STATEOFCHARGE_IN_WS', 'ENERGY_IN_WH', 'ENERGY_IN_KWH', 'ENERGY_IN_MWH', 'ENERGY_IN_GWH', 'ENERGY_IN_J', 'ENERGY_IN_KJ', 'ENERGY_IN_MJ', 'ENERGY_IN_GJ', 'ENERGY_IN_TJ',
-                                                     'ENERGY_IN_PJ', 'TEMPERATURE_IN_C', 'TEMPERATURE_IN_K', 'POWER_IN_W', 'POWER_IN_KW', 'POWER_IN_MW', 'POWER_IN_GW', 'POWER_IN_TW', 'MONEY_IN_EUR', 'MONEY_IN_KEUR', 'MONEY_IN_MEUR', 'PERCENTAGE', 'MONEY_IN_EUR_PER_KW', 'MONEY_IN_EUR_PER_KWH', 'VOLUME_IN_M3', 'VOLUME_IN_LITERS'])
+                        'ENERGY_IN_PJ', 'TEMPERATURE_IN_C', 'TEMPERATURE_IN_K', 'POWER_IN_W', 'POWER_IN_KW', 'POWER_IN_MW', 'POWER_IN_GW', 'POWER_IN_TW', 'MONEY_IN_EUR', 'MONEY_IN_KEUR', 'MONEY_IN_MEUR', 'PERCENTAGE', 'MONEY_IN_EUR_PER_KW', 'MONEY_IN_EUR_PER_KWH', 'VOLUME_IN_M3', 'VOLUME_IN_LITERS'])
 
 DurationUnitEnum = EEnum('DurationUnitEnum', literals=[
                          'SECOND', 'MINUTE', 'HOUR', 'DAY', 'WEEK', 'MONTH', 'YEAR'])
 
 BuildingTypeEnum = EEnum('BuildingTypeEnum', literals=['UNDEFINED', 'RESIDENTIAL', 'GATHERING', 'PRISON', 'HEALTHCARE',
-                                                       'INDUSTRY', 'OFFICE', 'EDUCATION', 'SPORTS', 'SHOPPING', 'HOTEL', 'GREENHOUSE', 'UTILITY', 'OTHER'])
+                         'INDUSTRY', 'OFFICE', 'EDUCATION', 'SPORTS', 'SHOPPING', 'HOTEL', 'GREENHOUSE', 'UTILITY', 'OTHER'])
 
 ConsTypeEnum = EEnum('ConsTypeEnum', literals=['PRIMARY', 'FINAL'])
 
@@ -36,7 +36,7 @@ AggrTypeEnum = EEnum('AggrTypeEnum', literals=[
                      'UNDEFINED', 'NOT_AGGREGATED', 'PER_COMMODITY', 'TOTAL_ENERGY', 'TOTAL_CAPABILITY', 'PER_CAPIBILITY'])
 
 AreaTypeEnum = EEnum('AreaTypeEnum', literals=['UNDEFINED', 'ROAD', 'RAILWAY', 'TERRAIN',
-                                               'RURAL_AREA', 'BUILT', 'WATER', 'SEA', 'RIVER', 'CANAL', 'LAKE', 'LAND', 'PARCEL'])
+                     'RURAL_AREA', 'BUILT', 'WATER', 'SEA', 'RIVER', 'CANAL', 'LAKE', 'LAND', 'PARCEL'])
 
 HeatDemandTypeEnum = EEnum('HeatDemandTypeEnum', literals=[
                            'UNDEFINED', 'SPACE_HEATING', 'HOT_TAPWATER', 'SH_AND_HTW', 'OTHER'])
@@ -48,10 +48,10 @@ RoofTypeEnum = EEnum('RoofTypeEnum', literals=[
                      'UNDEFINED', 'FLATROOF', 'SLANTEDROOF', 'COMBINATION'])
 
 EnergyLabelEnum = EEnum('EnergyLabelEnum', literals=['UNDEFINED', 'LABEL_G', 'LABEL_F', 'LABEL_E',
-                                                     'LABEL_D', 'LABEL_C', 'LABEL_B', 'LABEL_A', 'LABEL_AP', 'LABEL_APP', 'LABEL_APPP', 'LABEL_APPPP'])
+                        'LABEL_D', 'LABEL_C', 'LABEL_B', 'LABEL_A', 'LABEL_AP', 'LABEL_APP', 'LABEL_APPP', 'LABEL_APPPP'])
 
 ResidentialBuildingTypeEnum = EEnum('ResidentialBuildingTypeEnum', literals=['UNDEFINED', 'VRIJSTAANDE_WONING', 'TWEE_ONDER_EEN_KAP_WONING', 'RIJWONING',
-                                                                             'MAISONNETTEWONING', 'GALERIJWONING', 'PORTIEKWONING', 'FLATWONING', 'TUSSENWONING', 'HOEKWONING', 'GALERIJCOMPLEX', 'APPARTEMENTENCOMPLEX', 'APPARTEMENT'])
+                                    'MAISONNETTEWONING', 'GALERIJWONING', 'PORTIEKWONING', 'FLATWONING', 'TUSSENWONING', 'HOEKWONING', 'GALERIJCOMPLEX', 'APPARTEMENTENCOMPLEX', 'APPARTEMENT'])
 
 PowerPlantFuelEnum = EEnum('PowerPlantFuelEnum', literals=[
                            'UNDEFINED', 'COAL', 'BLAST_FURNACE_GAS', 'NATURAL_GAS', 'URANIUM', 'HYDROGEN'])
@@ -98,19 +98,19 @@ MobilityFuelTypeEnum = EEnum('MobilityFuelTypeEnum', literals=[
                              'UNDEFINED', 'PETROL', 'DIESEL', 'HYDROGEN', 'LPG', 'BIOFUEL', 'ELECTRICITY', 'OIL', 'LNG', 'KEROSENE'])
 
 VehicleTypeEnum = EEnum('VehicleTypeEnum', literals=['UNDEFINED', 'CAR', 'TRUCK', 'VAN', 'BUS', 'METRO', 'TRAM', 'TRAIN', 'PASSENGER_TRAIN',
-                                                     'FREIGHT_TRAIN', 'SCOOTER', 'MOTOR_CYCLE', 'NONROAD_VEHICLE', 'AGRARIAN_VEHICLE', 'BARGE', 'INTERNATIONAL_SHIPPING', 'AIRCRAFT', 'OTHER', 'TOTAL'])
+                        'FREIGHT_TRAIN', 'SCOOTER', 'MOTOR_CYCLE', 'NONROAD_VEHICLE', 'AGRARIAN_VEHICLE', 'BARGE', 'INTERNATIONAL_SHIPPING', 'AIRCRAFT', 'OTHER', 'TOTAL'])
 
 MultiplierEnum = EEnum('MultiplierEnum', literals=[
                        'NONE', 'KILO', 'MEGA', 'GIGA', 'TERRA', 'PETA', 'MILLI', 'MICRO', 'NANO', 'PICO'])
 
 PhysicalQuantityEnum = EEnum('PhysicalQuantityEnum', literals=['UNDEFINED', 'ENERGY', 'POWER', 'VOLTAGE', 'PRESSURE', 'TEMPERATURE',
-                                                               'EMISSION', 'COST', 'TIME', 'LENGTH', 'DISTANCE', 'IRRADIANCE', 'SPEED', 'STATE_OF_CHARGE', 'VOLUME', 'AREA'])
+                             'EMISSION', 'COST', 'TIME', 'LENGTH', 'DISTANCE', 'IRRADIANCE', 'SPEED', 'STATE_OF_CHARGE', 'VOLUME', 'AREA'])
 
 UnitEnum = EEnum('UnitEnum', literals=['NONE', 'JOULE', 'WATTHOUR', 'WATT', 'VOLT', 'BAR', 'PSI', 'DEGREES_CELSIUS', 'KELVIN', 'GRAM', 'EURO', 'DOLLAR', 'SECOND',
-                                       'MINUTE', 'QUARTER', 'HOUR', 'DAY', 'WEEK', 'MONTH', 'YEAR', 'METRE', 'SQUARE_METRE', 'CUBIC_METRE', 'LITRE', 'WATTSECOND', 'ARE', 'HECTARE', 'PERCENT'])
+                 'MINUTE', 'QUARTER', 'HOUR', 'DAY', 'WEEK', 'MONTH', 'YEAR', 'METRE', 'SQUARE_METRE', 'CUBIC_METRE', 'LITRE', 'WATTSECOND', 'ARE', 'HECTARE', 'PERCENT'])
 
 TimeUnit = EEnum('TimeUnit', literals=['NONE', 'SECOND',
-                                       'MINUTE', 'QUARTER', 'HOUR', 'DAY', 'WEEK', 'MONTH', 'YEAR'])
+                 'MINUTE', 'QUARTER', 'HOUR', 'DAY', 'WEEK', 'MONTH', 'YEAR'])
 
 GasConversionTypeEnum = EEnum('GasConversionTypeEnum', literals=['UNDEFINED', 'SMR', 'ATR'])
 
@@ -149,21 +149,21 @@ InterpolationMethodEnum = EEnum('InterpolationMethodEnum', literals=[
 
 
 class EnergySystem(EObject, metaclass=MetaEClass):
-    """This is the main class to describe an EnergySystem in ESDL. Each energy system description should start with this class. More information about ESDL and the Energy System can be found in the gitbook at https://energytransition.gitbook.io/esdl/"""
-    name = EAttribute(eType=EString, derived=False, changeable=True)
-    description = EAttribute(eType=EString, derived=False, changeable=True)
-    geographicalScope = EAttribute(eType=EString, derived=False, changeable=True)
-    sector = EAttribute(eType=SectorEnum, derived=False, changeable=True, upper=-1)
-    id = EAttribute(eType=EString, derived=False, changeable=True, iD=True)
-    measures = EReference(ordered=True, unique=True, containment=True)
-    instance = EReference(ordered=True, unique=True, containment=True, upper=-1)
-    energySystemInformation = EReference(ordered=True, unique=True, containment=True)
-    parties = EReference(ordered=True, unique=True, containment=True)
-    services = EReference(ordered=True, unique=True, containment=True)
-
-    def __init__(self, *, name=None, description=None, geographicalScope=None, sector=None, measures=None, instance=None, energySystemInformation=None, parties=None, services=None, id=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+
+    name = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    description = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    geographicalScope = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    sector = EAttribute(eType=SectorEnum, unique=True, derived=False, changeable=True, upper=-1)
+    id = EAttribute(eType=EString, unique=True, derived=False, changeable=True, iD=True)
+    measures = EReference(ordered=True, unique=True, containment=True, derived=False)
+    instance = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
+    energySystemInformation = EReference(ordered=True, unique=True, containment=True, derived=False)
+    parties = EReference(ordered=True, unique=True, containment=True, derived=False)
+    services = EReference(ordered=True, unique=True, containment=True, derived=False)
+
+    def __init__(self, *, name=None, description=None, geographicalScope=None, sector=None, id=None, measures=None, instance=None, energySystemInformation=None, parties=None, services=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -199,28 +199,27 @@ class EnergySystem(EObject, metaclass=MetaEClass):
 
 
 class Area(EObject, metaclass=MetaEClass):
-    """The Area class represents a physical geographic area or a more abstract logical area. In both cases it is the 'asset container', in a sense that all assets within the area are contained by the Area instance."""
-    id = EAttribute(eType=EString, derived=False, changeable=True, iD=True)
-    name = EAttribute(eType=EString, derived=False, changeable=True)
-    scope = EAttribute(eType=AreaScopeEnum, derived=False, changeable=True,
-                       default_value=AreaScopeEnum.UNDEFINED)
-    type = EAttribute(eType=AreaTypeEnum, derived=False, changeable=True)
-    geometryReference = EAttribute(eType=EString, derived=False, changeable=True)
-    buildingDensity = EAttribute(eType=EDouble, derived=False, changeable=True)
-    socialProperties = EReference(ordered=True, unique=True, containment=True)
-    economicProperties = EReference(ordered=True, unique=True, containment=True)
-    asset = EReference(ordered=True, unique=True, containment=True, upper=-1)
-    area = EReference(ordered=True, unique=True, containment=True, upper=-1)
-    containingArea = EReference(ordered=True, unique=True, containment=False)
-    isOwnedBy = EReference(ordered=True, unique=True, containment=False)
-    mobilityProperties = EReference(ordered=True, unique=True, containment=True)
-    KPIs = EReference(ordered=True, unique=True, containment=True)
-    potential = EReference(ordered=True, unique=True, containment=True, upper=-1)
-    geometry = EReference(ordered=True, unique=True, containment=True)
-
-    def __init__(self, *, id=None, name=None, scope=None, type=None, socialProperties=None, economicProperties=None, asset=None, area=None, containingArea=None, isOwnedBy=None, geometryReference=None, mobilityProperties=None, buildingDensity=None, KPIs=None, potential=None, geometry=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+
+    id = EAttribute(eType=EString, unique=True, derived=False, changeable=True, iD=True)
+    name = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    scope = EAttribute(eType=AreaScopeEnum, unique=True, derived=False, changeable=True)
+    type = EAttribute(eType=AreaTypeEnum, unique=True, derived=False, changeable=True)
+    geometryReference = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    buildingDensity = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    socialProperties = EReference(ordered=True, unique=True, containment=True, derived=False)
+    economicProperties = EReference(ordered=True, unique=True, containment=True, derived=False)
+    asset = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
+    area = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
+    containingArea = EReference(ordered=True, unique=True, containment=False, derived=False)
+    isOwnedBy = EReference(ordered=True, unique=True, containment=False, derived=False)
+    mobilityProperties = EReference(ordered=True, unique=True, containment=True, derived=False)
+    KPIs = EReference(ordered=True, unique=True, containment=True, derived=False)
+    potential = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
+    geometry = EReference(ordered=True, unique=True, containment=True, derived=False)
+
+    def __init__(self, *, id=None, name=None, scope=None, type=None, geometryReference=None, buildingDensity=None, socialProperties=None, economicProperties=None, asset=None, area=None, containingArea=None, isOwnedBy=None, mobilityProperties=None, KPIs=None, potential=None, geometry=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -275,18 +274,18 @@ class Area(EObject, metaclass=MetaEClass):
 
 @abstract
 class Port(EObject, metaclass=MetaEClass):
-    """Ports allow connections between EnergyAssets. Ports can be connected to one or more other ports. There are two types of ports: InPort and OutPort, which defines the primary direction of positive energy flow. InPorts can only be connected to OutPorts and vice versa."""
-    id = EAttribute(eType=EString, derived=False, changeable=True, iD=True)
-    maxPower = EAttribute(eType=EDouble, derived=False, changeable=True)
-    simultaneousPower = EAttribute(eType=EDouble, derived=False, changeable=True)
-    name = EAttribute(eType=EString, derived=False, changeable=True)
-    energyasset = EReference(ordered=True, unique=True, containment=False)
-    profile = EReference(ordered=True, unique=True, containment=True)
-    carrier = EReference(ordered=True, unique=True, containment=False)
-
-    def __init__(self, *, id=None, maxPower=None, energyasset=None, profile=None, carrier=None, simultaneousPower=None, name=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+
+    id = EAttribute(eType=EString, unique=True, derived=False, changeable=True, iD=True)
+    maxPower = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    simultaneousPower = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    name = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    energyasset = EReference(ordered=True, unique=True, containment=False, derived=False)
+    profile = EReference(ordered=True, unique=True, containment=True, derived=False)
+    carrier = EReference(ordered=True, unique=True, containment=False, derived=False)
+
+    def __init__(self, *, id=None, maxPower=None, simultaneousPower=None, name=None, energyasset=None, profile=None, carrier=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -313,16 +312,18 @@ class Port(EObject, metaclass=MetaEClass):
 
 
 class EconomicProperties(EObject, metaclass=MetaEClass):
-    """(experimental) Can be used to define the economic properties of an area"""
-    averageIncome = EAttribute(eType=EDouble, derived=False, changeable=True)
-    averageWOZvalue = EAttribute(eType=EDouble, derived=False, changeable=True)
-    percentageOwnerOccupiedProperties = EAttribute(eType=EDouble, derived=False, changeable=True)
-    percentageHousingAssociation = EAttribute(eType=EDouble, derived=False, changeable=True)
-    percentagePrivateRental = EAttribute(eType=EDouble, derived=False, changeable=True)
 
-    def __init__(self, *, averageIncome=None, averageWOZvalue=None, percentageOwnerOccupiedProperties=None, percentageHousingAssociation=None, percentagePrivateRental=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    averageIncome = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    averageWOZvalue = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    percentageOwnerOccupiedProperties = EAttribute(
+        eType=EDouble, unique=True, derived=False, changeable=True)
+    percentageHousingAssociation = EAttribute(
+        eType=EDouble, unique=True, derived=False, changeable=True)
+    percentagePrivateRental = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+
+    def __init__(self, *, averageIncome=None, averageWOZvalue=None, percentageOwnerOccupiedProperties=None, percentageHousingAssociation=None, percentagePrivateRental=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -343,14 +344,14 @@ class EconomicProperties(EObject, metaclass=MetaEClass):
 
 
 class SocialProperties(EObject, metaclass=MetaEClass):
-    """(experimental) Can be used to define the social properties of an area"""
-    socialCohesion = EAttribute(eType=EDouble, derived=False, changeable=True)
-    populationDensity = EAttribute(eType=EInt, derived=False, changeable=True)
-    numberOfInhabitants = EAttribute(eType=EInt, derived=False, changeable=True)
 
-    def __init__(self, *, socialCohesion=None, populationDensity=None, numberOfInhabitants=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    socialCohesion = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    populationDensity = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    numberOfInhabitants = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+
+    def __init__(self, *, socialCohesion=None, populationDensity=None, numberOfInhabitants=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -366,19 +367,19 @@ class SocialProperties(EObject, metaclass=MetaEClass):
 
 @abstract
 class Item(EObject, metaclass=MetaEClass):
-    """Class describing an abstract thing in an energy system. It is the parent of many other classes in ESDL, such as Assets, Services and Potentials. Parties can own Items"""
-    id = EAttribute(eType=EString, derived=False, changeable=True, iD=True)
-    name = EAttribute(eType=EString, derived=False, changeable=True)
-    shortName = EAttribute(eType=EString, derived=False, changeable=True)
-    description = EAttribute(eType=EString, derived=False, changeable=True)
-    originalIdInSource = EAttribute(eType=EString, derived=False, changeable=True)
-    isOwnedBy = EReference(ordered=True, unique=True, containment=False)
-    dataSource = EReference(ordered=True, unique=True, containment=True)
-    sector = EReference(ordered=True, unique=True, containment=False)
-
-    def __init__(self, *, id=None, name=None, shortName=None, isOwnedBy=None, description=None, originalIdInSource=None, dataSource=None, sector=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+
+    id = EAttribute(eType=EString, unique=True, derived=False, changeable=True, iD=True)
+    name = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    shortName = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    description = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    originalIdInSource = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    isOwnedBy = EReference(ordered=True, unique=True, containment=False, derived=False)
+    dataSource = EReference(ordered=True, unique=True, containment=True, derived=False)
+    sector = EReference(ordered=True, unique=True, containment=False, derived=False)
+
+    def __init__(self, *, id=None, name=None, shortName=None, description=None, originalIdInSource=None, isOwnedBy=None, dataSource=None, sector=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -408,13 +409,14 @@ class Item(EObject, metaclass=MetaEClass):
 
 
 class Measures(EObject, metaclass=MetaEClass):
-    """Collection of measures that can be applied to an energy system"""
-    asset = EReference(ordered=True, unique=True, containment=True, upper=-1)
-    measuresCollection = EReference(ordered=True, unique=True, containment=True, upper=-1)
 
-    def __init__(self, *, asset=None, measuresCollection=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    asset = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
+    measuresCollection = EReference(ordered=True, unique=True,
+                                    containment=True, derived=False, upper=-1)
+
+    def __init__(self, *, asset=None, measuresCollection=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -426,19 +428,18 @@ class Measures(EObject, metaclass=MetaEClass):
 
 
 class Instance(EObject, metaclass=MetaEClass):
-    """Instances are used to represent different representations of the same EnergySystem. Most of the times only one Instance will be used. The primary use case for having more than one Instance is when you have different aggregations of the same EnergySystem in the same model (e.g. the same region on house level and aggregated on neighbourhood level). Another option would be to create different instances for different years (to describe the progress of the energy transition)."""
-    id = EAttribute(eType=EString, derived=False, changeable=True, iD=True)
-    name = EAttribute(eType=EString, derived=False, changeable=True)
-    description = EAttribute(eType=EString, derived=False, changeable=True)
-    detailLevel = EAttribute(eType=AreaScopeEnum, derived=False,
-                             changeable=True, default_value=AreaScopeEnum.UNDEFINED)
-    aggrType = EAttribute(eType=AggrTypeEnum, derived=False, changeable=True)
-    area = EReference(ordered=True, unique=True, containment=True)
-    date = EReference(ordered=True, unique=True, containment=True)
-
-    def __init__(self, *, id=None, name=None, description=None, detailLevel=None, aggrType=None, area=None, date=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+
+    id = EAttribute(eType=EString, unique=True, derived=False, changeable=True, iD=True)
+    name = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    description = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    detailLevel = EAttribute(eType=AreaScopeEnum, unique=True, derived=False, changeable=True)
+    aggrType = EAttribute(eType=AggrTypeEnum, unique=True, derived=False, changeable=True)
+    area = EReference(ordered=True, unique=True, containment=True, derived=False)
+    date = EReference(ordered=True, unique=True, containment=True, derived=False)
+
+    def __init__(self, *, id=None, name=None, description=None, detailLevel=None, aggrType=None, area=None, date=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -465,14 +466,14 @@ class Instance(EObject, metaclass=MetaEClass):
 
 
 class Carriers(EObject, metaclass=MetaEClass):
-    """Collection of carriers as part of the Energy System Information. Both energy carriers and commodities."""
-    id = EAttribute(eType=EString, derived=False, changeable=True, iD=True)
-    carrier = EReference(ordered=True, unique=True, containment=True, upper=-1)
-    dataSource = EReference(ordered=True, unique=True, containment=True)
 
-    def __init__(self, *, carrier=None, dataSource=None, id=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    id = EAttribute(eType=EString, unique=True, derived=False, changeable=True, iD=True)
+    carrier = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
+    dataSource = EReference(ordered=True, unique=True, containment=True, derived=False)
+
+    def __init__(self, *, id=None, carrier=None, dataSource=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -487,19 +488,20 @@ class Carriers(EObject, metaclass=MetaEClass):
 
 
 class EnergySystemInformation(EObject, metaclass=MetaEClass):
-    """Describes reusable information of the energy system, that other classes can refer to in this energy system, such as carriers, profiles, data sources, quantity and units."""
-    id = EAttribute(eType=EString, derived=False, changeable=True, iD=True)
-    carriers = EReference(ordered=True, unique=True, containment=True)
-    profiles = EReference(ordered=True, unique=True, containment=True)
-    dataSources = EReference(ordered=True, unique=True, containment=True)
-    mobilityFuelInformation = EReference(ordered=True, unique=True, containment=True)
-    quantityAndUnits = EReference(ordered=True, unique=True, containment=True)
-    sectors = EReference(ordered=True, unique=True, containment=True)
-    buildingUsageInformation = EReference(ordered=True, unique=True, containment=True)
-
-    def __init__(self, *, carriers=None, profiles=None, dataSources=None, mobilityFuelInformation=None, quantityAndUnits=None, sectors=None, id=None, buildingUsageInformation=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+
+    id = EAttribute(eType=EString, unique=True, derived=False, changeable=True, iD=True)
+    carriers = EReference(ordered=True, unique=True, containment=True, derived=False)
+    profiles = EReference(ordered=True, unique=True, containment=True, derived=False)
+    dataSources = EReference(ordered=True, unique=True, containment=True, derived=False)
+    mobilityFuelInformation = EReference(ordered=True, unique=True, containment=True, derived=False)
+    quantityAndUnits = EReference(ordered=True, unique=True, containment=True, derived=False)
+    sectors = EReference(ordered=True, unique=True, containment=True, derived=False)
+    buildingUsageInformation = EReference(
+        ordered=True, unique=True, containment=True, derived=False)
+
+    def __init__(self, *, id=None, carriers=None, profiles=None, dataSources=None, mobilityFuelInformation=None, quantityAndUnits=None, sectors=None, buildingUsageInformation=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -530,19 +532,18 @@ class EnergySystemInformation(EObject, metaclass=MetaEClass):
 
 @abstract
 class GenericProfile(EObject, metaclass=MetaEClass):
-    """All profiles should describe these fields: a name and a ProfileType. There are two different profile types: static, with static values stored in the ESDL model itself. And External, which allows you to refer to an externally defined profile (e.g. in an Energy Information System or a timeseries database)"""
-    name = EAttribute(eType=EString, derived=False, changeable=True)
-    profileType = EAttribute(eType=ProfileTypeEnum, derived=False,
-                             changeable=True, default_value=ProfileTypeEnum.UNDEFINED)
-    id = EAttribute(eType=EString, derived=False, changeable=True, iD=True)
-    interpolationMethod = EAttribute(eType=InterpolationMethodEnum, derived=False,
-                                     changeable=True, default_value=InterpolationMethodEnum.UNDEFINED)
-    dataSource = EReference(ordered=True, unique=True, containment=True)
-    profileQuantityAndUnit = EReference(ordered=True, unique=True, containment=True)
-
-    def __init__(self, *, name=None, profileType=None, id=None, dataSource=None, profileQuantityAndUnit=None, interpolationMethod=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+
+    name = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    profileType = EAttribute(eType=ProfileTypeEnum, unique=True, derived=False, changeable=True)
+    id = EAttribute(eType=EString, unique=True, derived=False, changeable=True, iD=True)
+    interpolationMethod = EAttribute(eType=InterpolationMethodEnum,
+                                     unique=True, derived=False, changeable=True)
+    dataSource = EReference(ordered=True, unique=True, containment=True, derived=False)
+    profileQuantityAndUnit = EReference(ordered=True, unique=True, containment=True, derived=False)
+
+    def __init__(self, *, name=None, profileType=None, id=None, interpolationMethod=None, dataSource=None, profileQuantityAndUnit=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -574,15 +575,14 @@ class GenericProfile(EObject, metaclass=MetaEClass):
 
 
 class ProfileElement(EObject, metaclass=MetaEClass):
-    """ProfileElement describes a single profile element describing a range and a value which is valid for this range. From-field is inclusive, To-field is exclusive, allowing you to describe ranges such as 1-1-2017T00:00:00.000 to 1-1-2018T00:00:00.000 instead of 31-12-2017T23:59:59:999. The to-field may be ommitted, meaning this value is valid for all time after the specified to-datetime.
-Examples: The heat demand of a municipality in 2013 is 20 PJ. The range you define is then from 1-1-2013T to 1-1-2014T and the value 20 and ProfileType ENERGY_IN_PJ"""
-    from_ = EAttribute(eType=EDate, derived=False, changeable=True)
-    to = EAttribute(eType=EDate, derived=False, changeable=True)
-    value = EAttribute(eType=EDouble, derived=False, changeable=True)
 
-    def __init__(self, *, from_=None, to=None, value=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    from_ = EAttribute(eType=EDate, unique=True, derived=False, changeable=True)
+    to = EAttribute(eType=EDate, unique=True, derived=False, changeable=True)
+    value = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+
+    def __init__(self, *, from_=None, to=None, value=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -598,12 +598,12 @@ Examples: The heat demand of a municipality in 2013 is 20 PJ. The range you defi
 
 @abstract
 class GenericDistribution(EObject, metaclass=MetaEClass):
-    """Abstract class to represent different types of distributions"""
-    name = EAttribute(eType=EString, derived=False, changeable=True)
 
-    def __init__(self, *, name=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    name = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+
+    def __init__(self, *, name=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -612,13 +612,13 @@ class GenericDistribution(EObject, metaclass=MetaEClass):
 
 
 class Percentile(EObject, metaclass=MetaEClass):
-    """Defines the percentile of a percentile distribution"""
-    percentile = EAttribute(eType=EInt, derived=False, changeable=True)
-    value = EAttribute(eType=EDouble, derived=False, changeable=True)
 
-    def __init__(self, *, percentile=None, value=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    percentile = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    value = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+
+    def __init__(self, *, percentile=None, value=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -630,16 +630,18 @@ class Percentile(EObject, metaclass=MetaEClass):
 
 
 class CostInformation(EObject, metaclass=MetaEClass):
-    """Describes the costs to acquire, install and maintain a certain asset."""
-    investmentCosts = EReference(ordered=True, unique=True, containment=True)
-    installationCosts = EReference(ordered=True, unique=True, containment=True)
-    fixedOperationalAndMaintenanceCosts = EReference(ordered=True, unique=True, containment=True)
-    marginalCosts = EReference(ordered=True, unique=True, containment=True)
-    variableOperationalAndMaintenanceCosts = EReference(ordered=True, unique=True, containment=True)
 
-    def __init__(self, *, investmentCosts=None, installationCosts=None, fixedOperationalAndMaintenanceCosts=None, marginalCosts=None, variableOperationalAndMaintenanceCosts=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    investmentCosts = EReference(ordered=True, unique=True, containment=True, derived=False)
+    installationCosts = EReference(ordered=True, unique=True, containment=True, derived=False)
+    fixedOperationalAndMaintenanceCosts = EReference(
+        ordered=True, unique=True, containment=True, derived=False)
+    marginalCosts = EReference(ordered=True, unique=True, containment=True, derived=False)
+    variableOperationalAndMaintenanceCosts = EReference(
+        ordered=True, unique=True, containment=True, derived=False)
+
+    def __init__(self, *, investmentCosts=None, installationCosts=None, fixedOperationalAndMaintenanceCosts=None, marginalCosts=None, variableOperationalAndMaintenanceCosts=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -660,13 +662,13 @@ class CostInformation(EObject, metaclass=MetaEClass):
 
 
 class StringPerc(EObject, metaclass=MetaEClass):
-    """Defines a label and a percentage, used in StringLabelDistribution"""
-    label = EAttribute(eType=EString, derived=False, changeable=True)
-    percentage = EAttribute(eType=EDouble, derived=False, changeable=True)
 
-    def __init__(self, *, label=None, percentage=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    label = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    percentage = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+
+    def __init__(self, *, label=None, percentage=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -678,13 +680,13 @@ class StringPerc(EObject, metaclass=MetaEClass):
 
 
 class EnergyLabelPerc(EObject, metaclass=MetaEClass):
-    """Defines an energy label and a percentage, used in EnergyLabelDistribution"""
-    energyLabel = EAttribute(eType=EnergyLabelEnum, derived=False, changeable=True)
-    percentage = EAttribute(eType=EDouble, derived=False, changeable=True)
 
-    def __init__(self, *, energyLabel=None, percentage=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    energyLabel = EAttribute(eType=EnergyLabelEnum, unique=True, derived=False, changeable=True)
+    percentage = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+
+    def __init__(self, *, energyLabel=None, percentage=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -696,14 +698,14 @@ class EnergyLabelPerc(EObject, metaclass=MetaEClass):
 
 
 class FromToPerc(EObject, metaclass=MetaEClass):
-    """Defines a range and a percentage, used in the FromToDistribution class"""
-    from_ = EAttribute(eType=EDouble, derived=False, changeable=True)
-    to = EAttribute(eType=EDouble, derived=False, changeable=True)
-    percentage = EAttribute(eType=EDouble, derived=False, changeable=True)
 
-    def __init__(self, *, from_=None, to=None, percentage=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    from_ = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    to = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    percentage = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+
+    def __init__(self, *, from_=None, to=None, percentage=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -718,13 +720,13 @@ class FromToPerc(EObject, metaclass=MetaEClass):
 
 
 class PItemStat(EObject, metaclass=MetaEClass):
-    """(experimental) Used to define statistical information"""
-    value = EAttribute(eType=EDouble, derived=False, changeable=True)
-    sigma = EAttribute(eType=EDouble, derived=False, changeable=True)
 
-    def __init__(self, *, value=None, sigma=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    value = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    sigma = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+
+    def __init__(self, *, value=None, sigma=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -737,27 +739,26 @@ class PItemStat(EObject, metaclass=MetaEClass):
 
 @abstract
 class AbstractVariance(EObject, metaclass=MetaEClass):
-    """(experimental) Used to define statistical information"""
 
-    def __init__(self, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
 
 class Party(EObject, metaclass=MetaEClass):
-    """Defines a stakeholder in the energy system, to represent ownership"""
-    id = EAttribute(eType=EString, derived=False, changeable=True, iD=True)
-    name = EAttribute(eType=EString, derived=False, changeable=True)
-    shortName = EAttribute(eType=EString, derived=False, changeable=True)
-    owns = EReference(ordered=True, unique=True, containment=False, upper=-1)
-    ownsArea = EReference(ordered=True, unique=True, containment=False, upper=-1)
-    sector = EReference(ordered=True, unique=True, containment=False)
-
-    def __init__(self, *, owns=None, id=None, name=None, shortName=None, ownsArea=None, sector=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+
+    id = EAttribute(eType=EString, unique=True, derived=False, changeable=True, iD=True)
+    name = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    shortName = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    owns = EReference(ordered=True, unique=True, containment=False, derived=False, upper=-1)
+    ownsArea = EReference(ordered=True, unique=True, containment=False, derived=False, upper=-1)
+    sector = EReference(ordered=True, unique=True, containment=False, derived=False)
+
+    def __init__(self, *, id=None, name=None, shortName=None, owns=None, ownsArea=None, sector=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -782,12 +783,12 @@ class Party(EObject, metaclass=MetaEClass):
 
 @abstract
 class Geometry(EObject, metaclass=MetaEClass):
-    """Abstract class to define the shape/location of an asset or area. Parent class of e.g. Point, Line and Polygon"""
-    CRS = EAttribute(eType=EString, derived=False, changeable=True)
 
-    def __init__(self, *, CRS=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    CRS = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+
+    def __init__(self, *, CRS=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -797,15 +798,15 @@ class Geometry(EObject, metaclass=MetaEClass):
 
 @abstract
 class Carrier(EObject, metaclass=MetaEClass):
-    """Abstract class to define the carrier of energy, e.g. a energy carrier or a commodity (such as electricity)"""
-    name = EAttribute(eType=EString, derived=False, changeable=True)
-    id = EAttribute(eType=EString, derived=False, changeable=True, iD=True)
-    cost = EReference(ordered=True, unique=True, containment=True)
-    dataSource = EReference(ordered=True, unique=True, containment=True)
 
-    def __init__(self, *, name=None, id=None, cost=None, dataSource=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    name = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    id = EAttribute(eType=EString, unique=True, derived=False, changeable=True, iD=True)
+    cost = EReference(ordered=True, unique=True, containment=True, derived=False)
+    dataSource = EReference(ordered=True, unique=True, containment=True, derived=False)
+
+    def __init__(self, *, name=None, id=None, cost=None, dataSource=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -823,14 +824,13 @@ class Carrier(EObject, metaclass=MetaEClass):
 
 
 class Duration(EObject, metaclass=MetaEClass):
-    """Defines the duration of a profile query"""
-    value = EAttribute(eType=ELong, derived=False, changeable=True)
-    durationUnit = EAttribute(eType=DurationUnitEnum, derived=False,
-                              changeable=True, default_value=DurationUnitEnum.SECOND)
 
-    def __init__(self, *, value=None, durationUnit=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    value = EAttribute(eType=ELong, unique=True, derived=False, changeable=True)
+    durationUnit = EAttribute(eType=DurationUnitEnum, unique=True, derived=False, changeable=True)
+
+    def __init__(self, *, value=None, durationUnit=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -842,12 +842,12 @@ class Duration(EObject, metaclass=MetaEClass):
 
 
 class Profiles(EObject, metaclass=MetaEClass):
-    """Container for profiles in the Energy System Information where other profiles can refer to"""
-    profile = EReference(ordered=True, unique=True, containment=True, upper=-1)
 
-    def __init__(self, *, profile=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    profile = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
+
+    def __init__(self, *, profile=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -857,11 +857,11 @@ class Profiles(EObject, metaclass=MetaEClass):
 
 class Parties(EObject, metaclass=MetaEClass):
 
-    party = EReference(ordered=True, unique=True, containment=True, upper=-1)
+    party = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
 
-    def __init__(self, *, party=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self, *, party=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -871,12 +871,12 @@ class Parties(EObject, metaclass=MetaEClass):
 
 class DataSources(EObject, metaclass=MetaEClass):
 
-    id = EAttribute(eType=EString, derived=False, changeable=True, iD=True)
-    dataSource = EReference(ordered=True, unique=True, containment=True, upper=-1)
+    id = EAttribute(eType=EString, unique=True, derived=False, changeable=True, iD=True)
+    dataSource = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
 
-    def __init__(self, *, dataSource=None, id=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self, *, id=None, dataSource=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -889,11 +889,11 @@ class DataSources(EObject, metaclass=MetaEClass):
 
 class SubPolygon(EObject, metaclass=MetaEClass):
 
-    point = EReference(ordered=True, unique=True, containment=True, upper=-1)
+    point = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
 
-    def __init__(self, *, point=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self, *, point=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -903,13 +903,14 @@ class SubPolygon(EObject, metaclass=MetaEClass):
 
 class MobilityFuelInformation(EObject, metaclass=MetaEClass):
 
-    id = EAttribute(eType=EString, derived=False, changeable=True, iD=True)
-    vehicleFuelEfficiency = EReference(ordered=True, unique=True, containment=True, upper=-1)
-    dataSource = EReference(ordered=True, unique=True, containment=True)
+    id = EAttribute(eType=EString, unique=True, derived=False, changeable=True, iD=True)
+    vehicleFuelEfficiency = EReference(ordered=True, unique=True,
+                                       containment=True, derived=False, upper=-1)
+    dataSource = EReference(ordered=True, unique=True, containment=True, derived=False)
 
-    def __init__(self, *, vehicleFuelEfficiency=None, dataSource=None, id=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self, *, id=None, vehicleFuelEfficiency=None, dataSource=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -925,13 +926,13 @@ class MobilityFuelInformation(EObject, metaclass=MetaEClass):
 
 class VehicleFuelEfficiency(EObject, metaclass=MetaEClass):
 
-    vehicleType = EAttribute(eType=VehicleTypeEnum, derived=False, changeable=True)
-    fuel = EAttribute(eType=MobilityFuelTypeEnum, derived=False, changeable=True)
-    efficiency = EAttribute(eType=EDouble, derived=False, changeable=True)
+    vehicleType = EAttribute(eType=VehicleTypeEnum, unique=True, derived=False, changeable=True)
+    fuel = EAttribute(eType=MobilityFuelTypeEnum, unique=True, derived=False, changeable=True)
+    efficiency = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
-    def __init__(self, *, vehicleType=None, fuel=None, efficiency=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self, *, vehicleType=None, fuel=None, efficiency=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -947,11 +948,11 @@ class VehicleFuelEfficiency(EObject, metaclass=MetaEClass):
 
 class MobilityProperties(EObject, metaclass=MetaEClass):
 
-    numberOfVehicles = EReference(ordered=True, unique=True, containment=True)
+    numberOfVehicles = EReference(ordered=True, unique=True, containment=True, derived=False)
 
-    def __init__(self, *, numberOfVehicles=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self, *, numberOfVehicles=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -961,11 +962,11 @@ class MobilityProperties(EObject, metaclass=MetaEClass):
 
 class NumberOfVehicles(EObject, metaclass=MetaEClass):
 
-    vehicleCount = EReference(ordered=True, unique=True, containment=True, upper=-1)
+    vehicleCount = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
 
-    def __init__(self, *, vehicleCount=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self, *, vehicleCount=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -975,12 +976,12 @@ class NumberOfVehicles(EObject, metaclass=MetaEClass):
 
 class VehicleCount(EObject, metaclass=MetaEClass):
 
-    type = EAttribute(eType=VehicleTypeEnum, derived=False, changeable=True)
-    count = EAttribute(eType=EInt, derived=False, changeable=True)
+    type = EAttribute(eType=VehicleTypeEnum, unique=True, derived=False, changeable=True)
+    count = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
 
-    def __init__(self, *, type=None, count=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self, *, type=None, count=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -993,11 +994,11 @@ class VehicleCount(EObject, metaclass=MetaEClass):
 
 class Services(EObject, metaclass=MetaEClass):
 
-    service = EReference(ordered=True, unique=True, containment=True, upper=-1)
+    service = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
 
-    def __init__(self, *, service=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self, *, service=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -1008,22 +1009,22 @@ class Services(EObject, metaclass=MetaEClass):
 @abstract
 class AbstractDataSource(EObject, metaclass=MetaEClass):
 
-    def __init__(self, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
 
 class KPIs(EObject, metaclass=MetaEClass):
 
-    id = EAttribute(eType=EString, derived=False, changeable=True)
-    description = EAttribute(eType=EString, derived=False, changeable=True)
-    kpi = EReference(ordered=True, unique=True, containment=True, upper=-1)
+    id = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    description = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    kpi = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
 
-    def __init__(self, *, kpi=None, id=None, description=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self, *, id=None, description=None, kpi=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -1039,14 +1040,14 @@ class KPIs(EObject, metaclass=MetaEClass):
 
 class KPI(EObject, metaclass=MetaEClass):
 
-    id = EAttribute(eType=EString, derived=False, changeable=True)
-    name = EAttribute(eType=EString, derived=False, changeable=True)
-    value = EAttribute(eType=EDouble, derived=False, changeable=True)
-    quantityAndUnit = EReference(ordered=True, unique=True, containment=True)
+    id = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    name = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    value = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    quantityAndUnit = EReference(ordered=True, unique=True, containment=True, derived=False)
 
-    def __init__(self, *, id=None, name=None, quantityAndUnit=None, value=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self, *, id=None, name=None, value=None, quantityAndUnit=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -1065,12 +1066,13 @@ class KPI(EObject, metaclass=MetaEClass):
 
 class QuantityAndUnits(EObject, metaclass=MetaEClass):
 
-    id = EAttribute(eType=EString, derived=False, changeable=True, iD=True)
-    quantityAndUnit = EReference(ordered=True, unique=True, containment=True, upper=-1)
+    id = EAttribute(eType=EString, unique=True, derived=False, changeable=True, iD=True)
+    quantityAndUnit = EReference(ordered=True, unique=True,
+                                 containment=True, derived=False, upper=-1)
 
-    def __init__(self, *, quantityAndUnit=None, id=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self, *, id=None, quantityAndUnit=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -1084,9 +1086,9 @@ class QuantityAndUnits(EObject, metaclass=MetaEClass):
 @abstract
 class AbstractQuantityAndUnit(EObject, metaclass=MetaEClass):
 
-    def __init__(self, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -1094,12 +1096,12 @@ class AbstractQuantityAndUnit(EObject, metaclass=MetaEClass):
 @abstract
 class Parameters(EObject, metaclass=MetaEClass):
 
-    name = EAttribute(eType=EString, derived=False, changeable=True)
-    parameterUnit = EReference(ordered=True, unique=True, containment=True)
+    name = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    parameterUnit = EReference(ordered=True, unique=True, containment=True, derived=False)
 
-    def __init__(self, *, name=None, parameterUnit=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self, *, name=None, parameterUnit=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -1112,16 +1114,16 @@ class Parameters(EObject, metaclass=MetaEClass):
 
 class MeasuresCollection(EObject, metaclass=MetaEClass):
 
-    id = EAttribute(eType=EString, derived=False, changeable=True, iD=True)
-    name = EAttribute(eType=EString, derived=False, changeable=True)
-    description = EAttribute(eType=EString, derived=False, changeable=True)
-    asset = EReference(ordered=True, unique=True, containment=True, upper=-1)
-    costInformation = EReference(ordered=True, unique=True, containment=True)
-    dataSource = EReference(ordered=True, unique=True, containment=True)
+    id = EAttribute(eType=EString, unique=True, derived=False, changeable=True, iD=True)
+    name = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    description = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    asset = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
+    costInformation = EReference(ordered=True, unique=True, containment=True, derived=False)
+    dataSource = EReference(ordered=True, unique=True, containment=True, derived=False)
 
-    def __init__(self, *, id=None, name=None, asset=None, costInformation=None, description=None, dataSource=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self, *, id=None, name=None, description=None, asset=None, costInformation=None, dataSource=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -1146,13 +1148,13 @@ class MeasuresCollection(EObject, metaclass=MetaEClass):
 
 class Sectors(EObject, metaclass=MetaEClass):
 
-    id = EAttribute(eType=EString, derived=False, changeable=True, iD=True)
-    sector = EReference(ordered=True, unique=True, containment=True, upper=-1)
-    dataSource = EReference(ordered=True, unique=True, containment=True)
+    id = EAttribute(eType=EString, unique=True, derived=False, changeable=True, iD=True)
+    sector = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
+    dataSource = EReference(ordered=True, unique=True, containment=True, derived=False)
 
-    def __init__(self, *, sector=None, dataSource=None, id=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self, *, id=None, sector=None, dataSource=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -1168,15 +1170,15 @@ class Sectors(EObject, metaclass=MetaEClass):
 
 class Sector(EObject, metaclass=MetaEClass):
 
-    id = EAttribute(eType=EString, derived=False, changeable=True, iD=True)
-    name = EAttribute(eType=EString, derived=False, changeable=True)
-    description = EAttribute(eType=EString, derived=False, changeable=True)
-    code = EAttribute(eType=EString, derived=False, changeable=True)
-    dataSource = EReference(ordered=True, unique=True, containment=True)
+    id = EAttribute(eType=EString, unique=True, derived=False, changeable=True, iD=True)
+    name = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    description = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    code = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    dataSource = EReference(ordered=True, unique=True, containment=True, derived=False)
 
-    def __init__(self, *, id=None, name=None, description=None, dataSource=None, code=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self, *, id=None, name=None, description=None, code=None, dataSource=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -1199,28 +1201,28 @@ class Sector(EObject, metaclass=MetaEClass):
 @abstract
 class AbstractInstanceDate(EObject, metaclass=MetaEClass):
 
-    def __init__(self, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
 
 class WeekSchedule(EObject, metaclass=MetaEClass):
 
-    mon = EReference(ordered=True, unique=True, containment=True)
-    tue = EReference(ordered=True, unique=True, containment=True)
-    wed = EReference(ordered=True, unique=True, containment=True)
-    thu = EReference(ordered=True, unique=True, containment=True)
-    fri = EReference(ordered=True, unique=True, containment=True)
-    sat = EReference(ordered=True, unique=True, containment=True)
-    sun = EReference(ordered=True, unique=True, containment=True)
-    weekdays = EReference(ordered=True, unique=True, containment=True)
-    weekenddays = EReference(ordered=True, unique=True, containment=True)
+    mon = EReference(ordered=True, unique=True, containment=True, derived=False)
+    tue = EReference(ordered=True, unique=True, containment=True, derived=False)
+    wed = EReference(ordered=True, unique=True, containment=True, derived=False)
+    thu = EReference(ordered=True, unique=True, containment=True, derived=False)
+    fri = EReference(ordered=True, unique=True, containment=True, derived=False)
+    sat = EReference(ordered=True, unique=True, containment=True, derived=False)
+    sun = EReference(ordered=True, unique=True, containment=True, derived=False)
+    weekdays = EReference(ordered=True, unique=True, containment=True, derived=False)
+    weekenddays = EReference(ordered=True, unique=True, containment=True, derived=False)
 
-    def __init__(self, *, mon=None, tue=None, wed=None, thu=None, fri=None, sat=None, sun=None, weekdays=None, weekenddays=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self, *, mon=None, tue=None, wed=None, thu=None, fri=None, sat=None, sun=None, weekdays=None, weekenddays=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -1254,11 +1256,11 @@ class WeekSchedule(EObject, metaclass=MetaEClass):
 
 class DaySchedule(EObject, metaclass=MetaEClass):
 
-    event = EReference(ordered=True, unique=True, containment=True, upper=-1)
+    event = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
 
-    def __init__(self, *, event=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self, *, event=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -1268,14 +1270,14 @@ class DaySchedule(EObject, metaclass=MetaEClass):
 
 class Event(EObject, metaclass=MetaEClass):
 
-    id = EAttribute(eType=EString, derived=False, changeable=True)
-    time = EAttribute(eType=EString, derived=False, changeable=True)
-    description = EAttribute(eType=EString, derived=False, changeable=True)
-    value = EAttribute(eType=EDouble, derived=False, changeable=True)
+    id = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    time = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    description = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    value = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
-    def __init__(self, *, id=None, time=None, description=None, value=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self, *, id=None, time=None, description=None, value=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -1295,30 +1297,30 @@ class Event(EObject, metaclass=MetaEClass):
 @abstract
 class AbstractBuildingUsage(EObject, metaclass=MetaEClass):
 
-    def __init__(self, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
 
 class NewEClass198(EObject, metaclass=MetaEClass):
 
-    def __init__(self, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
 
 class BuildingUsageInformation(EObject, metaclass=MetaEClass):
 
-    id = EAttribute(eType=EString, derived=False, changeable=True, iD=True)
-    buildingUsage = EReference(ordered=True, unique=True, containment=True, upper=-1)
+    id = EAttribute(eType=EString, unique=True, derived=False, changeable=True, iD=True)
+    buildingUsage = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
 
-    def __init__(self, *, buildingUsage=None, id=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self, *, id=None, buildingUsage=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -1331,12 +1333,12 @@ class BuildingUsageInformation(EObject, metaclass=MetaEClass):
 
 class BuildingTypePercentage(EObject, metaclass=MetaEClass):
 
-    buildingType = EAttribute(eType=BuildingTypeEnum, derived=False, changeable=True)
-    percentage = EAttribute(eType=EDouble, derived=False, changeable=True)
+    buildingType = EAttribute(eType=BuildingTypeEnum, unique=True, derived=False, changeable=True)
+    percentage = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
-    def __init__(self, *, buildingType=None, percentage=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self, *, buildingType=None, percentage=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -1350,12 +1352,12 @@ class BuildingTypePercentage(EObject, metaclass=MetaEClass):
 class ResidentialBuildingTypePercentage(EObject, metaclass=MetaEClass):
 
     residentialBuildingType = EAttribute(
-        eType=ResidentialBuildingTypeEnum, derived=False, changeable=True)
-    percentage = EAttribute(eType=EDouble, derived=False, changeable=True)
+        eType=ResidentialBuildingTypeEnum, unique=True, derived=False, changeable=True)
+    percentage = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
-    def __init__(self, *, residentialBuildingType=None, percentage=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self, *, residentialBuildingType=None, percentage=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -1368,12 +1370,12 @@ class ResidentialBuildingTypePercentage(EObject, metaclass=MetaEClass):
 
 class HousingTypePercentage(EObject, metaclass=MetaEClass):
 
-    housingType = EAttribute(eType=HousingTypeEnum, derived=False, changeable=True)
-    percentage = EAttribute(eType=EDouble, derived=False, changeable=True)
+    housingType = EAttribute(eType=HousingTypeEnum, unique=True, derived=False, changeable=True)
+    percentage = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
-    def __init__(self, *, housingType=None, percentage=None, **kwargs):
-        if kwargs:
-            raise AttributeError('unexpected arguments: {}'.format(kwargs))
+    def __init__(self, *, housingType=None, percentage=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
 
         super().__init__()
 
@@ -1384,9 +1386,27 @@ class HousingTypePercentage(EObject, metaclass=MetaEClass):
             self.percentage = percentage
 
 
+class StringItem(EObject, metaclass=MetaEClass):
+
+    label = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    value = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+
+    def __init__(self, *, label=None, value=None):
+        # if kwargs:
+        #    raise AttributeError('unexpected arguments: {}'.format(kwargs))
+
+        super().__init__()
+
+        if label is not None:
+            self.label = label
+
+        if value is not None:
+            self.value = value
+
+
 class InPort(Port):
-    """Represents a port with a positive energy direction into the asset, e.g. for a Consumer. See Port for more details"""
-    connectedTo = EReference(ordered=True, unique=True, containment=False, upper=-1)
+
+    connectedTo = EReference(ordered=True, unique=True, containment=False, derived=False, upper=-1)
 
     def __init__(self, *, connectedTo=None, **kwargs):
 
@@ -1397,8 +1417,8 @@ class InPort(Port):
 
 
 class OutPort(Port):
-    """Represents a port with a positive energy direction out of the asset, e.g. for a Producer. See Port for more details"""
-    connectedTo = EReference(ordered=True, unique=True, containment=False, upper=-1)
+
+    connectedTo = EReference(ordered=True, unique=True, containment=False, derived=False, upper=-1)
 
     def __init__(self, *, connectedTo=None, **kwargs):
 
@@ -1410,22 +1430,22 @@ class OutPort(Port):
 
 @abstract
 class Asset(Item):
-    """Assets are all physical thing in the EnergySystem. Assets can have a location, a geometry, commissioning and decommissioning dates, cost information (investment, installation and operation and maintenance costs)."""
-    surfaceArea = EAttribute(eType=EInt, derived=False, changeable=True)
-    commissioningDate = EAttribute(eType=EDate, derived=False, changeable=True)
-    decommissioningDate = EAttribute(eType=EDate, derived=False, changeable=True)
-    owner = EAttribute(eType=EString, derived=False, changeable=True)
-    technicalLifetime = EAttribute(eType=EDouble, derived=False, changeable=True)
-    aggregated = EAttribute(eType=EBoolean, derived=False, changeable=True)
-    aggregationCount = EAttribute(eType=EInt, derived=False, changeable=True, default_value=1)
-    installationDuration = EAttribute(eType=EDouble, derived=False, changeable=True)
-    area = EReference(ordered=True, unique=True, containment=False)
-    containingBuilding = EReference(ordered=True, unique=True, containment=False)
-    geometry = EReference(ordered=True, unique=True, containment=True)
-    costInformation = EReference(ordered=True, unique=True, containment=True)
-    KPIs = EReference(ordered=True, unique=True, containment=True)
 
-    def __init__(self, *, surfaceArea=None, commissioningDate=None, decommissioningDate=None, owner=None, area=None, containingBuilding=None, geometry=None, costInformation=None, technicalLifetime=None, aggregated=None, aggregationCount=None, installationDuration=None, KPIs=None, **kwargs):
+    surfaceArea = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    commissioningDate = EAttribute(eType=EDate, unique=True, derived=False, changeable=True)
+    decommissioningDate = EAttribute(eType=EDate, unique=True, derived=False, changeable=True)
+    owner = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    technicalLifetime = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    aggregated = EAttribute(eType=EBoolean, unique=True, derived=False, changeable=True)
+    aggregationCount = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    installationDuration = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    area = EReference(ordered=True, unique=True, containment=False, derived=False)
+    containingBuilding = EReference(ordered=True, unique=True, containment=False, derived=False)
+    geometry = EReference(ordered=True, unique=True, containment=True, derived=False)
+    costInformation = EReference(ordered=True, unique=True, containment=True, derived=False)
+    KPIs = EReference(ordered=True, unique=True, containment=True, derived=False)
+
+    def __init__(self, *, surfaceArea=None, commissioningDate=None, decommissioningDate=None, owner=None, technicalLifetime=None, aggregated=None, aggregationCount=None, installationDuration=None, area=None, containingBuilding=None, geometry=None, costInformation=None, KPIs=None, **kwargs):
 
         super().__init__(**kwargs)
 
@@ -1470,10 +1490,10 @@ class Asset(Item):
 
 
 class Point(Geometry):
-    """Describes a point geometry, which can be used for giving assets a location on a map"""
-    lat = EAttribute(eType=EDouble, derived=False, changeable=True)
-    lon = EAttribute(eType=EDouble, derived=False, changeable=True)
-    elevation = EAttribute(eType=EDouble, derived=False, changeable=True)
+
+    lat = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    lon = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    elevation = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, lat=None, lon=None, elevation=None, **kwargs):
 
@@ -1490,9 +1510,9 @@ class Point(Geometry):
 
 
 class Polygon(Geometry):
-    """Describes a polygon geometry, which can be used for defining the shape of an area or building"""
-    exterior = EReference(ordered=True, unique=True, containment=True)
-    interior = EReference(ordered=True, unique=True, containment=True, upper=-1)
+
+    exterior = EReference(ordered=True, unique=True, containment=True, derived=False)
+    interior = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
 
     def __init__(self, *, exterior=None, interior=None, **kwargs):
 
@@ -1507,7 +1527,6 @@ class Polygon(Geometry):
 
 @abstract
 class Service(Item):
-    """Abstract class to represent logical entities in the energy system, e.g. demand response services, energy markets, etc."""
 
     def __init__(self, **kwargs):
 
@@ -1516,14 +1535,14 @@ class Service(Item):
 
 @abstract
 class Potential(Item):
-    """Abstract class that represents energy potentials in an area, like wind potential, geothermal potential, residual heat source potential, etc."""
-    geometryReference = EAttribute(eType=EString, derived=False, changeable=True)
-    aggregated = EAttribute(eType=EBoolean, derived=False, changeable=True, default_value=False)
-    aggregationCount = EAttribute(eType=EInt, derived=False, changeable=True, default_value=1)
-    geometry = EReference(ordered=True, unique=True, containment=True)
-    quantityAndUnit = EReference(ordered=True, unique=True, containment=True)
 
-    def __init__(self, *, geometry=None, geometryReference=None, quantityAndUnit=None, aggregated=None, aggregationCount=None, **kwargs):
+    geometryReference = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    aggregated = EAttribute(eType=EBoolean, unique=True, derived=False, changeable=True)
+    aggregationCount = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    geometry = EReference(ordered=True, unique=True, containment=True, derived=False)
+    quantityAndUnit = EReference(ordered=True, unique=True, containment=True, derived=False)
+
+    def __init__(self, *, geometryReference=None, aggregated=None, aggregationCount=None, geometry=None, quantityAndUnit=None, **kwargs):
 
         super().__init__(**kwargs)
 
@@ -1544,13 +1563,14 @@ class Potential(Item):
 
 
 class EnergyCarrier(Carrier):
-    """Defines a carrier of energy with its emission and energy content properties"""
-    energyContent = EAttribute(eType=EDouble, derived=False, changeable=True, default_value=0.0)
-    emission = EAttribute(eType=EDouble, derived=False, changeable=True, default_value=0.0)
-    energyCarrierType = EAttribute(eType=RenewableTypeEnum, derived=False, changeable=True)
-    stateOfMatter = EAttribute(eType=StateOfMatterEnum, derived=False, changeable=True)
-    energyContentUnit = EReference(ordered=True, unique=True, containment=True)
-    emissionUnit = EReference(ordered=True, unique=True, containment=True)
+
+    energyContent = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    emission = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    energyCarrierType = EAttribute(eType=RenewableTypeEnum, unique=True,
+                                   derived=False, changeable=True)
+    stateOfMatter = EAttribute(eType=StateOfMatterEnum, unique=True, derived=False, changeable=True)
+    energyContentUnit = EReference(ordered=True, unique=True, containment=True, derived=False)
+    emissionUnit = EReference(ordered=True, unique=True, containment=True, derived=False)
 
     def __init__(self, *, energyContent=None, emission=None, energyCarrierType=None, stateOfMatter=None, energyContentUnit=None, emissionUnit=None, **kwargs):
 
@@ -1577,7 +1597,6 @@ class EnergyCarrier(Carrier):
 
 @abstract
 class StaticProfile(GenericProfile):
-    """Stores the profile in the ESDL model itself, in contrast with an external profile, which refers to an external source for a profile"""
 
     def __init__(self, **kwargs):
 
@@ -1586,9 +1605,8 @@ class StaticProfile(GenericProfile):
 
 @abstract
 class ExternalProfile(GenericProfile):
-    """ExternalProfile allows to refer to an externally defined profile. Common uses are a profile defined in a (timeseries) database such as InfluxDB.
-It allows you to specify a multiplier to scale the supplied external profile by a certain factor (e.g. when using NEDU profiles). Default the multiplier is '1'."""
-    multiplier = EAttribute(eType=EDouble, derived=False, changeable=True, default_value=1.0)
+
+    multiplier = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, multiplier=None, **kwargs):
 
@@ -1599,8 +1617,8 @@ It allows you to specify a multiplier to scale the supplied external profile by
 
 
 class PercentileDistribution(GenericDistribution):
-    """Defines a distribution in terms of percentiles"""
-    percentile = EReference(ordered=True, unique=True, containment=True, upper=-1)
+
+    percentile = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
 
     def __init__(self, *, percentile=None, **kwargs):
 
@@ -1612,7 +1630,6 @@ class PercentileDistribution(GenericDistribution):
 
 @abstract
 class LabelDistribution(GenericDistribution):
-    """Abstract class to define a distribution with labels"""
 
     def __init__(self, **kwargs):
 
@@ -1620,8 +1637,8 @@ class LabelDistribution(GenericDistribution):
 
 
 class SymetricVariance(AbstractVariance):
-    """(experimental) Used to define statistical information"""
-    sigma = EAttribute(eType=EDouble, derived=False, changeable=True)
+
+    sigma = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, sigma=None, **kwargs):
 
@@ -1632,9 +1649,9 @@ class SymetricVariance(AbstractVariance):
 
 
 class AssymetricVariance(AbstractVariance):
-    """(experimental) Used to define statistical information"""
-    sigmaMin = EAttribute(eType=EDouble, derived=False, changeable=True)
-    sigmaPlus = EAttribute(eType=EDouble, derived=False, changeable=True)
+
+    sigmaMin = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    sigmaPlus = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, sigmaMin=None, sigmaPlus=None, **kwargs):
 
@@ -1648,11 +1665,11 @@ class AssymetricVariance(AbstractVariance):
 
 
 class DoubleAssymetricVariance(AbstractVariance):
-    """(experimental) Used to define statistical information"""
-    plus34perc = EAttribute(eType=EDouble, derived=False, changeable=True)
-    plus48perc = EAttribute(eType=EDouble, derived=False, changeable=True)
-    min34perc = EAttribute(eType=EDouble, derived=False, changeable=True)
-    min48perc = EAttribute(eType=EDouble, derived=False, changeable=True)
+
+    plus34perc = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    plus48perc = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    min34perc = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    min48perc = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, plus34perc=None, plus48perc=None, min34perc=None, min48perc=None, **kwargs):
 
@@ -1672,8 +1689,8 @@ class DoubleAssymetricVariance(AbstractVariance):
 
 
 class Line(Geometry):
-    """Describes a line geometry based on a list of points, which can be used to define the shape of pipes and cables"""
-    point = EReference(ordered=True, unique=True, containment=True, upper=-1)
+
+    point = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
 
     def __init__(self, *, point=None, **kwargs):
 
@@ -1685,7 +1702,6 @@ class Line(Geometry):
 
 @abstract
 class Commodity(Carrier):
-    """Abstract class for commodities"""
 
     def __init__(self, **kwargs):
 
@@ -1694,14 +1710,14 @@ class Commodity(Carrier):
 
 class DataSource(AbstractDataSource):
 
-    id = EAttribute(eType=EString, derived=False, changeable=True, iD=True)
-    name = EAttribute(eType=EString, derived=False, changeable=True)
-    description = EAttribute(eType=EString, derived=False, changeable=True)
-    reference = EAttribute(eType=EString, derived=False, changeable=True)
-    attribution = EAttribute(eType=EString, derived=False, changeable=True)
-    releaseDate = EAttribute(eType=EDate, derived=False, changeable=True)
-    version = EAttribute(eType=EString, derived=False, changeable=True)
-    licence = EAttribute(eType=EString, derived=False, changeable=True)
+    id = EAttribute(eType=EString, unique=True, derived=False, changeable=True, iD=True)
+    name = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    description = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    reference = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    attribution = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    releaseDate = EAttribute(eType=EDate, unique=True, derived=False, changeable=True)
+    version = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    licence = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, id=None, name=None, description=None, reference=None, attribution=None, releaseDate=None, version=None, licence=None, **kwargs):
 
@@ -1734,7 +1750,7 @@ class DataSource(AbstractDataSource):
 
 class MultiPolygon(Geometry):
 
-    polygon = EReference(ordered=True, unique=True, containment=True, upper=-1)
+    polygon = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
 
     def __init__(self, *, polygon=None, **kwargs):
 
@@ -1746,14 +1762,15 @@ class MultiPolygon(Geometry):
 
 class QuantityAndUnitType(AbstractQuantityAndUnit):
 
-    physicalQuantity = EAttribute(eType=PhysicalQuantityEnum, derived=False, changeable=True)
-    multiplier = EAttribute(eType=MultiplierEnum, derived=False, changeable=True)
-    unit = EAttribute(eType=UnitEnum, derived=False, changeable=True)
-    perMultiplier = EAttribute(eType=MultiplierEnum, derived=False, changeable=True)
-    perUnit = EAttribute(eType=UnitEnum, derived=False, changeable=True)
-    description = EAttribute(eType=EString, derived=False, changeable=True)
-    perTimeUnit = EAttribute(eType=TimeUnit, derived=False, changeable=True)
-    id = EAttribute(eType=EString, derived=False, changeable=True, iD=True)
+    physicalQuantity = EAttribute(eType=PhysicalQuantityEnum,
+                                  unique=True, derived=False, changeable=True)
+    multiplier = EAttribute(eType=MultiplierEnum, unique=True, derived=False, changeable=True)
+    unit = EAttribute(eType=UnitEnum, unique=True, derived=False, changeable=True)
+    perMultiplier = EAttribute(eType=MultiplierEnum, unique=True, derived=False, changeable=True)
+    perUnit = EAttribute(eType=UnitEnum, unique=True, derived=False, changeable=True)
+    description = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    perTimeUnit = EAttribute(eType=TimeUnit, unique=True, derived=False, changeable=True)
+    id = EAttribute(eType=EString, unique=True, derived=False, changeable=True, iD=True)
 
     def __init__(self, *, physicalQuantity=None, multiplier=None, unit=None, perMultiplier=None, perUnit=None, description=None, perTimeUnit=None, id=None, **kwargs):
 
@@ -1786,7 +1803,7 @@ class QuantityAndUnitType(AbstractQuantityAndUnit):
 
 class DataSourceReference(AbstractDataSource):
 
-    reference = EReference(ordered=True, unique=True, containment=False)
+    reference = EReference(ordered=True, unique=True, containment=False, derived=False)
 
     def __init__(self, *, reference=None, **kwargs):
 
@@ -1798,7 +1815,7 @@ class DataSourceReference(AbstractDataSource):
 
 class QuantityAndUnitReference(AbstractQuantityAndUnit):
 
-    reference = EReference(ordered=True, unique=True, containment=False)
+    reference = EReference(ordered=True, unique=True, containment=False, derived=False)
 
     def __init__(self, *, reference=None, **kwargs):
 
@@ -1810,7 +1827,7 @@ class QuantityAndUnitReference(AbstractQuantityAndUnit):
 
 class StringParameter(Parameters):
 
-    value = EAttribute(eType=EString, derived=False, changeable=True)
+    value = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, value=None, **kwargs):
 
@@ -1822,7 +1839,7 @@ class StringParameter(Parameters):
 
 class DoubleParameter(Parameters):
 
-    value = EAttribute(eType=EDouble, derived=False, changeable=True)
+    value = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, value=None, **kwargs):
 
@@ -1834,7 +1851,7 @@ class DoubleParameter(Parameters):
 
 class IntegerParameter(Parameters):
 
-    value = EAttribute(eType=EInt, derived=False, changeable=True)
+    value = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, value=None, **kwargs):
 
@@ -1846,7 +1863,7 @@ class IntegerParameter(Parameters):
 
 class BooleanParameter(Parameters):
 
-    value = EAttribute(eType=EBoolean, derived=False, changeable=True)
+    value = EAttribute(eType=EBoolean, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, value=None, **kwargs):
 
@@ -1858,7 +1875,7 @@ class BooleanParameter(Parameters):
 
 class MultiLine(Geometry):
 
-    line = EReference(ordered=True, unique=True, containment=True, upper=-1)
+    line = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
 
     def __init__(self, *, line=None, **kwargs):
 
@@ -1870,7 +1887,7 @@ class MultiLine(Geometry):
 
 class InstanceDate(AbstractInstanceDate):
 
-    date = EAttribute(eType=EDate, derived=False, changeable=True)
+    date = EAttribute(eType=EDate, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, date=None, **kwargs):
 
@@ -1882,8 +1899,8 @@ class InstanceDate(AbstractInstanceDate):
 
 class InstancePeriod(AbstractInstanceDate):
 
-    fromDate = EAttribute(eType=EDate, derived=False, changeable=True)
-    toDate = EAttribute(eType=EDate, derived=False, changeable=True)
+    fromDate = EAttribute(eType=EDate, unique=True, derived=False, changeable=True)
+    toDate = EAttribute(eType=EDate, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, fromDate=None, toDate=None, **kwargs):
 
@@ -1897,8 +1914,8 @@ class InstancePeriod(AbstractInstanceDate):
 
 
 class WKT(Geometry):
-    """Well-Known Text (see https://en.wikipedia.org/wiki/Well-known_text)"""
-    value = EAttribute(eType=EString, derived=False, changeable=True)
+
+    value = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, value=None, **kwargs):
 
@@ -1909,8 +1926,8 @@ class WKT(Geometry):
 
 
 class WKB(Geometry):
-    """Well-Known Binary (See https://en.wikipedia.org/wiki/Well-known_text#Well-known_binary)"""
-    value = EAttribute(eType=EString, derived=False, changeable=True)
+
+    value = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, value=None, **kwargs):
 
@@ -1922,11 +1939,11 @@ class WKB(Geometry):
 
 class BuildingUsage(AbstractBuildingUsage):
 
-    id = EAttribute(eType=EString, derived=False, changeable=True, iD=True)
-    name = EAttribute(eType=EString, derived=False, changeable=True)
-    coolingSetpoints = EReference(ordered=True, unique=True, containment=True)
-    heatingSetpoints = EReference(ordered=True, unique=True, containment=True)
-    openingHours = EReference(ordered=True, unique=True, containment=True)
+    id = EAttribute(eType=EString, unique=True, derived=False, changeable=True, iD=True)
+    name = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    coolingSetpoints = EReference(ordered=True, unique=True, containment=True, derived=False)
+    heatingSetpoints = EReference(ordered=True, unique=True, containment=True, derived=False)
+    openingHours = EReference(ordered=True, unique=True, containment=True, derived=False)
 
     def __init__(self, *, id=None, name=None, coolingSetpoints=None, heatingSetpoints=None, openingHours=None, **kwargs):
 
@@ -1950,7 +1967,7 @@ class BuildingUsage(AbstractBuildingUsage):
 
 class BuildingUsageReference(AbstractBuildingUsage):
 
-    reference = EReference(ordered=True, unique=True, containment=False)
+    reference = EReference(ordered=True, unique=True, containment=False, derived=False)
 
     def __init__(self, *, reference=None, **kwargs):
 
@@ -1960,11 +1977,30 @@ class BuildingUsageReference(AbstractBuildingUsage):
             self.reference = reference
 
 
+class DoubleKPI(KPI):
+
+    def __init__(self, **kwargs):
+
+        super().__init__(**kwargs)
+
+
+class DistributionKPI(KPI):
+
+    distribution = EReference(ordered=True, unique=True, containment=True, derived=False)
+
+    def __init__(self, *, distribution=None, **kwargs):
+
+        super().__init__(**kwargs)
+
+        if distribution is not None:
+            self.distribution = distribution
+
+
 @abstract
 class EnergyAsset(Asset):
-    """An abstract class that describes a connectable Asset using ports. EnergyAssets main subclasses contain the 5 capability type: Producer, Consumer, Storage, Conversion and Transport """
-    port = EReference(ordered=True, unique=True, containment=True, upper=-1)
-    controlStrategy = EReference(ordered=True, unique=True, containment=False)
+
+    port = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
+    controlStrategy = EReference(ordered=True, unique=True, containment=False, derived=False)
 
     def __init__(self, *, port=None, controlStrategy=None, **kwargs):
 
@@ -1978,8 +2014,8 @@ class EnergyAsset(Asset):
 
 
 class Insulation(Asset):
-    """Describes insulation that can be added to a building. The relation with the heat consumption is not defined and requires manual modelling"""
-    thermalInsulation = EAttribute(eType=EDouble, derived=False, changeable=True)
+
+    thermalInsulation = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, thermalInsulation=None, **kwargs):
 
@@ -1990,8 +2026,8 @@ class Insulation(Asset):
 
 
 class LegalArea(Potential):
-    """Used to define an area in which its purpose is defined by legal authorities, such as restricted areas. E.g. in areas where water is extracted, it is not allowed to plan new UTES."""
-    purpose = EAttribute(eType=EString, derived=False, changeable=True)
+
+    purpose = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, purpose=None, **kwargs):
 
@@ -2003,7 +2039,6 @@ class LegalArea(Potential):
 
 @abstract
 class EnergyService(Service):
-    """Abstract class to represent logical entities in the energy system, e.g. demand response services, energy markets, etc."""
 
     def __init__(self, **kwargs):
 
@@ -2012,13 +2047,13 @@ class EnergyService(Service):
 
 @abstract
 class AbstractBuilding(Asset):
-    """Describes the shared properties of building, building unit and aggregated building"""
-    energyLabel = EAttribute(eType=EnergyLabelEnum, derived=False, changeable=True)
-    energyIndex = EAttribute(eType=EDouble, derived=False, changeable=True)
-    asset = EReference(ordered=True, unique=True, containment=True, upper=-1)
-    buildingUsage = EReference(ordered=True, unique=True, containment=True)
 
-    def __init__(self, *, energyLabel=None, asset=None, energyIndex=None, buildingUsage=None, **kwargs):
+    energyLabel = EAttribute(eType=EnergyLabelEnum, unique=True, derived=False, changeable=True)
+    energyIndex = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    asset = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
+    buildingUsage = EReference(ordered=True, unique=True, containment=True, derived=False)
+
+    def __init__(self, *, energyLabel=None, energyIndex=None, asset=None, buildingUsage=None, **kwargs):
 
         super().__init__(**kwargs)
 
@@ -2036,9 +2071,9 @@ class AbstractBuilding(Asset):
 
 
 class WindPotential(Potential):
-    """Represents wind potential"""
-    value = EAttribute(eType=EDouble, derived=False, changeable=True)
-    height = EAttribute(eType=EInt, derived=False, changeable=True)
+
+    value = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    height = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, value=None, height=None, **kwargs):
 
@@ -2052,8 +2087,8 @@ class WindPotential(Potential):
 
 
 class DateTimeProfile(StaticProfile):
-    """Describes a profile using one or more Profile elements. Each element defines a from- and a to-datetime and a value which is valid for this range. The to-field may be ommitted, meaning this value is valid for all time after the to-date."""
-    element = EReference(ordered=True, unique=True, containment=True, upper=-1)
+
+    element = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
 
     def __init__(self, *, element=None, **kwargs):
 
@@ -2064,9 +2099,8 @@ class DateTimeProfile(StaticProfile):
 
 
 class SingleValue(StaticProfile):
-    """A profile used to define a single value. This should be used when no information is present about the time. E.g. the price of a PV panel as currently known
-When a model queries for a value from a certain date (and to a certain date), that information will be ignored and it will always return this value."""
-    value = EAttribute(eType=EDouble, derived=False, changeable=True)
+
+    value = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, value=None, **kwargs):
 
@@ -2077,20 +2111,24 @@ When a model queries for a value from a certain date (and to a certain date), th
 
 
 class StringLabelDistribution(LabelDistribution):
-    """Defines a distribution in terms of self-defined labels"""
-    stringPerc = EReference(ordered=True, unique=True, containment=True, upper=-1)
 
-    def __init__(self, *, stringPerc=None, **kwargs):
+    stringPerc = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
+    stringItem = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
+
+    def __init__(self, *, stringPerc=None, stringItem=None, **kwargs):
 
         super().__init__(**kwargs)
 
         if stringPerc:
             self.stringPerc.extend(stringPerc)
 
+        if stringItem:
+            self.stringItem.extend(stringItem)
+
 
 class EnergyLabelDistribution(LabelDistribution):
-    """Defines a distribution in terms of energy labels"""
-    labelPerc = EReference(ordered=True, unique=True, containment=True, upper=-1)
+
+    labelPerc = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
 
     def __init__(self, *, labelPerc=None, **kwargs):
 
@@ -2101,8 +2139,8 @@ class EnergyLabelDistribution(LabelDistribution):
 
 
 class FromToDistribution(LabelDistribution):
-    """Defines a distribution in terms of 'from' and 'to'"""
-    fromToPerc = EReference(ordered=True, unique=True, containment=True, upper=-1)
+
+    fromToPerc = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
 
     def __init__(self, *, fromToPerc=None, **kwargs):
 
@@ -2113,8 +2151,8 @@ class FromToDistribution(LabelDistribution):
 
 
 class URIProfile(ExternalProfile):
-    """Describes a reference to a profile in an information system using a URI (e.g. a URI to a profile in Energy Information System (EIS))"""
-    URI = EAttribute(eType=EString, derived=False, changeable=True)
+
+    URI = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, URI=None, **kwargs):
 
@@ -2126,11 +2164,11 @@ class URIProfile(ExternalProfile):
 
 @abstract
 class DatabaseProfile(ExternalProfile):
-    """Describes the fields of a generic database-based profile"""
-    host = EAttribute(eType=EString, derived=False, changeable=True)
-    port = EAttribute(eType=EInt, derived=False, changeable=True)
-    database = EAttribute(eType=EString, derived=False, changeable=True)
-    filters = EAttribute(eType=EString, derived=False, changeable=True)
+
+    host = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    port = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    database = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    filters = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, host=None, port=None, database=None, filters=None, **kwargs):
 
@@ -2150,8 +2188,8 @@ class DatabaseProfile(ExternalProfile):
 
 
 class GasCommodity(Commodity):
-    """Defines a gas commodity. This class can be used as an abstract way of modelling gas commodity and can be used in conjunction with electricity commodity and heat commodity. If more detailed modelling is necessary, use energy carriers."""
-    pressure = EAttribute(eType=EDouble, derived=False, changeable=True)
+
+    pressure = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, pressure=None, **kwargs):
 
@@ -2162,9 +2200,9 @@ class GasCommodity(Commodity):
 
 
 class HeatCommodity(Commodity):
-    """Defines a heat commodity"""
-    supplyTemperature = EAttribute(eType=EDouble, derived=False, changeable=True, default_value=0.0)
-    returnTemperature = EAttribute(eType=EDouble, derived=False, changeable=True)
+
+    supplyTemperature = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    returnTemperature = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, supplyTemperature=None, returnTemperature=None, **kwargs):
 
@@ -2178,8 +2216,8 @@ class HeatCommodity(Commodity):
 
 
 class ElectricityCommodity(Commodity):
-    """Defines a electricity commodity"""
-    voltage = EAttribute(eType=EDouble, derived=False, changeable=True)
+
+    voltage = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, voltage=None, **kwargs):
 
@@ -2190,9 +2228,9 @@ class ElectricityCommodity(Commodity):
 
 
 class Range(StaticProfile):
-    """Defines a range between two values"""
-    minValue = EAttribute(eType=EDouble, derived=False, changeable=True)
-    maxValue = EAttribute(eType=EDouble, derived=False, changeable=True)
+
+    minValue = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    maxValue = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, minValue=None, maxValue=None, **kwargs):
 
@@ -2206,11 +2244,12 @@ class Range(StaticProfile):
 
 
 class SolarPotential(Potential):
-    """Defines the potential for solar energy"""
-    value = EAttribute(eType=EDouble, derived=False, changeable=True, default_value=0.0)
-    SolarPotentialType = EAttribute(eType=PVInstallationTypeEnum, derived=False, changeable=True)
-    fullLoadHours = EAttribute(eType=EInt, derived=False, changeable=True)
-    area = EAttribute(eType=EDouble, derived=False, changeable=True)
+
+    value = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    SolarPotentialType = EAttribute(eType=PVInstallationTypeEnum,
+                                    unique=True, derived=False, changeable=True)
+    fullLoadHours = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    area = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, value=None, SolarPotentialType=None, fullLoadHours=None, area=None, **kwargs):
 
@@ -2230,9 +2269,9 @@ class SolarPotential(Potential):
 
 
 class ProfileReference(StaticProfile):
-    """Used to refer to profiles defined in the Energy System Information section"""
-    multiplier = EAttribute(eType=EDouble, derived=False, changeable=True, default_value=1.0)
-    reference = EReference(ordered=True, unique=True, containment=False)
+
+    multiplier = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    reference = EReference(ordered=True, unique=True, containment=False, derived=False)
 
     def __init__(self, *, multiplier=None, reference=None, **kwargs):
 
@@ -2247,10 +2286,11 @@ class ProfileReference(StaticProfile):
 
 class ResidualHeatSourcePotential(Potential):
 
-    value = EAttribute(eType=EDouble, derived=False, changeable=True, default_value=0.0)
-    type = EAttribute(eType=ResidualHeatSourceTypeEnum, derived=False, changeable=True)
-    associatedConversionAsset = EReference(ordered=True, unique=True, containment=False)
-    residualHeatSource = EReference(ordered=True, unique=True, containment=False)
+    value = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    type = EAttribute(eType=ResidualHeatSourceTypeEnum, unique=True, derived=False, changeable=True)
+    associatedConversionAsset = EReference(
+        ordered=True, unique=True, containment=False, derived=False)
+    residualHeatSource = EReference(ordered=True, unique=True, containment=False, derived=False)
 
     def __init__(self, *, value=None, type=None, associatedConversionAsset=None, residualHeatSource=None, **kwargs):
 
@@ -2279,7 +2319,8 @@ class EnergyCommodity(Commodity):
 @abstract
 class AbstractGTPotential(Potential):
 
-    geothermalSource = EReference(ordered=True, unique=True, containment=False, upper=-1)
+    geothermalSource = EReference(ordered=True, unique=True,
+                                  containment=False, derived=False, upper=-1)
 
     def __init__(self, *, geothermalSource=None, **kwargs):
 
@@ -2291,9 +2332,9 @@ class AbstractGTPotential(Potential):
 
 class UTESPotential(Potential):
 
-    value = EAttribute(eType=EDouble, derived=False, changeable=True)
-    type = EAttribute(eType=UTESPotentialTypeEnum, derived=False, changeable=True)
-    UTES = EReference(ordered=True, unique=True, containment=False, upper=-1)
+    value = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    type = EAttribute(eType=UTESPotentialTypeEnum, unique=True, derived=False, changeable=True)
+    UTES = EReference(ordered=True, unique=True, containment=False, derived=False, upper=-1)
 
     def __init__(self, *, value=None, type=None, UTES=None, **kwargs):
 
@@ -2311,7 +2352,7 @@ class UTESPotential(Potential):
 
 class BiomassPotential(Potential):
 
-    value = EAttribute(eType=EDouble, derived=False, changeable=True, default_value=0.0)
+    value = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, value=None, **kwargs):
 
@@ -2323,9 +2364,8 @@ class BiomassPotential(Potential):
 
 class Glass(Asset):
 
-    uWindow = EAttribute(eType=EDouble, derived=False, changeable=True)
-    glasType = EAttribute(eType=GlassTypeEnum, derived=False, changeable=True,
-                          default_value=GlassTypeEnum.UNDEFINED)
+    uWindow = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    glasType = EAttribute(eType=GlassTypeEnum, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, uWindow=None, glasType=None, **kwargs):
 
@@ -2340,8 +2380,8 @@ class Glass(Asset):
 
 class SearchAreaWind(Potential):
 
-    fullLoadHours = EAttribute(eType=EInt, derived=False, changeable=True)
-    area = EAttribute(eType=EDouble, derived=False, changeable=True)
+    fullLoadHours = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    area = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, fullLoadHours=None, area=None, **kwargs):
 
@@ -2356,8 +2396,8 @@ class SearchAreaWind(Potential):
 
 class SearchAreaSolar(Potential):
 
-    fullLoadHours = EAttribute(eType=EInt, derived=False, changeable=True)
-    area = EAttribute(eType=EDouble, derived=False, changeable=True)
+    fullLoadHours = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    area = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, fullLoadHours=None, area=None, **kwargs):
 
@@ -2372,7 +2412,8 @@ class SearchAreaSolar(Potential):
 
 class BuildingTypeDistribution(LabelDistribution):
 
-    buildingTypePercentage = EReference(ordered=True, unique=True, containment=True, upper=-1)
+    buildingTypePercentage = EReference(
+        ordered=True, unique=True, containment=True, derived=False, upper=-1)
 
     def __init__(self, *, buildingTypePercentage=None, **kwargs):
 
@@ -2385,7 +2426,7 @@ class BuildingTypeDistribution(LabelDistribution):
 class ResidentialBuildingTypeDistribution(LabelDistribution):
 
     residentialBuildingTypePercentage = EReference(
-        ordered=True, unique=True, containment=True, upper=-1)
+        ordered=True, unique=True, containment=True, derived=False, upper=-1)
 
     def __init__(self, *, residentialBuildingTypePercentage=None, **kwargs):
 
@@ -2397,7 +2438,8 @@ class ResidentialBuildingTypeDistribution(LabelDistribution):
 
 class HousingTypeDistribution(LabelDistribution):
 
-    housingTypePercentage = EReference(ordered=True, unique=True, containment=True, upper=-1)
+    housingTypePercentage = EReference(ordered=True, unique=True,
+                                       containment=True, derived=False, upper=-1)
 
     def __init__(self, *, housingTypePercentage=None, **kwargs):
 
@@ -2409,12 +2451,11 @@ class HousingTypeDistribution(LabelDistribution):
 
 @abstract
 class Producer(EnergyAsset):
-    """An abstract class that describes EnergyAssets that can produce energy. It is one of the 5 capabilities in ESDL"""
-    prodType = EAttribute(eType=RenewableTypeEnum, derived=False,
-                          changeable=True, default_value=RenewableTypeEnum.RENEWABLE)
-    operationalHours = EAttribute(eType=EInt, derived=False, changeable=True)
-    fullLoadHours = EAttribute(eType=EInt, derived=False, changeable=True)
-    power = EAttribute(eType=EDouble, derived=False, changeable=True)
+
+    prodType = EAttribute(eType=RenewableTypeEnum, unique=True, derived=False, changeable=True)
+    operationalHours = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    fullLoadHours = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    power = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, prodType=None, operationalHours=None, fullLoadHours=None, power=None, **kwargs):
 
@@ -2435,10 +2476,9 @@ class Producer(EnergyAsset):
 
 @abstract
 class Consumer(EnergyAsset):
-    """An abstract class that describes EnergyAssets that can consume energy. It is one of the 5 capabilities in ESDL"""
-    consType = EAttribute(eType=ConsTypeEnum, derived=False, changeable=True,
-                          default_value=ConsTypeEnum.PRIMARY)
-    power = EAttribute(eType=EDouble, derived=False, changeable=True)
+
+    consType = EAttribute(eType=ConsTypeEnum, unique=True, derived=False, changeable=True)
+    power = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, consType=None, power=None, **kwargs):
 
@@ -2453,18 +2493,17 @@ class Consumer(EnergyAsset):
 
 @abstract
 class Storage(EnergyAsset):
-    """An abstract class that describes EnergyAssets that can store energy. It is one of the 5 capabilities in ESDL"""
-    capacity = EAttribute(eType=EDouble, derived=False, changeable=True)
-    chargeEfficiency = EAttribute(eType=EDouble, derived=False, changeable=True, default_value=0.0)
-    dischargeEfficiency = EAttribute(eType=EDouble, derived=False,
-                                     changeable=True, default_value=0.0)
-    selfDischargeRate = EAttribute(eType=EDouble, derived=False, changeable=True, default_value=0.0)
-    fillLevel = EAttribute(eType=EDouble, derived=False, changeable=True)
-    maxChargeRate = EAttribute(eType=EDouble, derived=False, changeable=True, default_value=0.0)
-    maxDischargeRate = EAttribute(eType=EDouble, derived=False, changeable=True, default_value=0.0)
-    profile = EReference(ordered=True, unique=True, containment=True)
 
-    def __init__(self, *, capacity=None, chargeEfficiency=None, profile=None, dischargeEfficiency=None, selfDischargeRate=None, fillLevel=None, maxChargeRate=None, maxDischargeRate=None, **kwargs):
+    capacity = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    chargeEfficiency = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    dischargeEfficiency = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    selfDischargeRate = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    fillLevel = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    maxChargeRate = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    maxDischargeRate = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    profile = EReference(ordered=True, unique=True, containment=True, derived=False)
+
+    def __init__(self, *, capacity=None, chargeEfficiency=None, dischargeEfficiency=None, selfDischargeRate=None, fillLevel=None, maxChargeRate=None, maxDischargeRate=None, profile=None, **kwargs):
 
         super().__init__(**kwargs)
 
@@ -2495,12 +2534,13 @@ class Storage(EnergyAsset):
 
 @abstract
 class Conversion(EnergyAsset):
-    """An abstract class that describes EnergyAssets that can convert one energy carrier into another. It is one of the 5 capabilities in ESDL"""
-    efficiency = EAttribute(eType=EDouble, derived=False, changeable=True)
-    operationalHours = EAttribute(eType=EInt, derived=False, changeable=True)
-    fullLoadHours = EAttribute(eType=EInt, derived=False, changeable=True)
-    power = EAttribute(eType=EDouble, derived=False, changeable=True)
-    residualHeatSourcePotential = EReference(ordered=True, unique=True, containment=False)
+
+    efficiency = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    operationalHours = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    fullLoadHours = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    power = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    residualHeatSourcePotential = EReference(
+        ordered=True, unique=True, containment=False, derived=False)
 
     def __init__(self, *, efficiency=None, operationalHours=None, fullLoadHours=None, power=None, residualHeatSourcePotential=None, **kwargs):
 
@@ -2524,9 +2564,9 @@ class Conversion(EnergyAsset):
 
 @abstract
 class Transport(EnergyAsset):
-    """An abstract class that describes EnergyAssets that can transport energy. It is one of the 5 capabilities in ESDL"""
-    capacity = EAttribute(eType=EDouble, derived=False, changeable=True)
-    efficiency = EAttribute(eType=EDouble, derived=False, changeable=True)
+
+    capacity = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    efficiency = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, capacity=None, efficiency=None, **kwargs):
 
@@ -2540,26 +2580,26 @@ class Transport(EnergyAsset):
 
 
 class BuildingUnit(AbstractBuilding):
-    """Describes a physical part of a building. In dutch 'verblijfsobject' in the BAG national building and address registry. This can be used e.g. to model appartments in appartment complexes"""
-    type = EAttribute(eType=BuildingTypeEnum, derived=False, changeable=True)
-    housingType = EAttribute(eType=HousingTypeEnum, derived=False, changeable=True)
-    numberOfInhabitants = EAttribute(eType=EInt, derived=False, changeable=True)
-    inhabitantsType = EAttribute(eType=InhabitantsTypeEnum, derived=False, changeable=True)
-    floorArea = EAttribute(eType=EDouble, derived=False, changeable=True)
-    numberOfFloors = EAttribute(eType=EInt, derived=False, changeable=True)
-    slantedRoofArea = EAttribute(eType=EDouble, derived=False, changeable=True)
-    flatRoofArea = EAttribute(eType=EDouble, derived=False, changeable=True)
-    roofType = EAttribute(eType=RoofTypeEnum, derived=False, changeable=True)
-    wallArea = EAttribute(eType=EDouble, derived=False, changeable=True)
-    windowArea = EAttribute(eType=EDouble, derived=False, changeable=True)
-    rcFloor = EAttribute(eType=EDouble, derived=False, changeable=True)
-    rcWall = EAttribute(eType=EDouble, derived=False, changeable=True)
-    rfRoof = EAttribute(eType=EDouble, derived=False, changeable=True)
-    uWindow = EAttribute(eType=EDouble, derived=False, changeable=True)
-    glassType = EAttribute(eType=GlassTypeEnum, derived=False,
-                           changeable=True, default_value=GlassTypeEnum.UNDEFINED)
-    ventilationType = EAttribute(eType=VentilationTypeEnum, derived=False,
-                                 changeable=True, default_value=VentilationTypeEnum.UNDEFINED)
+
+    type = EAttribute(eType=BuildingTypeEnum, unique=True, derived=False, changeable=True)
+    housingType = EAttribute(eType=HousingTypeEnum, unique=True, derived=False, changeable=True)
+    numberOfInhabitants = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    inhabitantsType = EAttribute(eType=InhabitantsTypeEnum, unique=True,
+                                 derived=False, changeable=True)
+    floorArea = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    numberOfFloors = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    slantedRoofArea = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    flatRoofArea = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    roofType = EAttribute(eType=RoofTypeEnum, unique=True, derived=False, changeable=True)
+    wallArea = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    windowArea = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    rcFloor = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    rcWall = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    rfRoof = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    uWindow = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    glassType = EAttribute(eType=GlassTypeEnum, unique=True, derived=False, changeable=True)
+    ventilationType = EAttribute(eType=VentilationTypeEnum, unique=True,
+                                 derived=False, changeable=True)
 
     def __init__(self, *, type=None, housingType=None, numberOfInhabitants=None, inhabitantsType=None, floorArea=None, numberOfFloors=None, slantedRoofArea=None, flatRoofArea=None, roofType=None, wallArea=None, windowArea=None, rcFloor=None, rcWall=None, rfRoof=None, uWindow=None, glassType=None, ventilationType=None, **kwargs):
 
@@ -2618,26 +2658,27 @@ class BuildingUnit(AbstractBuilding):
 
 
 class Building(AbstractBuilding):
-    """Represents a physical building"""
-    buildingYear = EAttribute(eType=EInt, derived=False, changeable=True)
+
+    buildingYear = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
     residentialBuildingType = EAttribute(
-        eType=ResidentialBuildingTypeEnum, derived=False, changeable=True)
-    floorArea = EAttribute(eType=EDouble, derived=False, changeable=True)
-    numberOfFloors = EAttribute(eType=EInt, derived=False, changeable=True)
-    slantedRoofArea = EAttribute(eType=EDouble, derived=False, changeable=True)
-    flatRoofArea = EAttribute(eType=EDouble, derived=False, changeable=True)
-    roofType = EAttribute(eType=RoofTypeEnum, derived=False, changeable=True)
-    wallArea = EAttribute(eType=EDouble, derived=False, changeable=True)
-    windowArea = EAttribute(eType=EDouble, derived=False, changeable=True)
-    perimeter = EAttribute(eType=EDouble, derived=False, changeable=True)
-    height = EAttribute(eType=EDouble, derived=False, changeable=True)
-    rcFloor = EAttribute(eType=EDouble, derived=False, changeable=True)
-    rcWall = EAttribute(eType=EDouble, derived=False, changeable=True)
-    rcRoof = EAttribute(eType=EDouble, derived=False, changeable=True)
-    uWindow = EAttribute(eType=EDouble, derived=False, changeable=True)
-    orientation = EAttribute(eType=EInt, derived=False, changeable=True)
-    glassType = EAttribute(eType=GlassTypeEnum, derived=False, changeable=True)
-    ventilationType = EAttribute(eType=VentilationTypeEnum, derived=False, changeable=True)
+        eType=ResidentialBuildingTypeEnum, unique=True, derived=False, changeable=True)
+    floorArea = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    numberOfFloors = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    slantedRoofArea = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    flatRoofArea = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    roofType = EAttribute(eType=RoofTypeEnum, unique=True, derived=False, changeable=True)
+    wallArea = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    windowArea = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    perimeter = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    height = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    rcFloor = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    rcWall = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    rcRoof = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    uWindow = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    orientation = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    glassType = EAttribute(eType=GlassTypeEnum, unique=True, derived=False, changeable=True)
+    ventilationType = EAttribute(eType=VentilationTypeEnum, unique=True,
+                                 derived=False, changeable=True)
 
     def __init__(self, *, buildingYear=None, residentialBuildingType=None, floorArea=None, numberOfFloors=None, slantedRoofArea=None, flatRoofArea=None, roofType=None, wallArea=None, windowArea=None, perimeter=None, height=None, rcFloor=None, rcWall=None, rcRoof=None, uWindow=None, orientation=None, glassType=None, ventilationType=None, **kwargs):
 
@@ -2699,12 +2740,13 @@ class Building(AbstractBuilding):
 
 
 class GeothermalPotential(AbstractGTPotential):
-    """Defines the geothermal potential in a specific area. This type focusses on temperature and depth of the well. See GeothermalEnergyPotental for class focussing on Energy"""
-    temperature = EAttribute(eType=EInt, derived=False, changeable=True)
-    depth = EAttribute(eType=EInt, derived=False, changeable=True)
-    potential = EAttribute(eType=GeothermalPotentialEnum, derived=False, changeable=True)
-    powerPerDoublet = EAttribute(eType=GeothermalPowerEnum, derived=False,
-                                 changeable=True, default_value=GeothermalPowerEnum.UNKNOWN)
+
+    temperature = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    depth = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    potential = EAttribute(eType=GeothermalPotentialEnum, unique=True,
+                           derived=False, changeable=True)
+    powerPerDoublet = EAttribute(eType=GeothermalPowerEnum, unique=True,
+                                 derived=False, changeable=True)
 
     def __init__(self, *, temperature=None, depth=None, potential=None, powerPerDoublet=None, **kwargs):
 
@@ -2724,7 +2766,6 @@ class GeothermalPotential(AbstractGTPotential):
 
 
 class DemandResponseService(EnergyService):
-    """Indicates a service supporting demand response in the energy system"""
 
     def __init__(self, **kwargs):
 
@@ -2732,7 +2773,6 @@ class DemandResponseService(EnergyService):
 
 
 class AggregatorService(EnergyService):
-    """Indicates a aggregator service exploiting flexibility in the energy system"""
 
     def __init__(self, **kwargs):
 
@@ -2740,17 +2780,21 @@ class AggregatorService(EnergyService):
 
 
 class AggregatedBuilding(AbstractBuilding):
-    """Represents more than one building aggregated into one entity. It supports different types of aggregation, such as building type, energy label etc."""
-    numberOfBuildings = EAttribute(eType=EInt, derived=False, changeable=True)
-    floorArea = EAttribute(eType=EDouble, derived=False, changeable=True)
-    aggregationOf = EReference(ordered=True, unique=True, containment=False, upper=-1)
-    energyLabelDistribution = EReference(ordered=True, unique=True, containment=True)
-    buildingYearDistribution = EReference(ordered=True, unique=True, containment=True)
-    buildingTypeDistribution = EReference(ordered=True, unique=True, containment=True)
-    residentialBuildingTypeDistribution = EReference(ordered=True, unique=True, containment=True)
-    housingTypeDistribution = EReference(ordered=True, unique=True, containment=True)
 
-    def __init__(self, *, aggregationOf=None, numberOfBuildings=None, energyLabelDistribution=None, buildingYearDistribution=None, buildingTypeDistribution=None, residentialBuildingTypeDistribution=None, housingTypeDistribution=None, floorArea=None, **kwargs):
+    numberOfBuildings = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    floorArea = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    aggregationOf = EReference(ordered=True, unique=True,
+                               containment=False, derived=False, upper=-1)
+    energyLabelDistribution = EReference(ordered=True, unique=True, containment=True, derived=False)
+    buildingYearDistribution = EReference(
+        ordered=True, unique=True, containment=True, derived=False)
+    buildingTypeDistribution = EReference(
+        ordered=True, unique=True, containment=True, derived=False)
+    residentialBuildingTypeDistribution = EReference(
+        ordered=True, unique=True, containment=True, derived=False)
+    housingTypeDistribution = EReference(ordered=True, unique=True, containment=True, derived=False)
+
+    def __init__(self, *, numberOfBuildings=None, floorArea=None, aggregationOf=None, energyLabelDistribution=None, buildingYearDistribution=None, buildingTypeDistribution=None, residentialBuildingTypeDistribution=None, housingTypeDistribution=None, **kwargs):
 
         super().__init__(**kwargs)
 
@@ -2780,9 +2824,9 @@ class AggregatedBuilding(AbstractBuilding):
 
 
 class InfluxDBProfile(DatabaseProfile):
-    """Describes a profile based on a measurement and field as part of an InfluxDB timeseries query"""
-    measurement = EAttribute(eType=EString, derived=False, changeable=True)
-    field = EAttribute(eType=EString, derived=False, changeable=True)
+
+    measurement = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
+    field = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, measurement=None, field=None, **kwargs):
 
@@ -2798,7 +2842,7 @@ class InfluxDBProfile(DatabaseProfile):
 @abstract
 class ControlStrategy(EnergyService):
 
-    energyAsset = EReference(ordered=True, unique=True, containment=False)
+    energyAsset = EReference(ordered=True, unique=True, containment=False, derived=False)
 
     def __init__(self, *, energyAsset=None, **kwargs):
 
@@ -2810,9 +2854,9 @@ class ControlStrategy(EnergyService):
 
 class EnergyMarket(EnergyService):
 
-    asset = EReference(ordered=True, unique=True, containment=False, upper=-1)
-    carrier = EReference(ordered=True, unique=True, containment=False)
-    parameters = EReference(ordered=True, unique=True, containment=True, upper=-1)
+    asset = EReference(ordered=True, unique=True, containment=False, derived=False, upper=-1)
+    carrier = EReference(ordered=True, unique=True, containment=False, derived=False)
+    parameters = EReference(ordered=True, unique=True, containment=True, derived=False, upper=-1)
 
     def __init__(self, *, asset=None, carrier=None, parameters=None, **kwargs):
 
@@ -2830,8 +2874,8 @@ class EnergyMarket(EnergyService):
 
 class GeothermalEnergyPotential(AbstractGTPotential):
 
-    depth = EAttribute(eType=EInt, derived=False, changeable=True)
-    value = EAttribute(eType=EDouble, derived=False, changeable=True, default_value=0.0)
+    depth = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    value = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, depth=None, value=None, **kwargs):
 
@@ -2845,10 +2889,10 @@ class GeothermalEnergyPotential(AbstractGTPotential):
 
 
 class WindTurbine(Producer):
-    """Describes an individual wind turbine. A wind turbine is a producer capability"""
-    rotorDiameter = EAttribute(eType=EDouble, derived=False, changeable=True)
-    height = EAttribute(eType=EDouble, derived=False, changeable=True)
-    type = EAttribute(eType=WindTurbineTypeEnum, derived=False, changeable=True)
+
+    rotorDiameter = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    height = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    type = EAttribute(eType=WindTurbineTypeEnum, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, rotorDiameter=None, height=None, type=None, **kwargs):
 
@@ -2865,11 +2909,11 @@ class WindTurbine(Producer):
 
 
 class PVPanel(Producer):
-    """Describes an individual PV panel. See PVInstallation for multiple PV panels. This is a Producer capability"""
-    panelEfficiency = EAttribute(eType=EDouble, derived=False, changeable=True)
-    inverterEfficiency = EAttribute(eType=EDouble, derived=False, changeable=True)
-    angle = EAttribute(eType=EInt, derived=False, changeable=True)
-    orientation = EAttribute(eType=EInt, derived=False, changeable=True)
+
+    panelEfficiency = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    inverterEfficiency = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    angle = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    orientation = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, panelEfficiency=None, inverterEfficiency=None, angle=None, orientation=None, **kwargs):
 
@@ -2889,8 +2933,8 @@ class PVPanel(Producer):
 
 
 class Battery(Storage):
-    """A battery can store electrical energy. This is a Storage capability"""
-    maxChargeDischargeCycles = EAttribute(eType=EInt, derived=False, changeable=True)
+
+    maxChargeDischargeCycles = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, maxChargeDischargeCycles=None, **kwargs):
 
@@ -2901,8 +2945,9 @@ class Battery(Storage):
 
 
 class AggregatedConsumer(Consumer):
-    """Represents an aggregation of multiple consumers as one aggregated consumer. It allows you to reference the consumers it is aggregated of by using the aggregationOf reference. Can be used to aggregate a heterogeneous collection of consumers (e.g. of different types)"""
-    aggregationOf = EReference(ordered=True, unique=True, containment=False, upper=-1)
+
+    aggregationOf = EReference(ordered=True, unique=True,
+                               containment=False, derived=False, upper=-1)
 
     def __init__(self, *, aggregationOf=None, **kwargs):
 
@@ -2913,8 +2958,9 @@ class AggregatedConsumer(Consumer):
 
 
 class AggregatedProducer(Producer):
-    """Represents an aggregation of multiple producers as one aggregated producer. It allows you to reference the producers it is aggregated of by using the aggregationOf reference. Can be used to aggregate a heterogeneous collection of producers (e.g. of different types)"""
-    aggregationOf = EReference(ordered=True, unique=True, containment=False, upper=-1)
+
+    aggregationOf = EReference(ordered=True, unique=True,
+                               containment=False, derived=False, upper=-1)
 
     def __init__(self, *, aggregationOf=None, **kwargs):
 
@@ -2925,7 +2971,6 @@ class AggregatedProducer(Producer):
 
 
 class GenericConsumer(Consumer):
-    """Generic consumer class that can be used in cases that the actual asset type is not important or not supported yet in ESDL"""
 
     def __init__(self, **kwargs):
 
@@ -2933,7 +2978,6 @@ class GenericConsumer(Consumer):
 
 
 class GenericProducer(Producer):
-    """Generic producer class that can be used in cases that the actual asset type is not important or not supported yet in ESDL"""
 
     def __init__(self, **kwargs):
 
@@ -2941,7 +2985,6 @@ class GenericProducer(Producer):
 
 
 class GenericStorage(Storage):
-    """Generic storage class that can be used in cases that the actual asset type is not important or not supported yet in ESDL"""
 
     def __init__(self, **kwargs):
 
@@ -2949,7 +2992,6 @@ class GenericStorage(Storage):
 
 
 class GenericTransport(Transport):
-    """Generic transport class that can be used in cases that the actual asset type is not important or not supported yet in ESDL"""
 
     def __init__(self, **kwargs):
 
@@ -2957,7 +2999,6 @@ class GenericTransport(Transport):
 
 
 class GenericConversion(Conversion):
-    """Generic conversion class that can be used in cases that the actual asset type is not important or not supported yet in ESDL"""
 
     def __init__(self, **kwargs):
 
@@ -2965,8 +3006,9 @@ class GenericConversion(Conversion):
 
 
 class AggregatedTransport(Transport):
-    """Represents an aggregation of multiple transport assets as one aggregated transport asset. It allows you to reference the transport asset it is aggregated of by using the aggregationOf reference. Can be used to aggregate a heterogeneous collection of transport assets (e.g. of different types)"""
-    aggregationOf = EReference(ordered=True, unique=True, containment=False, upper=-1)
+
+    aggregationOf = EReference(ordered=True, unique=True,
+                               containment=False, derived=False, upper=-1)
 
     def __init__(self, *, aggregationOf=None, **kwargs):
 
@@ -2977,8 +3019,9 @@ class AggregatedTransport(Transport):
 
 
 class AggregatedConversion(Conversion):
-    """Represents an aggregation of multiple conversion assets as one aggregated conversion asset. It allows you to reference the conversion asset it is aggregated of by using the aggregationOf reference. Can be used to aggregate a heterogeneous collection of conversion assets (e.g. of different types)"""
-    aggregationOf = EReference(ordered=True, unique=True, containment=False, upper=-1)
+
+    aggregationOf = EReference(ordered=True, unique=True,
+                               containment=False, derived=False, upper=-1)
 
     def __init__(self, *, aggregationOf=None, **kwargs):
 
@@ -2989,8 +3032,9 @@ class AggregatedConversion(Conversion):
 
 
 class AggregatedStorage(Storage):
-    """Represents an aggregation of multiple storage assets as one aggregated storage asset. It allows you to reference the storage asset it is aggregated of by using the aggregationOf reference. Can be used to aggregate a heterogeneous collection of storage assets (e.g. of different types)"""
-    aggregationOf = EReference(ordered=True, unique=True, containment=False, upper=-1)
+
+    aggregationOf = EReference(ordered=True, unique=True,
+                               containment=False, derived=False, upper=-1)
 
     def __init__(self, *, aggregationOf=None, **kwargs):
 
@@ -3001,9 +3045,9 @@ class AggregatedStorage(Storage):
 
 
 class HeatStorage(Storage):
-    """Generic heat storage asset with min and max temperatures"""
-    minStorageTemperature = EAttribute(eType=EDouble, derived=False, changeable=True)
-    maxStorageTemperature = EAttribute(eType=EDouble, derived=False, changeable=True)
+
+    minStorageTemperature = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    maxStorageTemperature = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, minStorageTemperature=None, maxStorageTemperature=None, **kwargs):
 
@@ -3017,9 +3061,9 @@ class HeatStorage(Storage):
 
 
 class GasHeater(Conversion):
-    """Converts gas to heat, e.g. a gas boiler or gas heater"""
-    minimumBurnRate = EAttribute(eType=EDouble, derived=False, changeable=True, default_value=0.0)
-    type = EAttribute(eType=GasHeaterTypeEnum, derived=False, changeable=True)
+
+    minimumBurnRate = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    type = EAttribute(eType=GasHeaterTypeEnum, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, minimumBurnRate=None, type=None, **kwargs):
 
@@ -3033,7 +3077,6 @@ class GasHeater(Conversion):
 
 
 class SourceProducer(Producer):
-    """Represents a generic source that produces a certain commodity. Used to model the rest of the energy system that is out of the current scope"""
 
     def __init__(self, **kwargs):
 
@@ -3041,7 +3084,6 @@ class SourceProducer(Producer):
 
 
 class SinkConsumer(Consumer):
-    """Represents a generic sink that consumes a certain commodity. Used to model the rest of the energy system that is out of the current scope"""
 
     def __init__(self, **kwargs):
 
@@ -3049,15 +3091,15 @@ class SinkConsumer(Consumer):
 
 
 class GeothermalSource(Producer):
-    """Geothermal source including the installation that connects the source to the network"""
-    wellDepth = EAttribute(eType=EDouble, derived=False, changeable=True)
+
+    wellDepth = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
     geothermalSourceType = EAttribute(eType=GeothermalSourceTypeEnum,
-                                      derived=False, changeable=True)
-    COP = EAttribute(eType=EDouble, derived=False, changeable=True)
-    aquiferTemperature = EAttribute(eType=EDouble, derived=False, changeable=True)
-    flowRate = EAttribute(eType=EDouble, derived=False, changeable=True)
-    pumpPower = EAttribute(eType=EDouble, derived=False, changeable=True)
-    geothermalPotential = EReference(ordered=True, unique=True, containment=False)
+                                      unique=True, derived=False, changeable=True)
+    COP = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    aquiferTemperature = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    flowRate = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    pumpPower = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    geothermalPotential = EReference(ordered=True, unique=True, containment=False, derived=False)
 
     def __init__(self, *, wellDepth=None, geothermalSourceType=None, COP=None, aquiferTemperature=None, flowRate=None, pumpPower=None, geothermalPotential=None, **kwargs):
 
@@ -3087,16 +3129,15 @@ class GeothermalSource(Producer):
 
 @abstract
 class CoGeneration(Conversion):
-    """Abstract asset describing a co-generation plant that produces heat and electricity"""
-    heatEfficiency = EAttribute(eType=EDouble, derived=False, changeable=True, default_value=0.0)
-    electricalEfficiency = EAttribute(eType=EDouble, derived=False,
-                                      changeable=True, default_value=0.0)
-    HERatio = EAttribute(eType=EDouble, derived=False, changeable=True)
-    fuelType = EAttribute(eType=PowerPlantFuelEnum, derived=False, changeable=True)
-    leadCommodity = EAttribute(eType=CommodityEnum, derived=False, changeable=True)
-    energyCarrier = EReference(ordered=True, unique=True, containment=False)
 
-    def __init__(self, *, heatEfficiency=None, electricalEfficiency=None, energyCarrier=None, HERatio=None, fuelType=None, leadCommodity=None, **kwargs):
+    heatEfficiency = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    electricalEfficiency = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    HERatio = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    fuelType = EAttribute(eType=PowerPlantFuelEnum, unique=True, derived=False, changeable=True)
+    leadCommodity = EAttribute(eType=CommodityEnum, unique=True, derived=False, changeable=True)
+    energyCarrier = EReference(ordered=True, unique=True, containment=False, derived=False)
+
+    def __init__(self, *, heatEfficiency=None, electricalEfficiency=None, HERatio=None, fuelType=None, leadCommodity=None, energyCarrier=None, **kwargs):
 
         super().__init__(**kwargs)
 
@@ -3120,12 +3161,12 @@ class CoGeneration(Conversion):
 
 
 class HeatPump(Conversion):
-    """Describes a Heat Pump"""
-    source = EAttribute(eType=SourceTypeEnum, derived=False, changeable=True)
-    stages = EAttribute(eType=EInt, derived=False, changeable=True, default_value=1)
-    COP = EAttribute(eType=EDouble, derived=False, changeable=True)
+
+    source = EAttribute(eType=SourceTypeEnum, unique=True, derived=False, changeable=True)
+    stages = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    COP = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
     additionalHeatingSourceType = EAttribute(
-        eType=AdditionalHeatingSourceTypeEnum, derived=False, changeable=True)
+        eType=AdditionalHeatingSourceTypeEnum, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, source=None, stages=None, COP=None, additionalHeatingSourceType=None, **kwargs):
 
@@ -3145,9 +3186,10 @@ class HeatPump(Conversion):
 
 
 class HeatingDemand(Consumer):
-    """Describes the heating demand of e.g. a household, area, etc."""
-    type = EAttribute(eType=HeatDemandTypeEnum, derived=False, changeable=True)
-    deviceType = EAttribute(eType=HeatRadiationDeviceTypeEnum, derived=False, changeable=True)
+
+    type = EAttribute(eType=HeatDemandTypeEnum, unique=True, derived=False, changeable=True)
+    deviceType = EAttribute(eType=HeatRadiationDeviceTypeEnum,
+                            unique=True, derived=False, changeable=True)
 
     def __init__(self, *, type=None, deviceType=None, **kwargs):
 
@@ -3161,7 +3203,6 @@ class HeatingDemand(Consumer):
 
 
 class ElectricityDemand(Consumer):
-    """Describes the electricity demand of e.g. a household, area, etc."""
 
     def __init__(self, **kwargs):
 
@@ -3169,7 +3210,6 @@ class ElectricityDemand(Consumer):
 
 
 class GasDemand(Consumer):
-    """Describes the gas demand of e.g. a household, area, etc. This can be used for all types of gasses (e.g. CO2, Natural Gas, Hydrogen, etc.)"""
 
     def __init__(self, **kwargs):
 
@@ -3177,14 +3217,14 @@ class GasDemand(Consumer):
 
 
 class PowerPlant(Conversion):
-    """Defines an electricity generating plant"""
-    fuel = EAttribute(eType=PowerPlantFuelEnum, derived=False, changeable=True)
-    maxLoad = EAttribute(eType=EInt, derived=False, changeable=True)
-    minLoad = EAttribute(eType=EInt, derived=False, changeable=True)
-    effMaxLoad = EAttribute(eType=EDouble, derived=False, changeable=True)
-    effMinLoad = EAttribute(eType=EDouble, derived=False, changeable=True)
-    energyCarrier = EReference(ordered=True, unique=True, containment=False)
-    mustRun = EReference(ordered=True, unique=True, containment=True)
+
+    fuel = EAttribute(eType=PowerPlantFuelEnum, unique=True, derived=False, changeable=True)
+    maxLoad = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    minLoad = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    effMaxLoad = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    effMinLoad = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    energyCarrier = EReference(ordered=True, unique=True, containment=False, derived=False)
+    mustRun = EReference(ordered=True, unique=True, containment=True, derived=False)
 
     def __init__(self, *, fuel=None, maxLoad=None, minLoad=None, effMaxLoad=None, effMinLoad=None, energyCarrier=None, mustRun=None, **kwargs):
 
@@ -3213,7 +3253,6 @@ class PowerPlant(Conversion):
 
 
 class EVChargingStation(Consumer):
-    """Represents a charging station for electrical vehicles. Both single private-owned car chargers and public charging spaces can be modelled by this class"""
 
     def __init__(self, **kwargs):
 
@@ -3221,7 +3260,6 @@ class EVChargingStation(Consumer):
 
 
 class Losses(Consumer):
-    """Used to define losses explicitly (as a Consumer capability)"""
 
     def __init__(self, **kwargs):
 
@@ -3229,7 +3267,6 @@ class Losses(Consumer):
 
 
 class PowerToX(Conversion):
-    """Represents the ability to convert electricity to some other form of energy"""
 
     def __init__(self, **kwargs):
 
@@ -3237,7 +3274,6 @@ class PowerToX(Conversion):
 
 
 class CCS(Storage):
-    """Represents Carbon Capture and Storage"""
 
     def __init__(self, **kwargs):
 
@@ -3245,7 +3281,6 @@ class CCS(Storage):
 
 
 class XToPower(Conversion):
-    """Represents the ability to convert some other form of energy to electricity"""
 
     def __init__(self, **kwargs):
 
@@ -3253,8 +3288,8 @@ class XToPower(Conversion):
 
 
 class CoolingDemand(Consumer):
-    """Describes the cooling demand of e.g. a building"""
-    deviceType = EAttribute(eType=CoolingDeviceType, derived=False, changeable=True)
+
+    deviceType = EAttribute(eType=CoolingDeviceType, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, deviceType=None, **kwargs):
 
@@ -3265,7 +3300,6 @@ class CoolingDemand(Consumer):
 
 
 class Airco(Conversion):
-    """Represents an air conditioning unit"""
 
     def __init__(self, **kwargs):
 
@@ -3281,7 +3315,7 @@ class EnergyDemand(Consumer):
 
 class SolarCollector(Producer):
 
-    type = EAttribute(eType=SolarCollectorTypeEnum, derived=False, changeable=True)
+    type = EAttribute(eType=SolarCollectorTypeEnum, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, type=None, **kwargs):
 
@@ -3293,8 +3327,9 @@ class SolarCollector(Producer):
 
 class ResidualHeatSource(Producer):
 
-    type = EAttribute(eType=ResidualHeatSourceTypeEnum, derived=False, changeable=True)
-    residualHeatSourcePotential = EReference(ordered=True, unique=True, containment=False)
+    type = EAttribute(eType=ResidualHeatSourceTypeEnum, unique=True, derived=False, changeable=True)
+    residualHeatSourcePotential = EReference(
+        ordered=True, unique=True, containment=False, derived=False)
 
     def __init__(self, *, type=None, residualHeatSourcePotential=None, **kwargs):
 
@@ -3316,10 +3351,10 @@ class FermentationPlant(Conversion):
 
 class MobilityDemand(Consumer):
 
-    type = EAttribute(eType=VehicleTypeEnum, derived=False, changeable=True, upper=-1)
-    fuelType = EAttribute(eType=MobilityFuelTypeEnum, derived=False, changeable=True)
-    distance = EAttribute(eType=EInt, derived=False, changeable=True)
-    efficiency = EAttribute(eType=EDouble, derived=False, changeable=True)
+    type = EAttribute(eType=VehicleTypeEnum, unique=True, derived=False, changeable=True, upper=-1)
+    fuelType = EAttribute(eType=MobilityFuelTypeEnum, unique=True, derived=False, changeable=True)
+    distance = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    efficiency = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, type=None, fuelType=None, distance=None, efficiency=None, **kwargs):
 
@@ -3340,9 +3375,8 @@ class MobilityDemand(Consumer):
 
 class GasStorage(Storage):
 
-    minStoragePressure = EAttribute(eType=EDouble, derived=False, changeable=True)
-    maxStoragePressure = EAttribute(eType=EDouble, derived=False,
-                                    changeable=True, default_value=0.0)
+    minStoragePressure = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    maxStoragePressure = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, minStoragePressure=None, maxStoragePressure=None, **kwargs):
 
@@ -3357,7 +3391,7 @@ class GasStorage(Storage):
 
 class DrivenByDemand(ControlStrategy):
 
-    outPort = EReference(ordered=True, unique=True, containment=False)
+    outPort = EReference(ordered=True, unique=True, containment=False, derived=False)
 
     def __init__(self, *, outPort=None, **kwargs):
 
@@ -3369,8 +3403,8 @@ class DrivenByDemand(ControlStrategy):
 
 class GasConversion(Conversion):
 
-    type = EAttribute(eType=GasConversionTypeEnum, derived=False, changeable=True)
-    outputPressure = EAttribute(eType=EDouble, derived=False, changeable=True)
+    type = EAttribute(eType=GasConversionTypeEnum, unique=True, derived=False, changeable=True)
+    outputPressure = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, type=None, outputPressure=None, **kwargs):
 
@@ -3385,7 +3419,7 @@ class GasConversion(Conversion):
 
 class DrivenBySupply(ControlStrategy):
 
-    inPort = EReference(ordered=True, unique=True, containment=False)
+    inPort = EReference(ordered=True, unique=True, containment=False, derived=False)
 
     def __init__(self, *, inPort=None, **kwargs):
 
@@ -3397,7 +3431,7 @@ class DrivenBySupply(ControlStrategy):
 
 class DrivenByProfile(ControlStrategy):
 
-    profile = EReference(ordered=True, unique=True, containment=True)
+    profile = EReference(ordered=True, unique=True, containment=True, derived=False)
 
     def __init__(self, *, profile=None, **kwargs):
 
@@ -3409,7 +3443,7 @@ class DrivenByProfile(ControlStrategy):
 
 class WaterToPower(Producer):
 
-    type = EAttribute(eType=WaterToPowerTypeEnum, derived=False, changeable=True)
+    type = EAttribute(eType=WaterToPowerTypeEnum, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, type=None, **kwargs):
 
@@ -3460,7 +3494,7 @@ class AbstractConnection(Transport):
 
 class RoomHeater(Conversion):
 
-    type = EAttribute(eType=RoomHeaterTypeEnum, derived=False, changeable=True)
+    type = EAttribute(eType=RoomHeaterTypeEnum, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, type=None, **kwargs):
 
@@ -3479,8 +3513,8 @@ class BiomassHeater(Conversion):
 
 class StorageStrategy(ControlStrategy):
 
-    marginalChargeCosts = EReference(ordered=True, unique=True, containment=True)
-    marginalDischargeCosts = EReference(ordered=True, unique=True, containment=True)
+    marginalChargeCosts = EReference(ordered=True, unique=True, containment=True, derived=False)
+    marginalDischargeCosts = EReference(ordered=True, unique=True, containment=True, derived=False)
 
     def __init__(self, *, marginalChargeCosts=None, marginalDischargeCosts=None, **kwargs):
 
@@ -3495,7 +3529,7 @@ class StorageStrategy(ControlStrategy):
 
 class CurtailmentStrategy(ControlStrategy):
 
-    maxPower = EAttribute(eType=EDouble, derived=False, changeable=True)
+    maxPower = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, maxPower=None, **kwargs):
 
@@ -3512,9 +3546,16 @@ class PVTInstallation(Producer):
         super().__init__(**kwargs)
 
 
+class PVPark(Producer):
+
+    def __init__(self, **kwargs):
+
+        super().__init__(**kwargs)
+
+
 class ElectricityNetwork(EnergyNetwork):
-    """Describes an complete Electricty network, without detailing the complete topology. It is a Transport capability"""
-    voltage = EAttribute(eType=EDouble, derived=False, changeable=True)
+
+    voltage = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, voltage=None, **kwargs):
 
@@ -3525,8 +3566,8 @@ class ElectricityNetwork(EnergyNetwork):
 
 
 class ElectricityCable(AbstractConductor):
-    """Describes a representation of an electricity cable. When defining the geometry of a cable by means of a line, the first point of the line refers to the first port and the last point of the line refers to the second port."""
-    length = EAttribute(eType=EDouble, derived=False, changeable=True)
+
+    length = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, length=None, **kwargs):
 
@@ -3537,10 +3578,10 @@ class ElectricityCable(AbstractConductor):
 
 
 class HeatNetwork(EnergyNetwork):
-    """Describes an complete heat network, without detailing the complete topology. It is a Transport capability"""
-    temperature = EAttribute(eType=EDouble, derived=False, changeable=True)
-    temperatureMin = EAttribute(eType=EDouble, derived=False, changeable=True)
-    temperatureMax = EAttribute(eType=EDouble, derived=False, changeable=True)
+
+    temperature = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    temperatureMin = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    temperatureMax = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, temperature=None, temperatureMin=None, temperatureMax=None, **kwargs):
 
@@ -3557,8 +3598,8 @@ class HeatNetwork(EnergyNetwork):
 
 
 class GasNetwork(EnergyNetwork):
-    """Describes an complete gas network, without detailing the complete topology. It is a Transport capability"""
-    pressure = EAttribute(eType=EDouble, derived=False, changeable=True)
+
+    pressure = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, pressure=None, **kwargs):
 
@@ -3569,9 +3610,9 @@ class GasNetwork(EnergyNetwork):
 
 
 class Pipe(AbstractConductor):
-    """Represents a pipe to transport gasses or fluids. When defining the geometry of a pipe by means of a line, the first point of the line refers to the first port and the last point of the line refers to the second port."""
-    diameter = EAttribute(eType=EDouble, derived=False, changeable=True)
-    length = EAttribute(eType=EDouble, derived=False, changeable=True)
+
+    diameter = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    length = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, diameter=None, length=None, **kwargs):
 
@@ -3585,9 +3626,9 @@ class Pipe(AbstractConductor):
 
 
 class Transformer(AbstractTransformer):
-    """Electrical transformer between different voltage levels"""
-    voltagePrimary = EAttribute(eType=EDouble, derived=False, changeable=True)
-    voltageSecundary = EAttribute(eType=EDouble, derived=False, changeable=True)
+
+    voltagePrimary = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    voltageSecundary = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, voltagePrimary=None, voltageSecundary=None, **kwargs):
 
@@ -3601,8 +3642,8 @@ class Transformer(AbstractTransformer):
 
 
 class HeatExchange(AbstractTransformer):
-    """Exchange heat between two circuits"""
-    LossDeltaT = EAttribute(eType=EDouble, derived=False, changeable=True)
+
+    LossDeltaT = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, LossDeltaT=None, **kwargs):
 
@@ -3613,8 +3654,8 @@ class HeatExchange(AbstractTransformer):
 
 
 class EConnection(AbstractConnection):
-    """Electricity connection of a building. Defines the demarcation between the inhouse network and the electricity grid (location where the (smart) meter is located)"""
-    EANCode = EAttribute(eType=EString, derived=False, changeable=True)
+
+    EANCode = EAttribute(eType=EString, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, EANCode=None, **kwargs):
 
@@ -3625,7 +3666,6 @@ class EConnection(AbstractConnection):
 
 
 class HConnection(AbstractConnection):
-    """Heat connection of a building. Defines the demarcation between the inhouse network and the heat grid (location where the (smart) meter is located)"""
 
     def __init__(self, **kwargs):
 
@@ -3633,7 +3673,6 @@ class HConnection(AbstractConnection):
 
 
 class GConnection(AbstractConnection):
-    """Gas connection of a building. Defines the demarcation between the inhouse network and the gas grid (location where the (smart) meter is located)"""
 
     def __init__(self, **kwargs):
 
@@ -3641,7 +3680,6 @@ class GConnection(AbstractConnection):
 
 
 class FuelCell(CoGeneration):
-    """Defines a Fuel Cell"""
 
     def __init__(self, **kwargs):
 
@@ -3649,8 +3687,8 @@ class FuelCell(CoGeneration):
 
 
 class WindParc(WindTurbine):
-    """Defines a wind parc of multiple turbines"""
-    numberOfTurbines = EAttribute(eType=EInt, derived=False, changeable=True)
+
+    numberOfTurbines = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, numberOfTurbines=None, **kwargs):
 
@@ -3661,8 +3699,8 @@ class WindParc(WindTurbine):
 
 
 class PVParc(PVPanel):
-    """Defines a PV parc of multiple panels"""
-    numberOfPanels = EAttribute(eType=EInt, derived=False, changeable=True)
+
+    numberOfPanels = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, numberOfPanels=None, **kwargs):
 
@@ -3673,7 +3711,6 @@ class PVParc(PVPanel):
 
 
 class Pump(AbstractTransformer):
-    """Defines a pump, e.g. in a water or heat network"""
 
     def __init__(self, **kwargs):
 
@@ -3681,7 +3718,6 @@ class Pump(AbstractTransformer):
 
 
 class Valve(AbstractSwitch):
-    """Defines a valve, e.g. in a water, gas or heat network"""
 
     def __init__(self, **kwargs):
 
@@ -3689,8 +3725,8 @@ class Valve(AbstractSwitch):
 
 
 class CHP(CoGeneration):
-    """Describes a Combined Heat and Power installation"""
-    CHPType = EAttribute(eType=CHPTypeEnum, derived=False, changeable=True)
+
+    CHPType = EAttribute(eType=CHPTypeEnum, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, CHPType=None, **kwargs):
 
@@ -3702,11 +3738,11 @@ class CHP(CoGeneration):
 
 class Electrolyzer(PowerToX):
 
-    outputPressure = EAttribute(eType=EDouble, derived=False, changeable=True)
-    maxLoad = EAttribute(eType=EInt, derived=False, changeable=True)
-    minLoad = EAttribute(eType=EInt, derived=False, changeable=True)
-    effMaxLoad = EAttribute(eType=EDouble, derived=False, changeable=True)
-    effMinLoad = EAttribute(eType=EDouble, derived=False, changeable=True)
+    outputPressure = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    maxLoad = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    minLoad = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
+    effMaxLoad = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
+    effMinLoad = EAttribute(eType=EDouble, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, outputPressure=None, maxLoad=None, minLoad=None, effMaxLoad=None, effMinLoad=None, **kwargs):
 
@@ -3730,8 +3766,8 @@ class Electrolyzer(PowerToX):
 
 class PVInstallation(PVPanel):
 
-    type = EAttribute(eType=PVInstallationTypeEnum, derived=False, changeable=True)
-    numberOfPanels = EAttribute(eType=EInt, derived=False, changeable=True)
+    type = EAttribute(eType=PVInstallationTypeEnum, unique=True, derived=False, changeable=True)
+    numberOfPanels = EAttribute(eType=EInt, unique=True, derived=False, changeable=True)
 
     def __init__(self, *, type=None, numberOfPanels=None, **kwargs):
 
@@ -3753,9 +3789,8 @@ class CircuitBraker(AbstractSwitch):
 
 class UTES(HeatStorage):
 
-    type = EAttribute(eType=UTESTypeEnum, derived=False, changeable=True,
-                      default_value=UTESTypeEnum.UNDEFINED)
-    UTESPotential = EReference(ordered=True, unique=True, containment=False)
+    type = EAttribute(eType=UTESTypeEnum, unique=True, derived=False, changeable=True)
+    UTESPotential = EReference(ordered=True, unique=True, containment=False, derived=False)
 
     def __init__(self, *, type=None, UTESPotential=None, **kwargs):
 
@@ -3776,7 +3811,6 @@ class WaterBuffer(HeatStorage):
 
 
 class Joint(AbstractConductor):
-    """A Joint is a means to connect AbstractConductors. This helps when these conductors have opposite Ports."""
 
     def __init__(self, **kwargs):
 
@@ -6,29 +6,12 @@ import sys
 
 import io
 import json
-import requests
 
-from flask import current_app
 from app.helpers.exceptions import EnergysystemParseError
 from app.helpers.StringURI import StringURI
 from app.constants.errors import messages as messages
-
-class SessionWithUrlBase(requests.Session):
-    """
-    Helper class to store the base url. This allows us to only type the
-    relevant additional information.
-    from: https://stackoverflow.com/questions/42601812/python-requests-url-base-in-session
-    """
-    def __init__(self, url_base=None, *args, **kwargs):
-        super(SessionWithUrlBase, self).__init__(*args, **kwargs)
-        self.url_base = url_base
-
-
-    def request(self, method, url, **kwargs):
-        modified_url = self.url_base + url
-
-        return super(SessionWithUrlBase, self).request(
-            method, modified_url, **kwargs)
+from app.services.etengine_service import etengine_client
+from app.services.gquery_cache import gquery_cache
 
 
 class ETM_API(object):
@@ -45,7 +28,7 @@ class ETM_API(object):
         Note: 363691 is the scenario_id of a default scenario created by
         DataQuest. This scenario is stored within the ETM for future use.
         """
-        self.session = SessionWithUrlBase(current_app.config['ETENGINE'][environment])
+        self.session = etengine_client(environment)
         self.scenario_id = scenario_id
         self.environment = environment
 
@@ -70,8 +53,8 @@ class ETM_API(object):
                 "end_year": end_year
             }
         }
-        response = self.session.post("/scenarios", json=post_data,
-                                     headers={'Connection':'close'})
+        response = self.session.post("/scenarios", json=post_data)
+        self.handle_response(response)
 
         self.scenario_id = response.json()["id"]
 
@@ -81,8 +64,9 @@ class ETM_API(object):
         Resets scenario with scenario_id
         """
         put_data = {"reset": True}
-        response = self.session.put('/scenarios/' + self.scenario_id, json=put_data,
-                                    headers={'Connection':'close'})
+        response = self.session.put('/scenarios/' + self.scenario_id, json=put_data)
+        gquery_cache().invalidate(self.environment, self.scenario_id)
+        self.handle_response(response)
         self.current_metrics = self.return_gqueries(response)
 
 
@@ -90,8 +74,8 @@ class ETM_API(object):
         """
         Get list of available inputs. Can be used to search parameter space?
         """
-        response = self.session.get('/scenarios/' + self.scenario_id + "/inputs",
-                                    headers={'Connection':'close'})
+        response = self.session.get('/scenarios/' + self.scenario_id + "/inputs")
+        self.handle_response(response)
 
         self.dict_inputs = response.json()
 
@@ -99,8 +83,7 @@ class ETM_API(object):
         """
         Try to download the attached ESDL file from the scenario
         """
-        response = self.session.get('/scenarios/' +  str(self.scenario_id) + "/esdl_file?download=true",
-                                    headers={'Connection':'close'})
+        response = self.session.get('/scenarios/' +  str(self.scenario_id) + "/esdl_file?download=true")
         self.handle_response(response)
 
         return response.json()['file']
@@ -117,14 +100,23 @@ class ETM_API(object):
             "detailed": True,
         }
         response = self.session.put('/scenarios/' + str(self.scenario_id),
-                                    json=put_data, headers={'Connection':'close'})
+                                    json=put_data)
+        # The cached results of the scenario are outdated now
+        gquery_cache().invalidate(self.environment, self.scenario_id)
         self.handle_response(response)
 
     def handle_response(self, response):
         if response.ok:
             return
 
-        errors = response.json()['errors']
+        try:
+            errors = response.json()['errors']
+        except (ValueError, KeyError):
+            # Not an error of the scenario, ETEngine itself failed
+            raise EnergysystemParseError(
+                f'ETEngine returned a {response.status_code}',
+                status_code=502 if response.status_code >= 500 else None)
+
         message = errors[0]
         for etm_message, readable in messages.items():
             for error in errors:
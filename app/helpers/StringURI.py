@@ -1,12 +1,28 @@
 from pyecore.resources import URI
-from io import BytesIO
+from io import BytesIO, RawIOBase
+from urllib.parse import unquote_to_bytes
 
 
 class StringURI(URI):
+    """
+    URI of a resource in memory. The text to load can be a string, bytes (or any other buffer,
+    like a bytearray or memoryview) or a file-like object. Buffers and file-like objects are read
+    as they are, without copying them first.
+    """
     def __init__(self, uri, text=None):
         super(StringURI, self).__init__(uri)
-        if text is not None:
+        if text is None:
+            return
+
+        if isinstance(text, str):
             self.__stream = BytesIO(text.encode('UTF-8'))
+        elif isinstance(text, bytes):
+            # BytesIO shares the memory of the bytes until it is written to
+            self.__stream = BytesIO(text)
+        elif hasattr(text, 'read'):
+            self.__stream = text
+        else:
+            self.__stream = BufferStream(text)
 
     def getvalue(self):
         readbytes = self.__stream.getvalue()
@@ -22,4 +38,43 @@ class StringURI(URI):
         return self.__stream
 
     def get_stream(self):
-        return self.__stream
\ No newline at end of file
+        return self.__stream
+
+
+class BufferStream(RawIOBase):
+    """Reads a buffer (bytearray, memoryview, mmap...) through a view on it instead of a copy"""
+    def __init__(self, buffer):
+        super().__init__()
+        self.__view = memoryview(buffer).cast('B')
+        self.__position = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, target):
+        size = min(len(target), len(self.__view) - self.__position)
+        target[:size] = self.__view[self.__position:self.__position + size]
+        self.__position += size
+        return size
+
+
+def unquote_to_buffer(string, chunk_size=1 << 16):
+    """
+    Unquotes a URL encoded string (or bytes) into a bytearray, that can be loaded without copying
+    it. The string is unquoted in chunks, as unquoting all of it at once splits it into a list of
+    small objects that takes many times the memory of the string itself
+    """
+    buffer = bytearray()
+    start = 0
+    while start < len(string):
+        end = start + chunk_size
+        if end < len(string):
+            # Do not split an escape (%XX) between two chunks
+            escape = string.rfind('%' if isinstance(string, str) else b'%', end - 2, end)
+            if escape != -1:
+                end = escape
+
+        buffer += unquote_to_bytes(string[start:end])
+        start = end
+
+    return buffer
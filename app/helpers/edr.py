@@ -1,44 +1,115 @@
+import threading
+import time
+
 import requests
-from requests import Session, adapters
-from xml.etree import ElementTree
-import urllib.parse
+from flask import current_app
 
+from app.helpers.edr_cache import CachedAsset, EdrCache
 from app.helpers.energy_system_handler import EnergySystemHandler
+from app.helpers.exceptions import EnergysystemParseError
+from app.helpers.StringURI import unquote_to_buffer
+from app.services.resilience import ResilientSession, policy
+
+_lock = threading.Lock()
+_clients = {}
+
 
 class EnergyDataRepository():
     """
     Class to connect to the EnergyDataRepository (EDR) and collect relevant
-    data.
+    data. The session and the cache of the assets (see edr_cache) are shared
+    by every EnergyDataRepository in the process.
     """
 
     def __init__(self):
-        self.session = Session()
-        self.base_url = 'http://edr.hesi.energy/store'
+        config = current_app.config
+        self.base_url = config['EDR_URL']
+        self.max_age = config['EDR_CACHE_MAX_AGE']
+        self.offline = config['EDR_OFFLINE']
+        self.session, self.cache = edr_client(
+            self.base_url, config['EDR_CACHE_DIR'], config['EDR_CACHE_SIZE'], policy(config, 'EDR'))
 
 
-    def parse(self, response):
+    @staticmethod
+    def parse(content):
         esh = EnergySystemHandler()
-
-        try:
-            esdl_string = urllib.parse.unquote(response.text)
-            esh.load_from_string(esdl_string)
-        except EnergysystemParseError:
-            raise
+        esh.load(unquote_to_buffer(content))
 
         return esh.es
 
 
     def get_asset(self, asset_id):
         """
-        Get ESDL asset by ID
+        Get ESDL asset by ID. The asset is cached and shared, so it should be
+        read only
         """
-        params = {
-            'format': 'xml'
-        }
+        cached = self.cache.get(asset_id)
+
+        if cached is not None and (
+                self.offline or time.time() - cached.checked_at < self.max_age):
+            return cached.asset
+
+        if self.offline:
+            raise EnergysystemParseError(f'The EDR asset {asset_id} is not available offline')
+
+        try:
+            response = self.session.get(
+                f'{self.base_url}/esdl/{asset_id}',
+                params={'format': 'xml'},
+                headers=cached.validators() if cached else {},
+                verify=True)
+        except (requests.RequestException, EnergysystemParseError) as error:
+            # The EDR can't be reached, an outdated asset will do
+            if cached is not None:
+                return cached.asset
+
+            raise EnergysystemParseError(
+                f'The asset {asset_id} could not be fetched from the EDR',
+                status_code=getattr(error, 'status_code', 503)) from error
+
+        if cached is not None and response.status_code == 304:
+            self.cache.touch(asset_id, cached)
+            return cached.asset
+
+        if response.ok:
+            asset = self.parse(response.content)
+            self.cache.set(asset_id, CachedAsset(
+                asset,
+                response.content,
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified'),
+                time.time()))
+
+            return asset
+
+        # The EDR fails, an outdated asset will do
+        if cached is not None and response.status_code >= 500:
+            return cached.asset
+
+        raise EnergysystemParseError(
+            f'The asset {asset_id} could not be fetched from the EDR',
+            status_code=502 if response.status_code >= 500 else None)
+
+
+def edr_client(base_url, directory, size, edr_policy):
+    '''The shared session (with the policy) and asset cache for the EDR at the base url'''
+    key = (base_url, directory, size, edr_policy)
+
+    client = _clients.get(key)
+    if client is None:
+        with _lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _clients[key] = (
+                    ResilientSession('The EDR', edr_policy),
+                    EdrCache(directory, EnergyDataRepository.parse, size))
+
+    return client
 
-        response = self.session.get(
-            f'{self.base_url}/esdl/{asset_id}',
-            params=params,
-            verify=True)
 
-        return self.parse(response)
+def clear_edr_clients():
+    '''Forgets the sessions and the assets in memory (not those on disk)'''
+    with _lock:
+        for session, _ in _clients.values():
+            session.close()
+        _clients.clear()
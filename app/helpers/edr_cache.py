@@ -0,0 +1,136 @@
+'''
+Two-tier cache of the assets of the Energy Data Repository (EDR), which hardly ever change: the
+parsed assets are kept in memory (LRU, EDR_CACHE_SIZE assets) and their XML on disk (EDR_CACHE_DIR),
+so they survive restarts. An asset is revalidated with the EDR (If-None-Match/If-Modified-Since)
+when it was checked more than EDR_CACHE_MAX_AGE seconds ago. When the EDR can't be reached, or
+with EDR_OFFLINE set, the cached assets are used regardless of their age.
+'''
+
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+
+# Asset ids that can be used as file names
+SAFE_ID = re.compile(r'^[\w-]+$')
+
+
+class CachedAsset():
+    """
+    An asset from the EDR: the parsed object, its XML and the validators of the EDR response
+    """
+    __slots__ = ('asset', 'content', 'etag', 'last_modified', 'checked_at')
+
+    def __init__(self, asset, content, etag=None, last_modified=None, checked_at=0.):
+        self.asset = asset
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        self.checked_at = checked_at
+
+
+    def validators(self):
+        '''The headers of a conditional request for the asset'''
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+
+        return headers
+
+
+class EdrCache():
+    """
+    The memory and disk tiers of the cache. Assets are parsed by the given parse function when
+    they are read from disk
+    """
+    def __init__(self, directory, parse, size=128):
+        self.directory = directory
+        self.parse = parse
+        self.size = size
+        self._assets = OrderedDict()
+        self._lock = threading.Lock()
+
+
+    def get(self, asset_id):
+        '''The cached asset, from memory or from disk, or None'''
+        with self._lock:
+            cached = self._assets.get(asset_id)
+            if cached is not None:
+                self._assets.move_to_end(asset_id)
+                return cached
+
+        cached = self._read(asset_id)
+        if cached is not None:
+            self._remember(asset_id, cached)
+
+        return cached
+
+
+    def set(self, asset_id, cached):
+        '''Stores the asset in memory and on disk'''
+        self._remember(asset_id, cached)
+        self._write(asset_id, cached)
+
+
+    def touch(self, asset_id, cached):
+        '''The asset was revalidated: it is checked again after the max age'''
+        cached.checked_at = time.time()
+        self._write(asset_id, cached, content=False)
+
+
+    def _remember(self, asset_id, cached):
+        with self._lock:
+            self._assets[asset_id] = cached
+            self._assets.move_to_end(asset_id)
+
+            while len(self._assets) > self.size:
+                self._assets.popitem(last=False)
+
+
+    def _paths(self, asset_id):
+        base = os.path.join(self.directory, asset_id)
+        return base + '.esdl', base + '.json'
+
+
+    def _read(self, asset_id):
+        if not self.directory or not SAFE_ID.match(asset_id):
+            return None
+
+        content_path, meta_path = self._paths(asset_id)
+        try:
+            with open(content_path, 'rb') as content_file:
+                content = content_file.read()
+            with open(meta_path) as meta_file:
+                meta = json.load(meta_file)
+        except (OSError, ValueError):
+            return None
+
+        return CachedAsset(self.parse(content), content, **meta)
+
+
+    def _write(self, asset_id, cached, content=True):
+        if not self.directory or not SAFE_ID.match(asset_id):
+            return
+
+        content_path, meta_path = self._paths(asset_id)
+        os.makedirs(self.directory, exist_ok=True)
+
+        # Written to a temporary file first, so other processes never read half a file
+        if content:
+            _replace(content_path, cached.content)
+        _replace(meta_path, json.dumps({
+            'etag': cached.etag,
+            'last_modified': cached.last_modified,
+            'checked_at': cached.checked_at
+        }).encode('UTF-8'))
+
+
+def _replace(path, data):
+    temporary = f'{path}.{os.getpid()}.{threading.get_ident()}'
+    with open(temporary, 'wb') as temporary_file:
+        temporary_file.write(data)
+    os.replace(temporary, path)
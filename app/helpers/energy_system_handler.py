@@ -1,8 +1,12 @@
+import os
 from time import sleep
 
 from pyecore.resources import ResourceSet, URI
-from pyecore.utils import DynamicEPackage, alias
 from pyecore.resources.resource import HttpURI
+from app.helpers.esdl_metamodel import get_metamodel, attr_to_dict
+from app.helpers.esdl_extract import EsdlExtractor
+from app.helpers.esdl_index import EsdlIndex
+from app.helpers.output_stream import stream_writes
 from app.helpers.xmlresource import XMLResource
 from pyecore.notification import EObserver
 import uuid
@@ -12,35 +16,20 @@ from io import BytesIO
 class EnergySystemHandler:
     """Class to handle (load, read, and update) an ESDL Energy System"""
 
-    def __init__(self, name=None):
-        # create a resourceSet that hold the contents of the esdl.ecore model and the instances we use/create
+    def __init__(self, name=None, mode=None):
+        # create a resourceSet that holds the instances we use/create
         self.rset = ResourceSet()
 
         # Assign files with the .esdl extension to the XMLResource instead of default XMI
         self.rset.resource_factory['esdl'] = lambda uri: XMLResource(uri)
 
-        # Read the esdl.ecore from the tmp folder
-        esdl_model_resource = self.rset.get_resource(URI('tmp/esdl/esdl.ecore'))
+        # The ESDL metamodel is only loaded once per process and shared by all handlers. The mode
+        # (dynamic or static) defaults to the one set in the config
+        metamodel = get_metamodel(mode)
+        self.rset.metamodel_registry[metamodel.nsURI] = metamodel.package
 
-        esdl_model = esdl_model_resource.contents[0]
-        # print('Namespace: {}'.format(esdl_model.nsURI))
-        self.rset.metamodel_registry[esdl_model.nsURI] = esdl_model
-
-        # Create a dynamic model from the loaded esdl.ecore model, which we can use to build Energy Systems
-        self.esdl = DynamicEPackage(esdl_model)
-
-        # fix python buildin 'from' that is also used in ProfileElement as attribute
-        # use 'start' instead of 'from' when using a ProfileElement
-        alias('start', self.esdl.ProfileElement.findEStructuralFeature('from'))
-
-        # have a nice __repr__ for some ESDL classes when printing ESDL objects (includes all Assets and EnergyAssets)
-        self.esdl.Item.python_class.__repr__ = lambda x: '{}: ({})'.format(x.name, EnergySystemHandler.attr_to_dict(x))
-        self.esdl.Carrier.python_class.__repr__ = lambda x: '{}: ({})'.format(x.name, EnergySystemHandler.attr_to_dict(x))
-        self.esdl.Geometry.python_class.__repr__ = lambda x: '{}: ({})'.format(x.name, EnergySystemHandler.attr_to_dict(x))
-        self.esdl.QuantityAndUnitType.python_class.__repr__ = lambda x: '{}: ({})'.format(x.id, EnergySystemHandler.attr_to_dict(x))
-        self.esdl.QuantityAndUnitReference.python_class.__repr__ = lambda x: '{}: ({})'.format('QuantityAndUnitReference', EnergySystemHandler.attr_to_dict(x))
-        self.esdl.KPI.python_class.__repr__ = lambda x: '{}: ({})'.format(x.name, EnergySystemHandler.attr_to_dict(x))
-        self.esdl.ProfileElement.python_class.__repr__ = lambda x: 'ProfileElement ({})'.format(EnergySystemHandler.attr_to_dict(x))
+        # The ESDL model (dynamic or generated), which we can use to build Energy Systems
+        self.esdl = metamodel.esdl
 
         if name:
             self.name = name
@@ -49,13 +38,7 @@ class EnergySystemHandler:
     # Creates a dict of all the attributes of an ESDL object
     @staticmethod
     def attr_to_dict(esdl_object):
-        d = dict()
-        d['esdlType'] = esdl_object.eClass.name
-        for attr in dir(esdl_object):
-            attr_value = esdl_object.eGet(attr)
-            if attr_value is not None:
-                d[attr] = attr_value
-        return d
+        return attr_to_dict(esdl_object)
 
     # Creates a uuid: useful for generating unique IDs
     @staticmethod
@@ -66,6 +49,7 @@ class EnergySystemHandler:
         # load the ESDL file
         self.resource = self.rset.get_resource(URI(name))
         self.es = self.resource.contents[0]
+        self.index = EsdlIndex(self.es)
 
     # Add Energy System Information
     def add_energy_system_information(self):
@@ -138,25 +122,14 @@ class EnergySystemHandler:
 
     # Get a list of assets of a specific ESDL type in the specified area or asset
     def get_assets_of_type(self, area, esdl_type):
-        assets = []
-
-        for current_asset in area.asset:
-            if isinstance(current_asset, esdl_type):
-                assets.append(current_asset)
-
-        return assets
+        return self.index.assets_of_type(area, esdl_type)
 
 
     # Get a list of assets of a specific ESDL type in the specified area or asset
     # filtered by a specified attribute-value combination
+    # (the assets are grouped by type, area and attribute value in the index on the first call)
     def get_assets_of_type_and_attribute_value(self, area, esdl_type, attribute, value):
-        assets = []
-
-        for current_asset in area.asset:
-            if isinstance(current_asset, esdl_type):
-                if str(getattr(current_asset, attribute)) == value:
-                    assets.append(current_asset)
-        return assets
+        return self.index.assets_of_type(area, esdl_type, attribute, value)
 
     # Get a list of potentials of a specific ESDL type in the main instance's area
     def get_potentials_of_type(self, esdl_type):
@@ -167,24 +140,22 @@ class EnergySystemHandler:
                 potentials.append(current_potential)
         return potentials
 
-    # returns a generator of all assets or potentials of a specific type. Not only the ones defined in the main Instance's Area
+    # returns a list of all assets or potentials of a specific type (or one of its subtypes) in this
+    # energy system. Not only the ones defined in the main Instance's Area
     # e.g. QuantityAndUnits can be defined in the KPI of an Area or in the EnergySystemInformation object
-    # this function returns all of them at once
+    # this function returns all of them at once, using the index that is kept up to date when objects are added or removed
     def get_all_instances_of_type(self, esdl_type):
-        return esdl_type.allInstances()
+        return self.index.instances_of_type(esdl_type)
 
 
     # Using this function you can query for objects by ID
-    # After loading an ESDL-file, all objects that have an ID defines are stored in resource.uuid_dict automatically
-    # Note: If you add things later to the resource, it won't be added automatically to this dictionary though.
-    # Use get_by_id_slow() for that
+    # All objects in the Energy System that have an ID are kept in the index, also the ones that are added
+    # (or re-IDed) after loading the ESDL-file
     def get_by_id(self, id):
-        if id in self.resource.uuid_dict:
-            return self.resource.uuid_dict[id]
-        else:
-            return None
+        return self.index.get_by_id(id)
 
-    # This function iterates over all the contents of the Energy System and is much slower than get_by_id()
+    # This function iterates over all the contents of the Energy System and is much slower than get_by_id(),
+    # which gives the same result
     def get_by_id_slow(self, id):
         for child in self.es.eAllContents():
             if hasattr(child, 'id'):
@@ -257,43 +228,77 @@ class EnergySystemHandler:
     # get the energy system as a XML String
     # does not change the 'active' resource
     # so save() will still save as a file
-    def get_as_string(self):
+    def get_as_string(self, pretty_print=True):
         # to use strings as resources, we simulate a string as being a file
         uri = StringURI('tmp/anyname.esdl')
-        # create the string resource
-        stringresource = self.rset.create_resource(uri)
-        # add the current energy system
-        stringresource.append(self.es)
-        # save the resource
-        stringresource.save()
-        # remove the temporary resource in the resource set
-        self.rset.remove_resource(stringresource)
+        self.write(uri, pretty_print)
         # return the string
         return uri.getvalue()
 
-    def get_as_stream(self):
+    def get_as_stream(self, pretty_print=True):
         # to use strings as resources, we simulate a string as being a file
         uri = StringURI('tmp/anyname.esdl')
-        # create the string resource
+        self.write(uri, pretty_print)
+        # return the stream
+        return uri.get_stream()
+
+    # write the energy system as XML to a (String)URI, a file name or a writable file-like object
+    # like an open file or a response stream. The XML is written element by element while the
+    # energy system is traversed (see xmlresource.py), without building a tree first
+    def write(self, output, pretty_print=True):
+        # create a temporary resource to save the current energy system with
+        uri = output if isinstance(output, URI) else StringURI('tmp/anyname.esdl')
         stringresource = self.rset.create_resource(uri)
         # add the current energy system
         stringresource.append(self.es)
         # save the resource
-        stringresource.save()
+        stringresource.save(None if output is uri else output, pretty_print=pretty_print)
         # remove the temporary resource in the resource set
         self.rset.remove_resource(stringresource)
-        # return the string
-        return uri.get_stream()
+
+    # iterate over the energy system as XML (UTF-8 bytes), optionally gzip compressed, in chunks
+    # that are written while they are consumed (see output_stream.py): the whole document is never
+    # held in memory, e.g. when it is streamed to a client
+    def iter_chunks(self, pretty_print=True, compress=False):
+        return stream_writes(lambda output: self.write(output, pretty_print), compress)
 
     # load an EnergySystem from a string (using UTF-8 encoding)
     def load_from_string(self, string):
-        uri = StringURI('loadfromstring', string)
+        return self.load(StringURI('loadfromstring', string))
+
+    # load an EnergySystem from bytes (or another buffer), a file-like object or a path. The XML is
+    # parsed directly from the source, without copying it into a string first
+    def load(self, source):
+        if isinstance(source, (str, os.PathLike)):
+            uri = URI(os.fspath(source))
+        elif isinstance(source, URI):
+            uri = source
+        else:
+            uri = StringURI('loadfromsource', source)
+
         # this overrides the current loaded resource
         self.resource = self.rset.create_resource(uri)
         self.resource.load()
         self.es = self.resource.contents[0]
+        self.index = EsdlIndex(self.es)
         return self.es
 
+    # extract only the parts of an EnergySystem that are translated into ETM slider settings from
+    # bytes (or another buffer), a file-like object or a path, streaming the XML instead of loading
+    # all of it (see esdl_extract.py). The result has no resource and misses everything else in the
+    # file, so it should not be saved or attached to a scenario
+    def extract_energy_system(self, source):
+        if not isinstance(source, (str, os.PathLike)) and not hasattr(source, 'read'):
+            source = StringURI('extractfromsource', source).create_instream()
+
+        self.es = EsdlExtractor(self.esdl).extract(source)
+        self.index = EsdlIndex(self.es)
+        return self.es
+
+    # extract the translated parts of an EnergySystem from a string (using UTF-8 encoding)
+    def extract_from_string(self, string):
+        return self.extract_energy_system(string.encode('UTF-8'))
+
 
 class PrintNotification(EObserver):
     def __init__(self, notifier=None):
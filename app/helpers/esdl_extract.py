@@ -0,0 +1,180 @@
+'''
+Streaming extraction of the parts of an ESDL energy system that are translated into ETM slider
+settings. The XML is read with lxml's iterparse and every element is freed as soon as it has been
+read, so geometry, profiles and all assets that are not translated are never loaded into memory.
+'''
+
+from lxml import etree
+from pyecore.ecore import EClass
+
+from app.helpers.exceptions import EnergysystemParseError
+
+XSI_TYPE = '{http://www.w3.org/2001/XMLSchema-instance}type'
+
+# The objects (of these types or their subtypes) that translate_esdl_to_slider_settings looks at.
+# They are extracted wherever they are in the energy system, together with their containers.
+EXTRACTED_TYPES = (
+    'Instance', 'Area', 'SolarPotential', 'WindTurbine', 'PVPark', 'PVInstallation',
+    'AggregatedBuilding', 'HeatPump', 'HConnection', 'GasHeater'
+)
+
+# The contents of the extracted types that are extracted entirely
+EXTRACTED_CONTENTS = {
+    'AggregatedBuilding': ('buildingTypeDistribution', 'energyLabelDistribution'),
+    'PVInstallation': ('port',)
+}
+
+
+class _Frame():
+    '''An element that is being read, with the object it is extracted into (if any)'''
+    __slots__ = ('element', 'eclass', 'feature', 'extracted', 'entirely', 'eobject')
+
+    def __init__(self, element, eclass, feature, extracted, entirely):
+        self.element = element
+        self.eclass = eclass
+        self.feature = feature
+        self.extracted = extracted
+        self.entirely = entirely
+        self.eobject = None
+
+
+class EsdlExtractor():
+    """
+    Extracts the objects of EXTRACTED_TYPES from an ESDL document into a pruned energy system of
+    the given ESDL package (handler.esdl). Attributes are decoded like the XMLResource does, but
+    references between objects (like the connections between ports) are left out.
+    """
+
+    def __init__(self, esdl):
+        self.esdl = esdl
+        self._features = {}
+        self._extracted = {}
+        self._contents = {}
+
+    def extract(self, source):
+        '''
+        Reads the ESDL document from the source (a file name or a file-like object) and returns
+        its pruned EnergySystem
+        '''
+        stack = []
+        root = None
+
+        for event, element in etree.iterparse(source, events=('start', 'end'), huge_tree=True):
+            if event == 'start':
+                frame = self._start(element, stack[-1] if stack else None)
+                stack.append(frame)
+
+                if frame.extracted:
+                    self._materialise(stack)
+                continue
+
+            root = stack.pop().eobject
+
+            # Free the element and the ones read before it, which are done as well
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+        return root
+
+    def _start(self, element, parent):
+        '''A frame for the element, or a frame that skips it when it is not part of the model'''
+        _, name = _split(element.tag)
+
+        if parent is None:
+            return _Frame(element, self._eclass(name), None, True, False)
+
+        if parent.eclass is None:
+            return _Frame(element, None, None, False, False)
+
+        feature = self._feature(parent.eclass, name)
+        if feature is None or not (feature.is_reference and feature.containment):
+            return _Frame(element, None, None, False, False)
+
+        xsi_type = element.get(XSI_TYPE)
+        eclass = self._eclass(xsi_type.split(':')[-1]) if xsi_type else feature.eType
+
+        entirely = parent.entirely or (
+            parent.extracted and feature.name in self._extracted_contents(parent.eclass))
+
+        return _Frame(element, eclass, feature, entirely or self._is_extracted(eclass), entirely)
+
+    def _materialise(self, stack):
+        '''Creates the objects of the frames on the stack that do not have one yet'''
+        for index, frame in enumerate(stack):
+            if frame.eobject is not None:
+                continue
+
+            frame.eobject = frame.eclass()
+            self._decode_attributes(frame.eobject, frame.element)
+
+            if index > 0:
+                container = stack[index - 1].eobject
+                if frame.feature.many:
+                    container.eGet(frame.feature).append(frame.eobject)
+                else:
+                    container.eSet(frame.feature, frame.eobject)
+
+    def _decode_attributes(self, eobject, element):
+        '''Sets the attributes of the object to the (decoded) values of the element'''
+        for key, value in element.attrib.items():
+            if key.startswith('{'):
+                continue
+
+            feature = self._feature(eobject.eClass, key)
+            if feature is None or not feature.is_attribute:
+                continue
+
+            from_string = feature.eType.from_string
+            if feature.many:
+                eobject.eGet(feature).extend(from_string(item) for item in value.split())
+            else:
+                eobject.eSet(feature, from_string(value))
+
+    def _eclass(self, name):
+        '''The EClass with the given name, raises an EnergysystemParseError when there is none'''
+        esdl_type = getattr(self.esdl, name, None)
+        if isinstance(esdl_type, EClass):
+            return esdl_type
+        if isinstance(esdl_type, type) and isinstance(getattr(esdl_type, 'eClass', None), EClass):
+            return esdl_type.eClass
+
+        raise EnergysystemParseError(f'could not load ESDL: unknown type esdl:{name}')
+
+    def _feature(self, eclass, name):
+        '''The structural feature of the EClass with the given name, or None'''
+        key = (eclass, name)
+        if key not in self._features:
+            self._features[key] = eclass.findEStructuralFeature(name)
+
+        return self._features[key]
+
+    def _is_extracted(self, eclass):
+        '''If objects of the EClass are extracted'''
+        if eclass not in self._extracted:
+            self._extracted[eclass] = any(
+                supertype.name in EXTRACTED_TYPES for supertype in _supertypes(eclass))
+
+        return self._extracted[eclass]
+
+    def _extracted_contents(self, eclass):
+        '''The containment features of the EClass that are extracted entirely'''
+        if eclass not in self._contents:
+            self._contents[eclass] = {
+                feature for supertype in _supertypes(eclass)
+                for feature in EXTRACTED_CONTENTS.get(supertype.name, ())}
+
+        return self._contents[eclass]
+
+
+def _supertypes(eclass):
+    '''The EClass and all its supertypes'''
+    return (eclass, *eclass.eAllSuperTypes())
+
+def _split(tag):
+    '''The namespace and the local name of the tag'''
+    if tag.startswith('{'):
+        namespace, name = tag[1:].split('}', 1)
+        return namespace, name
+
+    return None, tag
@@ -0,0 +1,217 @@
+'''
+Index of the objects in a loaded energy system, kept up to date through pyecore notifications
+'''
+
+from pyecore.ecore import EClass
+from pyecore.notification import EObserver, Kind
+
+
+class EsdlIndex(EObserver):
+    """
+    Indexes all objects contained in the given root object (usually the EnergySystem) by their
+    type, including all their supertypes: a lookup for Producer also returns the WindTurbines.
+    Objects that have an id are indexed by their id as well, and the assets of each area (or
+    asset) can be looked up by their type and the value of one of their attributes.
+
+    The index observes every object it contains. When objects are added to (or removed from) the
+    energy system, they (and everything they contain) are added to (or removed from) the index.
+    """
+
+    def __init__(self, root):
+        super().__init__()
+        self.root = root
+        self._by_type = {}
+        self._by_id = {}
+        self._type_keys = {}
+        self._id_features = {}
+        self._containments = {}
+        # The assets of each type grouped by their container and the value of an attribute,
+        # compiled on the first lookup: {(eClass, attribute): {(container, value): [assets]}}
+        self._compiled = {}
+        # pyecore notifies a removal before the object is placed in its new container, so
+        # whether a removed object left the energy system is checked on the next lookup
+        self._removed = []
+
+        self._add(root)
+
+    def instances_of_type(self, esdl_type):
+        '''All objects of the given ESDL type (the class or its EClass) and its subtypes'''
+        self._flush()
+
+        eclass = esdl_type if isinstance(esdl_type, EClass) else esdl_type.eClass
+        return list(self._by_type.get(eclass, ()))
+
+    def get_by_id(self, object_id):
+        '''The object with the given id, or None'''
+        self._flush()
+        return self._by_id.get(object_id)
+
+    def assets_of_type(self, container, esdl_type, attribute=None, value=None):
+        '''
+        The assets of the area (or asset) of the given ESDL type or its subtypes. When an attribute
+        is given, only the assets of which the attribute has the given value (as a string)
+        '''
+        self._flush()
+
+        eclass = esdl_type if isinstance(esdl_type, EClass) else esdl_type.eClass
+
+        if container not in self._by_type.get(container.eClass, ()):
+            return [asset for asset in container.asset if isinstance(asset, esdl_type)
+                    and (attribute is None or str(getattr(asset, attribute)) == value)]
+
+        compiled = self._compiled.get((eclass, attribute))
+        if compiled is None:
+            compiled = self._compile(eclass, attribute)
+
+        return list(compiled.get((container, value), ()))
+
+    def __contains__(self, eobject):
+        self._flush()
+        return eobject in self._by_type.get(eobject.eClass, ())
+
+    def notifyChanged(self, notification):
+        feature = notification.feature
+        if feature.is_attribute:
+            self._invalidate(notification.notifier.eClass, feature.name)
+
+        if feature is self._id_feature(notification.notifier.eClass):
+            self._update_id(notification.notifier, notification.old, notification.new)
+            return
+
+        if not (feature.is_reference and feature.containment):
+            return
+
+        kind = notification.kind
+        if kind in (Kind.ADD, Kind.SET) and notification.new is not None:
+            self._add(notification.new)
+        elif kind is Kind.ADD_MANY:
+            for eobject in notification.new:
+                self._add(eobject)
+
+        if kind in (Kind.REMOVE, Kind.SET, Kind.UNSET) and notification.old is not None:
+            self._removed.append(notification.old)
+        elif kind is Kind.REMOVE_MANY:
+            self._removed.extend(notification.old)
+
+    def _add(self, eobject):
+        '''Indexes the object and all objects it contains'''
+        for current in self._walk(eobject):
+            for key in self._keys(current.eClass):
+                self._by_type.setdefault(key, {})[current] = None
+
+            self._invalidate(current.eClass)
+
+            if self._id_feature(current.eClass):
+                self._update_id(current, None, current.id)
+
+            if self not in current.listeners:
+                self.observe(current)
+
+    def _remove(self, eobject):
+        '''Removes the object and all objects it contains from the index'''
+        for current in self._walk(eobject):
+            for key in self._keys(current.eClass):
+                self._by_type.get(key, {}).pop(current, None)
+
+            self._invalidate(current.eClass)
+
+            if self._id_feature(current.eClass):
+                self._update_id(current, current.id, None)
+
+            if self in current.listeners:
+                current.listeners.remove(self)
+
+    def _update_id(self, eobject, old_id, new_id):
+        '''Moves the object from its old id to its new id'''
+        if old_id is not None and self._by_id.get(old_id) is eobject:
+            del self._by_id[old_id]
+
+        if new_id is not None:
+            self._by_id[new_id] = eobject
+
+    def _compile(self, eclass, attribute):
+        '''Groups the assets of the EClass by their container and the value of the attribute'''
+        compiled = {}
+        for eobject in self._by_type.get(eclass, ()):
+            containment = eobject.eContainmentFeature()
+            if containment is None or containment.name != 'asset':
+                continue
+
+            value = str(getattr(eobject, attribute)) if attribute is not None else None
+            compiled.setdefault((eobject.eContainer(), value), []).append(eobject)
+
+        self._compiled[(eclass, attribute)] = compiled
+        return compiled
+
+    def _invalidate(self, eclass, attribute=None):
+        '''
+        Drops the compiled lookups of the EClass (and its supertypes) that are affected by a change
+        of the attribute, or by adding or removing an object of the EClass
+        '''
+        if not self._compiled:
+            return
+
+        keys = self._keys(eclass)
+        for compiled in list(self._compiled):
+            if compiled[0] in keys and (attribute is None or compiled[1] == attribute):
+                del self._compiled[compiled]
+
+    def _flush(self):
+        '''Removes the objects that were removed from the energy system since the last lookup'''
+        while self._removed:
+            eobject = self._removed.pop()
+            if not self._is_contained(eobject):
+                self._remove(eobject)
+
+    def _is_contained(self, eobject):
+        '''If the object is (still) part of the indexed energy system'''
+        while eobject is not None:
+            if eobject is self.root:
+                return True
+            eobject = eobject.eContainer()
+
+        return False
+
+    def _walk(self, eobject):
+        '''
+        The object and all objects it contains, depth first. Like eAllContents(), but with the
+        containment features looked up once per EClass instead of once per object
+        '''
+        stack = [eobject]
+        while stack:
+            current = stack.pop()
+            yield current
+
+            contents = []
+            for feature in self._containment_features(current.eClass):
+                value = current.eGet(feature)
+                if feature.many:
+                    contents.extend(value)
+                elif value is not None:
+                    contents.append(value)
+
+            stack.extend(reversed(contents))
+
+    def _containment_features(self, eclass):
+        '''The features of the EClass that contain other objects'''
+        if eclass not in self._containments:
+            self._containments[eclass] = tuple(
+                feature for feature in eclass.eAllStructuralFeatures()
+                if feature.is_reference and feature.containment)
+
+        return self._containments[eclass]
+
+    def _id_feature(self, eclass):
+        '''The id attribute of the EClass, or None for types without an id'''
+        if eclass not in self._id_features:
+            feature = eclass.findEStructuralFeature('id')
+            self._id_features[eclass] = feature if feature and feature.is_attribute else None
+
+        return self._id_features[eclass]
+
+    def _keys(self, eclass):
+        '''The EClass and all its supertypes'''
+        if eclass not in self._type_keys:
+            self._type_keys[eclass] = (eclass, *eclass.eAllSuperTypes())
+
+        return self._type_keys[eclass]
@@ -0,0 +1,210 @@
+'''
+Process-wide registry of the ESDL metamodel. The metamodel is loaded only once per process and
+then shared by every EnergySystemHandler. Handlers only create a fresh ResourceSet for their own
+instance data.
+
+There are two modes, selected by ESDL_METAMODEL in the config:
+- dynamic: the esdl.ecore resource (or its snapshot) is loaded at runtime into a DynamicEPackage
+- static: classes are resolved from the generated package in app/esdl, no ecore parsing at all
+
+The static mode can only be configured when the generated package was generated from the ecore
+resource the dynamic mode loads, see missing_static_classifiers().
+'''
+
+import os
+import threading
+from functools import lru_cache
+
+from flask import current_app, has_app_context
+from lxml import etree
+from pyecore.ecore import EClass
+from pyecore.resources import ResourceSet, URI
+from pyecore.utils import DynamicEPackage, alias
+from app.helpers.esdl_snapshot import load_snapshot, write_snapshot
+
+ECORE_RESOURCE = 'tmp/esdl/esdl.ecore'
+
+DYNAMIC = 'dynamic'
+STATIC = 'static'
+
+_lock = threading.Lock()
+_metamodels = {}
+
+
+class EsdlMetamodel():
+    """
+    A loaded ESDL metamodel: the EPackage that is registered in the ResourceSets of the handlers
+    and the package through which ESDL classes are resolved (handler.esdl).
+    Instances are immutable once created, so they can be shared between threads.
+    """
+    __slots__ = ('_package', '_esdl')
+
+    def __init__(self, package, esdl):
+        object.__setattr__(self, '_package', package)
+        object.__setattr__(self, '_esdl', esdl)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('The ESDL metamodel is shared between handlers and cannot be changed')
+
+    @property
+    def package(self):
+        '''The EPackage of the metamodel'''
+        return self._package
+
+    @property
+    def esdl(self):
+        '''The package to resolve ESDL classes from, e.g. metamodel.esdl.WindTurbine'''
+        return self._esdl
+
+    @property
+    def nsURI(self):
+        '''The namespace URI under which ESDL documents refer to the metamodel'''
+        return self._package.nsURI
+
+
+def attr_to_dict(esdl_object):
+    '''Creates a dict of all the attributes of an ESDL object'''
+    d = dict()
+    d['esdlType'] = esdl_object.eClass.name
+    for attr in dir(esdl_object):
+        attr_value = esdl_object.eGet(attr)
+        if attr_value is not None:
+            d[attr] = attr_value
+    return d
+
+
+def load_metamodel(path=ECORE_RESOURCE):
+    '''
+    Loads the esdl.ecore resource into a new EsdlMetamodel. Prefer get_metamodel(), which only
+    does this once per process.
+    '''
+    # Rebuild the model from the snapshot of this exact ecore resource when there is one (see
+    # esdl_snapshot.py), which is faster than parsing the ecore XMI. Otherwise the ecore resource
+    # is parsed, and the snapshot is (re)written for the next time
+    esdl_model = load_snapshot(path)
+    if esdl_model is None:
+        esdl_model = ResourceSet().get_resource(URI(path)).contents[0]
+        try:
+            write_snapshot(path, esdl_model)
+        except OSError:
+            pass
+
+    # Create a dynamic model from the loaded esdl.ecore model, which we can use to build Energy Systems
+    esdl = DynamicEPackage(esdl_model)
+
+    # fix python buildin 'from' that is also used in ProfileElement as attribute
+    # use 'start' instead of 'from' when using a ProfileElement
+    alias('start', esdl.ProfileElement.findEStructuralFeature('from'))
+
+    _add_representations(esdl)
+
+    return EsdlMetamodel(esdl_model, esdl)
+
+
+def load_static_metamodel():
+    '''
+    Wraps the generated package in app/esdl into a new EsdlMetamodel. Prefer get_metamodel(),
+    which only does this once per process.
+    '''
+    # pylint: disable=import-outside-toplevel
+    import app.esdl as esdl
+
+    # The generator renames the python keyword 'from' to 'from_'. Name the features after the
+    # ESDL attribute again, so they can be read from and written to ESDL files, and keep 'from_'
+    # and 'start' (like the dynamic metamodel) as aliases
+    for klass in (esdl.ProfileElement, esdl.FromToPerc):
+        feature = klass.eClass.findEStructuralFeature('from_')
+        if feature:
+            feature.name = 'from'
+            setattr(klass, 'from', feature)
+
+    esdl.ProfileElement.start = esdl.ProfileElement.eClass.findEStructuralFeature('from')
+
+    _add_representations(esdl)
+
+    return EsdlMetamodel(esdl, esdl)
+
+
+def _add_representations(esdl):
+    '''
+    Have a nice __repr__ for some ESDL classes when printing ESDL objects (includes all Assets and
+    EnergyAssets)
+    '''
+    def python_class(name):
+        klass = getattr(esdl, name)
+        return klass.python_class if isinstance(klass, EClass) else klass
+
+    python_class('Item').__repr__ = lambda x: '{}: ({})'.format(x.name, attr_to_dict(x))
+    python_class('Carrier').__repr__ = lambda x: '{}: ({})'.format(x.name, attr_to_dict(x))
+    python_class('Geometry').__repr__ = lambda x: '{}: ({})'.format(x.name, attr_to_dict(x))
+    python_class('QuantityAndUnitType').__repr__ = lambda x: '{}: ({})'.format(x.id, attr_to_dict(x))
+    python_class('QuantityAndUnitReference').__repr__ = lambda x: '{}: ({})'.format('QuantityAndUnitReference', attr_to_dict(x))
+    python_class('KPI').__repr__ = lambda x: '{}: ({})'.format(x.name, attr_to_dict(x))
+    python_class('ProfileElement').__repr__ = lambda x: 'ProfileElement ({})'.format(attr_to_dict(x))
+
+
+LOADERS = {
+    DYNAMIC: load_metamodel,
+    STATIC: load_static_metamodel
+}
+
+
+@lru_cache(maxsize=None)
+def missing_static_classifiers(path=ECORE_RESOURCE):
+    '''
+    The names of the classifiers of the ecore resource at path that the generated package in
+    app/esdl does not contain, or all of them when the package has another nsURI. Nothing is
+    missing when there is no ecore resource to compare the package with.
+    '''
+    if not os.path.exists(path):
+        return ()
+
+    # pylint: disable=import-outside-toplevel
+    import app.esdl as esdl
+
+    root = etree.parse(path).getroot()
+    classifiers = [classifier.get('name') for classifier in root.iterfind('eClassifiers')]
+    if root.get('nsURI') != esdl.nsURI:
+        return tuple(sorted(classifiers))
+
+    return tuple(sorted(name for name in classifiers if name not in esdl.eClassifiers))
+
+
+def configured_mode():
+    '''
+    The metamodel mode set in the config of the current app, dynamic outside of an app. The
+    static mode is rejected (with a ValueError) when the generated package is out of date
+    '''
+    if not has_app_context():
+        return DYNAMIC
+
+    mode = current_app.config.get('ESDL_METAMODEL', DYNAMIC)
+
+    if mode == STATIC:
+        missing = missing_static_classifiers()
+        if missing:
+            raise ValueError(
+                f'The generated ESDL package in app/esdl does not contain {", ".join(missing)} '
+                f'of {ECORE_RESOURCE}: regenerate it with "pipenv run generate_esdl_package" '
+                'before using the static ESDL metamodel')
+
+    return mode
+
+
+def get_metamodel(mode=None):
+    '''
+    Returns the ESDL metamodel of this process for the given mode (defaults to the configured
+    mode), loading it on first use. Safe to call from multiple threads: each metamodel is loaded
+    exactly once.
+    '''
+    mode = mode or configured_mode()
+
+    if mode not in LOADERS:
+        raise ValueError(f'Unknown ESDL metamodel mode: {mode}')
+
+    if mode not in _metamodels:
+        with _lock:
+            if mode not in _metamodels:
+                _metamodels[mode] = LOADERS[mode]()
+
+    return _metamodels[mode]
@@ -0,0 +1,201 @@
+'''
+Binary snapshot of the esdl.ecore resource. Parsing the ecore XMI is the largest part of loading
+the dynamic metamodel, so the parsed model is flattened once into plain python data and pickled
+next to the ecore resource. Loading the snapshot rebuilds the same EPackage without any XML
+parsing.
+
+A snapshot is keyed by the SHA-256 of the ecore resource it was made from, and is only used when
+that hash still matches the ecore resource on disk. A snapshot that can't be used is ignored, the
+metamodel is then parsed from the ecore resource and the snapshot is written again.
+
+Snapshots are unpickled, and unpickling data can run arbitrary code: the folder of the ecore
+resource (tmp/esdl) must not be writable by untrusted parties.
+'''
+
+import hashlib
+import os
+import pickle
+from collections import defaultdict
+from functools import lru_cache
+
+from pyecore import ecore
+from pyecore.resources import ResourceSet, URI, global_registry
+
+# Bump when the layout of the snapshot changes, so old snapshots are no longer used
+SNAPSHOT_FORMAT = 1
+
+
+def snapshot_path(ecore_path):
+    '''The location of the snapshot belonging to the ecore resource at ecore_path'''
+    return ecore_path + '.snapshot'
+
+
+def ecore_hash(ecore_path):
+    '''The SHA-256 of the ecore resource at ecore_path'''
+    with open(ecore_path, 'rb') as ecore_file:
+        return hashlib.sha256(ecore_file.read()).hexdigest()
+
+
+def write_snapshot(ecore_path, esdl_model=None):
+    '''
+    Writes the snapshot of the ecore resource, parsing it unless its model is given. Returns the
+    path of the snapshot
+    '''
+    if esdl_model is None:
+        esdl_model = ResourceSet().get_resource(URI(ecore_path)).contents[0]
+
+    snapshot = {
+        'format': SNAPSHOT_FORMAT,
+        'sha256': ecore_hash(ecore_path),
+        'nodes': _flatten(esdl_model)
+    }
+
+    path = snapshot_path(ecore_path)
+    with open(path + '.tmp', 'wb') as snapshot_file:
+        pickle.dump(snapshot, snapshot_file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    # Replace the old snapshot at once, so other processes never read a half written one
+    os.replace(path + '.tmp', path)
+
+    return path
+
+
+def load_snapshot(ecore_path):
+    '''
+    Rebuilds the EPackage of the ecore resource from its snapshot. Returns None when there is no
+    snapshot, when it was made from another version of the ecore resource, or when it can't be
+    read or rebuilt (a truncated or incompatible pickle can fail in many ways).
+    '''
+    # The snapshot is trusted: see the security note at the top of this module
+    try:
+        with open(snapshot_path(ecore_path), 'rb') as snapshot_file:
+            snapshot = pickle.load(snapshot_file)
+
+        if snapshot.get('format') != SNAPSHOT_FORMAT or \
+                snapshot.get('sha256') != ecore_hash(ecore_path):
+            return None
+
+        return _rebuild(snapshot['nodes'])
+    except Exception: # pylint: disable=broad-except
+        return None
+
+
+def _flatten(root):
+    '''
+    Flattens the model into a list of nodes in document order. A node is a tuple of
+    (metaclass name, index of the container, containment feature, attributes, references,
+    annotation details). References point to other nodes by index, or to classifiers of other
+    packages (like EString) by (nsURI, name).
+    '''
+    eobjects = [root, *root.eAllContents()]
+    index = {id(eobject): position for position, eobject in enumerate(eobjects)}
+
+    def target(eobject):
+        if id(eobject) in index:
+            return index[id(eobject)]
+
+        return (eobject.ePackage.nsURI, eobject.name)
+
+    nodes = []
+    for eobject in eobjects:
+        attributes, references = [], []
+
+        for feature in eobject.eClass.eAllStructuralFeatures():
+            if feature.derived or feature.transient or not eobject.eIsSet(feature):
+                continue
+
+            if feature.is_attribute:
+                value = eobject.eGet(feature)
+                if value is not None and value != feature.get_default_value():
+                    attributes.append((feature.name, list(value) if feature.many else value))
+            elif not (feature.containment or feature.container):
+                values = eobject.eGet(feature)
+                targets = [target(value) for value in (values if feature.many else [values]) if value]
+                if targets:
+                    references.append((feature.name, targets))
+
+        container = eobject.eContainer()
+        nodes.append((
+            eobject.eClass.name,
+            index[id(container)] if container is not None else None,
+            eobject.eContainmentFeature().name if container is not None else None,
+            attributes,
+            references,
+            dict(eobject.details.items()) if isinstance(eobject, ecore.EAnnotation) else None
+        ))
+
+    return nodes
+
+
+def _rebuild(nodes):
+    '''Creates the model from the flattened nodes, see _flatten'''
+    eobjects = []
+    contents = defaultdict(list)
+
+    # Create all objects with their attributes first, then put them in their containers and only
+    # then resolve the references between them. Collections are filled in one go, so that an
+    # EClass only has to update its python class once per feature.
+    for metaclass_name, container, feature_name, attributes, _, _ in nodes:
+        metaclass = getattr(ecore, metaclass_name)
+        eobject = metaclass(dict(attributes)['name']) if metaclass is ecore.EClass else metaclass()
+
+        for name, value in attributes:
+            if isinstance(value, list):
+                eobject.__getattribute__(name).extend(value)
+            elif not (metaclass is ecore.EClass and name == 'name'):
+                eobject.__setattr__(name, value)
+
+        if container is not None:
+            contents[(container, feature_name)].append(eobject)
+
+        eobjects.append(eobject)
+
+    for (container, feature_name), values in contents.items():
+        _attach(eobjects[container], feature_name, values)
+
+    def resolve(target):
+        if isinstance(target, int):
+            return eobjects[target]
+
+        return global_registry[target[0]].getEClassifier(target[1])
+
+    # The XMI loader sets eOpposite after all other references as well
+    opposites = []
+    for eobject, (_, _, _, _, references, details) in zip(eobjects, nodes):
+        for name, targets in references:
+            if name == 'eOpposite':
+                opposites.append((eobject, name, targets))
+            else:
+                _attach(eobject, name, [resolve(target) for target in targets])
+
+        if details:
+            _add_details(eobject, details)
+
+    for eobject, name, targets in opposites:
+        eobject.__setattr__(name, resolve(targets[0]))
+
+    return eobjects[0]
+
+
+@lru_cache(maxsize=None)
+def _is_many(metaclass, feature_name):
+    '''If the feature of the Ecore metaclass holds a collection'''
+    return metaclass.eClass.findEStructuralFeature(feature_name).many
+
+
+def _attach(eobject, feature_name, values):
+    '''Adds the values to the (many or single valued) feature of the eobject'''
+    if _is_many(type(eobject), feature_name):
+        eobject.__getattribute__(feature_name).extend(values)
+    else:
+        eobject.__setattr__(feature_name, values[0])
+
+
+def _add_details(annotation, details):
+    '''Adds the details to the annotation, and documentation to the annotated class'''
+    for key, value in details.items():
+        annotation.details[key] = value
+
+        if key == 'documentation':
+            annotated = annotation.eContainer()
+            getattr(annotated, 'python_class', annotated).__doc__ = value
@@ -0,0 +1,116 @@
+import app.constants.kpis as kpis
+
+from app.services.query_scenario import CachedQueryScenario, QueryScenario
+
+
+class KPIEngine():
+    """
+    Class to add the ETM KPIs (see app/constants/kpis) to an ESDL energy system, or to update
+    the KPIs it already has. The gqueries of all KPIs are fetched from the ETM scenario at once:
+    every query makes ETEngine recalculate the scenario. The queries of updates are cached per
+    version of the scenario.
+    """
+
+    def __init__(self, energy_system, etm):
+        self.energy_system = energy_system
+        self.etm = etm
+        self.metrics = {}
+
+
+    def add(self, metrics=None):
+        """
+        Add (empty) KPIs to the energy system and fill them with the ETM metrics. The metrics are
+        queried, unless they were already queried when the scenario was created
+        """
+        self.energy_system.add_kpis()
+
+        if metrics is None:
+            self.query(kpis.gqueries.values())
+        else:
+            self.metrics = metrics
+
+        for kpi_id, prop in kpis.gqueries.items():
+            kpi = self.energy_system.create_kpi(
+                prop['esdl_type'],
+                kpi_id,
+                prop['name'],
+                self.energy_system.get_by_id(prop['q_and_u']))
+
+            if prop['esdl_type'] == 'DistributionKPI':
+                kpi.distribution = self.energy_system.esdl.StringLabelDistribution()
+
+            self.set_value(kpi, prop)
+
+            print(f'Adding KPI of type: {type(kpi)}')
+            self.energy_system.add_kpi(kpi)
+
+
+    def update(self, metrics=None):
+        """
+        Update the KPIs of the energy system to the ETM metrics. The metrics are queried, unless
+        they were already queried by the QueryPlanner
+        """
+        list_of_kpis = self.present()
+
+        if not list_of_kpis:
+            return
+
+        if metrics is None:
+            self.query((prop for _, prop in list_of_kpis), cached=True)
+        else:
+            self.metrics = metrics
+
+        for kpi, prop in list_of_kpis:
+            if prop['esdl_type'] == 'DistributionKPI':
+                kpi.distribution.stringItem.clear()
+
+            self.set_value(kpi, prop)
+
+
+    def present(self):
+        """
+        The KPIs in the energy system, with their props
+        """
+        area_kpis = self.energy_system.es.instance[0].area.KPIs
+        if area_kpis is None:
+            return []
+
+        return [(kpi, kpis.gqueries[kpi.id]) for kpi in area_kpis.kpi]
+
+
+    def query(self, props, cached=False):
+        """
+        Query the ETM scenario for the gqueries of all the given KPI props in one go
+        """
+        service = CachedQueryScenario if cached else QueryScenario
+
+        query_result = service(self.etm.environment, self.etm.scenario_id)(*self.gqueries(props))
+
+        if not query_result.successful: raise ValueError(query_result.errors)
+        self.metrics = query_result.value
+
+
+    @staticmethod
+    def gqueries(props):
+        """
+        The gqueries of the KPI props, in order and each of them only once
+        """
+        return list(dict.fromkeys(
+            gquery['gquery'] for prop in props for gquery in prop['gqueries']))
+
+
+    def set_value(self, kpi, prop):
+        """
+        Set the value (or distribution) of the KPI based on the queried metrics
+        """
+        if prop['esdl_type'] == 'DistributionKPI':
+            for gquery in prop['gqueries']:
+                val = self.metrics[gquery['gquery']]['future'] * prop['factor']
+
+                if val != 0:
+                    kpi.distribution.stringItem.append(self.energy_system.esdl.StringItem(
+                        label=gquery['label'],
+                        value=val))
+
+        else:
+            kpi.value = self.metrics[prop['gqueries'][0]['gquery']]['future'] * prop['factor']
@@ -0,0 +1,88 @@
+'''
+Turns a function that writes to a file-like object, like EnergySystemHandler.write, into an
+iterator of the chunks it writes, so they can be sent while the rest is still being written (e.g.
+as a streamed response). The function runs in a thread of its own, which waits while the chunks
+it wrote are not consumed: only a few chunks are held in memory at any time.
+'''
+
+import queue
+import threading
+from gzip import GzipFile
+
+# Put in the queue by the writing thread when it's done
+_DONE = object()
+
+
+class StreamClosed(Exception):
+    '''The chunks are no longer consumed'''
+
+
+class _Pipe():
+    """
+    The file-like object the function writes to, which hands the chunks to the consumer
+    """
+    def __init__(self, size):
+        self.chunks = queue.Queue(size)
+        self.closed = threading.Event()
+
+
+    def write(self, data):
+        '''Hands the data to the consumer as a chunk, returns the number of bytes written'''
+        if data:
+            self.put(data)
+
+        return len(data)
+
+
+    def flush(self):
+        '''Nothing to flush: every chunk is handed over as soon as it's written'''
+
+
+    def put(self, item):
+        '''Waits for room in the queue. Raises StreamClosed when the consumer stopped'''
+        while not self.closed.is_set():
+            try:
+                self.chunks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+        raise StreamClosed()
+
+
+def stream_writes(write, compress=False, size=4):
+    '''
+    Calls write(output) in a thread and yields the bytes written to the output, gzip compressed
+    when compress is set, keeping at most size chunks waiting. Errors of the function are raised
+    by the iterator. The thread starts at the first chunk and stops when the iterator is closed
+    '''
+    pipe = _Pipe(size)
+
+    def produce():
+        try:
+            if compress:
+                with GzipFile(fileobj=pipe, mode='wb', mtime=0) as output:
+                    write(output)
+            else:
+                write(pipe)
+            pipe.put(_DONE)
+        except StreamClosed:
+            pass
+        except Exception as error: # pylint: disable=broad-except
+            try:
+                pipe.put(error)
+            except StreamClosed:
+                pass
+
+    threading.Thread(target=produce, name='output-stream', daemon=True).start()
+
+    try:
+        while True:
+            chunk = pipe.chunks.get()
+            if chunk is _DONE:
+                return
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+    finally:
+        pipe.closed.set()
@@ -0,0 +1,83 @@
+import app.constants.assets as assets
+
+from app.helpers.exceptions import EnergysystemParseError
+from app.helpers.kpi_engine import KPIEngine
+from app.services.query_scenario import CachedQueryScenario
+
+KPIS = 'KPIs'
+
+
+class QueryPlanner():
+    """
+    Plans the gqueries needed to update an ESDL energy system to its ETM scenario: those of the
+    KPIs in the energy system and of every supply type that can be updated. They are queried in
+    one round trip, after which each consumer (the KPIs or a supply type) gets its own slice of
+    the results.
+    """
+
+    def __init__(self, energy_system, etm):
+        self.energy_system = energy_system
+        self.etm = etm
+        self.plan = {}
+        self.results = {}
+
+
+    def __call__(self):
+        """
+        Plan and execute the gqueries, returns the planner
+        """
+        self.make_plan()
+        self.execute()
+
+        return self
+
+
+    def make_plan(self):
+        """
+        Gather the gqueries of every consumer
+        """
+        self.plan = {}
+
+        kpi_props = [prop for _, prop in KPIEngine(self.energy_system, self.etm).present()]
+        if kpi_props:
+            self.plan[KPIS] = KPIEngine.gqueries(kpi_props)
+
+        for asset_type in self.supply_types():
+            self.plan[asset_type] = [prop['gquery'] for prop in assets.supply[asset_type]]
+
+
+    def execute(self):
+        """
+        Query the gqueries of all consumers in one go
+        """
+        list_of_gqueries = list(dict.fromkeys(
+            gquery for gqueries in self.plan.values() for gquery in gqueries))
+
+        if not list_of_gqueries:
+            return
+
+        query_result = CachedQueryScenario(self.etm.environment, self.etm.scenario_id)(
+            *list_of_gqueries)
+
+        if not query_result.successful:
+            raise EnergysystemParseError(
+                f'The ETM scenario could not be queried: {", ".join(query_result.errors)}')
+
+        self.results = query_result.value
+
+
+    def results_for(self, consumer):
+        """
+        The results of the gqueries of the consumer
+        """
+        return {gquery: self.results[gquery] for gquery in self.plan.get(consumer, ())}
+
+
+    @staticmethod
+    def supply_types():
+        """
+        The supply types that can be updated: all their props have a gquery
+        """
+        return [
+            asset_type for asset_type, props in assets.supply.items()
+            if all(prop.get('gquery') for prop in props)]
@@ -1,4 +1,4 @@
-from app.constants.inputs import input_values
+from app.constants.inputs import new_input_values
 
 
 class RooftopPV():
@@ -9,9 +9,10 @@ class RooftopPV():
     Note: it assumes the units of the potential and used energy to be the same.
     """
 
-    def __init__(self, energy_system, props):
+    def __init__(self, energy_system, props, input_values=None):
         self.energy_system = energy_system
         self.props = props
+        self.input_values = new_input_values() if input_values is None else input_values
         self.potential = 0.
         self.production = 0.
         self.percentage_used = 0.
@@ -80,4 +81,4 @@ class RooftopPV():
         if self.potential > 0:
             for prop in self.props:
                 for key in prop['inputs'].values():
-                    input_values[key]['value'] = self.percentage_used * prop['factor']
+                    self.input_values[key]['value'] = self.percentage_used * prop['factor']
@@ -1,22 +1,22 @@
 import app.constants.assets as assets
-from app.constants.inputs import input_values
-# TODO: why are we importing everything here?
-from app.esdl.esdl import *
+from app.constants.inputs import new_input_values
 from app.helpers.edr import EnergyDataRepository
+from app.helpers.exceptions import EnergysystemParseError
 
-from app.services.query_scenario import QueryScenario
+from app.services.query_scenario import CachedQueryScenario
 
 
 class Supply():
     """
     Class to parse ESDL information about a single supply asset and
-    translate it to the relevant ETM inputs.
+    translate it to the relevant ETM inputs (of the translation, or new ones).
     """
 
-    def __init__(self, energy_system, asset_type, props):
+    def __init__(self, energy_system, asset_type, props, input_values=None):
         self.energy_system = energy_system
         self.asset_type = asset_type
         self.props = props
+        self.input_values = new_input_values() if input_values is None else input_values
         self.list_of_assets = []
         self.power = 0.
         self.full_load_hours = 0.
@@ -34,12 +34,14 @@ class Supply():
         self.set_props(overwrite)
 
 
-    def update(self, etm):
+    def update(self, etm, results=None):
         """
-        Update the power and full load hours based on the ETM inputs
+        Update the power and full load hours based on the ETM inputs. The
+        gqueries are queried, unless their results are given (by the
+        QueryPlanner)
         """
         self.call()
-        self.update_props(etm)
+        self.update_props(etm, results)
 
 
     def all_instances(self):
@@ -70,8 +72,8 @@ class Supply():
                 etm_value = esdl_value * prop['factor']
 
                 # Initialise the input value if it hasn't been touched yet
-                if not input_values[prop['input']]['value']:
-                    input_values[prop['input']]['value'] = 0
+                if not self.input_values[prop['input']]['value']:
+                    self.input_values[prop['input']]['value'] = 0
 
                 # Keep track of the installed capacity to determine the average FLH
                 if prop['attribute'] == 'power':
@@ -80,7 +82,7 @@ class Supply():
                     # print(f'CAP = {total_power}')
 
                 elif prop['attribute'] == 'fullLoadHours':
-                    prev_etm_value = input_values[prop['input']]['value']
+                    prev_etm_value = self.input_values[prop['input']]['value']
                     diff = etm_value - prev_etm_value # 1920 - 2500 = -580
                     etm_value = diff * current_power / total_power # -580 * 13 / 19
                     full_load_hours += etm_value
@@ -88,7 +90,7 @@ class Supply():
 
                 # Update ETM input value when these should be overwritten
                 if overwrite:
-                    input_values[prop['input']]['value'] += etm_value
+                    self.input_values[prop['input']]['value'] += etm_value
 
             self.power = total_power
             self.full_load_hours = full_load_hours
@@ -97,34 +99,39 @@ class Supply():
         print(f'self.full_load_hours = {self.full_load_hours}')
 
 
-    def query_scenario(self, etm, prop):
+    def query_scenario(self, etm):
         """
-        TODO
+        Query the ETM scenario for the gqueries of all props at once
         """
-        query_result = QueryScenario(etm.environment, etm.scenario_id)(prop['gquery'])
+        gqueries = [prop['gquery'] for prop in self.props]
+        query_result = CachedQueryScenario(etm.environment, etm.scenario_id)(*gqueries)
 
         if query_result.successful:
-            return query_result.value[prop['gquery']]['future'] / prop['factor']
+            return query_result.value
 
         raise EnergysystemParseError(
-            f"We currently do not support the ETM gquery listed in the config: {prop['gquery']}"
+            "We currently do not support the ETM gqueries listed in the config: " +
+            ', '.join(gqueries)
         )
 
 
-    def update_props(self, etm):
+    def update_props(self, etm, results=None):
         """
-        TODO
+        Update the full load hours and power of the assets to the ETM values.
+        The results of the gqueries are queried when they are not given
         """
+        if results is None:
+            results = self.query_scenario(etm)
+
         list_of_props = {}
         for prop in self.props:
             list_of_props[prop['attribute']] = prop
 
         # First, update the full load hours. This value is necessary for the
         # measures that follow from updating the power.
-        # TODO: Send the queries in batches instead of one-by-one
         for attr in ['fullLoadHours', 'power']:
             prop = list_of_props[attr]
-            val = self.query_scenario(etm, prop)
+            val = results[prop['gquery']]['future'] / prop['factor']
 
             if attr == 'fullLoadHours':
                 self.update_flh(val / prop['factor'])
@@ -145,8 +152,9 @@ class Supply():
         """
         self.full_load_hours = val
 
+        # Full load hours are whole numbers in ESDL
         for asset in self.list_of_assets:
-            asset.fullLoadHours = val
+            asset.fullLoadHours = int(val)
 
 
     def remove_assets(self, diff):
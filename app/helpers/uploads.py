@@ -0,0 +1,61 @@
+'''
+Files uploaded to the app, like an ESDL file posted to create_scenario as multipart/form-data.
+The files in a request are spooled: kept in memory up to UPLOAD_SPOOL_SIZE bytes, and written to a
+temporary file on disk beyond that, so large uploads are never held in memory as a whole. They are
+parsed from there, decompressed on the fly when they are gzip compressed.
+'''
+
+from gzip import GzipFile
+from tempfile import SpooledTemporaryFile
+
+from flask import Request, current_app
+
+# The first bytes of a gzip file
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+class UploadRequest(Request):
+    """
+    The requests of the app, which spool their files up to UPLOAD_SPOOL_SIZE bytes in memory
+    """
+    # pylint: disable=unused-argument
+    def _get_file_stream(self, total_content_length, content_type, filename=None,
+                         content_length=None):
+        return SpooledTemporaryFile(current_app.config['UPLOAD_SPOOL_SIZE'], 'rb+')
+
+
+def open_upload(upload):
+    '''
+    A stream of the contents of the uploaded file (a FileStorage), decompressed while it is read
+    when the file is gzip compressed
+    '''
+    stream = upload.stream
+    stream.seek(0)
+    compressed = stream.read(len(GZIP_MAGIC)) == GZIP_MAGIC
+    stream.seek(0)
+
+    return GzipFile(fileobj=stream, mode='rb') if compressed else stream
+
+
+def upload_title(upload):
+    '''The name of the uploaded file, without the .gz extension of a compressed file'''
+    filename = (upload.filename or '').replace('\\', '/').rsplit('/', 1)[-1]
+    if filename.endswith('.gz'):
+        filename = filename[:-len('.gz')]
+
+    return filename or None
+
+
+def upload_file(upload):
+    '''
+    A real file with the contents of the uploaded file (a FileStorage), for readers that need one
+    (like zipfile and tarfile, which ask the stream whether it is seekable): a file spooled in
+    memory is written to disk first
+    '''
+    stream = upload.stream
+    if isinstance(stream, SpooledTemporaryFile):
+        stream.rollover()
+        stream = stream._file # pylint: disable=protected-access
+
+    stream.seek(0)
+    return stream
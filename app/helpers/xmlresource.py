@@ -1,10 +1,20 @@
 '''
 A copy of XMIResource, with minor changes (see comments made by edwinmatthijsen/ewoudwerkman)
 see https://github.com/pyecore/pyecore/blob/master/pyecore/resources/xmi.py for the source
+
+Saving does not build an lxml tree: the objects are written one by one to the output stream by
+an XMLWriter, producing the same (pretty printed) XML the lxml tree used to.
 '''
+from pyecore.resources import URI
 from pyecore.resources.xmi import XMIResource, XMIOptions, XMI_URL, XSI_URL, XSI
-# pylint: disable=no-name-in-module
-from lxml.etree import QName, Element, ElementTree
+
+# Characters that are escaped in attribute values and in text, the same way libxml2 does
+ATTRIBUTE_ESCAPES = str.maketrans({
+    '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;',
+    '\n': '&#10;', '\r': '&#13;', '\t': '&#9;'
+})
+TEXT_ESCAPES = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '\r': '&#13;'})
+
 
 class XMLResource(XMIResource):
     ''' XML version of XMIResource '''
@@ -13,44 +23,224 @@ class XMLResource(XMIResource):
         self._later = []
         self.prefixes = {}
         self.reverse_nsmap = {}
+        self._declared = set()
 
-    def save(self, output=None, options=None):
+    def save(self, output=None, options=None, pretty_print=True):
+        '''
+        Writes the contents to the output: a URI, a file name or a writable file-like object (like
+        an open file or a response stream). Defaults to the URI of the resource.
+        '''
         self.options = options or {}
-        output = self.open_out_stream(output)
+        serialize_default = self.options.get(XMIOptions.SERIALIZE_DEFAULT_VALUES, False)
+
+        if hasattr(output, 'write'):
+            uri, stream = None, output
+        else:
+            uri = output if isinstance(output, URI) else URI(output) if output else self.uri
+            stream = uri.create_outstream()
+
         self.prefixes.clear()
         self.reverse_nsmap.clear()
 
-        serialize_default = \
-            self.options.get(XMIOptions.SERIALIZE_DEFAULT_VALUES,
-                             False)
-        nsmap = {XSI: XSI_URL} # remove XMI for XML serialization
+        # The namespaces are declared on the root element before anything else is written, so
+        # they are registered up front (remove XMI for XML serialization, unless it is used)
+        self.register_nsmap(XSI, XSI_URL)
+        if self.use_uuid or len(self.contents) != 1:
+            self.register_nsmap('xmi', XMI_URL)
+        for root in self.contents:
+            self.register_eobject_epackage(root)
+        self._declared = set(self.reverse_nsmap)
+
+        writer = XMLWriter(stream, pretty_print)
+        writer.declaration()
 
         if len(self.contents) == 1:
-            root = self.contents[0]
-            self.register_eobject_epackage(root)
-            tmp_xmi_root = self._go_across(root, serialize_default)
+            self._write_eobject(writer, self.contents[0], serialize_default, self._namespaces())
         else:
             # this case hasn't been verified for XML serialization
-            tag = QName(XMI_URL, 'XMI')
-            tmp_xmi_root = Element(tag)
+            writer.start(self._qualified(XMI_URL, 'XMI'), self._namespaces())
             for root in self.contents:
-                root_node = self._go_across(root, serialize_default)
-                tmp_xmi_root.append(root_node)
-
-        # update nsmap with prefixes register during the nodes creation
-        nsmap.update(self.prefixes)
-        xmi_root = Element(tmp_xmi_root.tag, nsmap=nsmap)
-        xmi_root[:] = tmp_xmi_root[:]
-        xmi_root.attrib.update(tmp_xmi_root.attrib)
-
-        # remove XMI version in XML serialization
-        #xmi_version = etree.QName(XMI_URL, 'version')
-        #xmi_root.attrib[xmi_version] = '2.0'
-
-        tree = ElementTree(xmi_root)
-        tree.write(output,
-                   pretty_print=True,
-                   xml_declaration=True,
-                   encoding=tree.docinfo.encoding)
-        output.flush()
-        self.uri.close_stream()
+                self._write_eobject(writer, root, serialize_default)
+            writer.end(self._qualified(XMI_URL, 'XMI'))
+
+        writer.close()
+        stream.flush()
+
+        if uri:
+            uri.close_stream()
+
+    def _write_eobject(self, writer, obj, serialize_default, attributes=None):
+        '''
+        Writes the object and everything it contains. Like _go_across, but the attributes are
+        collected first and the contents are written right away, instead of creating elements
+        '''
+        attributes = list(attributes or ())
+        # the elements inside the node, in the order of the features: ('element', tag, attributes,
+        # text) for elements that were created by _go_across, or ('eobject', child)
+        contents = []
+
+        eclass = obj.eClass
+        if not obj.eContainmentFeature():  # obj is the root
+            nsURI = eclass.ePackage.nsURI
+            tag = self._qualified(nsURI, eclass.name) if nsURI else eclass.name
+        else:
+            tag = obj.eContainmentFeature().name
+            if obj.eContainmentFeature()._eType != eclass:
+                attributes[0:0] = self._explicit_type(obj)
+
+        if self.use_uuid:
+            self._assign_uuid(obj)
+            attributes.append((self._qualified(XMI_URL, 'id'), obj._internal_id))
+
+        for feat in obj._isset:
+            if feat.derived or feat.transient:
+                continue
+            feat_name = feat.name
+            value = obj.__getattribute__(feat_name)
+            if value is None:
+                if serialize_default:
+                    nil = (self._qualified(XSI_URL, 'nil'), 'true')
+                    contents.append(('element', feat_name, [nil], None))
+                continue
+            if hasattr(feat._eType, 'eType') and feat._eType.eType is dict:
+                for key, val in value.items():
+                    contents.append(('element', feat_name, [('key', key), ('value', val)], None))
+            elif feat.is_attribute:
+                etype = feat._eType
+                if feat.many and value:
+                    to_str = etype.to_string
+                    result_list = [to_str(v) for v in value]
+                    if any(x.isspace() for string in result_list for x in string):
+                        for string in result_list:
+                            contents.append(('element', feat_name, [], string))
+                    else:
+                        attributes.append((feat_name, ' '.join(result_list)))
+                    continue
+                default_value = feat.get_default_value()
+                if value != default_value or serialize_default:
+                    attributes.append((feat_name, etype.to_string(value)))
+                continue
+
+            elif feat.is_reference and \
+                    feat.eOpposite and feat.eOpposite.containment:
+                continue
+            elif feat.is_reference and not feat.containment:
+                values = value if feat.many else [value]
+                embedded = []
+                for target in values:
+                    frag, is_crossref = self._build_path_from(target)
+                    if is_crossref:
+                        contents.append(('element', feat_name,
+                                         [('href', frag), *self._explicit_type(target)], None))
+                    else:
+                        embedded.append(frag)
+                if embedded:
+                    attributes.append((feat_name, ' '.join(embedded)))
+
+            if feat.is_reference and feat.containment:
+                children = value if feat.many else [value]
+                contents.extend(('eobject', child) for child in children)
+
+        if not contents:
+            writer.empty(tag, attributes)
+            return
+
+        writer.start(tag, attributes)
+        for content in contents:
+            if content[0] == 'eobject':
+                self._write_eobject(writer, content[1], serialize_default)
+            else:
+                _, sub_tag, sub_attributes, text = content
+                if text is None:
+                    writer.empty(sub_tag, sub_attributes)
+                else:
+                    writer.text_element(sub_tag, sub_attributes, text)
+        writer.end(tag)
+
+    def _explicit_type(self, obj):
+        '''The xsi:type attribute of the object, with the declaration of its namespace if needed'''
+        epackage = obj.eClass.ePackage
+        if epackage.nsURI not in self.reverse_nsmap:
+            self.register_nsmap(epackage.nsPrefix, epackage.nsURI)
+
+        prefix = self.reverse_nsmap[epackage.nsURI]
+        xsi_type = (self._qualified(XSI_URL, 'type'), '{0}:{1}'.format(prefix, obj.eClass.name))
+
+        # The root element was already written for objects of other packages than the one of
+        # the root, so their namespace is declared where it is used
+        if epackage.nsURI not in self._declared:
+            return [(f'xmlns:{prefix}', epackage.nsURI), xsi_type]
+
+        return [xsi_type]
+
+    def _namespaces(self):
+        '''The namespace declarations of the root element'''
+        return [(f'xmlns:{prefix}', uri) for prefix, uri in self.prefixes.items()]
+
+    def _qualified(self, uri, name):
+        '''The prefixed name in the given (registered) namespace'''
+        return f'{self.reverse_nsmap[uri]}:{name}'
+
+
+class XMLWriter():
+    """
+    Writes XML incrementally to a binary stream (UTF-8), indented the way lxml pretty prints.
+    Writes are buffered in chunks of about 64 kB.
+    """
+    CHUNK_SIZE = 1 << 16
+
+    def __init__(self, stream, pretty_print=True):
+        self.stream = stream
+        self.pretty_print = pretty_print
+        self._depth = 0
+        self._parts = []
+        self._size = 0
+
+    def declaration(self):
+        self._write("<?xml version='1.0' encoding='UTF-8'?>\n")
+
+    def start(self, tag, attributes):
+        self._indent()
+        self._write(f'<{tag}{self._attributes(attributes)}>')
+        self._depth += 1
+
+    def end(self, tag):
+        self._depth -= 1
+        if self.pretty_print:
+            self._write('\n' + '  ' * self._depth)
+        self._write(f'</{tag}>')
+
+    def empty(self, tag, attributes):
+        self._indent()
+        self._write(f'<{tag}{self._attributes(attributes)}/>')
+
+    def text_element(self, tag, attributes, text):
+        self._indent()
+        self._write(f'<{tag}{self._attributes(attributes)}>{text.translate(TEXT_ESCAPES)}</{tag}>')
+
+    def close(self):
+        '''Writes what is left in the buffer'''
+        if self.pretty_print:
+            self._write('\n')
+        self._flush()
+
+    @staticmethod
+    def _attributes(attributes):
+        return ''.join(
+            f' {name}="{value.translate(ATTRIBUTE_ESCAPES)}"' for name, value in attributes)
+
+    def _indent(self):
+        if self.pretty_print and self._depth:
+            self._write('\n' + '  ' * self._depth)
+
+    def _write(self, string):
+        self._parts.append(string)
+        self._size += len(string)
+        if self._size >= self.CHUNK_SIZE:
+            self._flush()
+
+    def _flush(self):
+        if self._parts:
+            self.stream.write(''.join(self._parts).encode('UTF-8'))
+            self._parts = []
+            self._size = 0
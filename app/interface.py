@@ -2,24 +2,25 @@ import sys
 
 import webbrowser
 
-import urllib.parse
-
 import app.constants.areas as areas
 import app.constants.assets as assets
 import app.constants.key_figures as key_figures
 import app.constants.kpis as kpis
 
 from app.constants.q_and_u import quantities
-from app.constants.inputs import input_values
+from app.constants.inputs import new_input_values
 
 from app.helpers.balancer import Balancer
 from app.helpers.energy_system_handler import EnergySystemHandler
 from app.helpers.ETM_API import ETM_API
 from app.helpers.exceptions import EnergysystemParseError
+from app.helpers.kpi_engine import KPIEngine
+from app.helpers.query_planner import KPIS, QueryPlanner
 from app.helpers.rooftop_pv import RooftopPV
+from app.helpers.StringURI import unquote_to_buffer
 from app.helpers.supply import Supply
+from app.services.bootstrap_scenario import BootstrapScenario
 
-from app.services.query_scenario import QueryScenario
 
 def start_etm_session(environment, scenario_id=None):
     """
@@ -50,76 +51,26 @@ def add_quantity_and_units(energy_system):
             q_and_u.quantityAndUnit.append(unit)
 
 
-def update_kpis(energy_system, etm):
+def update_kpis(energy_system, etm, metrics=None):
     """
-    TODO
+    Update the KPIs of the energy system based on the ETM metrics, which are
+    queried all at once (unless they are given)
     """
+    KPIEngine(energy_system, etm).update(metrics)
 
-    for kpi in energy_system.es.instance[0].area.KPIs.kpi:
-        prop = kpis.gqueries[kpi.id]
-
-        list_of_gqueries = [gquery['gquery'] for gquery in prop['gqueries']]
-        query_result = QueryScenario(etm.environment, etm.scenario_id)(*list_of_gqueries)
-
-        if not query_result.successful: raise ValueError(query_result.errors)
-        metrics = query_result.value
-
-        if prop['esdl_type'] == 'DistributionKPI':
-            for it in kpi.distribution.stringItem:
-                kpi.distribution.stringItem.remove(it)
-
-            for gquery in prop['gqueries']:
-                val = metrics[gquery['gquery']]['future'] * prop['factor']
 
-                if val != 0:
-                    kpi.distribution.stringItem.append(energy_system.esdl.StringItem(
-                        label=gquery['label'],
-                        value=val))
-
-        else:
-            kpi.value = metrics[prop['gqueries'][0]['gquery']]['future'] * prop['factor']
-
-
-def add_kpis(energy_system, etm):
+def add_kpis(energy_system, etm, metrics=None):
     """
-    TODO
+    Add the KPIs to the energy system based on the ETM metrics, which are
+    queried all at once (unless they are given)
     """
-    energy_system.add_kpis()
+    KPIEngine(energy_system, etm).add(metrics)
 
-    for kpi_id, prop in kpis.gqueries.items():
-        list_of_gqueries = [gquery['gquery'] for gquery in prop['gqueries']]
-        query_result = QueryScenario(etm.environment, etm.scenario_id)(*list_of_gqueries)
 
-        if not query_result.successful: raise ValueError(query_result.errors)
-        metrics = query_result.value
-
-        kpi = energy_system.create_kpi(
-            prop['esdl_type'],
-            kpi_id,
-            prop['name'],
-            energy_system.get_by_id_slow(prop['q_and_u']))
-
-        if prop['esdl_type'] == 'DistributionKPI':
-            kpi.distribution = energy_system.esdl.StringLabelDistribution()
-
-            for gquery in prop['gqueries']:
-                val = metrics[gquery['gquery']]['future'] * prop['factor']
-
-                if val != 0:
-                    kpi.distribution.stringItem.append(energy_system.esdl.StringItem(
-                        label=gquery['label'],
-                        value=val))
-
-        else:
-            kpi.value = metrics[prop['gqueries'][0]['gquery']]['future'] * prop['factor']
-
-        print(f'Adding KPI of type: {type(kpi)}')
-        energy_system.add_kpi(kpi)
-
-
-def determine_number_of_buildings(energy_system):
+def determine_number_of_buildings(energy_system, input_values=None):
     """
-    Determine the number of buildings per building type
+    Determine the number of buildings per building type, and set the number of
+    residences in the input values (when given)
     """
     number_of_buildings = {
         'RESIDENTIAL': 0,
@@ -138,8 +89,9 @@ def determine_number_of_buildings(energy_system):
 
                 number_of_buildings[building_type] += number
 
-                input_values['households_number_of_residences']['value'] = (
-                    number_of_buildings['RESIDENTIAL'])
+                if input_values is not None:
+                    input_values['households_number_of_residences']['value'] = (
+                        number_of_buildings['RESIDENTIAL'])
 
                 # print(f'number_of_buildings = {number_of_buildings}')
 
@@ -168,7 +120,8 @@ def parse_heating_technology(
         aggregated_building,
         building_type,
         number_of_buildings,
-        total_number_of_buildings):
+        total_number_of_buildings,
+        input_values):
     """
     TODO
     """
@@ -232,7 +185,8 @@ def parse_energy_labels(
         aggregated_building,
         building_type,
         number_of_buildings,
-        total_number_of_buildings):
+        total_number_of_buildings,
+        input_values):
     """
     TODO
     """
@@ -254,7 +208,7 @@ def parse_energy_labels(
         input_values[input_value]['value'] += etm_value
 
 
-def parse_aggregated_buiding(energy_system, area, total_number_of_buildings):
+def parse_aggregated_buiding(energy_system, area, total_number_of_buildings, input_values):
     """
     TODO
     """
@@ -273,14 +227,16 @@ def parse_aggregated_buiding(energy_system, area, total_number_of_buildings):
                 aggregated_building,
                 building_type,
                 number_of_buildings,
-                total_number_of_buildings)
+                total_number_of_buildings,
+                input_values)
 
             # Parse distribution of energy labels
             parse_energy_labels(
                 aggregated_building,
                 building_type,
                 number_of_buildings,
-                total_number_of_buildings)
+                total_number_of_buildings,
+                input_values)
 
     except:
         pass
@@ -288,37 +244,64 @@ def parse_aggregated_buiding(energy_system, area, total_number_of_buildings):
 
 def translate_esdl_to_slider_settings(energy_system, environment):
     """
-    TODO
+    Create a new ETM scenario for the energy system, with its sliders set to
+    the translated energy system. The scenario is created with its sliders in
+    one request, which also asks for the gqueries of the KPIs.
+    Returns the ServiceResult of the creation, with the scenario id and the
+    metrics of the KPIs as value
     """
-    # Reset input_values
-    for input_name, value in input_values.items():
-        value['value'] = None
+    # Use the API to create a new ETM scenario for this specific region, with
+    # all new sliders set simultaneously
+    return BootstrapScenario(environment)(*scenario_settings(energy_system))
 
+
+async def translate_esdl_to_slider_settings_async(energy_system, environment):
+    """
+    Coroutine version of translate_esdl_to_slider_settings: the energy system
+    is translated right away, the creation of the scenario is awaited
+    """
+    return await BootstrapScenario(environment).call_async(*scenario_settings(energy_system))
+
+
+def scenario_settings(energy_system):
+    """
+    The title, area code, end year, sliders and gqueries of the scenario of
+    the energy system
+    """
     # Determine top level area
     top_area = energy_system.es.instance[0].area
 
-    # Use the API to create a new (empty) ETM scenario for this specific region
-    etm = start_etm_session(environment)
-
-    etm.create_new_scenario(
+    return (
         f'Mondaine - {energy_system.es.name}',
         areas.mapping[top_area.id],
-        2050)
+        2050,
+        translate_to_sliders(energy_system),
+        KPIEngine.gqueries(kpis.gqueries.values()))
+
 
-    number_of_buildings = determine_number_of_buildings(energy_system)
+def translate_to_sliders(energy_system):
+    """
+    Translate the energy system into slider settings
+    """
+    # Every translation starts from its own, untouched input values
+    input_values = new_input_values()
+
+    top_area = energy_system.es.instance[0].area
+    number_of_buildings = determine_number_of_buildings(energy_system, input_values)
 
     # Parse supply assets and calculate the new input values
     for asset_type, properties in assets.supply.items():
         if asset_type == 'RooftopPV':
-            RooftopPV(energy_system, properties).call()
+            RooftopPV(energy_system, properties, input_values).call()
         else:
-            Supply(energy_system, asset_type, properties).call(overwrite=True)
+            Supply(energy_system, asset_type, properties, input_values).call(overwrite=True)
 
     for sub_area in top_area.area:
         parse_aggregated_buiding(
             energy_system,
             sub_area,
-            number_of_buildings)
+            number_of_buildings,
+            input_values)
 
     # Balance share groups
     balanced_input_values = Balancer(input_values).call()
@@ -331,16 +314,14 @@ def translate_esdl_to_slider_settings(energy_system, environment):
             print(f"{input_name}: {input_value['value']}")
             set_sliders[input_name] = input_value['value']
 
-    # Set all new sliders simultaneously
-    response = etm.change_inputs(set_sliders)
-
-    return etm, response
+    return set_sliders
 
 
-def add_kpis_to_esdl(energy_system, environment, scenario_id):
+def add_kpis_to_esdl(energy_system, environment, scenario_id, metrics=None):
     """
     After adding the KPI's to the EnergySystem, it's no longer able to be
-    converted into either a file or an esdl string
+    converted into either a file or an esdl string. The metrics are queried
+    when they are not given
     """
     etm = start_etm_session(environment, scenario_id)
 
@@ -348,7 +329,7 @@ def add_kpis_to_esdl(energy_system, environment, scenario_id):
     add_quantity_and_units(energy_system)
 
     # Add (empty) KPIs and targets and update KPIs based on ETM metrics
-    add_kpis(energy_system, etm)
+    add_kpis(energy_system, etm, metrics)
 
     # Just for testing:
     # f = open('data/output/test_import_1.esdl', 'a')
@@ -358,16 +339,19 @@ def add_kpis_to_esdl(energy_system, environment, scenario_id):
 
 def update_esdl(energy_system, environment, scenario_id):
     """
-    TODO
+    Update the energy system to the ETM scenario. Everything that is needed
+    from the scenario is queried in one go
     """
     etm = start_etm_session(environment, scenario_id)
+    planner = QueryPlanner(energy_system, etm)()
 
     # Update KPIs
-    update_kpis(energy_system, etm)
+    update_kpis(energy_system, etm, planner.results_for(KPIS))
 
-    # Update capacities of wind turbines and possibly add measures
-    for asset_type in ['WindTurbine']:
-        Supply(energy_system, asset_type, assets.supply[asset_type]).update(etm)
+    # Update capacities of supply (wind turbines) and possibly add measures
+    for asset_type in planner.supply_types():
+        Supply(energy_system, asset_type, assets.supply[asset_type]).update(
+            etm, planner.results_for(asset_type))
 
     # Just for testing:
     # f = open('data/output/test.esdl', 'a')
@@ -376,14 +360,33 @@ def update_esdl(energy_system, environment, scenario_id):
 
     return energy_system
 
-def setup_esh_from_energy_system(energy_system):
+def setup_esh_from_energy_system(energy_system, extract=False):
+    """
+    Loads the energy system from a URL encoded ESDL string (as posted in a form), or from bytes or
+    a file-like object. Strings are unquoted straight into a buffer, which is parsed without
+    copying it again. With extract only the parts that are translated into slider settings are
+    read (see esdl_extract.py)
+    """
     esh = EnergySystemHandler()
     try:
-        esdl_string = urllib.parse.unquote(energy_system)
-        esh.load_from_string(esdl_string)
+        if isinstance(energy_system, str):
+            energy_system = unquote_to_buffer(energy_system)
+        if extract:
+            esh.extract_energy_system(energy_system)
+        else:
+            esh.load(energy_system)
         return esh
+    except EnergysystemParseError:
+        raise
     except Exception as e:
-        return 'could not load ESDL: '+ str(e), 404
+        raise EnergysystemParseError('could not load ESDL: ' + str(e)) from e
+
+async def setup_esh_from_energy_system_async(energy_system):
+    """
+    Coroutine version of setup_esh_from_energy_system. Loading does not wait
+    for anything, it runs while the other coroutines wait for ETEngine
+    """
+    return setup_esh_from_energy_system(energy_system)
 
 def setup_esh_from_scenario(environment, scenario_id):
     esh = EnergySystemHandler()
@@ -1,24 +1,65 @@
 ''' Service for uploading an ESDL file to ETEngine'''
 
+from gzip import GzipFile
+from shutil import copyfileobj
+from tempfile import SpooledTemporaryFile
+from uuid import uuid4
+
+from flask import current_app
+
+try:
+    from urllib3.fields import format_multipart_header_param
+except ImportError: # urllib3 1.x
+    from urllib3.fields import format_header_param_html5 as format_multipart_header_param
+
 from app.services.etengine_service import EtengineService
 from app.services.service_result import ServiceResult
 
 class AttachEsdlToEtengine(EtengineService):
-    def __call__(self, energy_system_stream, title):
+    def __call__(self, energy_system, title):
         """
-        Attach the energy system to the scenario
+        Attach the energy system to the scenario. The energy system is either an
+        EnergySystemHandler, which is serialized straight into the upload, or a stream of ESDL
         """
-        # Rewind the BytesIO stream just to be sure
-        energy_system_stream.seek(0)
-        files = {"file": (title, energy_system_stream)}
-        response = self.session.put(
-            '/scenarios/' + str(self.scenario_id) + "/esdl_file",
-            files=files,
-            headers={'Connection': 'close'}
-        )
+        with self.__body(energy_system, title) as body:
+            response = self.session.put(
+                '/scenarios/' + str(self.scenario_id) + "/esdl_file",
+                data=body,
+                headers=body.headers()
+            )
 
         return self.__handle_response(response)
 
+    async def call_async(self, energy_system, title):
+        """
+        Coroutine version of the upload, so it can run concurrently with other requests
+        """
+        with self.__body(energy_system, title) as body:
+            response = await self.async_session.put(
+                '/scenarios/' + str(self.scenario_id) + "/esdl_file",
+                data=body,
+                headers=body.headers()
+            )
+
+        return self.__handle_response(response)
+
+    def __body(self, energy_system, title):
+        config = current_app.config
+
+        if hasattr(energy_system, 'read'):
+            # Rewind the stream just to be sure
+            energy_system.seek(0)
+            write = lambda output: copyfileobj(energy_system, output)
+        else:
+            write = energy_system.write
+
+        return MultipartUpload(
+            title,
+            write,
+            compress=self.environment in config['ETENGINE_GZIP_UPLOADS'],
+            spool_size=config['ETENGINE_UPLOAD_SPOOL_SIZE']
+        )
+
     def __handle_response(self, response):
         '''
         Returns a service result, by which we can check later if it's
@@ -34,3 +75,60 @@ class AttachEsdlToEtengine(EtengineService):
             return ServiceResult.failure(['File is too large'])
 
         return ServiceResult.failure([f'ETEngine returned a {response.status_code}'])
+
+
+class MultipartUpload():
+    """
+    The multipart/form-data body of a file upload. The file is written by the given function to
+    a spooled temporary file (in memory up to spool_size bytes, on disk beyond that), gzip
+    compressed when compress is set, so the upload is never held in memory as a whole. The body
+    is sent in chunks with its length known up front, and can be sent again when a request is
+    retried
+    """
+    replayable = True
+    chunk_size = 1 << 16
+
+    def __init__(self, filename, write, compress=False, spool_size=1 << 22):
+        self.boundary = uuid4().hex
+        self.compressed = compress
+        self.spool = SpooledTemporaryFile(spool_size)
+
+        output = GzipFile(fileobj=self.spool, mode='wb', mtime=0) if compress else self.spool
+        # Escaped like requests escapes the names of the files it uploads, so quotes and line
+        # breaks in the name can't end the header
+        filename = format_multipart_header_param('filename', filename)
+        output.write((
+            f'--{self.boundary}\r\n'
+            f'Content-Disposition: form-data; name="file"; {filename}\r\n'
+            'Content-Type: application/octet-stream\r\n\r\n').encode('UTF-8'))
+        write(output)
+        output.write(f'\r\n--{self.boundary}--\r\n'.encode('UTF-8'))
+
+        if compress:
+            output.close()
+
+        self.length = self.spool.tell()
+
+    def headers(self):
+        headers = {'Content-Type': f'multipart/form-data; boundary={self.boundary}'}
+        if self.compressed:
+            headers['Content-Encoding'] = 'gzip'
+
+        return headers
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        self.spool.seek(0)
+        while True:
+            chunk = self.spool.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        self.spool.close()
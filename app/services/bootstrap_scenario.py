@@ -0,0 +1,84 @@
+''' Service for creating an ETEngine scenario with its sliders set, in as few requests as possible'''
+
+from json.decoder import JSONDecodeError
+from app.services.etengine_service import EtengineService
+from app.services.query_scenario import QueryScenario
+from app.services.service_result import ServiceResult
+
+class BootstrapScenario(EtengineService):
+    def __call__(self, title, area_code, end_year, user_values, gqueries=()):
+        """
+        Create a scenario with the user values (sliders) set in the same request, and ask for the
+        gqueries of the new scenario. When ETEngine does not answer the gqueries on creation, they
+        are queried in a second request.
+        Returns a ServiceResult with the scenario id and a dict of the gquery results as value.
+        """
+        response = self.session.post(
+            '/scenarios',
+            json=self.__data(title, area_code, end_year, user_values, gqueries)
+        )
+        if not response.ok:
+            return self.__handle_failure(response)
+
+        results = self.__handle_creation(response)
+
+        if any(gquery not in results for gquery in gqueries):
+            query_result = QueryScenario(self.environment, self.scenario_id)(*gqueries)
+            if not query_result.successful:
+                return query_result
+
+            results = query_result.value
+
+        return ServiceResult.success({'scenario_id': self.scenario_id, 'gqueries': results})
+
+    async def call_async(self, title, area_code, end_year, user_values, gqueries=()):
+        """
+        Coroutine version of the creation, so other work can be done while ETEngine creates the
+        scenario
+        """
+        response = await self.async_session.post(
+            '/scenarios',
+            json=self.__data(title, area_code, end_year, user_values, gqueries)
+        )
+        if not response.ok:
+            return self.__handle_failure(response)
+
+        results = self.__handle_creation(response)
+
+        if any(gquery not in results for gquery in gqueries):
+            query_result = await QueryScenario(
+                self.environment, self.scenario_id).call_async(*gqueries)
+            if not query_result.successful:
+                return query_result
+
+            results = query_result.value
+
+        return ServiceResult.success({'scenario_id': self.scenario_id, 'gqueries': results})
+
+    def __data(self, title, area_code, end_year, user_values, gqueries):
+        return {
+            "scenario": {
+                "title": title,
+                "area_code": area_code,
+                "end_year": end_year,
+                "user_values": user_values
+            },
+            "gqueries": list(gqueries),
+            "detailed": True
+        }
+
+    def __handle_creation(self, response):
+        '''
+        Stores the id of the created scenario, returns the gquery results ETEngine answered
+        '''
+        self.scenario_id = response.json()['id']
+        return response.json().get('gqueries') or {}
+
+    def __handle_failure(self, response):
+        '''
+        Returns a failed service result, with the errors of ETE when it returned any
+        '''
+        try:
+            return ServiceResult.failure(response.json()['errors'])
+        except (JSONDecodeError, KeyError):
+            return ServiceResult.failure([f'ETEngine returned a {response.status_code}'])
@@ -1,27 +1,143 @@
 '''
-Service to establish a connection to ETEngine
+Service to establish a connection to ETEngine. The connections are pooled: there is one client
+(session) per ETEngine environment per process, which keeps its connections alive and is shared
+by all services. The asyncio version of the client (AsyncSession) makes its requests through the
+same pool, so that independent requests can run concurrently. The timeouts, retries and circuit
+breaker of the clients are described in app/services/resilience.py.
 '''
 
-import requests
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 from flask import current_app
 
+from app.services.resilience import ResilientSession, policy
+
+# The endpoints of ETEngine, their names are used in ETENGINE_TIMEOUTS
+ENDPOINTS = (
+    ('POST', r'/scenarios$', 'create'),
+    ('GET', r'/scenarios/\d+$', 'scenario'),
+    ('PUT', r'/scenarios/\d+$', 'query'),
+    ('PUT', r'/scenarios/\d+/esdl_file$', 'upload'),
+    ('GET', r'/scenarios/\d+/esdl_file$', 'download'),
+    ('GET', r'/scenarios/\d+/inputs$', 'inputs'),
+)
+
+_lock = threading.Lock()
+_clients = {}
+_executor = None
+
 class EtengineService():
     """
     Setup a basic service to connect to ETEngine
     """
     def __init__(self, environment, scenario_id=0):
-        self.session = SessionWithUrlBase(current_app.config['ETENGINE'][environment])
+        self.session = etengine_client(environment)
+        self.async_session = AsyncSession(self.session)
+        self.environment = environment
         self.scenario_id = scenario_id
 
+
+def etengine_client(environment):
+    '''
+    The shared client of the ETEngine environment ("beta" or "pro") in the config. It is created
+    on the first request for the environment, with ETENGINE_POOL_SIZE keep-alive connections and
+    the timeouts, retries and circuit breaker of the ETENGINE settings
+    '''
+    config = current_app.config
+    key = (config['ETENGINE'][environment], config['ETENGINE_POOL_SIZE'], policy(config, 'ETENGINE'))
+
+    client = _clients.get(key)
+    if client is None:
+        with _lock:
+            client = _clients.get(key)
+            if client is None:
+                client = _clients[key] = SessionWithUrlBase(*key)
+
+    return client
+
+
+def etengine_executor():
+    '''
+    The threads in which the requests of the asyncio clients are made, as many as there are
+    connections in a pool
+    '''
+    global _executor
+
+    if _executor is None:
+        pool_size = current_app.config['ETENGINE_POOL_SIZE']
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(pool_size, thread_name_prefix='etengine')
+
+    return _executor
+
+
+def close_etengine_clients():
+    '''Closes the connections of all clients, new clients are created when they are needed'''
+    global _executor
+
+    with _lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
+
+        if _executor is not None:
+            _executor.shutdown()
+            _executor = None
+
+
+def run_concurrently(*coroutines):
+    '''
+    Sync wrapper for the coroutines of the services: runs them concurrently in a new event loop
+    and returns their results (in the same order). For use in the Flask resources, which are not
+    running an event loop themselves
+    '''
+    async def gather():
+        return await asyncio.gather(*coroutines)
+
+    return asyncio.run(gather())
+
+
+class AsyncSession():
+    """
+    Asyncio version of an ETEngine client. The requests are made by the (pooled) client in the
+    threads of the etengine executor, so they can be awaited without blocking the event loop.
+    """
+    def __init__(self, session):
+        self.session = session
+        self.executor = etengine_executor()
+
+
+    async def request(self, method, url, **kwargs):
+        return await asyncio.get_running_loop().run_in_executor(
+            self.executor, partial(self.session.request, method, url, **kwargs))
+
+
+    async def get(self, url, **kwargs):
+        return await self.request('GET', url, **kwargs)
+
+
+    async def post(self, url, **kwargs):
+        return await self.request('POST', url, **kwargs)
+
+
+    async def put(self, url, **kwargs):
+        return await self.request('PUT', url, **kwargs)
+
+
 # Can/should we get rid of this?
-class SessionWithUrlBase(requests.Session):
+class SessionWithUrlBase(ResilientSession):
     """
     Helper class to store the base url. This allows us to only type the
-    relevant additional information.
+    relevant additional information. Also sets the size of the connection pool and the
+    resilience policy of requests.
     from: https://stackoverflow.com/questions/42601812/python-requests-url-base-in-session
     """
-    def __init__(self, url_base=None, *args, **kwargs):
-        super(SessionWithUrlBase, self).__init__(*args, **kwargs)
+    def __init__(self, url_base, pool_size, policy):
+        super(SessionWithUrlBase, self).__init__('ETEngine', policy, ENDPOINTS, pool_size)
         self.url_base = url_base
 
 
@@ -0,0 +1,133 @@
+'''
+Cache of gquery results, in front of QueryScenario (see CachedQueryScenario). Results are keyed by
+(environment, scenario_id, version, gquery), where the version is the updated_at of the scenario:
+when the scenario is changed, in the ETM or by us, its results are no longer found. Our own
+changes (change_inputs) also remove the results of the scenario right away.
+
+The default backend keeps the results in the process (MemoryBackend, bounded by GQUERY_CACHE_SIZE
+and GQUERY_CACHE_TTL in the config). A shared backend can be set as GQUERY_CACHE_BACKEND, it
+should implement get_many, set_many and delete_scenario like MemoryBackend does.
+'''
+
+import threading
+import time
+from collections import OrderedDict
+
+from flask import current_app
+
+_lock = threading.Lock()
+_caches = {}
+
+
+def gquery_cache():
+    '''The process-wide gquery cache, created with the backend from the config on first use'''
+    config = current_app.config
+    key = (config['GQUERY_CACHE_SIZE'], config['GQUERY_CACHE_TTL'], config['GQUERY_CACHE_BACKEND'])
+
+    cache = _caches.get(key)
+    if cache is None:
+        with _lock:
+            cache = _caches.get(key)
+            if cache is None:
+                backend = config['GQUERY_CACHE_BACKEND'] or MemoryBackend(
+                    config['GQUERY_CACHE_SIZE'], config['GQUERY_CACHE_TTL'])
+                cache = _caches[key] = GqueryCache(backend)
+
+    return cache
+
+
+def clear_gquery_caches():
+    '''Forgets all caches (and their counters), new caches are created when they are needed'''
+    with _lock:
+        _caches.clear()
+
+
+class GqueryCache():
+    """
+    Looks up and stores the results of the gqueries of a version of a scenario in the backend,
+    and counts the hits and misses
+    """
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+
+    def get(self, environment, scenario_id, version, gqueries):
+        '''The cached results of the gqueries (a dict), the ones that were not found are left out'''
+        keys = {(environment, str(scenario_id), version, gquery): gquery for gquery in gqueries}
+        found = self.backend.get_many(list(keys))
+
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+
+        return {keys[key]: result for key, result in found.items()}
+
+
+    def set(self, environment, scenario_id, version, results):
+        '''Stores the results (dict of gquery: result) of the version of the scenario'''
+        self.backend.set_many({
+            (environment, str(scenario_id), version, gquery): result
+            for gquery, result in results.items()
+        })
+
+
+    def invalidate(self, environment, scenario_id):
+        '''Removes the results of all versions of the scenario'''
+        self.backend.delete_scenario(environment, str(scenario_id))
+
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses}
+
+
+class MemoryBackend():
+    """
+    In-process LRU backend: holds at most size results, each for at most ttl seconds
+    """
+    def __init__(self, size=10_000, ttl=300):
+        self.size = size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+
+    def get_many(self, keys):
+        found = {}
+        now = time.monotonic()
+
+        with self._lock:
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+
+                expires, result = entry
+                if expires < now:
+                    del self._entries[key]
+                    continue
+
+                self._entries.move_to_end(key)
+                found[key] = result
+
+        return found
+
+
+    def set_many(self, results):
+        expires = time.monotonic() + self.ttl
+
+        with self._lock:
+            for key, result in results.items():
+                self._entries[key] = (expires, result)
+                self._entries.move_to_end(key)
+
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+
+    def delete_scenario(self, environment, scenario_id):
+        with self._lock:
+            for key in [key for key in self._entries if key[:2] == (environment, scenario_id)]:
+                del self._entries[key]
@@ -0,0 +1,332 @@
+'''
+Jobs that run in the background, like creating a scenario with create_scenario?async=true. A
+bounded pool of JOBS_WORKERS threads works through at most JOBS_QUEUE_SIZE waiting jobs; when the
+queue is full new jobs are refused with a 503, so a burst of requests can't pile up without bound.
+Finished jobs are kept for JOBS_TTL seconds, so their results can be polled.
+
+The jobs run in the process that queued them. With JOBS_DIR set, every job is also written to a
+file in that directory whenever its status changes, so it can be polled from any process, like
+the other workers of the server. The process that owns a job writes it again every
+JOBS_HEARTBEAT seconds until it is done: a job that is not done, while the process that owns it
+is gone or stopped writing it, is reported as failed when it is polled.
+'''
+
+import json
+import os
+import re
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import current_app
+
+from app.helpers.exceptions import EnergysystemParseError
+
+# Job ids that can be used as file names
+SAFE_ID = re.compile(r'^[0-9a-f]{32}$')
+
+QUEUED = 'queued'
+RUNNING = 'running'
+FINISHED = 'finished'
+FAILED = 'failed'
+
+# A job that is not done is stale when its owner missed this many heartbeats
+MISSED_HEARTBEATS = 3
+
+_lock = threading.Lock()
+_queues = {}
+
+
+class Job():
+    """
+    A job, with its status and its result when it finished or its errors when it failed. The
+    job is owned by the process (pid) on the host that runs it, which last stored it at heartbeat
+    """
+    # pylint: disable=too-many-arguments disable=too-many-instance-attributes
+    def __init__(self, job_id=None, status=QUEUED, result=None, errors=(), finished_at=None,
+                 host=None, pid=None, heartbeat=None):
+        self.id = job_id or uuid.uuid4().hex
+        self.status = status
+        self.result = result
+        self.errors = list(errors)
+        self.finished_at = finished_at
+        self.host = host or socket.gethostname()
+        self.pid = pid or os.getpid()
+        self.heartbeat = heartbeat or time.time()
+
+
+    @property
+    def done(self):
+        '''Whether the job finished or failed'''
+        return self.status in (FINISHED, FAILED)
+
+
+    def to_dict(self):
+        '''The job as it is reported to the client'''
+        job = {'job_id': self.id, 'status': self.status}
+        if self.status == FINISHED:
+            job.update(self.result or {})
+        elif self.status == FAILED:
+            job['errors'] = self.errors
+
+        return job
+
+
+    def to_file(self):
+        '''Everything about the job, as stored in JOBS_DIR'''
+        return {
+            'job_id': self.id,
+            'status': self.status,
+            'result': self.result,
+            'errors': self.errors,
+            'finished_at': self.finished_at,
+            'host': self.host,
+            'pid': self.pid,
+            'heartbeat': self.heartbeat
+        }
+
+
+    def owner_is_gone(self):
+        '''Whether the process that owns the job is known to have stopped'''
+        if self.host != socket.gethostname():
+            return False
+
+        try:
+            os.kill(self.pid, 0)
+        except ProcessLookupError:
+            return True
+        except OSError:
+            # The process exists, but belongs to someone else
+            pass
+
+        return False
+
+
+class JobQueue():
+    """
+    Runs the jobs in a pool of workers. Every job takes a slot until it's done: there are as many
+    slots as there are workers and places in the queue. Jobs are stored in the directory, when
+    given, and stored again every heartbeat seconds until they are done
+    """
+    # pylint: disable=too-many-arguments disable=too-many-instance-attributes
+    def __init__(self, workers, queue_size, ttl, directory=None, heartbeat=10):
+        self.ttl = ttl
+        self.directory = directory
+        self.heartbeat = heartbeat
+        self.jobs = {}
+        self.executor = ThreadPoolExecutor(workers, thread_name_prefix='jobs')
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._lock = threading.Lock()
+        # Jobs are stored one at a time, so an older state never replaces a newer one
+        self._write_lock = threading.RLock()
+        self._stopped = threading.Event()
+        self._heart = None
+
+
+    def submit(self, function, *args):
+        '''
+        Queues a job that calls the function with the args in the context of the current app.
+        Raises a 503 when the queue is full
+        '''
+        if not self._slots.acquire(blocking=False):
+            raise EnergysystemParseError(
+                'Too many jobs are waiting, please try again later', status_code=503)
+
+        # pylint: disable=protected-access
+        app = current_app._get_current_object()
+
+        job = Job()
+        try:
+            with self._lock:
+                self._expire()
+                self.jobs[job.id] = job
+            self._write(job)
+            self._start_heartbeat(app)
+
+            self.executor.submit(self._run, app, job, function, args)
+        except BaseException:
+            with self._lock:
+                self.jobs.pop(job.id, None)
+            self._remove(job.id)
+            self._slots.release()
+            raise
+
+        return job
+
+
+    def get(self, job_id):
+        '''
+        The job, or None when it's unknown or expired. Jobs of other processes are read from the
+        directory
+        '''
+        with self._lock:
+            job = self.jobs.get(job_id)
+
+        return job or self._read(job_id)
+
+
+    def shutdown(self):
+        '''Waits for the jobs to be done, and stops the heartbeat'''
+        self.executor.shutdown()
+        self._stopped.set()
+        if self._heart is not None:
+            self._heart.join()
+
+
+    def _run(self, app, job, function, args):
+        with app.app_context():
+            job.status = RUNNING
+            self._write(job)
+
+            # The outcome when the job is stopped, by a KeyboardInterrupt or SystemExit
+            result, errors, status = None, ['The job stopped unexpectedly'], FAILED
+            try:
+                result, errors, status = function(*args), [], FINISHED
+            except EnergysystemParseError as error:
+                errors, status = [error.message], FAILED
+            except Exception: # pylint: disable=broad-except
+                app.logger.exception('Job %s failed', job.id)
+                errors, status = ['Something went wrong'], FAILED
+            finally:
+                try:
+                    self._finish(job, status, result, errors)
+                finally:
+                    self._slots.release()
+
+
+    def _finish(self, job, status, result, errors):
+        '''
+        Stores the outcome of the job, and only then reports it as done in this process, so every
+        process sees it done as soon as this one does
+        '''
+        with self._write_lock:
+            done = Job(
+                job.id, status, result, errors, time.time(), job.host, job.pid, job.heartbeat)
+            self._write(done)
+
+            job.result, job.errors, job.finished_at = done.result, done.errors, done.finished_at
+            job.status = status
+
+
+    def _expire(self):
+        for job_id in [job_id for job_id, job in self.jobs.items() if self._expired(job)]:
+            del self.jobs[job_id]
+            self._remove(job_id)
+
+
+    def _expired(self, job):
+        return job.done and job.finished_at < time.time() - self.ttl
+
+
+    def _path(self, job_id):
+        return os.path.join(self.directory, f'{job_id}.json')
+
+
+    def _read(self, job_id):
+        if not self.directory or not SAFE_ID.match(job_id):
+            return None
+
+        try:
+            with open(self._path(job_id)) as job_file:
+                job = Job(**json.load(job_file))
+        except (OSError, ValueError, TypeError):
+            return None
+
+        if self._expired(job):
+            self._remove(job_id)
+            return None
+
+        if not job.done and self._stale(job):
+            # The process that ran the job stopped before it was done (it timed out, was recycled
+            # or ran out of memory)
+            job.status = FAILED
+            job.errors = ['The job stopped unexpectedly']
+            job.finished_at = time.time()
+            self._write(job)
+
+        return job
+
+
+    def _stale(self, job):
+        return job.owner_is_gone() or \
+            job.heartbeat < time.time() - MISSED_HEARTBEATS * self.heartbeat
+
+
+    def _start_heartbeat(self, app):
+        '''Starts storing the jobs that are not done every heartbeat, when they are stored'''
+        if not self.directory or self._heart is not None:
+            return
+
+        with self._lock:
+            if self._heart is None:
+                self._heart = threading.Thread(
+                    target=self._beat, args=(app,), name='jobs-heartbeat', daemon=True)
+                self._heart.start()
+
+
+    def _beat(self, app):
+        with app.app_context():
+            while not self._stopped.wait(self.heartbeat):
+                with self._lock:
+                    jobs = [job for job in self.jobs.values() if not job.done]
+
+                for job in jobs:
+                    with self._write_lock:
+                        # A job that is done was stored for the last time
+                        if not job.done:
+                            job.heartbeat = time.time()
+                            self._write(job)
+
+
+    def _write(self, job):
+        if not self.directory:
+            return
+
+        # Written to a temporary file first, so other processes never read half a job
+        path = self._path(job.id)
+        temporary = f'{path}.{os.getpid()}.{threading.get_ident()}'
+        try:
+            with self._write_lock:
+                data = json.dumps(job.to_file())
+                os.makedirs(self.directory, exist_ok=True)
+                with open(temporary, 'w') as job_file:
+                    job_file.write(data)
+                os.replace(temporary, path)
+        except (OSError, TypeError, ValueError):
+            # The job can still be polled from this process
+            current_app.logger.exception('Job %s could not be stored', job.id)
+
+
+    def _remove(self, job_id):
+        if self.directory:
+            try:
+                os.remove(self._path(job_id))
+            except OSError:
+                pass
+
+
+def job_queue():
+    '''The job queue of the process, with the JOBS settings in the config'''
+    config = current_app.config
+    key = (
+        config['JOBS_WORKERS'], config['JOBS_QUEUE_SIZE'], config['JOBS_TTL'], config['JOBS_DIR'],
+        config['JOBS_HEARTBEAT'])
+
+    queue = _queues.get(key)
+    if queue is None:
+        with _lock:
+            queue = _queues.get(key)
+            if queue is None:
+                queue = _queues[key] = JobQueue(*key)
+
+    return queue
+
+
+def close_job_queues():
+    '''Waits for the running jobs and forgets all jobs'''
+    with _lock:
+        for queue in _queues.values():
+            queue.shutdown()
+        _queues.clear()
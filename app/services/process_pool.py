@@ -0,0 +1,145 @@
+'''
+Runs a function for many items in a pool of processes, so the CPU bound work of converting energy
+systems (parsing, translating and serializing) scales with the number of cores. The processes are
+spawned once and reused. Every call runs in the context of an app with the settings of the
+calling app, and every item gets its own result: an item that fails does not affect the others.
+
+An item that crashes its process breaks the whole pool, and with it the items that were still
+running or waiting. Those are run again in a new pool, one at a time, so only the item that
+crashed fails.
+
+The pool has BULK_PROCESSES processes, or when that is not set, an equal share of the cores of the
+host for each of the SERVER_WORKERS server processes. Each process makes its own calls to ETEngine,
+one item at a time, so no more calls are made at once than there are processes.
+'''
+
+import os
+import pickle
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+
+from flask import current_app
+
+from app.helpers.exceptions import EnergysystemParseError
+
+_lock = threading.Lock()
+_pools = {}
+
+# The apps in a process of the pool, per settings
+_apps = {}
+
+
+def process_pool():
+    '''The pool of the process, with pool_size() processes'''
+    processes = pool_size(current_app.config)
+
+    pool = _pools.get(processes)
+    if pool is None:
+        with _lock:
+            pool = _pools.get(processes)
+            if pool is None:
+                # Spawned instead of forked, as the app runs threads that may hold locks
+                pool = _pools[processes] = ProcessPoolExecutor(
+                    processes, mp_context=get_context('spawn'))
+
+    return pool
+
+
+def pool_size(config):
+    '''
+    BULK_PROCESSES, or the cores of the host divided among the SERVER_WORKERS, as each server
+    process has a pool of its own
+    '''
+    if config['BULK_PROCESSES']:
+        return config['BULK_PROCESSES']
+
+    return max(1, (os.cpu_count() or 1) // config['SERVER_WORKERS'])
+
+
+def close_process_pools():
+    '''Waits for the running items and stops the processes, new pools start when needed'''
+    with _lock:
+        for pool in _pools.values():
+            pool.shutdown()
+        _pools.clear()
+
+
+def run_in_processes(function, items):
+    '''
+    Calls the function (a module level function) with the args of each item in the pool. Returns
+    the results in the order of the items: the value the function returned, or a dict with the
+    errors of the item when it failed
+    '''
+    settings = _settings(current_app.config)
+    results = [None] * len(items)
+
+    pool = process_pool()
+    futures = [pool.submit(_run, settings, function, args) for args in items]
+    unfinished = []
+
+    for index, future in enumerate(futures):
+        try:
+            results[index] = future.result()
+        except BrokenProcessPool:
+            unfinished.append(index)
+
+    if unfinished:
+        _drop_pool(pool)
+
+    # One of the unfinished items crashed the pool, run alone it can only break a pool of its own
+    for index in unfinished:
+        pool = process_pool()
+        try:
+            results[index] = pool.submit(_run, settings, function, items[index]).result()
+        except BrokenProcessPool:
+            _drop_pool(pool)
+            results[index] = {'errors': ['The conversion stopped unexpectedly']}
+
+    return results
+
+
+def _drop_pool(pool):
+    '''A crashed pool can't be used anymore, the next call starts a new one'''
+    with _lock:
+        for processes, other in list(_pools.items()):
+            if other is pool:
+                del _pools[processes]
+    pool.shutdown()
+
+
+def _settings(config):
+    '''The settings of the config that can be sent to another process'''
+    settings = {}
+    for key, value in config.items():
+        if not key.isupper():
+            continue
+        try:
+            pickle.dumps(value)
+        except Exception: # pylint: disable=broad-except
+            continue
+        settings[key] = value
+
+    return settings
+
+
+def _run(settings, function, args):
+    '''Runs in a process of the pool: calls the function in the context of an app'''
+    # pylint: disable=import-outside-toplevel
+    from app import create_app
+
+    key = repr(sorted(settings.items()))
+    app = _apps.get(key)
+    if app is None:
+        app = _apps[key] = create_app()
+        app.config.update(settings)
+
+    with app.app_context():
+        try:
+            return function(*args)
+        except EnergysystemParseError as error:
+            return {'errors': [error.message]}
+        except Exception: # pylint: disable=broad-except
+            app.logger.exception('Converting an item failed')
+            return {'errors': ['Something went wrong']}
@@ -2,6 +2,7 @@
 
 from json.decoder import JSONDecodeError
 from app.services.etengine_service import EtengineService
+from app.services.gquery_cache import gquery_cache
 from app.services.service_result import ServiceResult
 
 class QueryScenario(EtengineService):
@@ -10,16 +11,27 @@ class QueryScenario(EtengineService):
         Query a scenario with supplied gqueries (one or more).
         Returns a ServiceResult with a dict containing the gquery results as value.
         """
-        data = {"gqueries": list(gqueries), "detailed": True}
-
         response = self.session.put(
             '/scenarios/' + str(self.scenario_id),
-            json=data,
-            headers={'Connection': 'close'}
+            json=self.__data(gqueries)
+        )
+
+        return self.__handle_response(response)
+
+    async def call_async(self, *gqueries):
+        """
+        Coroutine version of the query, so it can run concurrently with other requests
+        """
+        response = await self.async_session.put(
+            '/scenarios/' + str(self.scenario_id),
+            json=self.__data(gqueries)
         )
 
         return self.__handle_response(response)
 
+    def __data(self, gqueries):
+        return {"gqueries": list(gqueries), "detailed": True}
+
     def __handle_response(self, response):
         '''
         Returns a service result, by which we can check later if it's a success or not
@@ -32,3 +44,42 @@ class QueryScenario(EtengineService):
             return ServiceResult.failure(response.json()['errors'])
         except JSONDecodeError:
             return ServiceResult.failure([f'ETEngine returned a {response.status_code}'])
+
+
+class CachedQueryScenario(QueryScenario):
+    def __call__(self, *gqueries):
+        """
+        Query a scenario like QueryScenario, but only for the gqueries that are not cached for
+        the current version of the scenario. Looking up the version is a lot cheaper than a query,
+        as it does not make ETEngine calculate the scenario.
+        """
+        version = self.version()
+        if version is None:
+            return super().__call__(*gqueries)
+
+        cache = gquery_cache()
+        results = cache.get(self.environment, self.scenario_id, version, gqueries)
+        missing = [gquery for gquery in gqueries if gquery not in results]
+
+        if missing:
+            query_result = super().__call__(*missing)
+            if not query_result.successful:
+                return query_result
+
+            cache.set(self.environment, self.scenario_id, version, query_result.value)
+            results.update(query_result.value)
+
+        return ServiceResult.success({gquery: results[gquery] for gquery in gqueries})
+
+    def version(self):
+        """
+        The version of the scenario (when it was last updated), or None when it's unknown
+        """
+        response = self.session.get('/scenarios/' + str(self.scenario_id))
+        if not response.ok:
+            return None
+
+        try:
+            return response.json().get('updated_at')
+        except JSONDecodeError:
+            return None
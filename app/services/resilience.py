@@ -0,0 +1,205 @@
+'''
+Resilience of the calls to the upstream services (ETEngine and the EDR). Every request gets a
+timeout (per endpoint), idempotent requests are retried a bounded number of times with jittered
+exponential backoff, and a circuit breaker per upstream (so per ETEngine environment) fails fast
+while the upstream keeps failing. Requests that can't be completed raise an
+EnergysystemParseError: 503 when the upstream can't be reached or the breaker is open, 504 when
+it timed out, 502 when its response could not be read.
+'''
+
+import random
+import re
+import threading
+import time
+from collections import namedtuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.helpers.exceptions import EnergysystemParseError
+
+# Requests that can be sent again without changing the outcome
+IDEMPOTENT = frozenset(('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'))
+
+# Responses that mean the upstream (or a proxy in front of it) is temporarily unavailable
+RETRY_STATUSES = frozenset((502, 503, 504))
+
+# The settings of an upstream, see policy()
+Policy = namedtuple('Policy', [
+    'timeout', 'timeouts', 'retries', 'backoff', 'breaker_failures', 'breaker_reset'])
+
+
+def policy(config, prefix):
+    '''
+    The policy of the upstream from its settings in the config: <prefix>_TIMEOUT,
+    <prefix>_TIMEOUTS (per endpoint, optional), <prefix>_RETRIES, <prefix>_BACKOFF,
+    <prefix>_BREAKER_FAILURES and <prefix>_BREAKER_RESET
+    '''
+    return Policy(
+        timeout=config[f'{prefix}_TIMEOUT'],
+        timeouts=tuple(sorted(config.get(f'{prefix}_TIMEOUTS', {}).items())),
+        retries=config[f'{prefix}_RETRIES'],
+        backoff=config[f'{prefix}_BACKOFF'],
+        breaker_failures=config[f'{prefix}_BREAKER_FAILURES'],
+        breaker_reset=config[f'{prefix}_BREAKER_RESET'])
+
+
+class CircuitBreaker():
+    """
+    Opens after a number of consecutive failures, after which requests fail right away. When it
+    has been open for reset_after seconds it lets one trial request through, which closes it
+    again when it succeeds
+    """
+    def __init__(self, failures=5, reset_after=30.):
+        self.failures = failures
+        self.reset_after = reset_after
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.trial = False
+        self._lock = threading.Lock()
+
+
+    @property
+    def is_open(self):
+        '''Whether requests fail right away (except for a trial request)'''
+        return self.opened_at is not None
+
+
+    def allow(self):
+        '''Whether a request may be sent now'''
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if self.trial or time.monotonic() - self.opened_at < self.reset_after:
+                return False
+
+            self.trial = True
+            return True
+
+
+    def succeeded(self):
+        '''Records a successful request, which closes the breaker'''
+        with self._lock:
+            self.consecutive_failures = 0
+            self.opened_at = None
+            self.trial = False
+
+
+    def failed(self):
+        '''Records a failed request, which opens the breaker after enough of them in a row'''
+        with self._lock:
+            self.consecutive_failures += 1
+            self.trial = False
+            if self.failures and self.consecutive_failures >= self.failures:
+                self.opened_at = time.monotonic()
+
+
+    def release(self):
+        '''Ends a trial without an outcome, so that another trial request can be sent'''
+        with self._lock:
+            self.trial = False
+
+
+class ResilientSession(requests.Session):
+    """
+    A session that applies the policy to all its requests. The endpoints are (method, pattern,
+    name) of the paths of the upstream, by which the timeouts of the policy are looked up
+    """
+    def __init__(self, name, policy, endpoints=(), pool_size=10):
+        super().__init__()
+        self.name = name
+        self.policy = policy
+        self.endpoints = endpoints
+        self.timeouts = dict(policy.timeouts)
+        self.breaker = CircuitBreaker(policy.breaker_failures, policy.breaker_reset)
+
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.mount('http://', adapter)
+        self.mount('https://', adapter)
+
+
+    def endpoint(self, method, url):
+        '''The name of the endpoint of the request, or None when it's not one of the endpoints'''
+        path = urlsplit(url).path
+        for endpoint_method, pattern, name in self.endpoints:
+            if endpoint_method == method and re.search(pattern, path):
+                return name
+
+        return None
+
+
+    def request(self, method, url, **kwargs):
+        '''Sends the request with the timeout of its endpoint, unless a timeout was given'''
+        kwargs.setdefault(
+            'timeout',
+            self.timeouts.get(self.endpoint(method.upper(), url), self.policy.timeout))
+
+        return super().request(method, url, **kwargs)
+
+
+    def send(self, request, **kwargs):
+        '''
+        Sends the request, retrying it when that is safe. A request with a streamed body is only
+        retried when the body can be read again (is replayable)
+        '''
+        replayable = isinstance(request.body, (bytes, str, type(None))) or \
+            getattr(request.body, 'replayable', False)
+        retries = self.policy.retries if replayable else 0
+
+        for attempt in range(retries + 1):
+            if not self.breaker.allow():
+                raise EnergysystemParseError(
+                    f'{self.name} is unavailable, please try again later', status_code=503)
+
+            # Whether the outcome of the request was recorded by the breaker. Errors other than
+            # those of requests (like a KeyboardInterrupt or a bug) are not failures of the
+            # upstream, but do end a trial of the breaker
+            recorded = False
+            try:
+                response = super().send(request, **kwargs)
+                recorded = True
+            except requests.RequestException as error:
+                self.breaker.failed()
+                recorded = True
+                # A request that timed out while connecting was never received
+                unavailable = isinstance(error, (requests.ConnectionError, requests.Timeout))
+                if attempt < retries and unavailable and (
+                        request.method in IDEMPOTENT or isinstance(error, requests.ConnectTimeout)):
+                    self.wait(attempt)
+                    continue
+
+                raise self.failure(error) from error
+            finally:
+                if not recorded:
+                    self.breaker.release()
+
+            if response.status_code < 500:
+                self.breaker.succeeded()
+                return response
+
+            self.breaker.failed()
+            if attempt < retries and request.method in IDEMPOTENT and \
+                    response.status_code in RETRY_STATUSES:
+                response.close()
+                self.wait(attempt)
+                continue
+
+            return response
+
+
+    def wait(self, attempt):
+        '''Full jitter: a random time up to the exponential backoff of the attempt'''
+        base, cap = self.policy.backoff
+        time.sleep(random.uniform(0, min(cap, base * 2 ** attempt)))
+
+
+    def failure(self, error):
+        '''The EnergysystemParseError for the error of requests that failed the request'''
+        if isinstance(error, requests.ReadTimeout):
+            return EnergysystemParseError(f'{self.name} did not respond in time', status_code=504)
+        if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+            return EnergysystemParseError(f'{self.name} could not be reached', status_code=503)
+
+        return EnergysystemParseError(
+            f'{self.name} sent a response that could not be read', status_code=502)
@@ -0,0 +1,80 @@
+'''
+Compares converting a region of energy systems one create_scenario call at a time with one call of
+the bulk create_scenarios endpoint, with a growing number of processes. ETEngine is played by the
+local stand-in (lib/stand_in, in a process of its own) at a realistic latency. The bulk pool is
+started (and its processes import the app) before it is measured.
+
+Usage: PYTHONPATH=. python benchmarks/bench_bulk.py [--items 8] [--processes 1 2 4]
+    [--esdl app/data/input/S1b_B_BodemWP_Hengelo.esdl]
+'''
+import argparse
+import contextlib
+import io
+import subprocess
+import sys
+from time import perf_counter
+from urllib.parse import quote
+
+from app import create_app
+from benchmarks.bench_end_to_end import DEFAULT_LATENCY
+
+
+def start_stand_in():
+    latency = [argument for rule in DEFAULT_LATENCY for argument in ('--latency', rule)]
+    stand_in = subprocess.Popen(
+        [sys.executable, 'lib/stand_in/server.py', '--port', '0', *latency],
+        stdout=subprocess.PIPE, text=True)
+
+    return stand_in, stand_in.stdout.readline().split()[-1]
+
+
+def one_at_a_time(client, energy_systems):
+    for energy_system in energy_systems:
+        response = client.post('/api/v1/create_scenario/', data={
+            'energy_system': energy_system, 'environment': 'beta'})
+        assert response.status_code == 200
+
+
+def bulk(client, energy_systems):
+    response = client.post('/api/v1/create_scenarios/', data={
+        'energy_system': energy_systems, 'environment': 'beta'})
+    assert all('scenario_id' in scenario for scenario in response.json['scenarios'])
+
+
+def measure(function, *args):
+    # The app prints what it translates
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = perf_counter()
+        function(*args)
+        return perf_counter() - start
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--items', type=int, default=8)
+    parser.add_argument('--processes', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--esdl', default='app/data/input/S1b_B_BodemWP_Hengelo.esdl')
+    args = parser.parse_args()
+
+    stand_in, url = start_stand_in()
+    app = create_app()
+    app.config['ETENGINE'] = {'beta': f'{url}/api/v3', 'pro': f'{url}/api/v3'}
+    client = app.test_client()
+
+    with open(args.esdl) as esdl_file:
+        energy_systems = [quote(esdl_file.read())] * args.items
+
+    print(f'{args.items} energy systems, latency {" ".join(DEFAULT_LATENCY)}')
+    elapsed = measure(one_at_a_time, client, energy_systems)
+    print(f'{"one at a time":<22} {elapsed:>8.1f} s {args.items / elapsed:>8.2f} per s')
+
+    for processes in args.processes:
+        app.config['BULK_PROCESSES'] = processes
+        # Warm up: spawn the processes of the pool
+        measure(bulk, client, energy_systems[:processes])
+
+        elapsed = measure(bulk, client, energy_systems)
+        print(f'{f"bulk, {processes} processes":<22} {elapsed:>8.1f} s '
+              f'{args.items / elapsed:>8.2f} per s')
+
+    stand_in.terminate()
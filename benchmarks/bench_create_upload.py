@@ -0,0 +1,80 @@
+'''
+Compares the ways of posting a synthetic energy system of growing size to create_scenario: as a
+URL encoded form field, as a multipart .esdl file and as a gzip compressed one. Reports the bytes
+posted, and the time and the peak of the memory traced while the request body is read and the
+energy system is parsed from it (which is all that differs between them). The peak includes the
+parsed energy system, the times include the overhead of tracing.
+
+Usage: PYTHONPATH=. python benchmarks/bench_create_upload.py [buildings ...]
+'''
+import gzip
+import io
+import sys
+import tracemalloc
+from time import perf_counter
+from urllib.parse import quote
+
+from flask import request
+from werkzeug.test import EnvironBuilder
+
+from app import create_app
+from app.helpers.uploads import open_upload
+from app.interface import setup_esh_from_energy_system
+from benchmarks.synthetic import generate_esdl
+
+
+def form(esdl):
+    return {'data': {'energy_system': quote(esdl), 'environment': 'beta'}}
+
+
+def multipart(esdl, compress=False):
+    content = esdl.encode('UTF-8')
+    if compress:
+        content = gzip.compress(content)
+
+    return {'data': {
+        'energy_system_file': (io.BytesIO(content), 'energy_system.esdl'),
+        'environment': 'beta'
+    }}
+
+
+def parse():
+    if 'energy_system_file' in request.files:
+        return setup_esh_from_energy_system(open_upload(request.files['energy_system_file']))
+
+    return setup_esh_from_energy_system(request.form['energy_system'])
+
+
+def measure(app, body):
+    '''Returns the bytes posted, the time in ms and the traced peak in MB of parsing the body'''
+    builder = EnvironBuilder(method='POST', **body)
+    environ = builder.get_environ()
+    builder.close()
+    posted = int(environ['CONTENT_LENGTH'])
+
+    tracemalloc.start()
+    start = perf_counter()
+    with app.request_context(environ):
+        parse()
+    elapsed = perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return posted, elapsed * 1000, peak / 1e6
+
+
+if __name__ == '__main__':
+    sizes = [int(size) for size in sys.argv[1:]] or [500, 2_000, 5_000, 10_000]
+    app = create_app()
+
+    print(f'{"buildings":>9} {"posted as":<15} {"posted":>10} {"time":>11} {"peak":>11}')
+    for size in sizes:
+        esdl = generate_esdl(size)
+
+        for label, body in (
+                ('form field', form(esdl)),
+                ('multipart', multipart(esdl)),
+                ('multipart gzip', multipart(esdl, compress=True))):
+            posted, elapsed, peak = measure(app, body)
+            print(f'{size:>9} {label:<15} {posted / 1e6:>7.2f} MB {elapsed:>8.0f} ms '
+                  f'{peak:>8.1f} MB')
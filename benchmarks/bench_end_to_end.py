@@ -0,0 +1,124 @@
+'''
+End-to-end benchmark of create_scenario and export_esdl: the app is served by a threaded WSGI
+server, with ETEngine and the EDR played by the local stand-in (lib/stand_in) at a realistic
+latency. Reports the p50 and p99 latency and the requests per second of both endpoints, and of
+create_scenario as a job (async=true), from posting it until polling tells it finished.
+
+Requests are sent by a number of concurrent clients (--concurrency).
+
+Usage: PYTHONPATH=. python benchmarks/bench_end_to_end.py [--requests 50] [--concurrency 4]
+    [--latency query=150:30 ...] [--esdl app/data/input/S1b_B_BodemWP_Hengelo.esdl]
+'''
+import argparse
+import contextlib
+import io
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+
+import requests
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+from app import create_app
+from lib.stand_in.server import Schedule, StandIn
+
+# Roughly what the app sees from engine.energytransitionmodel.com
+DEFAULT_LATENCY = ['create=250:50', 'query=150:30', 'upload=120:20', 'download=80:10', '*=40:10']
+
+
+def serve_app(stand_in):
+    '''Serves the app (pointing to the stand-in) in a background thread, returns its url'''
+    app = create_app()
+    app.config['ETENGINE'] = {'beta': f'{stand_in.url}/api/v3', 'pro': f'{stand_in.url}/api/v3'}
+    app.config['EDR_URL'] = f'{stand_in.url}/store'
+
+    class QuietHandler(WSGIRequestHandler):
+        def log_request(self, *args):
+            pass
+
+    server = make_server('127.0.0.1', 0, app, threaded=True, request_handler=QuietHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server, f'http://127.0.0.1:{server.server_port}/api/v1'
+
+
+def run(request, number, concurrency):
+    '''Sends the requests, returns the latencies (in ms) and the requests per second'''
+    local = threading.local()
+
+    def timed(_):
+        if not hasattr(local, 'session'):
+            local.session = requests.Session()
+
+        start = time.perf_counter()
+        response = request(local.session)
+        response.raise_for_status()
+        return (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as executor:
+        latencies = sorted(executor.map(timed, range(number)))
+
+    return latencies, number / (time.perf_counter() - start)
+
+
+def report(name, latencies, rps):
+    print(f'{name:>15} {statistics.median(latencies):>8.0f} ms '
+          f'{latencies[max(0, int(len(latencies) * 0.99) - 1)]:>8.0f} ms {rps:>8.2f}')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=50)
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--latency', action='append', metavar='ENDPOINT=MS[:JITTER]')
+    parser.add_argument('--errors', action='append', default=[], metavar='ENDPOINT=EVERY[:STATUS]')
+    parser.add_argument('--esdl', default='app/data/input/S1b_B_BodemWP_Hengelo.esdl')
+    args = parser.parse_args()
+
+    stand_in = StandIn(schedule=Schedule.parse(args.latency or DEFAULT_LATENCY, args.errors))
+    stand_in.start()
+    server, url = serve_app(stand_in)
+
+    with open(args.esdl) as esdl_file:
+        energy_system = quote(esdl_file.read())
+
+    def create_scenario(session):
+        return session.post(f'{url}/create_scenario/', data={
+            'energy_system': energy_system, 'environment': 'beta'})
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        scenario_id = create_scenario(requests).json()['scenario_id']
+
+    def create_scenario_job(session):
+        response = session.post(f'{url}/create_scenario/', data={
+            'energy_system': energy_system, 'environment': 'beta', 'async': 'true'})
+        status_url = url.rsplit('/api/v1', 1)[0] + response.json()['status_url']
+
+        while True:
+            response = session.get(status_url)
+            if response.json()['status'] in ('finished', 'failed'):
+                return response
+            time.sleep(0.02)
+
+    def export_esdl(session):
+        return session.post(f'{url}/export_esdl/', data={
+            'environment': 'beta', 'session_id': scenario_id})
+
+    # The app prints what it translates
+    with contextlib.redirect_stdout(io.StringIO()):
+        create = run(create_scenario, args.requests, args.concurrency)
+        job = run(create_scenario_job, args.requests, args.concurrency)
+        export = run(export_esdl, args.requests, args.concurrency)
+
+    print(f'{args.requests} requests, latency {" ".join(args.latency or DEFAULT_LATENCY)}')
+    print(f'{"":>15} {"p50":>11} {"p99":>11} {"req/s":>8}')
+    report(f'create x{args.concurrency}', *create)
+    report(f'create job x{args.concurrency}', *job)
+    report(f'export_esdl x{args.concurrency}', *export)
+    print(f'stand-in requests: {dict(stand_in.requests)}')
+
+    server.shutdown()
+    stand_in.shutdown()
@@ -0,0 +1,132 @@
+'''
+Compares the latency of ETEngine requests the way they used to be made (a new session for every
+service, with "Connection: close", so every request sets up a new TCP and TLS connection) with the
+pooled keep-alive client that is shared by the services. ETEngine is played by a local HTTPS server
+with a self-signed certificate (created with openssl, plain HTTP when openssl is not available)
+that answers a QueryScenario request after an optional delay.
+
+Usage: PYTHONPATH=. python benchmarks/bench_etengine_latency.py [requests] [delay in ms]
+'''
+import json
+import os
+import shutil
+import ssl
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from app import create_app
+from app.services.query_scenario import QueryScenario
+
+DELAY = 0.0
+CERT = True
+
+
+class StandIn(BaseHTTPRequestHandler):
+    """Answers every PUT with the future value of the requested gqueries"""
+    protocol_version = 'HTTP/1.1'
+    # The headers and the body are written separately, which would be held back by Nagle's
+    # algorithm on a kept-alive connection (ETEngine itself does not do this)
+    disable_nagle_algorithm = True
+
+    def do_PUT(self):
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        time.sleep(DELAY)
+
+        response = json.dumps({'gqueries': {
+            gquery: {'present': 1.0, 'future': 2.0} for gquery in body['gqueries']
+        }}).encode('UTF-8')
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve(directory):
+    '''Starts the stand-in server, returns the server, its url and its certificate'''
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandIn)
+    scheme, cert = 'http', True
+
+    openssl = shutil.which('openssl')
+    if openssl:
+        cert, key = os.path.join(directory, 'cert.pem'), os.path.join(directory, 'key.pem')
+        subprocess.run(
+            [openssl, 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1', '-subj',
+             '/CN=127.0.0.1', '-addext', 'subjectAltName=IP:127.0.0.1',
+             '-keyout', key, '-out', cert],
+            check=True, capture_output=True)
+
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cert, key)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+        scheme = 'https'
+
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server, f'{scheme}://127.0.0.1:{server.server_port}/api/v3', cert
+
+
+def trust(session, cert):
+    '''Verify the stand-in with its own certificate, regardless of the CA bundle in the env'''
+    session.trust_env = False
+    session.verify = cert
+
+
+def before(url):
+    '''A request the way the services used to make it'''
+    session = requests.Session()
+    trust(session, CERT)
+    session.put(f'{url}/scenarios/1', json={'gqueries': ['dashboard_total_costs']},
+                headers={'Connection': 'close'})
+
+
+def after(_url):
+    '''A request through the shared client'''
+    QueryScenario('pro', 1)('dashboard_total_costs')
+
+
+def latencies(request, url, number):
+    '''The latencies of the requests in ms'''
+    request(url)  # warm up
+    timings = []
+    for _ in range(number):
+        start = time.perf_counter()
+        request(url)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    return timings
+
+
+if __name__ == '__main__':
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    DELAY = float(sys.argv[2]) / 1000 if len(sys.argv) > 2 else 0.0
+
+    with tempfile.TemporaryDirectory() as directory:
+        server, url, CERT = serve(directory)
+        app = create_app(testing=True)
+        app.config['ETENGINE'] = {'pro': url}
+
+        with app.app_context():
+            trust(QueryScenario('pro', 1).session, CERT)
+
+            print(f'{number} requests to {url}, {DELAY * 1000:.0f} ms server delay')
+            print(f'{"":>8} {"mean":>9} {"p50":>9} {"p99":>9}')
+            for name, request in (('before', before), ('after', after)):
+                timings = sorted(latencies(request, url, number))
+                print(f'{name:>8} ' + ' '.join(f'{value:>6.2f} ms' for value in (
+                    statistics.mean(timings),
+                    timings[len(timings) // 2],
+                    timings[int(len(timings) * 0.99) - 1])))
+
+        server.shutdown()
@@ -0,0 +1,61 @@
+'''
+Compares the two responses of export_esdl for synthetic energy systems of growing size: the ESDL
+inside a JSON object (serialized to a string, then escaped into the JSON, as flask-restx does)
+with the ESDL streamed as XML, uncompressed and gzip compressed. Reports the bytes sent, the time
+until the first chunk can be sent, the time until the last one, and the peak of the memory traced
+while responding.
+
+Usage: PYTHONPATH=. python benchmarks/bench_export.py [buildings ...]
+'''
+import json
+import sys
+import tracemalloc
+from time import perf_counter
+
+from app.helpers.energy_system_handler import EnergySystemHandler
+from benchmarks.synthetic import generate_esdl
+
+
+def json_response(handler):
+    yield json.dumps({'energy_system': handler.get_as_string()}).encode('UTF-8')
+
+
+def xml_response(handler):
+    return handler.iter_chunks()
+
+
+def gzip_response(handler):
+    return handler.iter_chunks(compress=True)
+
+
+def measure(response, handler):
+    '''Returns the bytes sent, the time to the first and the last chunk in ms and the peak in MB'''
+    sent = 0
+    first = None
+
+    tracemalloc.start()
+    start = perf_counter()
+    for chunk in response(handler):
+        if first is None:
+            first = perf_counter() - start
+        sent += len(chunk)
+    elapsed = perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return sent, first * 1000, elapsed * 1000, peak / 1e6
+
+
+if __name__ == '__main__':
+    sizes = [int(size) for size in sys.argv[1:]] or [500, 2_000, 5_000, 10_000]
+
+    print(f'{"buildings":>9} {"response":<9} {"sent":>10} {"first":>11} {"last":>11} {"peak":>11}')
+    for size in sizes:
+        handler = EnergySystemHandler()
+        handler.load_from_string(generate_esdl(size))
+
+        for label, response in (
+                ('json', json_response), ('xml', xml_response), ('xml gzip', gzip_response)):
+            sent, first, elapsed, peak = measure(response, handler)
+            print(f'{size:>9} {label:<9} {sent / 1e6:>7.2f} MB {first:>8.0f} ms '
+                  f'{elapsed:>8.0f} ms {peak:>8.1f} MB')
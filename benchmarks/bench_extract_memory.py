@@ -0,0 +1,38 @@
+'''
+Compares the peak memory (tracemalloc) and time of loading synthetic energy systems of growing
+size entirely with pyecore with extracting only the parts that are translated into slider
+settings (EnergySystemHandler.extract_from_string).
+
+Usage: PYTHONPATH=. python benchmarks/bench_extract_memory.py [buildings ...]
+'''
+import sys
+import tracemalloc
+from time import perf_counter
+
+from app.helpers.energy_system_handler import EnergySystemHandler
+from benchmarks.synthetic import generate_esdl
+
+def measure(load, esdl_string):
+    '''The peak memory in MB and the time in ms it takes to load the string'''
+    handler = EnergySystemHandler()
+
+    tracemalloc.start()
+    start = perf_counter()
+    load(handler, esdl_string)
+    elapsed = perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak / 1e6, elapsed * 1000
+
+if __name__ == '__main__':
+    sizes = [int(size) for size in sys.argv[1:]] or [1_000, 5_000, 10_000]
+
+    print(f'{"buildings":>10} {"file MB":>8} {"load MB":>8} {"ms":>8} {"extract MB":>11} {"ms":>8}')
+    for size in sizes:
+        esdl_string = generate_esdl(size)
+        loaded = measure(EnergySystemHandler.load_from_string, esdl_string)
+        extracted = measure(EnergySystemHandler.extract_from_string, esdl_string)
+
+        print(f'{size:>10} {len(esdl_string) / 1e6:>8.1f} {loaded[0]:>8.1f} {loaded[1]:>8.0f} '
+              f'{extracted[0]:>11.1f} {extracted[1]:>8.0f}')
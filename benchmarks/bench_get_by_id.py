@@ -0,0 +1,50 @@
+'''
+Compares looking up objects by id with get_by_id_slow (a walk over the whole energy system) with
+get_by_id (the index) on a synthetic energy system of about 100k objects. The ids looked up are
+QuantityAndUnitTypes and KPIs added after loading (like add_kpis does), an asset at the end of the
+energy system and an unknown id.
+
+Usage: PYTHONPATH=. python benchmarks/bench_get_by_id.py [objects] [iterations]
+'''
+import sys
+from time import perf_counter
+from timeit import timeit
+
+from app.constants.q_and_u import quantities
+from app.helpers.energy_system_handler import EnergySystemHandler
+from app.helpers.esdl_index import EsdlIndex
+from app.interface import add_quantity_and_units
+from benchmarks.synthetic import generate_esdl
+
+# The synthetic energy systems contain about 14 objects per aggregated building
+OBJECTS_PER_BUILDING = 14
+
+def report(label, seconds):
+    print(f'{label:<40} {seconds * 1000:10.3f} ms')
+
+if __name__ == '__main__':
+    objects = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    handler = EnergySystemHandler()
+    handler.load_from_string(generate_esdl(objects // OBJECTS_PER_BUILDING))
+
+    start = perf_counter()
+    EsdlIndex(handler.es)
+    build = perf_counter() - start
+    report(f'build index ({sum(1 for _ in handler.es.eAllContents()) + 1} objects)', build)
+
+    add_quantity_and_units(handler)
+    handler.add_kpis()
+    ids = list(quantities)
+    for number in range(20):
+        handler.add_kpi(handler.create_kpi('DoubleKPI', f'kpi_{number}', 'KPI', None))
+        ids.append(f'kpi_{number}')
+    ids += [f'building_{objects // OBJECTS_PER_BUILDING - 1}', 'unknown']
+
+    slow = timeit(lambda: [handler.get_by_id_slow(i) for i in ids], number=iterations) / iterations
+    fast = timeit(lambda: [handler.get_by_id(i) for i in ids], number=iterations) / iterations
+
+    report(f'get_by_id_slow x {len(ids)}', slow)
+    report(f'get_by_id x {len(ids)}', fast)
+    print(f'speedup: {slow / fast:.0f}x')
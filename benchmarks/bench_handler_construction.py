@@ -0,0 +1,36 @@
+'''
+Compares the cost of constructing an EnergySystemHandler when the esdl.ecore metamodel is parsed
+for every handler (as it used to be) with handlers that share the process-wide metamodel.
+
+Usage: PYTHONPATH=. python benchmarks/bench_handler_construction.py [iterations]
+'''
+import sys
+from timeit import timeit
+
+from pyecore.resources import ResourceSet
+from app.helpers.esdl_metamodel import get_metamodel, load_metamodel
+from app.helpers.energy_system_handler import EnergySystemHandler
+from app.helpers.xmlresource import XMLResource
+
+def construct_with_own_metamodel():
+    '''The old constructor: a fresh ResourceSet that parses esdl.ecore itself'''
+    rset = ResourceSet()
+    rset.resource_factory['esdl'] = XMLResource
+    metamodel = load_metamodel()
+    rset.metamodel_registry[metamodel.nsURI] = metamodel.package
+
+def report(label, seconds, iterations):
+    print(f'{label:<32} {seconds / iterations * 1000:10.3f} ms per handler')
+
+if __name__ == '__main__':
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    # Load the shared metamodel up front, like the first request of a worker would
+    get_metamodel()
+
+    before = timeit(construct_with_own_metamodel, number=iterations)
+    after = timeit(EnergySystemHandler, number=iterations)
+
+    report('parse esdl.ecore per handler', before, iterations)
+    report('shared metamodel', after, iterations)
+    print(f'speedup: {before / after:.0f}x')
@@ -0,0 +1,67 @@
+'''
+Compares classifying the heating technologies of all aggregated buildings of a synthetic energy
+system (10k buildings by default) with linear scans over the assets of each building, as it used
+to be, with the (type, attribute, value) lookups of the index.
+
+Usage: PYTHONPATH=. python benchmarks/bench_heating_classification.py [buildings] [iterations]
+'''
+import sys
+from timeit import timeit
+
+from app.constants.inputs import new_input_values
+from app.helpers.energy_system_handler import EnergySystemHandler
+from app.interface import determine_number_of_buildings, parse_heating_technology
+from benchmarks.synthetic import generate_esdl
+
+class LinearScanHandler(EnergySystemHandler):
+    '''The lookups of the assets of an area as they were before the index'''
+
+    def get_assets_of_type(self, area, esdl_type):
+        return [asset for asset in area.asset if isinstance(asset, esdl_type)]
+
+    def get_assets_of_type_and_attribute_value(self, area, esdl_type, attribute, value):
+        return [asset for asset in area.asset if isinstance(asset, esdl_type)
+                and str(getattr(asset, attribute)) == value]
+
+def collect_buildings(handler):
+    '''All aggregated buildings with their building type and number of buildings'''
+    return [
+        (building, str(building.buildingTypeDistribution.buildingTypePercentage[0].buildingType),
+         building.numberOfBuildings)
+        for area in handler.es.instance[0].area.area
+        for building in handler.get_assets_of_type(area, handler.esdl.AggregatedBuilding)]
+
+def classify(handler, aggregated_buildings, total_number_of_buildings):
+    '''Parses the heating technologies of all aggregated buildings into the input values'''
+    input_values = new_input_values()
+
+    for building, building_type, number in aggregated_buildings:
+        parse_heating_technology(
+            handler, building, building_type, number, total_number_of_buildings, input_values)
+
+    return {name: value['value'] for name, value in input_values.items()}
+
+def report(label, seconds):
+    print(f'{label:<24} {seconds * 1000:10.1f} ms')
+
+if __name__ == '__main__':
+    buildings = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    esdl_string = generate_esdl(buildings)
+    linear, indexed = LinearScanHandler(), EnergySystemHandler()
+    linear.load_from_string(esdl_string)
+    indexed.load_from_string(esdl_string)
+
+    total = determine_number_of_buildings(indexed)
+    linear_buildings, indexed_buildings = collect_buildings(linear), collect_buildings(indexed)
+
+    # The first classification also compiles the lookups of the index
+    assert classify(linear, linear_buildings, total) == classify(indexed, indexed_buildings, total)
+
+    before = timeit(lambda: classify(linear, linear_buildings, total), number=iterations)
+    after = timeit(lambda: classify(indexed, indexed_buildings, total), number=iterations)
+
+    report('linear scans', before / iterations)
+    report('index', after / iterations)
+    print(f'speedup: {before / after:.1f}x ({buildings} buildings)')
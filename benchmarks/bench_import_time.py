@@ -0,0 +1,83 @@
+'''
+Measures the startup time of the app with `python -X importtime`: the imports needed to run
+create_app() in a fresh process, in the environment set by FLASK_ENV (production by default).
+Fails (exit code 1) when the startup regressed:
+- when it takes more than TOLERANCE longer than the baseline in import_time_baseline.json
+- when one of the DEFERRED modules is imported, which should only be loaded when they are used
+
+Record a new baseline on your machine with --update.
+
+Usage: PYTHONPATH=. python benchmarks/bench_import_time.py [--update] [iterations]
+'''
+import json
+import os
+import subprocess
+import sys
+from statistics import median
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'import_time_baseline.json')
+TOLERANCE = 0.25
+
+STARTUP = 'from app import create_app; create_app()'
+
+DEFERRED = (
+    'app.esdl._package',
+    'app.esdl.esdl',
+)
+
+def import_times():
+    '''
+    Runs the startup in a fresh process, returns the cumulative import time in microseconds of
+    each imported module
+    '''
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', STARTUP],
+        capture_output=True, check=True, text=True)
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, module = line[len('import time:'):].split('|')
+        times[module.strip()] = (int(cumulative), len(module) - len(module.lstrip()))
+
+    return times
+
+def total(times):
+    '''The total startup time in ms: the cumulative time of the top level imports'''
+    level = min(indent for _, indent in times.values())
+    return sum(cumulative for cumulative, indent in times.values() if indent == level) / 1000
+
+def main(update, iterations):
+    runs = [import_times() for _ in range(iterations)]
+    startup = median(total(times) for times in runs)
+
+    heaviest = sorted(runs[-1].items(), key=lambda item: item[1][0], reverse=True)[:10]
+    for module, (cumulative, _) in heaviest:
+        print(f'{cumulative / 1000:8.1f} ms  {module}')
+    print(f'\nstartup imports: {startup:.1f} ms (median of {iterations})')
+
+    if update:
+        with open(BASELINE_PATH, 'w') as baseline_file:
+            json.dump({'startup_ms': round(startup, 1)}, baseline_file, indent=4)
+            baseline_file.write('\n')
+        print(f'baseline updated: {BASELINE_PATH}')
+        return 0
+
+    failures = [f'{module} is imported at startup' for module in DEFERRED if module in runs[-1]]
+
+    with open(BASELINE_PATH) as baseline_file:
+        baseline = json.load(baseline_file)['startup_ms']
+    print(f'baseline: {baseline:.1f} ms, allowed: {baseline * (1 + TOLERANCE):.1f} ms')
+
+    if startup > baseline * (1 + TOLERANCE):
+        failures.append(f'startup regressed from {baseline:.1f} ms to {startup:.1f} ms')
+
+    for failure in failures:
+        print(f'FAIL: {failure}')
+
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    arguments = [argument for argument in sys.argv[1:] if argument != '--update']
+    sys.exit(main('--update' in sys.argv, int(arguments[0]) if arguments else 10))
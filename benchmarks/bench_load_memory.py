@@ -0,0 +1,58 @@
+'''
+Compares the peak memory (tracemalloc) of loading URL encoded ESDL strings of increasing size, as
+they are posted to the API, the way it used to be (unquote to a string, which is encoded to bytes
+again by the StringURI) with setup_esh_from_energy_system, which unquotes into a buffer that is
+parsed as it is. Also reports loading from raw bytes and from a file. The peaks include the loaded
+energy system itself.
+
+Usage: PYTHONPATH=. python benchmarks/bench_load_memory.py [buildings ...]
+'''
+import os
+import sys
+import tempfile
+import tracemalloc
+import urllib.parse
+
+from app.helpers.energy_system_handler import EnergySystemHandler
+from app.interface import setup_esh_from_energy_system
+from benchmarks.synthetic import generate_esdl
+
+def unquote_to_string(encoded):
+    '''How setup_esh_from_energy_system used to load the posted energy system'''
+    handler = EnergySystemHandler()
+    handler.load_from_string(urllib.parse.unquote(encoded))
+
+def from_bytes(data):
+    EnergySystemHandler().load(data)
+
+def peak(load, source):
+    '''The peak memory in MB while loading the source'''
+    tracemalloc.start()
+    load(source)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return peak_memory / 1e6
+
+if __name__ == '__main__':
+    sizes = [int(size) for size in sys.argv[1:]] or [500, 1_000, 2_000, 4_000]
+
+    print(f'{"buildings":>10} {"file MB":>8} {"before":>9} {"after":>9} {"bytes":>9} {"file":>9}')
+    for size in sizes:
+        esdl_bytes = generate_esdl(size).encode('UTF-8')
+        encoded = urllib.parse.quote(esdl_bytes)
+
+        with tempfile.NamedTemporaryFile(suffix='.esdl', delete=False) as esdl_file:
+            esdl_file.write(esdl_bytes)
+
+        try:
+            peaks = (
+                peak(unquote_to_string, encoded),
+                peak(setup_esh_from_energy_system, encoded),
+                peak(from_bytes, esdl_bytes),
+                peak(from_bytes, esdl_file.name))
+        finally:
+            os.remove(esdl_file.name)
+
+        print(f'{size:>10} {len(esdl_bytes) / 1e6:>8.1f} ' +
+              ' '.join(f'{value:>6.1f} MB' for value in peaks))
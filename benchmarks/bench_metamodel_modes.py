@@ -0,0 +1,48 @@
+'''
+Compares the dynamic ESDL metamodel (esdl.ecore parsed at runtime) with the static one (generated
+package in app/esdl): the cold start of a fresh process up to the first EnergySystemHandler, and
+the time it takes to load a synthetic ESDL energy system in each mode.
+
+Usage: PYTHONPATH=. python benchmarks/bench_metamodel_modes.py [buildings] [iterations]
+'''
+import subprocess
+import sys
+from timeit import timeit
+
+from app.helpers.esdl_metamodel import DYNAMIC, STATIC
+from app.helpers.energy_system_handler import EnergySystemHandler
+from benchmarks.synthetic import generate_esdl
+
+COLD_START = '''
+from time import perf_counter
+from app.helpers.energy_system_handler import EnergySystemHandler
+start = perf_counter()
+EnergySystemHandler(mode={mode!r})
+print(perf_counter() - start)
+'''
+
+def cold_start(mode):
+    '''Seconds it takes a new process to construct its first handler, including the metamodel'''
+    result = subprocess.run(
+        [sys.executable, '-c', COLD_START.format(mode=mode)],
+        capture_output=True, check=True, text=True)
+    return float(result.stdout)
+
+def load(mode, esdl_string):
+    '''Loads the ESDL string with a new handler in the given mode'''
+    EnergySystemHandler(mode=mode).load_from_string(esdl_string)
+
+if __name__ == '__main__':
+    buildings = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    esdl_string = generate_esdl(buildings)
+
+    for mode in (DYNAMIC, STATIC):
+        start = min(cold_start(mode) for _ in range(iterations))
+        # The first load in this process also loads the metamodel, so leave it out
+        load(mode, esdl_string)
+        seconds = timeit(lambda mode=mode: load(mode, esdl_string), number=iterations) / iterations
+
+        print(f'{mode:<8} cold start {start * 1000:8.1f} ms   ' +
+              f'load {buildings} buildings {seconds * 1000:8.1f} ms')
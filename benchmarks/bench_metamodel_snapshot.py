@@ -0,0 +1,58 @@
+'''
+Compares the cold start of the dynamic ESDL metamodel when esdl.ecore is parsed with pyecore's XMI
+loader with loading it from the binary snapshot. Every measurement runs in a fresh process, like a
+container start or a newly forked worker. Without a snapshot, loading the metamodel writes it, so
+the snapshot is removed before every measurement of the XMI loader (which includes writing it).
+
+Usage: PYTHONPATH=. python benchmarks/bench_metamodel_snapshot.py [ecore resource] [iterations]
+'''
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from statistics import median
+
+from app.helpers.esdl_metamodel import ECORE_RESOURCE
+from app.helpers.esdl_snapshot import snapshot_path, write_snapshot
+
+COLD_START = '''
+from time import perf_counter
+from app.helpers.esdl_metamodel import load_metamodel
+start = perf_counter()
+load_metamodel({path!r})
+print(perf_counter() - start)
+'''
+
+def cold_start(path):
+    '''Seconds it takes a new process to load the metamodel from the ecore resource at path'''
+    result = subprocess.run(
+        [sys.executable, '-c', COLD_START.format(path=path)],
+        capture_output=True, check=True, text=True)
+    return float(result.stdout)
+
+def report(label, seconds):
+    print(f'{label:<24} {median(seconds) * 1000:8.1f} ms (median), {min(seconds) * 1000:8.1f} ms (min)')
+
+if __name__ == '__main__':
+    ecore_resource = sys.argv[1] if len(sys.argv) > 1 else ECORE_RESOURCE
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, 'esdl.ecore')
+        shutil.copy(ecore_resource, path)
+
+        xmi = []
+        for _ in range(iterations):
+            if os.path.exists(snapshot_path(path)):
+                os.remove(snapshot_path(path))
+            xmi.append(cold_start(path))
+
+        write_snapshot(path)
+        print(f'snapshot: {os.path.getsize(snapshot_path(path)) / 1024:.0f} kB, ' +
+              f'ecore resource: {os.path.getsize(path) / 1024:.0f} kB')
+        snapshot = [cold_start(path) for _ in range(iterations)]
+
+    report('parse ecore XMI', xmi)
+    report('load snapshot', snapshot)
+    print(f'speedup: {median(xmi) / median(snapshot):.2f}x')
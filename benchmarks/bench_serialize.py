@@ -0,0 +1,106 @@
+'''
+Compares writing synthetic energy systems of growing size with the XMLResource as it used to be (an
+lxml tree that is copied into a second root element and pretty printed) with the incremental
+XMLWriter: the time and the peak growth of the resident memory of get_as_string and of writing to
+a file. The resident memory (Linux only) is sampled, as tracemalloc does not see the memory that
+libxml2 allocates for the tree. Each measurement runs in a fresh process.
+
+Usage: PYTHONPATH=. python benchmarks/bench_serialize.py [buildings ...]
+'''
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+from time import perf_counter, sleep
+
+# pylint: disable=no-name-in-module
+from lxml.etree import Element, ElementTree
+from pyecore.resources.xmi import XSI, XSI_URL
+
+from app.helpers.energy_system_handler import EnergySystemHandler
+from app.helpers.xmlresource import XMLResource
+from benchmarks.synthetic import generate_esdl
+
+class LxmlTreeResource(XMLResource):
+    '''The XMLResource as it was before the XMLWriter'''
+
+    def save(self, output=None, options=None, pretty_print=True):
+        self.options = options or {}
+        output = self.open_out_stream(output)
+        self.prefixes.clear()
+        self.reverse_nsmap.clear()
+
+        root = self.contents[0]
+        self.register_eobject_epackage(root)
+        tmp_xmi_root = self._go_across(root)
+
+        nsmap = {XSI: XSI_URL}
+        nsmap.update(self.prefixes)
+        xmi_root = Element(tmp_xmi_root.tag, nsmap=nsmap)
+        xmi_root[:] = tmp_xmi_root[:]
+        xmi_root.attrib.update(tmp_xmi_root.attrib)
+
+        tree = ElementTree(xmi_root)
+        tree.write(output, pretty_print=pretty_print, xml_declaration=True,
+                   encoding=tree.docinfo.encoding)
+        output.flush()
+        self.uri.close_stream()
+
+def resident_memory():
+    '''The resident memory of this process in bytes'''
+    with open('/proc/self/statm') as statm:
+        return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+def measure(function):
+    '''The time in ms and the peak growth of the resident memory in MB of calling the function'''
+    baseline = resident_memory()
+    peak = [baseline]
+    done = threading.Event()
+
+    def sample():
+        while not done.is_set():
+            peak[0] = max(peak[0], resident_memory())
+            sleep(0.001)
+
+    sampler = threading.Thread(target=sample)
+    sampler.start()
+    start = perf_counter()
+    function()
+    elapsed = perf_counter() - start
+    done.set()
+    sampler.join()
+
+    return elapsed * 1000, (max(peak[0], resident_memory()) - baseline) / 1e6
+
+def run(size, label, target):
+    '''Measures writing the energy system with the resource of the label to the target'''
+    handler = EnergySystemHandler()
+    handler.load_from_string(generate_esdl(size))
+    handler.rset.resource_factory['esdl'] = RESOURCES[label]
+
+    if target == 'get_as_string':
+        return measure(handler.get_as_string)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'energy_system.esdl')
+        return measure(lambda: handler.save(path))
+
+RESOURCES = {'lxml tree': LxmlTreeResource, 'XMLWriter': XMLResource}
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--run']:
+        print(*run(int(sys.argv[2]), sys.argv[3], sys.argv[4]))
+        sys.exit()
+
+    sizes = [int(size) for size in sys.argv[1:]] or [2_000, 5_000]
+
+    for size in sizes:
+        print(f'{size} buildings')
+        for label in RESOURCES:
+            for target in ('get_as_string', 'to file'):
+                output = subprocess.run(
+                    [sys.executable, __file__, '--run', str(size), label, target],
+                    check=True, capture_output=True, text=True).stdout
+                elapsed, memory = (float(value) for value in output.split()[-2:])
+                print(f'  {label + ": " + target:<28} {elapsed:>8.0f} ms {memory:>8.1f} MB')
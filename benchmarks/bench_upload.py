@@ -0,0 +1,82 @@
+'''
+Compares uploading synthetic energy systems of growing size to the local stand-in (lib/stand_in)
+the way AttachEsdlToEtengine used to (the serialized ESDL in a BytesIO, encoded as multipart in
+memory by requests) with the streamed upload, uncompressed and gzip compressed: the bytes sent,
+the time the upload takes (serializing included) and the peak of the memory traced while
+uploading. The stand-in runs in a process of its own, so its memory is not traced.
+
+Usage: PYTHONPATH=. python benchmarks/bench_upload.py [buildings ...]
+'''
+import subprocess
+import sys
+import tracemalloc
+from time import perf_counter
+
+from app import create_app
+from app.helpers.energy_system_handler import EnergySystemHandler
+from app.services.attach_esdl_to_etengine import AttachEsdlToEtengine
+from app.services.etengine_service import etengine_client
+from benchmarks.synthetic import generate_esdl
+
+
+def in_memory(handler, scenario_id):
+    '''The upload as it was before streaming'''
+    stream = handler.get_as_stream()
+    stream.seek(0)
+    return etengine_client('beta').put(
+        f'/scenarios/{scenario_id}/esdl_file', files={'file': ('energy_system.esdl', stream)})
+
+
+def streamed(handler, scenario_id):
+    # The response of the last request tells the size of the body
+    AttachEsdlToEtengine('beta', scenario_id)(handler, 'energy_system.esdl')
+
+
+def measure(app, upload, handler, scenario_id, compress=False):
+    '''Returns the bytes sent, the time in ms and the traced peak in MB of the upload'''
+    app.config['ETENGINE_GZIP_UPLOADS'] = ('beta',) if compress else ()
+    sent = []
+    session = etengine_client('beta')
+    session.hooks['response'] = [lambda response, *args, **kwargs: sent.append(
+        int(response.request.headers['Content-Length']))]
+
+    tracemalloc.start()
+    start = perf_counter()
+    upload(handler, scenario_id)
+    elapsed = perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    session.hooks['response'] = []
+    return sent[-1], elapsed * 1000, peak / 1e6
+
+
+if __name__ == '__main__':
+    sizes = [int(size) for size in sys.argv[1:]] or [500, 2_000, 5_000, 10_000]
+
+    stand_in = subprocess.Popen(
+        [sys.executable, 'lib/stand_in/server.py', '--port', '0'],
+        stdout=subprocess.PIPE, text=True)
+    # The stand-in tells where it listens
+    url = stand_in.stdout.readline().split()[-1]
+
+    app = create_app()
+    app.config['ETENGINE'] = {'beta': f'{url}/api/v3'}
+
+    with app.app_context():
+        scenario_id = etengine_client('beta').post('/scenarios', json={}).json()['id']
+
+        print(f'{"buildings":>9} {"upload":<10} {"sent":>10} {"time":>11} {"peak":>11}')
+        for size in sizes:
+            handler = EnergySystemHandler()
+            handler.load_from_string(generate_esdl(size))
+
+            for label, upload, compress in (
+                    ('in memory', in_memory, False),
+                    ('streamed', streamed, False),
+                    ('gzip', streamed, True)):
+                sent, elapsed, peak = measure(app, upload, handler, scenario_id, compress)
+                print(f'{size:>9} {label:<10} {sent / 1e6:>7.2f} MB {elapsed:>8.0f} ms '
+                      f'{peak:>8.1f} MB')
+
+    stand_in.terminate()
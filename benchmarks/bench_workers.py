@@ -0,0 +1,109 @@
+'''
+Throughput of the production server (gunicorn, see gunicorn.conf.py) with a growing number of
+workers: the requests per second of create_scenario and export_esdl, and the memory of the
+master and its workers together (the sum of their proportional set size, in which the pages they
+share count once). ETEngine is played by the local stand-in (lib/stand_in, in a process of its
+own) at a realistic latency.
+
+The workers can only add throughput up to the number of cores of the machine, for the part of a
+request that is not waiting for ETEngine. Measuring the memory needs Linux.
+
+Usage: PYTHONPATH=. python benchmarks/bench_workers.py [--requests 40] [--concurrency 8]
+    [--workers 1 2 4] [--threads 4] [--esdl app/data/input/S1b_B_BodemWP_Hengelo.esdl]
+'''
+import argparse
+import contextlib
+import os
+import socket
+import subprocess
+import sys
+import time
+from urllib.parse import quote
+
+import requests
+
+from benchmarks.bench_bulk import start_stand_in
+from benchmarks.bench_end_to_end import DEFAULT_LATENCY, run
+
+
+def free_port():
+    with contextlib.closing(socket.socket()) as free:
+        free.bind(('127.0.0.1', 0))
+        return free.getsockname()[1]
+
+
+def serve(stand_in_url, workers, threads):
+    '''Starts gunicorn pointing to the stand-in, returns the process and the url of the api'''
+    port = free_port()
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '--config', 'gunicorn.conf.py',
+         '--bind', f'127.0.0.1:{port}', '--workers', str(workers), '--threads', str(threads),
+         '--access-logfile', '/dev/null'],
+        env=dict(os.environ, FLASK_ENV='stand_in', STAND_IN_URL=stand_in_url),
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    url = f'http://127.0.0.1:{port}/api/v1'
+    while True:
+        try:
+            requests.get(f'{url}/')
+            return server, url
+        except requests.ConnectionError:
+            time.sleep(0.1)
+
+
+def memory(pid):
+    '''The proportional set size in MB of the process and its children'''
+    with open(f'/proc/{pid}/task/{pid}/children') as children_file:
+        pids = [pid, *map(int, children_file.read().split())]
+
+    total = 0
+    for process in pids:
+        with open(f'/proc/{process}/smaps_rollup') as smaps:
+            total += next(int(line.split()[1]) for line in smaps if line.startswith('Pss:'))
+
+    return total / 1024
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=40)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--esdl', default='app/data/input/S1b_B_BodemWP_Hengelo.esdl')
+    args = parser.parse_args()
+
+    stand_in, stand_in_url = start_stand_in()
+
+    with open(args.esdl) as esdl_file:
+        energy_system = quote(esdl_file.read())
+
+    print(f'{args.requests} requests by {args.concurrency} clients, {args.threads} threads per '
+          f'worker, {os.cpu_count()} cores, latency {" ".join(DEFAULT_LATENCY)}')
+    print(f'{"workers":>7} {"create req/s":>13} {"export req/s":>13} {"memory":>10}')
+
+    for workers in args.workers:
+        server, url = serve(stand_in_url, workers, args.threads)
+
+        def create_scenario(session):
+            return session.post(f'{url}/create_scenario/', data={
+                'energy_system': energy_system, 'environment': 'beta'})
+
+        scenario_id = create_scenario(requests).json()['scenario_id']
+
+        def export_esdl(session):
+            return session.post(f'{url}/export_esdl/', data={
+                'environment': 'beta', 'session_id': scenario_id})
+
+        # Warm up: every worker handles a request
+        run(export_esdl, workers * args.threads, args.concurrency)
+
+        create = run(create_scenario, args.requests, args.concurrency)[1]
+        export = run(export_esdl, args.requests, args.concurrency)[1]
+
+        print(f'{workers:>7} {create:>13.2f} {export:>13.2f} {memory(server.pid):>7.0f} MB')
+
+        server.terminate()
+        server.wait()
+
+    stand_in.terminate()
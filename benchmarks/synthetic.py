@@ -0,0 +1,97 @@
+'''
+Generates synthetic ESDL energy systems for the benchmarks. They are modelled after the Hengelo
+energy systems in app/data/input: a municipality with wind turbines, rooftop PV and neighbourhoods
+that contain aggregated buildings with their heating technologies, demands and geometry.
+'''
+import random
+
+HEADER = '''<?xml version='1.0' encoding='UTF-8'?>
+<esdl:EnergySystem xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xmlns:esdl="http://www.tno.nl/esdl" name="{name}" id="{name}">
+  <energySystemInformation xsi:type="esdl:EnergySystemInformation" id="energy_system_information">
+    <quantityAndUnits xsi:type="esdl:QuantityAndUnits" id="quantity_and_units">
+      <quantityAndUnit xsi:type="esdl:QuantityAndUnitType" id="energy_GJ_yr" perTimeUnit="YEAR" unit="JOULE" physicalQuantity="ENERGY" multiplier="GIGA"/>
+    </quantityAndUnits>
+  </energySystemInformation>
+  <instance xsi:type="esdl:Instance" id="instance" aggrType="PER_COMMODITY" name="y2050">
+    <area xsi:type="esdl:Area" name="Hengelo" id="Hengelo">
+      <potential xsi:type="esdl:SolarPotential" id="solar_potential" value="{potential}"/>
+'''
+
+WIND_TURBINE = '''      <asset xsi:type="esdl:WindTurbine" power="{power}" name="WindTurbine_{index}" fullLoadHours="{flh}" id="wind_{index}">
+        <geometry xsi:type="esdl:Point" lon="6.7{index}" lat="52.2{index}"/>
+      </asset>
+'''
+
+PV_INSTALLATION = '''      <asset xsi:type="esdl:PVInstallation" name="PV_{index}" id="pv_{index}">
+        <port xsi:type="esdl:OutPort" id="pv_{index}_out">
+          <profile xsi:type="esdl:SingleValue" value="{production}" id="pv_{index}_profile"/>
+        </port>
+      </asset>
+'''
+
+HEATING_ASSETS = (
+    '<asset xsi:type="esdl:HeatPump" name="eWP_bodem" id="{id}_heating" source="SUB_SURFACE">',
+    '<asset xsi:type="esdl:HeatPump" name="eWP_lucht" id="{id}_heating" source="AIR">',
+    '<asset xsi:type="esdl:HeatPump" name="hWP" id="{id}_heating" additionalHeatingSourceType="GAS">',
+    '<asset xsi:type="esdl:HConnection" name="Heat_connector" id="{id}_heating">',
+    '<asset xsi:type="esdl:GasHeater" name="HR_ketel" id="{id}_heating">',
+)
+
+AGGREGATED_BUILDING = '''        <asset xsi:type="esdl:AggregatedBuilding" name="building_{id}" id="{id}" numberOfBuildings="{number}">
+          <geometry xsi:type="esdl:Point" lon="6.79" lat="52.26"/>
+          {heating}
+            <geometry xsi:type="esdl:Point" lon="250.0" lat="250.0" CRS="Simple"/>
+            <port xsi:type="esdl:InPort" id="{id}_heating_in" name="InPort"/>
+          </asset>
+          <asset xsi:type="esdl:HeatingDemand" name="demand" id="{id}_demand" type="SPACE_HEATING">
+            <geometry xsi:type="esdl:Point" lon="375.0" lat="125.0" CRS="Simple"/>
+            <port xsi:type="esdl:InPort" id="{id}_demand_in" name="InPort">
+              <profile xsi:type="esdl:SingleValue" value="6.0" id="{id}_demand_profile"/>
+            </port>
+          </asset>
+          <energyLabelDistribution xsi:type="esdl:EnergyLabelDistribution">
+            <labelPerc xsi:type="esdl:EnergyLabelPerc" percentage="{label_a}" energyLabel="LABEL_A"/>
+            <labelPerc xsi:type="esdl:EnergyLabelPerc" percentage="{label_b}" energyLabel="LABEL_B"/>
+          </energyLabelDistribution>
+          <buildingTypeDistribution xsi:type="esdl:BuildingTypeDistribution">
+            <buildingTypePercentage xsi:type="esdl:BuildingTypePercentage" buildingType="{building_type}" percentage="100.0"/>
+          </buildingTypeDistribution>
+        </asset>
+'''
+
+FOOTER = '''    </area>
+  </instance>
+</esdl:EnergySystem>
+'''
+
+
+def generate_esdl(number_of_buildings, buildings_per_area=50, wind_turbines=10, seed=0):
+    '''Returns an ESDL string with the given number of aggregated buildings'''
+    rand = random.Random(seed)
+    parts = [HEADER.format(name=f'synthetic_{number_of_buildings}', potential=5000.0)]
+
+    for index in range(wind_turbines):
+        parts.append(WIND_TURBINE.format(
+            index=index, power=rand.choice([3e6, 6e6, 13e6]), flh=rand.choice([1920, 2500])))
+        parts.append(PV_INSTALLATION.format(index=index, production=rand.randint(1, 100)))
+
+    for building in range(number_of_buildings):
+        if building % buildings_per_area == 0:
+            if building: parts.append('      </area>\n')
+            parts.append(
+                f'      <area xsi:type="esdl:Area" scope="NEIGHBOURHOOD" id="bu{building:08d}">\n')
+
+        building_id = f'building_{building}'
+        label_a = round(rand.random(), 4)
+        parts.append(AGGREGATED_BUILDING.format(
+            id=building_id,
+            number=rand.randint(1, 1000),
+            heating=rand.choice(HEATING_ASSETS).format(id=building_id),
+            label_a=label_a,
+            label_b=round(1 - label_a, 4),
+            building_type=rand.choice(['RESIDENTIAL', 'UTILITY'])))
+
+    if number_of_buildings: parts.append('      </area>\n')
+    parts.append(FOOTER)
+
+    return ''.join(parts)
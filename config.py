@@ -2,6 +2,8 @@
 Contains the configuration of the app
 '''
 
+import os
+
 class Config(object):
     '''Default config settings'''
     DEBUG = False
@@ -13,11 +15,104 @@ class Config(object):
         'beta': 'https://beta-engine.energytransitionmodel.com/api/v3'
     }
 
+    # The ETEngine connections are kept alive and shared by all requests (per environment, per
+    # process): ETENGINE_POOL_SIZE is the number of connections kept open per environment, which
+    # should be at least the number of threads of a worker. ETENGINE_TIMEOUT is the default
+    # (connect, read) timeout in seconds of a request to ETEngine, ETENGINE_TIMEOUTS the timeouts
+    # of specific endpoints (see ENDPOINTS in app/services/etengine_service.py)
+    ETENGINE_POOL_SIZE = 10
+    ETENGINE_TIMEOUT = (5, 120)
+    ETENGINE_TIMEOUTS = {'scenario': (5, 10), 'inputs': (5, 30), 'download': (5, 30)}
+
+    # Idempotent requests are retried ETENGINE_RETRIES times when ETEngine can't be reached or is
+    # unavailable, after a random wait of up to (base * 2 ** attempt) seconds, capped, from
+    # ETENGINE_BACKOFF = (base, cap). After ETENGINE_BREAKER_FAILURES failures in a row requests
+    # to the environment fail right away, for ETENGINE_BREAKER_RESET seconds
+    ETENGINE_RETRIES = 2
+    ETENGINE_BACKOFF = (0.2, 2.0)
+    ETENGINE_BREAKER_FAILURES = 5
+    ETENGINE_BREAKER_RESET = 30
+
+    # ESDL uploads are written to a temporary file that is kept in memory up to
+    # ETENGINE_UPLOAD_SPOOL_SIZE bytes, and are gzip compressed (Content-Encoding) for the
+    # environments in ETENGINE_GZIP_UPLOADS, which should accept compressed requests
+    ETENGINE_UPLOAD_SPOOL_SIZE = 4 * 1024 * 1024
+    ETENGINE_GZIP_UPLOADS = ()
+
+    # Files uploaded to the app (like an ESDL file posted to create_scenario) are kept in memory
+    # up to UPLOAD_SPOOL_SIZE bytes, and in a temporary file on disk beyond that
+    UPLOAD_SPOOL_SIZE = 4 * 1024 * 1024
+
+    # Gquery results are cached per version of a scenario (see app/services/gquery_cache.py): at
+    # most GQUERY_CACHE_SIZE results, for GQUERY_CACHE_TTL seconds. GQUERY_CACHE_BACKEND can be
+    # set to a shared backend, by default the results are kept in the process
+    GQUERY_CACHE_SIZE = 10_000
+    GQUERY_CACHE_TTL = 300
+    GQUERY_CACHE_BACKEND = None
+
+    # In production the app is served by gunicorn (see gunicorn.conf.py and wsgi.py): on
+    # SERVER_BIND, by SERVER_WORKERS processes that each handle SERVER_THREADS requests at once.
+    # The workers are forked from a master that already loaded the app and the ESDL metamodel
+    SERVER_BIND = '0.0.0.0:5000'
+    SERVER_WORKERS = 2
+    SERVER_THREADS = 4
+
+    # create_scenario can run in the background as a job (see app/services/jobs.py): by
+    # JOBS_WORKERS threads per process, with at most JOBS_QUEUE_SIZE jobs waiting. The results of
+    # finished jobs can be polled for JOBS_TTL seconds, also from other processes when they are
+    # stored in JOBS_DIR. Stored jobs are stored again every JOBS_HEARTBEAT seconds until they are
+    # done, those of a process that stopped (or missed a few heartbeats) are reported as failed
+    JOBS_WORKERS = 4
+    JOBS_QUEUE_SIZE = 16
+    JOBS_TTL = 60 * 60
+    JOBS_DIR = 'tmp/jobs'
+    JOBS_HEARTBEAT = 10
+
+    # create_scenarios converts at most BULK_MAX_ITEMS energy systems at once, in a pool of
+    # BULK_PROCESSES processes (see app/services/process_pool.py) per server worker. When it is
+    # None the cores of the host are divided among the SERVER_WORKERS, so the pools of all workers
+    # together have a process per core. The energy systems in an uploaded archive are at most
+    # BULK_MAX_ARCHIVE_SIZE bytes together, unpacked
+    BULK_PROCESSES = None
+    BULK_MAX_ITEMS = 100
+    BULK_MAX_ARCHIVE_SIZE = 512 * 1024 * 1024
+
+    # The Energy Data Repository, where the ESDL descriptions of assets are stored. Its assets are
+    # cached in memory (at most EDR_CACHE_SIZE) and in EDR_CACHE_DIR, and revalidated after
+    # EDR_CACHE_MAX_AGE seconds. With EDR_OFFLINE only the cached assets are used. Requests to the
+    # EDR are retried like those to ETEngine
+    EDR_URL = 'http://edr.hesi.energy/store'
+    EDR_TIMEOUT = (5, 30)
+    EDR_RETRIES = 2
+    EDR_BACKOFF = (0.2, 2.0)
+    EDR_BREAKER_FAILURES = 5
+    EDR_BREAKER_RESET = 30
+    EDR_CACHE_DIR = 'tmp/edr'
+    EDR_CACHE_SIZE = 128
+    EDR_CACHE_MAX_AGE = 24 * 60 * 60
+    EDR_OFFLINE = False
+
+    # Where the ESDL classes come from: 'dynamic' parses the ecore resource in tmp/esdl at
+    # runtime, 'static' uses the generated package in app/esdl (regenerate it with
+    # "pipenv run generate_esdl_package" when the ecore resource is updated, the static mode is
+    # rejected as long as it does not contain all classes of the ecore resource)
+    ESDL_METAMODEL = 'dynamic'
+
+    # With ESDL_EXTRACT_TRANSLATION, create_scenario translates the slider settings from a streamed
+    # extraction of the posted energy system (see app/helpers/esdl_extract.py), so ETEngine can
+    # start creating the scenario sooner. The energy system is still loaded entirely, to add the
+    # KPIs and attach it, while the scenario is created. This trades CPU for latency: the posted
+    # ESDL is parsed twice, and the peak memory use is the same as without the extraction. Energy
+    # systems posted as a file are loaded entirely right away, without an extraction
+    ESDL_EXTRACT_TRANSLATION = False
+
 class ProductionConfig(Config):
-    ''' Use the defaults for production'''
+    ''' Use the defaults for production, served by more workers'''
+    SERVER_WORKERS = 4
 
 class StagingConfig(ProductionConfig):
-    ''' Use the production defaults for staging'''
+    ''' Use the production defaults for staging, served by fewer workers'''
+    SERVER_WORKERS = 2
 
 class DevelopmentConfig(Config):
     '''Sets debug to true'''
@@ -30,6 +125,26 @@ class DevelopmentConfig(Config):
     # Where <PORT> should be 3000, 3001, etc. You need host.docker.internal instead of localhost
     # here when running the app in Docker.
 
+class StandInConfig(Config):
+    '''
+    Points ETEngine and the EDR to the local stand-in (lib/stand_in/server.py), at STAND_IN_URL
+    in the environment or localhost:3999. Select it with FLASK_ENV=stand_in
+    '''
+    STAND_IN_URL = os.environ.get('STAND_IN_URL', 'http://localhost:3999')
+    ETENGINE = {
+        'pro': f'{STAND_IN_URL}/api/v3',
+        'beta': f'{STAND_IN_URL}/api/v3'
+    }
+    EDR_URL = f'{STAND_IN_URL}/store'
+    ETENGINE_GZIP_UPLOADS = ('pro', 'beta')
+
 class TestingConfig(Config):
-    '''Sets testing to true'''
+    '''
+    Sets testing to true, EDR assets and jobs are only kept in memory and retries are not
+    delayed
+    '''
     TESTING = True
+    EDR_CACHE_DIR = None
+    JOBS_DIR = None
+    ETENGINE_BACKOFF = (0, 0)
+    EDR_BACKOFF = (0, 0)
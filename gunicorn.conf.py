@@ -0,0 +1,51 @@
+'''
+Settings of gunicorn, the production server: gunicorn --config gunicorn.conf.py (or pipenv run
+serve). The number of workers and threads are set per environment in config.py, as SERVER_WORKERS
+and SERVER_THREADS, and can be overridden on the command line (--workers, --threads).
+'''
+# pylint: disable=invalid-name
+
+import math
+
+from wsgi import app
+
+wsgi_app = 'wsgi:app'
+
+# The app is loaded (see wsgi.py) before the workers are forked, so they share it
+preload_app = True
+
+bind = app.config['SERVER_BIND']
+workers = app.config['SERVER_WORKERS']
+threads = app.config['SERVER_THREADS']
+worker_class = 'gthread'
+
+# The calls to ETEngine that a conversion (create_scenario) makes one after the other, at worst:
+# creating the scenario, querying its KPIs (when ETEngine did not answer them on creation) and
+# uploading the ESDL
+CONVERSION_CALLS = ('create', 'query', 'upload')
+
+def longest_conversion(config):
+    '''
+    How long a conversion can wait for ETEngine: each of its calls may be tried ETENGINE_RETRIES
+    more times, each attempt up to its connect and read timeout, with a backoff in between
+    '''
+    retries = config['ETENGINE_RETRIES']
+    _, backoff_cap = config['ETENGINE_BACKOFF']
+
+    longest = 0
+    for name in CONVERSION_CALLS:
+        connect, read = config['ETENGINE_TIMEOUTS'].get(name, config['ETENGINE_TIMEOUT'])
+        longest += (retries + 1) * (connect + read) + retries * backoff_cap
+
+    return math.ceil(longest)
+
+# The main thread of a gthread worker keeps notifying the master while the requests run in the
+# other threads, so the timeout only restarts a worker that hangs as a whole. It does not limit
+# how long a request takes, the timeouts of the calls to ETEngine do
+timeout = 30
+
+# Workers that are restarted (on a reload or a deploy) first finish their running requests, for as
+# long as a conversion can take
+graceful_timeout = longest_conversion(app.config)
+
+accesslog = '-'
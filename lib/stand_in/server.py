@@ -0,0 +1,315 @@
+'''
+A local stand-in for ETEngine and the Energy Data Repository (EDR), to run and benchmark the app
+without calling engine.energytransitionmodel.com or edr.hesi.energy. It implements the endpoints
+the app uses, keeps the scenarios in memory and answers with the fixtures in lib/stand_in/fixtures
+(shaped like the responses of ETEngine and the EDR).
+
+Latency and errors can be injected per endpoint (create, scenario, query, upload, download,
+inputs, edr, or * for all of them), for example:
+    python lib/stand_in/server.py --port 3999 --latency query=150:30 --errors upload=20:503
+answers queries after 150 ms (+/- 30 ms) and fails every 20th upload with a 503.
+
+Point the app to it with FLASK_ENV=stand_in (see StandInConfig in config.py).
+'''
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from email.parser import BytesParser
+from email.utils import formatdate
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+# (method, path) of the endpoints: the name by which latency and errors are scheduled
+ENDPOINTS = [
+    ('POST', re.compile(r'^/api/v3/scenarios$'), 'create'),
+    ('GET', re.compile(r'^/api/v3/scenarios/(\d+)$'), 'scenario'),
+    ('PUT', re.compile(r'^/api/v3/scenarios/(\d+)$'), 'query'),
+    ('PUT', re.compile(r'^/api/v3/scenarios/(\d+)/esdl_file$'), 'upload'),
+    ('GET', re.compile(r'^/api/v3/scenarios/(\d+)/esdl_file$'), 'download'),
+    ('GET', re.compile(r'^/api/v3/scenarios/(\d+)/inputs$'), 'inputs'),
+    ('GET', re.compile(r'^/store/esdl/([\w-]+)$'), 'edr'),
+]
+
+
+class Rule():
+    """
+    The latency (in ms, with a uniform jitter) and the errors (every nth request fails with the
+    status) of an endpoint
+    """
+    def __init__(self, latency=0., jitter=0., error_every=0, error_status=500):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_every = error_every
+        self.error_status = error_status
+
+
+    def delay(self):
+        return max(0., self.latency + random.uniform(-self.jitter, self.jitter)) / 1000
+
+
+    def fails(self, count):
+        return bool(self.error_every) and count % self.error_every == 0
+
+
+class Schedule():
+    """
+    The rules per endpoint, endpoints without a rule of their own follow the rule of '*'
+    """
+    def __init__(self, rules=None):
+        self.rules = rules or {}
+
+
+    def rule(self, endpoint):
+        return self.rules.get(endpoint) or self.rules.get('*') or Rule()
+
+
+    @classmethod
+    def parse(cls, latencies=(), errors=()):
+        '''A schedule from endpoint=ms[:jitter] latencies and endpoint=every[:status] errors'''
+        rules = {}
+        for latency in latencies:
+            endpoint, value = latency.split('=')
+            rule = rules.setdefault(endpoint, Rule())
+            milliseconds, _, jitter = value.partition(':')
+            rule.latency, rule.jitter = float(milliseconds), float(jitter or 0)
+
+        for error in errors:
+            endpoint, value = error.split('=')
+            rule = rules.setdefault(endpoint, Rule())
+            every, _, status = value.partition(':')
+            rule.error_every, rule.error_status = int(every), int(status or 500)
+
+        return cls(rules)
+
+
+class StandIn(ThreadingHTTPServer):
+    """
+    The stand-in server, holds the scenarios and counts the requests per endpoint
+    """
+    daemon_threads = True
+
+    def __init__(self, address=('127.0.0.1', 0), schedule=None, fixtures=FIXTURES):
+        super().__init__(address, Handler)
+        self.schedule = schedule or Schedule()
+        self.requests = Counter()
+        self.scenarios = {}
+        self.lock = threading.Lock()
+
+        with open(os.path.join(fixtures, 'gqueries.json')) as gqueries:
+            self.gqueries = json.load(gqueries)
+        with open(os.path.join(fixtures, 'inputs.json')) as inputs:
+            self.inputs = json.load(inputs)
+        self.edr = os.path.join(fixtures, 'edr')
+
+
+    @property
+    def url(self):
+        return f'http://{self.server_address[0]}:{self.server_address[1]}'
+
+
+    def start(self):
+        '''Serves in a background thread, returns the server'''
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+
+    def count(self, endpoint):
+        with self.lock:
+            self.requests[endpoint] += 1
+            return self.requests[endpoint]
+
+
+class Handler(BaseHTTPRequestHandler):
+    """
+    Handles the requests of the app like ETEngine (api/v3) and the EDR (store) would
+    """
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.handle_endpoint('GET')
+
+
+    def do_POST(self):
+        self.handle_endpoint('POST')
+
+
+    def do_PUT(self):
+        self.handle_endpoint('PUT')
+
+
+    def handle_endpoint(self, method):
+        path = urlsplit(self.path).path
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        if self.headers.get('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+
+        for endpoint_method, pattern, endpoint in ENDPOINTS:
+            match = pattern.match(path)
+            if endpoint_method == method and match:
+                break
+        else:
+            return self.respond(404, {'errors': ['Not found']})
+
+        rule = self.server.schedule.rule(endpoint)
+        count = self.server.count(endpoint)
+        time.sleep(rule.delay())
+
+        if rule.fails(count):
+            return self.respond(rule.error_status, {'errors': [f'Injected error ({endpoint})']})
+
+        if endpoint in ('create', 'edr'):
+            return getattr(self, endpoint)(*match.groups(), body)
+
+        with self.server.lock:
+            scenario = self.server.scenarios.get(int(match.group(1)))
+        if scenario is None:
+            return self.respond(404, {'errors': ['Scenario not found']})
+
+        return getattr(self, endpoint)(scenario, body)
+
+
+    def create(self, body):
+        attributes = json.loads(body or b'{}').get('scenario', {})
+
+        with self.server.lock:
+            scenario = {
+                'id': len(self.server.scenarios) + 1,
+                'title': attributes.get('title'),
+                'area_code': attributes.get('area_code', 'nl'),
+                'end_year': attributes.get('end_year', 2050),
+                'user_values': dict(attributes.get('user_values') or {}),
+                'esdl_file': None,
+                'updated_at': now()
+            }
+            self.server.scenarios[scenario['id']] = scenario
+
+        self.respond(200, describe(scenario))
+
+
+    def scenario(self, scenario, _body):
+        self.respond(200, describe(scenario))
+
+
+    def query(self, scenario, body):
+        data = json.loads(body or b'{}')
+        unknown = [gquery for gquery in data.get('gqueries', []) if gquery not in self.server.gqueries]
+        if unknown:
+            return self.respond(422, {'errors': [f'Gquery {gquery} does not exist' for gquery in unknown]})
+
+        user_values = (data.get('scenario') or {}).get('user_values')
+        with self.server.lock:
+            if data.get('reset'):
+                scenario['user_values'] = {}
+                scenario['updated_at'] = now()
+            if user_values:
+                scenario['user_values'].update(user_values)
+                scenario['updated_at'] = now()
+
+        self.respond(200, {
+            'scenario': describe(scenario),
+            'gqueries': {gquery: self.server.gqueries[gquery] for gquery in data.get('gqueries', [])}
+        })
+
+
+    def upload(self, scenario, body):
+        message = BytesParser(policy=HTTP).parsebytes(
+            f'Content-Type: {self.headers["Content-Type"]}\r\n\r\n'.encode() + body)
+        files = [part for part in message.iter_parts() if part.get_filename()] \
+            if message.is_multipart() else []
+        content = files[0].get_payload(decode=True) if files else b''
+
+        if not content.strip():
+            return self.respond(422, {'errors': ['This file does not contain ESDL']})
+
+        with self.server.lock:
+            scenario['esdl_file'] = (files[0].get_filename(), content.decode('UTF-8'))
+
+        self.respond(200, {})
+
+
+    def download(self, scenario, _body):
+        if scenario['esdl_file'] is None:
+            return self.respond(404, {'errors': ['No ESDL file attached to this scenario']})
+
+        filename, content = scenario['esdl_file']
+        self.respond(200, {'filename': filename, 'file': content})
+
+
+    def inputs(self, scenario, _body):
+        self.respond(200, {
+            key: dict(values, user=scenario['user_values'][key])
+            if key in scenario['user_values'] else values
+            for key, values in self.server.inputs.items()
+        })
+
+
+    def edr(self, asset_id, _body):
+        path = os.path.join(self.server.edr, f'{asset_id}.esdl')
+        if not os.path.exists(path):
+            return self.respond(404, b'Not found', 'text/plain')
+
+        with open(path, 'rb') as asset:
+            content = asset.read()
+
+        # Like the EDR, assets can be revalidated by their ETag or modification time
+        validators = {
+            'ETag': f'"{hashlib.sha1(content).hexdigest()}"',
+            'Last-Modified': formatdate(os.path.getmtime(path), usegmt=True)
+        }
+        if self.headers.get('If-None-Match') == validators['ETag'] or (
+                'If-None-Match' not in self.headers and
+                self.headers.get('If-Modified-Since') == validators['Last-Modified']):
+            return self.respond(304, b'', headers=validators)
+
+        self.respond(200, content, 'application/xml', validators)
+
+
+    def respond(self, status, body, content_type='application/json', headers=None):
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode('UTF-8')
+
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for header, value in (headers or {}).items():
+            self.send_header(header, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+    def log_message(self, *args):
+        pass
+
+
+def describe(scenario):
+    '''The scenario as ETEngine describes it'''
+    return {key: value for key, value in scenario.items() if key != 'esdl_file'}
+
+
+def now():
+    return datetime.now(timezone.utc).isoformat()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=3999)
+    parser.add_argument('--latency', action='append', default=[], metavar='ENDPOINT=MS[:JITTER]')
+    parser.add_argument('--errors', action='append', default=[], metavar='ENDPOINT=EVERY[:STATUS]')
+    args = parser.parse_args()
+
+    server = StandIn((args.host, args.port), Schedule.parse(args.latency, args.errors))
+    print(f'ETEngine and EDR stand-in listening on {server.url}', flush=True)
+    server.serve_forever()
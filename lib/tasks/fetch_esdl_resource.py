@@ -1,11 +1,16 @@
 '''
 Downloads the ecore esdl resource from github into the tmp folder. This xml-file is needed as a
-resource for the EnergySystemHandler
+resource for the EnergySystemHandler. A binary snapshot of the resource is written next to it, from
+which the EnergySystemHandler can load the metamodel faster
 '''
 import requests
 import sys
 import os
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+# pylint: disable=wrong-import-position
+from app.helpers.esdl_snapshot import write_snapshot
+
 TMP_FOLDER_PATH = 'tmp/esdl/'
 ECORE_FILE_PATH = TMP_FOLDER_PATH + 'esdl.ecore'
 
@@ -24,5 +29,7 @@ if __name__ == "__main__":
 
         with open(ECORE_FILE_PATH, 'wb') as file:
             file.write(result.content)
+
+        write_snapshot(ECORE_FILE_PATH)
     else:
         raise ValueError(f'Could not fetch ESDL ecore resource from github #{commit_hash}')
@@ -0,0 +1,37 @@
+'''
+Generates the static ESDL package in app/esdl from the ecore esdl resource in the tmp folder (see
+fetch_esdl_resource.py). The generated package is used when ESDL_METAMODEL is set to 'static', and
+has to be regenerated whenever the ecore resource is updated.
+
+The generated package __init__ is written to app/esdl/_package.py, behind the lazy facade in
+app/esdl/__init__.py
+'''
+import os
+import shutil
+import sys
+import tempfile
+
+from pyecore.resources import ResourceSet, URI
+from pyecoregen.ecore import EcoreGenerator
+
+ECORE_FILE_PATH = 'tmp/esdl/esdl.ecore'
+OUTPUT_FOLDER_PATH = 'app/esdl/'
+
+if __name__ == "__main__":
+    ecore_file_path = sys.argv[1] if len(sys.argv) > 1 else ECORE_FILE_PATH
+
+    esdl_model = ResourceSet().get_resource(URI(ecore_file_path)).contents[0]
+
+    # The resource lists the receiver of some operations (like getProfile) as a parameter named
+    # self, which the generated methods have already
+    for classifier in esdl_model.eClassifiers:
+        for operation in getattr(classifier, 'eOperations', ()):
+            for parameter in [param for param in operation.eParameters if param.name == 'self']:
+                operation.eParameters.remove(parameter)
+
+    with tempfile.TemporaryDirectory() as folder:
+        # Writes esdl/__init__.py and esdl/esdl.py
+        EcoreGenerator().generate(esdl_model, folder)
+
+        shutil.copy(os.path.join(folder, 'esdl', 'esdl.py'), OUTPUT_FOLDER_PATH + 'esdl.py')
+        shutil.copy(os.path.join(folder, 'esdl', '__init__.py'), OUTPUT_FOLDER_PATH + '_package.py')
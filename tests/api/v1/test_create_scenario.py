@@ -2,6 +2,16 @@
 Tests for the import esdl api
 '''
 
+import gzip
+import io
+import time
+from urllib.parse import quote
+import pytest
+import requests
+# pylint: disable=import-error
+from app.helpers.energy_system_handler import EnergySystemHandler
+from app.services.etengine_service import etengine_client
+
 API_URL = '/api/v1/create_scenario/'
 
 def test_import_esdl_with_invalid_params(client):
@@ -14,3 +24,231 @@ def test_get_responds_wit_405(client):
     '''Check if unavailable method is caught'''
     response = client.get(API_URL)
     assert response.status_code == 405
+
+@pytest.mark.parametrize('extract', [False, True])
+def test_create_scenario_round_trips(app, client, requests_mock, extract):
+    '''
+    The scenario is created with its sliders set, so ETEngine is called to create it, to query the
+    KPIs (ETEngine does not answer them on creation) and to attach the ESDL
+    '''
+    app.config['ESDL_EXTRACT_TRANSLATION'] = extract
+    etengine = app.config['ETENGINE']['beta']
+
+    def query(request, _context):
+        return {'gqueries': {
+            gquery: {'present': 1.0, 'future': 2.0} for gquery in request.json()['gqueries']}}
+
+    # The ESDL is streamed, so it is read while it's uploaded
+    uploads = []
+    def upload(request, _context):
+        uploads.append(b''.join(request.body))
+        return ''
+
+    creation = requests_mock.post(f'{etengine}/scenarios', json={'id': 12345})
+    requests_mock.put(f'{etengine}/scenarios/12345', json=query)
+    requests_mock.put(f'{etengine}/scenarios/12345/esdl_file', status_code=204, text=upload)
+
+    with open('app/data/input/S1b_B_BodemWP_Hengelo.esdl') as esdl_file:
+        response = client.post(API_URL, data={
+            'energy_system': quote(esdl_file.read()),
+            'environment': 'beta'
+        })
+
+    assert response.status_code == 200
+    assert response.json['scenario_id'] == 12345
+    assert requests_mock.call_count == 3
+    assert creation.last_request.json()['scenario']['user_values']
+    assert b'total_costs' in uploads[0]
+
+def test_create_scenario_loads_while_etengine_creates_it(app, client, requests_mock, monkeypatch):
+    '''
+    With the extraction the energy system is loaded entirely while the scenario is created, instead
+    of after it
+    '''
+    app.config['ESDL_EXTRACT_TRANSLATION'] = True
+    mock_etengine(app, requests_mock)
+
+    # requests_mock answers right away, so the creation is made to take a while
+    periods = {}
+    with app.app_context():
+        session = etengine_client('beta')
+    request = session.request
+    def slow_request(method, url, **kwargs):
+        if method == 'POST':
+            start = time.perf_counter()
+            time.sleep(0.3)
+            periods['creation'] = (start, time.perf_counter())
+        return request(method, url, **kwargs)
+    monkeypatch.setattr(session, 'request', slow_request)
+
+    load = EnergySystemHandler.load
+    def timed_load(self, source):
+        start = time.perf_counter()
+        result = load(self, source)
+        periods['load'] = (start, time.perf_counter())
+        return result
+    monkeypatch.setattr(EnergySystemHandler, 'load', timed_load)
+
+    with open('app/data/input/S1b_B_BodemWP_Hengelo.esdl') as esdl_file:
+        response = client.post(API_URL, data={
+            'energy_system': quote(esdl_file.read()),
+            'environment': 'beta'
+        })
+
+    assert response.status_code == 200
+    assert response.json['scenario_id'] == 12345
+    # The energy system was loaded before the creation was done
+    assert periods['load'][0] < periods['creation'][1]
+
+def test_create_scenario_when_etengine_is_down(app, client, requests_mock):
+    '''ETEngine can't be reached: the client gets a 503 instead of waiting'''
+    requests_mock.post(f'{app.config["ETENGINE"]["beta"]}/scenarios', exc=requests.ConnectTimeout)
+
+    with open('app/data/input/S1b_B_BodemWP_Hengelo.esdl') as esdl_file:
+        response = client.post(API_URL, data={
+            'energy_system': quote(esdl_file.read()),
+            'environment': 'beta'
+        })
+
+    assert response.status_code == 503
+    assert response.json['message'] == 'ETEngine could not be reached'
+
+def test_create_scenario_as_job(app, client, requests_mock):
+    '''The scenario is created in the background, the job is polled until it's finished'''
+    etengine = app.config['ETENGINE']['beta']
+    requests_mock.post(f'{etengine}/scenarios', json={'id': 12345})
+    requests_mock.put(f'{etengine}/scenarios/12345', json=lambda request, _context: {
+        'gqueries': {gquery: {'present': 1.0, 'future': 2.0}
+                     for gquery in request.json()['gqueries']}})
+    requests_mock.put(f'{etengine}/scenarios/12345/esdl_file', status_code=204)
+
+    with open('app/data/input/S1b_B_BodemWP_Hengelo.esdl') as esdl_file:
+        response = client.post(API_URL, data={
+            'energy_system': quote(esdl_file.read()),
+            'environment': 'beta',
+            'async': 'true'
+        })
+
+    assert response.status_code == 202
+    assert response.json['status_url'] == f'/api/v1/jobs/{response.json["job_id"]}'
+
+    job = poll(client, response.json['status_url'])
+
+    assert job['status'] == 'finished'
+    assert job['scenario_id'] == 12345
+    assert 'url' in job['show_url']
+
+def test_failed_job(app, client, requests_mock):
+    requests_mock.post(
+        f'{app.config["ETENGINE"]["beta"]}/scenarios', status_code=422,
+        json={'errors': ['Area code is unknown']})
+
+    with open('app/data/input/S1b_B_BodemWP_Hengelo.esdl') as esdl_file:
+        response = client.post(API_URL, data={
+            'energy_system': quote(esdl_file.read()),
+            'environment': 'beta',
+            'async': 'true'
+        })
+
+    job = poll(client, response.json['status_url'])
+
+    assert job['status'] == 'failed'
+    assert job['errors'] == ['Area code is unknown']
+
+@pytest.mark.parametrize('filename, compress', [
+    ('hengelo.esdl', False),
+    ('hengelo.esdl.gz', True)
+])
+def test_create_scenario_from_file(app, client, requests_mock, filename, compress):
+    '''The ESDL is uploaded as a file, gzip compressed or not, and named after the file'''
+    uploads = mock_etengine(app, requests_mock)
+
+    with open('app/data/input/S1b_B_BodemWP_Hengelo.esdl', 'rb') as esdl_file:
+        content = esdl_file.read()
+    if compress:
+        content = gzip.compress(content)
+
+    response = client.post(API_URL, data={
+        'energy_system_file': (io.BytesIO(content), filename),
+        'environment': 'beta'
+    }, content_type='multipart/form-data')
+
+    assert response.status_code == 200
+    assert response.json['scenario_id'] == 12345
+    assert b'filename="hengelo.esdl"' in uploads[0]
+    assert b'total_costs' in uploads[0]
+
+def test_create_scenario_from_file_as_job(app, client, requests_mock):
+    '''The upload is parsed before the request is done, the job creates the scenario'''
+    mock_etengine(app, requests_mock)
+
+    with open('app/data/input/S1b_B_BodemWP_Hengelo.esdl', 'rb') as esdl_file:
+        response = client.post(API_URL, data={
+            'energy_system_file': (esdl_file, 'hengelo.esdl'),
+            'environment': 'beta',
+            'async': 'true'
+        }, content_type='multipart/form-data')
+
+    assert response.status_code == 202
+    assert poll(client, response.json['status_url'])['scenario_id'] == 12345
+
+def test_create_scenario_from_invalid_files(client):
+    response = client.post(API_URL, data={'environment': 'beta'})
+
+    assert response.status_code == 422
+    assert response.json['message'] == 'No energy system was given'
+
+    response = client.post(API_URL, data={
+        'energy_system_file': (io.BytesIO(b'\x1f\x8b not really gzip'), 'hengelo.esdl.gz'),
+        'environment': 'beta'
+    }, content_type='multipart/form-data')
+
+    assert response.status_code == 422
+    assert response.json['message'].startswith('could not load ESDL')
+
+def test_create_scenario_with_unknown_type(app, client):
+    app.config['ESDL_EXTRACT_TRANSLATION'] = True
+
+    response = client.post(API_URL, data={
+        'energy_system': quote(
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<esdl:EnergySystem xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+            'xmlns:esdl="http://www.tno.nl/esdl" id="energy_system">'
+            '<instance xsi:type="esdl:Instanse" id="instance"/></esdl:EnergySystem>'),
+        'environment': 'beta'
+    })
+
+    assert response.status_code == 422
+    assert response.json['message'] == 'could not load ESDL: unknown type esdl:Instanse'
+
+def test_unknown_job(client):
+    response = client.get('/api/v1/jobs/unknown')
+
+    assert response.status_code == 404
+
+def poll(client, status_url, timeout=10):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = client.get(status_url).json
+        if job['status'] in ('finished', 'failed'):
+            return job
+        time.sleep(0.05)
+
+    return job
+
+def mock_etengine(app, requests_mock):
+    '''ETEngine creates scenario 12345, returns the bodies of the uploads to it'''
+    etengine = app.config['ETENGINE']['beta']
+    uploads = []
+
+    def upload(request, _context):
+        uploads.append(b''.join(request.body))
+        return ''
+
+    requests_mock.post(f'{etengine}/scenarios', json={'id': 12345})
+    requests_mock.put(f'{etengine}/scenarios/12345', json=lambda request, _context: {
+        'gqueries': {gquery: {'present': 1.0, 'future': 2.0}
+                     for gquery in request.json()['gqueries']}})
+    requests_mock.put(f'{etengine}/scenarios/12345/esdl_file', status_code=204, text=upload)
+
+    return uploads
@@ -0,0 +1,62 @@
+'''
+Tests for the bulk create api (the conversions themselves are tested against the stand-in, as
+they run in other processes)
+'''
+import io
+import zipfile
+import pytest
+
+API_URL = '/api/v1/create_scenarios/'
+
+def test_without_energy_systems(client):
+    response = client.post(API_URL, data={'environment': 'beta'})
+
+    assert response.status_code == 422
+    assert response.json['message'] == 'No energy systems were given'
+
+def test_too_many_energy_systems(app, client):
+    app.config['BULK_MAX_ITEMS'] = 2
+    response = client.post(API_URL, data={'environment': 'beta', 'energy_system': ['a', 'b', 'c']})
+
+    assert response.status_code == 422
+
+def test_unreadable_archive(client):
+    response = client.post(API_URL, data={
+        'environment': 'beta',
+        'archive': (io.BytesIO(b'not an archive'), 'region.zip')
+    })
+
+    assert response.status_code == 422
+    assert response.json['message'] == 'The archive could not be read'
+
+def zip_archive(*files):
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as zipped:
+        for name, contents in files:
+            zipped.writestr(name, contents)
+
+    return io.BytesIO(archive.getvalue())
+
+def test_too_many_energy_systems_in_archive(app, client):
+    app.config['BULK_MAX_ITEMS'] = 2
+    response = client.post(API_URL, data={
+        'environment': 'beta',
+        'archive': (zip_archive(('a.esdl', 'a'), ('b.esdl', 'b'), ('c.esdl', 'c')), 'region.zip')
+    })
+
+    assert response.status_code == 422
+    assert response.json['message'] == 'At most 2 energy systems can be converted at once'
+
+@pytest.mark.parametrize('spool_size', [100, 1_000_000])
+def test_too_large_archive(app, client, spool_size):
+    app.config['UPLOAD_SPOOL_SIZE'] = spool_size
+    app.config['BULK_MAX_ARCHIVE_SIZE'] = 100_000
+    # Compresses to a few hundred bytes, unpacks to more than the maximum size
+    response = client.post(API_URL, data={
+        'environment': 'beta',
+        'archive': (zip_archive(('a.esdl', 'a' * 200_000)), 'region.zip')
+    })
+
+    assert response.status_code == 422
+    assert response.json['message'] == \
+        'The energy systems in the archive can be at most 100000 bytes together'
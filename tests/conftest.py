@@ -7,6 +7,11 @@ import pytest
 sys.path.append(path.dirname(path.dirname(path.abspath(__file__))))
 # pylint: disable=wrong-import-position, disable=import-error, disable=redefined-outer-name
 from app import create_app
+from app.helpers.edr import clear_edr_clients
+from app.services.etengine_service import close_etengine_clients
+from app.services.gquery_cache import clear_gquery_caches
+from app.services.jobs import close_job_queues
+from app.services.process_pool import close_process_pools
 
 @pytest.fixture(scope='session', autouse=True)
 def precondition():
@@ -26,6 +31,12 @@ def app():
         'TESTING': True
     })
     yield app
+    # Do not keep jobs, cached gquery results, EDR assets or open circuit breakers between tests
+    close_job_queues()
+    close_process_pools()
+    clear_gquery_caches()
+    clear_edr_clients()
+    close_etengine_clients()
 
 @pytest.fixture
 def client(app):
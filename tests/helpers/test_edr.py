@@ -0,0 +1,86 @@
+''' Tests for the cached assets of the Energy Data Repository '''
+import pytest
+import requests
+# pylint: disable=import-error disable=redefined-outer-name
+from app.helpers.edr import EnergyDataRepository, clear_edr_clients
+from app.helpers.exceptions import EnergysystemParseError
+
+ASSET_ID = 'b68cb054-44ee-46cb-a32b-ef1b7830f0e1'
+ASSET_URL = f'http://edr.test/store/esdl/{ASSET_ID}'
+
+@pytest.fixture
+def edr(app, tmp_path):
+    app.config['EDR_URL'] = 'http://edr.test/store'
+    app.config['EDR_CACHE_DIR'] = str(tmp_path)
+    with app.app_context():
+        yield EnergyDataRepository
+
+@pytest.fixture
+def asset():
+    with open(f'lib/stand_in/fixtures/edr/{ASSET_ID}.esdl', 'rb') as asset_file:
+        return asset_file.read()
+
+@pytest.fixture
+def served(requests_mock, asset):
+    return requests_mock.get(ASSET_URL, content=asset, headers={'ETag': '"v1"'})
+
+def test_get_asset_from_memory(edr, served):
+    first = edr().get_asset(ASSET_ID)
+
+    assert first.power == 3e6
+    assert edr().get_asset(ASSET_ID) is first
+    assert served.call_count == 1
+
+def test_get_asset_from_disk(edr, served):
+    edr().get_asset(ASSET_ID)
+    clear_edr_clients()
+
+    assert edr().get_asset(ASSET_ID).power == 3e6
+    assert served.call_count == 1
+
+def test_revalidate_not_modified(app, edr, served, requests_mock):
+    first = edr().get_asset(ASSET_ID)
+    app.config['EDR_CACHE_MAX_AGE'] = 0
+    not_modified = requests_mock.get(ASSET_URL, status_code=304)
+
+    assert edr().get_asset(ASSET_ID) is first
+    assert not_modified.last_request.headers['If-None-Match'] == '"v1"'
+
+def test_revalidate_modified(app, edr, served, requests_mock, asset):
+    edr().get_asset(ASSET_ID)
+    app.config['EDR_CACHE_MAX_AGE'] = 0
+    requests_mock.get(ASSET_URL, content=asset.replace(b'3000000.0', b'2000000.0'))
+
+    assert edr().get_asset(ASSET_ID).power == 2e6
+
+def test_stale_when_edr_is_down(app, edr, served, requests_mock):
+    first = edr().get_asset(ASSET_ID)
+    app.config['EDR_CACHE_MAX_AGE'] = 0
+    requests_mock.get(ASSET_URL, exc=requests.ConnectionError)
+
+    assert edr().get_asset(ASSET_ID) is first
+
+    requests_mock.get(ASSET_URL, status_code=503)
+
+    assert edr().get_asset(ASSET_ID) is first
+
+def test_offline(app, edr, served):
+    first = edr().get_asset(ASSET_ID)
+    app.config['EDR_CACHE_MAX_AGE'] = 0
+    app.config['EDR_OFFLINE'] = True
+
+    assert edr().get_asset(ASSET_ID) is first
+    assert served.call_count == 1
+
+    with pytest.raises(EnergysystemParseError):
+        edr().get_asset('not-cached')
+
+def test_not_cached_when_edr_is_down(edr, requests_mock):
+    requests_mock.get(ASSET_URL, status_code=503)
+
+    with pytest.raises(EnergysystemParseError) as error:
+        edr().get_asset(ASSET_ID)
+
+    assert error.value.status_code == 502
+    # The request was retried
+    assert requests_mock.call_count == 3
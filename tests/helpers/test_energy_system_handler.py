@@ -0,0 +1,127 @@
+''' Tests for loading energy systems into the EnergySystemHandler from different sources '''
+import gzip
+import threading
+from io import BytesIO
+from pathlib import Path
+import urllib.parse
+import pytest
+# pylint: disable=import-error disable=redefined-outer-name
+from app.helpers.energy_system_handler import EnergySystemHandler
+from app.helpers.output_stream import StreamClosed, stream_writes
+from app.helpers.StringURI import StringURI, BufferStream, unquote_to_buffer
+from app.interface import setup_esh_from_energy_system
+
+FIXTURE = 'tests/fixtures/hengelo.esdl'
+
+@pytest.fixture
+def esdl_bytes():
+    with open(FIXTURE, 'rb') as esdl_file:
+        return esdl_file.read()
+
+def summary(handler):
+    ''' The name of the energy system and the number of buildings and wind turbines in it '''
+    return (
+        handler.es.name,
+        len(handler.get_all_instances_of_type(handler.esdl.AggregatedBuilding)),
+        len(handler.get_all_instances_of_type(handler.esdl.WindTurbine))
+    )
+
+@pytest.mark.parametrize('source', [
+    lambda data: data,
+    bytearray,
+    memoryview,
+    BytesIO,
+    lambda data: FIXTURE,
+    lambda data: Path(FIXTURE)
+])
+def test_load_from_sources(esdl_bytes, source):
+    handler = EnergySystemHandler()
+    handler.load(source(esdl_bytes))
+
+    assert summary(handler) == ('Hengelo', 6, 2)
+
+def test_load_from_file_and_string(esdl_bytes):
+    from_file = EnergySystemHandler()
+    with open(FIXTURE, 'rb') as esdl_file:
+        from_file.load(esdl_file)
+
+    from_string = EnergySystemHandler()
+    from_string.load_from_string(esdl_bytes.decode('UTF-8'))
+
+    assert summary(from_file) == summary(from_string) == ('Hengelo', 6, 2)
+    assert from_file.get_as_string() == from_string.get_as_string()
+
+def test_string_uri_reads_buffers_without_copying_them(esdl_bytes):
+    buffer = bytearray(esdl_bytes)
+    stream = StringURI('buffer', buffer).create_instream()
+
+    assert isinstance(stream, BufferStream)
+    assert stream.read(5) == b'<?xml'
+
+    # The stream reads from the buffer itself
+    buffer[5:10] = b'XXXXX'
+    assert stream.read(5) == b'XXXXX'
+
+def test_string_uri_uses_file_like_objects_as_they_are(esdl_bytes):
+    stream = BytesIO(esdl_bytes)
+    assert StringURI('stream', stream).create_instream() is stream
+
+def test_setup_from_url_encoded_string(esdl_bytes):
+    handler = setup_esh_from_energy_system(urllib.parse.quote(esdl_bytes))
+
+    assert summary(handler) == ('Hengelo', 6, 2)
+
+def test_setup_from_bytes(esdl_bytes):
+    assert summary(setup_esh_from_energy_system(esdl_bytes)) == ('Hengelo', 6, 2)
+
+def test_extract_from_bytes(esdl_bytes):
+    handler = EnergySystemHandler()
+    handler.extract_energy_system(memoryview(esdl_bytes))
+
+    assert summary(handler) == ('Hengelo', 6, 2)
+
+@pytest.mark.parametrize('chunk_size', [3, 4, 5, 1 << 16])
+def test_unquote_to_buffer(esdl_bytes, chunk_size):
+    encoded = urllib.parse.quote(esdl_bytes)
+
+    assert unquote_to_buffer(encoded, chunk_size) == esdl_bytes
+    assert unquote_to_buffer(encoded.encode('ascii'), chunk_size) == esdl_bytes
+
+@pytest.mark.parametrize('compress', [False, True])
+def test_iter_chunks(esdl_bytes, compress):
+    handler = EnergySystemHandler()
+    handler.load(esdl_bytes)
+
+    streamed = b''.join(handler.iter_chunks(compress=compress))
+
+    if compress:
+        streamed = gzip.decompress(streamed)
+    assert streamed.decode('UTF-8') == handler.get_as_string()
+
+def test_output_stream_raises_errors_of_the_writer():
+    def write(output):
+        output.write(b'<half')
+        raise ValueError('Does not work')
+
+    chunks = stream_writes(write)
+
+    assert next(chunks) == b'<half'
+    with pytest.raises(ValueError):
+        next(chunks)
+
+def test_output_stream_stops_the_writer_when_closed():
+    stopped = threading.Event()
+
+    def write(output):
+        try:
+            while True:
+                output.write(b'chunk')
+        except StreamClosed:
+            stopped.set()
+            raise
+
+    chunks = stream_writes(write, size=1)
+    next(chunks)
+    chunks.close()
+
+    assert stopped.wait(5)
@@ -0,0 +1,161 @@
+'''
+Equivalence tests between extracting an energy system for the translation into slider settings and
+loading it entirely with pyecore
+'''
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from glob import glob
+from io import BytesIO
+import pytest
+# pylint: disable=import-error disable=redefined-outer-name
+import app.constants.assets as assets
+from app.constants.inputs import new_input_values
+from app.helpers.esdl_extract import EXTRACTED_TYPES
+from app.helpers.exceptions import EnergysystemParseError
+from app.helpers.esdl_metamodel import DYNAMIC, STATIC
+from app.helpers.energy_system_handler import EnergySystemHandler
+from app.helpers.rooftop_pv import RooftopPV
+from app.helpers.supply import Supply
+from app.interface import determine_number_of_buildings, parse_aggregated_buiding
+
+CORPUS = ['tests/fixtures/hengelo.esdl'] + sorted(glob('app/data/input/*.esdl'))
+
+def load(path, mode=None):
+    ''' The ESDL file at path, loaded entirely and extracted '''
+    with open(path) as esdl_file:
+        esdl_string = esdl_file.read()
+
+    loaded = EnergySystemHandler(mode=mode)
+    loaded.load_from_string(esdl_string)
+    extracted = EnergySystemHandler(mode=mode)
+    extracted.extract_from_string(esdl_string)
+
+    return loaded, extracted
+
+def label(eobject):
+    ''' Identifies an object in the graph by its type and id or name '''
+    if eobject is None:
+        return None
+    return (eobject.eClass.name, getattr(eobject, 'id', None) or getattr(eobject, 'name', None))
+
+def describe(eobject):
+    ''' The object, its place in the graph and its attributes '''
+    attributes = tuple(
+        (feature.name, str(eobject.eGet(feature)))
+        for feature in eobject.eClass.eAllAttributes() if eobject.eIsSet(feature))
+    containment = eobject.eContainmentFeature()
+
+    return (
+        label(eobject),
+        label(eobject.eContainer()),
+        containment.name if containment else None,
+        attributes
+    )
+
+def graph(energy_system):
+    ''' All objects in the energy system as a comparable multiset '''
+    return Counter(describe(eobject) for eobject in [energy_system, *energy_system.eAllContents()])
+
+def translate(handler):
+    '''
+    The input values of the translation into slider settings, without the ETM session. Rooftop
+    PV only contributes its potential, as the production is read from a profile that this ESDL
+    version holds as a single object
+    '''
+    input_values = new_input_values()
+    number_of_buildings = determine_number_of_buildings(handler, input_values)
+
+    for asset_type, properties in assets.supply.items():
+        if asset_type == 'RooftopPV':
+            RooftopPV(handler, properties, input_values).set_potential()
+        else:
+            Supply(handler, asset_type, properties, input_values).call(overwrite=True)
+
+    for sub_area in handler.es.instance[0].area.area:
+        parse_aggregated_buiding(handler, sub_area, number_of_buildings, input_values)
+
+    return {name: value['value'] for name, value in input_values.items()}
+
+@pytest.mark.parametrize('path', CORPUS)
+def test_extracted_objects_are_equal_to_the_loaded_objects(path):
+    loaded, extracted = load(path)
+    extracted_graph = graph(extracted.es)
+
+    # Everything that was extracted is part of the loaded energy system as well...
+    assert not extracted_graph - graph(loaded.es)
+
+    # ...and nothing the translation looks at is left out
+    for esdl_type in EXTRACTED_TYPES:
+        esdl_class = getattr(loaded.esdl, esdl_type)
+        assert Counter(
+            describe(eobject) for eobject in loaded.get_all_instances_of_type(esdl_class)
+        ) == Counter(
+            describe(eobject) for eobject in extracted.get_all_instances_of_type(esdl_class))
+
+@pytest.mark.parametrize('path', CORPUS)
+def test_translation_of_extracted_energy_system(path):
+    loaded, extracted = load(path)
+
+    assert translate(extracted) == translate(loaded)
+
+@pytest.mark.parametrize('mode', [DYNAMIC, STATIC])
+def test_extracted_contents(mode):
+    loaded, extracted = load('tests/fixtures/hengelo.esdl', mode)
+    building = extracted.get_by_id('building_0')
+
+    assert building.geometry is None
+    assert not extracted.get_all_instances_of_type(extracted.esdl.HeatingDemand)
+    assert loaded.get_all_instances_of_type(loaded.esdl.HeatingDemand)
+
+    assert building.energyLabelDistribution.labelPerc
+    assert extracted.get_by_id('pv_0').port[0].profile.value == (
+        loaded.get_by_id('pv_0').port[0].profile.value)
+
+def test_extract_from_file():
+    handler = EnergySystemHandler()
+    with open('tests/fixtures/hengelo.esdl', 'rb') as esdl_file:
+        handler.extract_energy_system(esdl_file)
+
+    assert handler.es.instance[0].area.id == 'Hengelo'
+    assert len(handler.get_all_instances_of_type(handler.esdl.AggregatedBuilding)) == 6
+
+def test_extract_objects_in_other_containers():
+    handler = EnergySystemHandler()
+    handler.extract_energy_system(BytesIO(
+        b'<?xml version="1.0" encoding="UTF-8"?>'
+        b'<esdl:EnergySystem xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+        b'xmlns:esdl="http://www.tno.nl/esdl" name="building" id="energy_system">'
+        b'<instance xsi:type="esdl:Instance" id="instance"><area xsi:type="esdl:Area" id="GM0503">'
+        b'<asset xsi:type="esdl:Building" id="building" floorArea="120.0">'
+        b'<geometry xsi:type="esdl:Point" lon="4.36" lat="52.01"/>'
+        b'<asset xsi:type="esdl:WindTurbine" id="wind" power="3000000.0"/>'
+        b'</asset></area></instance></esdl:EnergySystem>'))
+
+    # The building containing the wind turbine is extracted as well, without its geometry
+    wind_turbine = handler.get_by_id('wind')
+    assert wind_turbine.power == 3e6
+    assert wind_turbine.eContainer() is handler.get_by_id('building')
+    assert wind_turbine.eContainer().floorArea == 120.0
+    assert wind_turbine.eContainer().geometry is None
+
+def test_concurrent_translations_do_not_share_input_values():
+    paths = ['app/data/input/S1b_B_BodemWP_Hengelo.esdl', 'tests/fixtures/hengelo.esdl'] * 4
+    handlers = [load(path)[1] for path in paths]
+    expected = [translate(handler) for handler in handlers]
+
+    with ThreadPoolExecutor(len(handlers)) as executor:
+        assert list(executor.map(translate, handlers)) == expected
+
+def test_extract_unknown_type():
+    handler = EnergySystemHandler()
+
+    with pytest.raises(EnergysystemParseError) as error:
+        handler.extract_energy_system(BytesIO(
+            b'<?xml version="1.0" encoding="UTF-8"?>'
+            b'<esdl:EnergySystem xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+            b'xmlns:esdl="http://www.tno.nl/esdl" name="wind" id="energy_system">'
+            b'<instance xsi:type="esdl:Instance" id="instance"><area xsi:type="esdl:Area" id="GM0503">'
+            b'<asset xsi:type="esdl:WindMill" id="wind"/>'
+            b'</area></instance></esdl:EnergySystem>'))
+
+    assert error.value.message == 'could not load ESDL: unknown type esdl:WindMill'
@@ -0,0 +1,132 @@
+''' Tests for the index of the objects in a loaded energy system '''
+import pytest
+# pylint: disable=import-error disable=redefined-outer-name
+from app.helpers.esdl_metamodel import DYNAMIC, STATIC
+from app.helpers.energy_system_handler import EnergySystemHandler
+from app.constants.assets import heating_technologies
+from app.constants.q_and_u import quantities
+from app.interface import add_quantity_and_units, determine_number_of_buildings
+
+def load(mode=None):
+    ''' A handler with the Hengelo fixture loaded '''
+    handler = EnergySystemHandler(mode=mode)
+    with open('tests/fixtures/hengelo.esdl') as esdl_file:
+        handler.load_from_string(esdl_file.read())
+    return handler
+
+@pytest.fixture
+def handler():
+    return load()
+
+def names(eobjects):
+    return sorted(eobject.name for eobject in eobjects)
+
+@pytest.mark.parametrize('mode', [DYNAMIC, STATIC])
+def test_instances_of_supertypes(mode):
+    handler = load(mode)
+
+    wind_turbines = handler.get_all_instances_of_type(handler.esdl.WindTurbine)
+    producers = handler.get_all_instances_of_type(handler.esdl.Producer)
+
+    assert names(wind_turbines) == ['WindTurbine_0', 'WindTurbine_1']
+    assert names(producers) == ['PV_0', 'PV_1', 'WindTurbine_0', 'WindTurbine_1']
+    assert len(handler.get_all_instances_of_type(handler.esdl.AggregatedBuilding)) == 6
+
+def test_instances_of_other_energy_systems_are_not_included(handler):
+    other = load()
+
+    assert len(handler.get_all_instances_of_type(handler.esdl.WindTurbine)) == 2
+    assert determine_number_of_buildings(other) == {'RESIDENTIAL': 1460, 'UTILITY': 2476}
+
+def test_added_instances(handler):
+    area = handler.es.instance[0].area
+    area.asset.append(handler.esdl.WindTurbine(id='new_wind', name='WindTurbine_new'))
+
+    sub_area = handler.esdl.Area(id='new_area')
+    sub_area.asset.append(handler.esdl.WindTurbine(id='sub_wind', name='WindTurbine_sub'))
+    area.area.append(sub_area)
+
+    assert names(handler.get_all_instances_of_type(handler.esdl.WindTurbine)) == [
+        'WindTurbine_0', 'WindTurbine_1', 'WindTurbine_new', 'WindTurbine_sub']
+
+def test_removed_instances(handler):
+    area = handler.es.instance[0].area
+    area.asset.remove(handler.get_by_id('wind_0'))
+    area.area.remove(area.area[0])
+
+    assert names(handler.get_all_instances_of_type(handler.esdl.WindTurbine)) == ['WindTurbine_1']
+    assert len(handler.get_all_instances_of_type(handler.esdl.AggregatedBuilding)) == 3
+
+def test_moved_instances(handler):
+    area = handler.es.instance[0].area
+    area.area[1].asset.append(handler.get_by_id('wind_0'))
+
+    assert names(handler.get_all_instances_of_type(handler.esdl.WindTurbine)) == [
+        'WindTurbine_0', 'WindTurbine_1']
+
+def test_instances_after_writing_the_energy_system(handler):
+    handler.get_as_string()
+    handler.es.instance[0].area.asset.append(handler.esdl.WindTurbine(name='WindTurbine_new'))
+
+    assert len(handler.get_all_instances_of_type(handler.esdl.WindTurbine)) == 3
+
+def test_ids_of_loaded_objects(handler):
+    assert handler.get_by_id('wind_0').name == 'WindTurbine_0'
+    assert handler.get_by_id('unknown') is None
+
+def test_ids_of_objects_added_after_loading(handler):
+    add_quantity_and_units(handler)
+    handler.add_kpis()
+    handler.add_kpi(handler.create_kpi(
+        'DoubleKPI', 'kpi_1', 'KPI', handler.get_by_id('energy_GJ_yr')))
+
+    assert handler.get_by_id('kpis') is handler.es.instance[0].area.KPIs
+    assert handler.get_by_id('kpi_1').quantityAndUnit is handler.get_by_id('energy_GJ_yr')
+    assert all(handler.get_by_id(quantity) is not None for quantity in quantities)
+    assert handler.get_by_id('kpi_1') is handler.get_by_id_slow('kpi_1')
+
+def test_ids_of_changed_and_removed_objects(handler):
+    wind_turbine = handler.get_by_id('wind_0')
+    wind_turbine.id = 'wind_renamed'
+    handler.es.instance[0].area.asset.remove(handler.get_by_id('wind_1'))
+
+    assert handler.get_by_id('wind_0') is None
+    assert handler.get_by_id('wind_renamed') is wind_turbine
+    assert handler.get_by_id('wind_1') is None
+
+def linear_scan(area, esdl_type, attribute, value):
+    ''' The assets as they were found before the index, with a scan over the assets of the area '''
+    return [asset for asset in area.asset if isinstance(asset, esdl_type)
+            and str(getattr(asset, attribute)) == value]
+
+def test_assets_of_type_and_attribute_value_of_each_building(handler):
+    for building in handler.get_all_instances_of_type(handler.esdl.AggregatedBuilding):
+        for technology, properties in heating_technologies.items():
+            esdl_type = getattr(handler.esdl, technology)
+            assert handler.get_assets_of_type(building, esdl_type) == [
+                asset for asset in building.asset if isinstance(asset, esdl_type)]
+
+            for prop in properties:
+                if prop['attribute']:
+                    assert handler.get_assets_of_type_and_attribute_value(
+                        building, esdl_type, prop['attribute'], prop['value']
+                    ) == linear_scan(building, esdl_type, prop['attribute'], prop['value'])
+
+def test_assets_of_type_and_attribute_value_after_changes(handler):
+    building = handler.get_by_id('building_1')
+    heat_pump = handler.get_by_id('building_1_heating')
+    assert handler.get_assets_of_type_and_attribute_value(
+        building, handler.esdl.HeatPump, 'source', 'AIR') == [heat_pump]
+
+    heat_pump.source = handler.esdl.SourceTypeEnum.getEEnumLiteral('SUB_SURFACE')
+    gas_heater = handler.esdl.GasHeater(id='building_1_gas_heater')
+    building.asset.append(gas_heater)
+
+    assert not handler.get_assets_of_type_and_attribute_value(
+        building, handler.esdl.HeatPump, 'source', 'AIR')
+    assert handler.get_assets_of_type_and_attribute_value(
+        building, handler.esdl.HeatPump, 'source', 'SUB_SURFACE') == [heat_pump]
+    assert handler.get_assets_of_type(building, handler.esdl.GasHeater) == [gas_heater]
+
+    building.asset.remove(gas_heater)
+    assert not handler.get_assets_of_type(building, handler.esdl.GasHeater)
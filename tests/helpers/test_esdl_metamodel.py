@@ -0,0 +1,29 @@
+''' Tests for the process-wide ESDL metamodel registry '''
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+# pylint: disable=import-error
+from app.helpers.esdl_metamodel import EsdlMetamodel, get_metamodel
+from app.helpers.energy_system_handler import EnergySystemHandler
+
+def test_get_metamodel_is_shared():
+    metamodel = get_metamodel()
+    assert isinstance(metamodel, EsdlMetamodel)
+    assert get_metamodel() is metamodel
+
+def test_get_metamodel_from_multiple_threads():
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        metamodels = list(executor.map(lambda _: get_metamodel(), range(16)))
+
+    assert all(metamodel is metamodels[0] for metamodel in metamodels)
+
+def test_metamodel_is_immutable():
+    with pytest.raises(AttributeError):
+        get_metamodel().package = None
+
+def test_handlers_share_the_metamodel():
+    handler_1 = EnergySystemHandler()
+    handler_2 = EnergySystemHandler()
+
+    assert handler_1.esdl is handler_2.esdl
+    assert handler_1.rset is not handler_2.rset
+    assert handler_1.rset.metamodel_registry[get_metamodel().nsURI] is get_metamodel().package
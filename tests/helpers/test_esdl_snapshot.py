@@ -0,0 +1,82 @@
+''' Tests for the binary snapshot of the esdl.ecore resource '''
+import pickle
+import shutil
+import pytest
+from pyecore.resources import ResourceSet, URI
+# pylint: disable=import-error disable=redefined-outer-name disable=protected-access
+from app.helpers.esdl_snapshot import load_snapshot, snapshot_path, write_snapshot, _flatten
+from app.helpers.esdl_metamodel import load_metamodel
+from app.helpers.energy_system_handler import EnergySystemHandler
+
+@pytest.fixture
+def ecore_path(tmp_path):
+    '''A copy of the ecore resource, so the tests can write snapshots next to it'''
+    path = str(tmp_path / 'esdl.ecore')
+    shutil.copy('tmp/esdl/esdl.ecore', path)
+    return path
+
+def test_snapshot_rebuilds_the_parsed_model(ecore_path):
+    write_snapshot(ecore_path)
+
+    parsed = ResourceSet().get_resource(URI(ecore_path)).contents[0]
+    rebuilt = load_snapshot(ecore_path)
+
+    assert rebuilt is not None
+    assert _flatten(rebuilt) == _flatten(parsed)
+
+def test_without_snapshot(ecore_path):
+    assert load_snapshot(ecore_path) is None
+
+def test_snapshot_of_another_ecore_resource(ecore_path):
+    write_snapshot(ecore_path)
+
+    with open(ecore_path, 'a') as ecore_file:
+        ecore_file.write('\n')
+
+    assert load_snapshot(ecore_path) is None
+
+@pytest.mark.parametrize('contents', [
+    b'not a snapshot',
+    # A pickle of a class that does not exist
+    b'cbuiltins\nNoSuchClass\n.',
+    # A pickle of the wrong type
+    pickle.dumps(['not', 'a', 'snapshot']),
+])
+def test_corrupt_snapshot(ecore_path, contents):
+    with open(snapshot_path(ecore_path), 'wb') as snapshot_file:
+        snapshot_file.write(contents)
+
+    assert load_snapshot(ecore_path) is None
+
+def test_truncated_snapshot(ecore_path):
+    write_snapshot(ecore_path)
+    with open(snapshot_path(ecore_path), 'rb') as snapshot_file:
+        contents = snapshot_file.read()
+    with open(snapshot_path(ecore_path), 'wb') as snapshot_file:
+        snapshot_file.write(contents[:len(contents) // 2])
+
+    assert load_snapshot(ecore_path) is None
+
+def test_metamodel_rewrites_an_unusable_snapshot(ecore_path):
+    with open(snapshot_path(ecore_path), 'wb') as snapshot_file:
+        snapshot_file.write(b'not a snapshot')
+
+    metamodel = load_metamodel(ecore_path)
+
+    assert metamodel.esdl.WindTurbine
+    assert load_snapshot(ecore_path) is not None
+
+def test_metamodel_from_snapshot_loads_esdl(ecore_path):
+    write_snapshot(ecore_path)
+    metamodel = load_metamodel(ecore_path)
+
+    handler = EnergySystemHandler()
+    handler.rset.metamodel_registry[metamodel.nsURI] = metamodel.package
+    handler.esdl = metamodel.esdl
+
+    with open('tests/fixtures/hengelo.esdl') as esdl_file:
+        energy_system = handler.load_from_string(esdl_file.read())
+
+    wind_turbines = handler.get_assets_of_type(energy_system.instance[0].area, metamodel.esdl.WindTurbine)
+    assert len(wind_turbines) == 2
+    assert 'from="2019-01-01T00:00:00' in handler.get_as_string()
@@ -0,0 +1,66 @@
+''' Tests for adding and updating the KPIs of an energy system with one ETEngine query '''
+import pytest
+# pylint: disable=import-error disable=redefined-outer-name
+from app.constants.kpis import gqueries as kpis
+from app.helpers.energy_system_handler import EnergySystemHandler
+from app.interface import add_kpis_to_esdl, update_kpis, start_etm_session
+
+SCENARIO_URL = '{}/scenarios/12345'
+
+def all_gqueries():
+    return [gquery['gquery'] for prop in kpis.values() for gquery in prop['gqueries']]
+
+@pytest.fixture
+def handler():
+    handler = EnergySystemHandler()
+    handler.load('tests/fixtures/hengelo.esdl')
+    return handler
+
+@pytest.fixture
+def etengine(app, requests_mock):
+    ''' Mocks querying the scenario, every gquery has a future value of 2 '''
+    def respond(request, _context):
+        return {'gqueries': {
+            gquery: {'present': 1.0, 'future': 2.0} for gquery in request.json()['gqueries']}}
+
+    requests_mock.get(
+        SCENARIO_URL.format(app.config['ETENGINE']['beta']),
+        json={'id': 12345, 'updated_at': '2021-06-01T12:00:00.000+02:00'})
+    return requests_mock.put(SCENARIO_URL.format(app.config['ETENGINE']['beta']), json=respond)
+
+def test_add_kpis_with_one_query(app, handler, etengine):
+    with app.app_context():
+        add_kpis_to_esdl(handler, 'beta', 12345)
+
+    assert etengine.call_count == 1
+    assert sorted(etengine.last_request.json()['gqueries']) == sorted(set(all_gqueries()))
+
+    assert handler.get_kpi_by_id('total_costs').value == 2.0
+    assert handler.get_kpi_by_id('total_co2_emissions').value == pytest.approx(2e-6)
+    assert len(handler.es.instance[0].area.KPIs.kpi) == len(kpis)
+
+    distribution = handler.get_kpi_by_id('source_of_electricity_production').distribution
+    assert len(distribution.stringItem) == len(kpis['source_of_electricity_production']['gqueries'])
+    assert distribution.stringItem[0].value == 2e6
+
+def test_update_kpis_with_one_query(app, handler, etengine):
+    with app.app_context():
+        add_kpis_to_esdl(handler, 'beta', 12345)
+        handler.get_kpi_by_id('total_costs').value = 0.0
+
+        update_kpis(handler, start_etm_session('beta', 12345))
+
+    assert etengine.call_count == 2
+    assert handler.get_kpi_by_id('total_costs').value == 2.0
+
+    # The distribution is replaced, not appended to
+    distribution = handler.get_kpi_by_id('source_of_electricity_production').distribution
+    assert len(distribution.stringItem) == len(kpis['source_of_electricity_production']['gqueries'])
+
+def test_failing_query(app, handler, requests_mock):
+    requests_mock.put(
+        SCENARIO_URL.format(app.config['ETENGINE']['beta']),
+        json={'errors': ['Unknown gquery']}, status_code=422)
+
+    with app.app_context(), pytest.raises(ValueError):
+        add_kpis_to_esdl(handler, 'beta', 12345)
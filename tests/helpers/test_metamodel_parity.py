@@ -0,0 +1,121 @@
+'''
+Parity tests between the dynamic and the static ESDL metamodel: the same ESDL corpus is loaded in
+both modes and the resulting object graphs are compared
+'''
+from collections import Counter
+from glob import glob
+import re
+import pytest
+# pylint: disable=import-error disable=redefined-outer-name
+from app.helpers.esdl_metamodel import (
+    DYNAMIC, ECORE_RESOURCE, STATIC, get_metamodel, missing_static_classifiers
+)
+from app.helpers.energy_system_handler import EnergySystemHandler
+
+CORPUS = ['tests/fixtures/hengelo.esdl'] + sorted(glob('app/data/input/*.esdl'))
+
+def load(path, mode):
+    ''' Loads the ESDL file at path with the metamodel of the given mode '''
+    handler = EnergySystemHandler(mode=mode)
+    with open(path) as esdl_file:
+        handler.load_from_string(esdl_file.read())
+    return handler
+
+def label(eobject):
+    ''' Identifies an object in the graph by its type and id or name '''
+    if eobject is None:
+        return None
+    return (eobject.eClass.name, getattr(eobject, 'id', None) or getattr(eobject, 'name', None))
+
+def describe(eobject):
+    ''' A comparable description of the object, its set features and its place in the graph '''
+    features = []
+    for feature in eobject.eClass.eAllStructuralFeatures():
+        # the reference back to the container is already part of the description below
+        container_reference = not feature.is_attribute and feature.container
+        if feature.derived or feature.transient or container_reference or not eobject.eIsSet(feature):
+            continue
+        value = eobject.eGet(feature)
+        values = list(value) if feature.many else [value]
+        if feature.is_attribute:
+            values = [str(val) for val in values]
+        else:
+            values = [label(val) for val in values]
+        features.append((feature.name, tuple(values)))
+
+    container = eobject.eContainer()
+    containment = eobject.eContainmentFeature()
+    return (
+        label(eobject),
+        label(container),
+        containment.name if containment else None,
+        tuple(sorted(features))
+    )
+
+def graph(energy_system):
+    ''' All objects in the energy system as a comparable multiset '''
+    return Counter(describe(eobject) for eobject in [energy_system, *energy_system.eAllContents()])
+
+def missing_static_classes(path):
+    ''' The ESDL types used in the file that the generated package does not know about '''
+    with open(path) as esdl_file:
+        types = set(re.findall(r'esdl:(\w+)', esdl_file.read()))
+    return sorted(
+        esdl_type for esdl_type in types
+        if not get_metamodel(STATIC).esdl.getEClassifier(esdl_type))
+
+@pytest.mark.parametrize('path', CORPUS)
+def test_dynamic_and_static_graphs_are_equal(path):
+    # Fails when the generated package is out of date: regenerate it with
+    # "pipenv run generate_esdl_package"
+    assert missing_static_classes(path) == []
+
+    dynamic = load(path, DYNAMIC)
+    static = load(path, STATIC)
+
+    assert graph(dynamic.es) == graph(static.es)
+
+@pytest.mark.parametrize('mode', [DYNAMIC, STATIC])
+def test_profile_element_from(mode):
+    handler = load('tests/fixtures/hengelo.esdl', mode)
+    element = next(
+        eobject for eobject in handler.es.eAllContents()
+        if isinstance(eobject, handler.esdl.ProfileElement))
+
+    assert element.start.year == 2019
+    assert getattr(element, 'from') == element.start
+    assert 'from="2019-01-01T00:00:00' in handler.get_as_string()
+
+def test_static_mode_resolves_classes_from_the_generated_package():
+    # pylint: disable=import-outside-toplevel
+    import app.esdl
+
+    handler = EnergySystemHandler(mode=STATIC)
+    assert handler.esdl is app.esdl
+    assert handler.esdl.WindTurbine is app.esdl.WindTurbine
+
+def test_configured_mode(app, monkeypatch):
+    monkeypatch.setattr('app.helpers.esdl_metamodel.missing_static_classifiers', lambda: ())
+    app.config['ESDL_METAMODEL'] = STATIC
+    with app.app_context():
+        assert EnergySystemHandler().esdl is get_metamodel(STATIC).esdl
+
+def test_generated_package_is_up_to_date():
+    assert missing_static_classifiers() == ()
+
+def test_static_mode_is_rejected_when_the_package_is_out_of_date(app, tmpdir, monkeypatch):
+    with open(ECORE_RESOURCE) as ecore_file:
+        ecore = ecore_file.read()
+    outdated = tmpdir.join('esdl.ecore')
+    new_classifier = '<eClassifiers xsi:type="ecore:EClass" name="NewAsset"/>'
+    outdated.write(ecore.replace('<eClassifiers ', f'{new_classifier}\n  <eClassifiers ', 1))
+
+    assert 'NewAsset' in missing_static_classifiers(str(outdated))
+    assert missing_static_classifiers(str(tmpdir.join('unknown.ecore'))) == ()
+
+    monkeypatch.setattr(
+        'app.helpers.esdl_metamodel.missing_static_classifiers',
+        lambda: missing_static_classifiers(str(outdated)))
+    app.config['ESDL_METAMODEL'] = STATIC
+    with app.app_context(), pytest.raises(ValueError, match='regenerate it'):
+        EnergySystemHandler()
@@ -0,0 +1,72 @@
+''' Tests for updating an energy system to its ETM scenario with one ETEngine query '''
+import pytest
+# pylint: disable=import-error disable=redefined-outer-name
+import app.constants.assets as assets
+from app.constants.kpis import gqueries as kpis
+from app.helpers.energy_system_handler import EnergySystemHandler
+from app.helpers.exceptions import EnergysystemParseError
+from app.helpers.query_planner import KPIS, QueryPlanner
+from app.interface import add_kpis_to_esdl, start_etm_session, update_esdl
+
+SCENARIO_URL = '{}/scenarios/12345'
+WIND_CAPACITY = assets.supply['WindTurbine'][0]['gquery']
+
+def supply_gqueries():
+    return [prop['gquery'] for prop in assets.supply['WindTurbine']]
+
+@pytest.fixture
+def handler():
+    handler = EnergySystemHandler()
+    handler.load('tests/fixtures/hengelo.esdl')
+    return handler
+
+@pytest.fixture
+def etengine(app, requests_mock):
+    '''
+    Mocks querying the scenario, every gquery has a future value of 2, except for the wind
+    capacity (so no measures are added)
+    '''
+    def respond(request, _context):
+        return {'gqueries': {
+            gquery: {'present': 1.0, 'future': 0.0 if gquery == WIND_CAPACITY else 2.0}
+            for gquery in request.json()['gqueries']}}
+
+    requests_mock.get(
+        SCENARIO_URL.format(app.config['ETENGINE']['beta']),
+        json={'id': 12345, 'updated_at': '2021-06-01T12:00:00.000+02:00'})
+    return requests_mock.put(SCENARIO_URL.format(app.config['ETENGINE']['beta']), json=respond)
+
+def test_update_with_one_query(app, handler, etengine):
+    with app.app_context():
+        add_kpis_to_esdl(handler, 'beta', 12345)
+        handler.get_kpi_by_id('total_costs').value = 0.0
+
+        update_esdl(handler, 'beta', 12345)
+
+    # Adding the KPIs and updating the energy system
+    assert etengine.call_count == 2
+    assert set(etengine.last_request.json()['gqueries']) == set(
+        gquery['gquery'] for prop in kpis.values() for gquery in prop['gqueries']
+    ) | set(supply_gqueries())
+
+    assert handler.get_kpi_by_id('total_costs').value == 2.0
+    for wind_turbine in handler.get_all_instances_of_type(handler.esdl.WindTurbine):
+        assert wind_turbine.fullLoadHours == 2
+
+def test_plan_without_kpis(app, handler, etengine):
+    with app.app_context():
+        planner = QueryPlanner(handler, start_etm_session('beta', 12345))()
+
+    assert etengine.call_count == 1
+    assert etengine.last_request.json()['gqueries'] == supply_gqueries()
+    assert planner.results_for(KPIS) == {}
+    assert list(planner.results_for('WindTurbine')) == supply_gqueries()
+
+def test_failing_query(app, handler, requests_mock):
+    requests_mock.get(SCENARIO_URL.format(app.config['ETENGINE']['beta']), json={})
+    requests_mock.put(
+        SCENARIO_URL.format(app.config['ETENGINE']['beta']),
+        json={'errors': ['Unknown gquery']}, status_code=422)
+
+    with app.app_context(), pytest.raises(EnergysystemParseError):
+        update_esdl(handler, 'beta', 12345)
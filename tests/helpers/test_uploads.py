@@ -0,0 +1,27 @@
+''' Tests for files uploaded to the app '''
+import io
+import pytest
+from flask import request
+from werkzeug.datastructures import FileStorage
+# pylint: disable=import-error
+from app.helpers.uploads import upload_title
+
+@pytest.mark.parametrize('size, rolled', [(10, False), (10_000, True)])
+def test_uploads_are_spooled_to_disk_above_the_spool_size(app, size, rolled):
+    app.config['UPLOAD_SPOOL_SIZE'] = 1_000
+
+    with app.test_request_context(method='POST', content_type='multipart/form-data', data={
+            'energy_system_file': (io.BytesIO(b'x' * size), 'hengelo.esdl')}):
+        stream = request.files['energy_system_file'].stream
+
+        assert stream._rolled is rolled # pylint: disable=protected-access
+        assert stream.read() == b'x' * size
+
+@pytest.mark.parametrize('filename, title', [
+    ('hengelo.esdl', 'hengelo.esdl'),
+    ('hengelo.esdl.gz', 'hengelo.esdl'),
+    ('C:\\Users\\me\\hengelo.esdl', 'hengelo.esdl'),
+    ('', None)
+])
+def test_upload_title(filename, title):
+    assert upload_title(FileStorage(io.BytesIO(), filename)) == title
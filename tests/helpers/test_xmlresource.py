@@ -0,0 +1,88 @@
+''' Tests for writing energy systems with the XMLResource '''
+from io import BytesIO
+from glob import glob
+import pytest
+from lxml import etree
+# pylint: disable=import-error disable=redefined-outer-name disable=protected-access
+from pyecore.resources.xmi import XSI, XSI_URL
+from app.helpers.energy_system_handler import EnergySystemHandler
+from app.helpers.StringURI import StringURI
+
+CORPUS = ['tests/fixtures/hengelo.esdl'] + sorted(glob('app/data/input/*.esdl'))
+
+@pytest.fixture
+def handler():
+    handler = EnergySystemHandler()
+    handler.load('tests/fixtures/hengelo.esdl')
+    return handler
+
+def lxml_tree_string(handler, pretty_print=True):
+    ''' The energy system written the way the XMLResource used to: as an lxml tree '''
+    resource = handler.rset.create_resource(StringURI('tmp/tree.esdl'))
+    resource.append(handler.es)
+    resource.options = {}
+    resource.prefixes.clear()
+    resource.reverse_nsmap.clear()
+    resource.register_eobject_epackage(handler.es)
+    tree_root = resource._go_across(handler.es)
+    handler.rset.remove_resource(resource)
+
+    root = etree.Element(tree_root.tag, nsmap={XSI: XSI_URL, **resource.prefixes})
+    root[:] = tree_root[:]
+    root.attrib.update(tree_root.attrib)
+
+    return etree.tostring(
+        etree.ElementTree(root), pretty_print=pretty_print, xml_declaration=True,
+        encoding='UTF-8').decode('UTF-8')
+
+@pytest.mark.parametrize('path', CORPUS)
+def test_same_xml_as_the_lxml_tree(path):
+    handler = EnergySystemHandler()
+    handler.load(path)
+
+    assert handler.get_as_string() == lxml_tree_string(handler)
+
+def test_escaped_values(handler):
+    name = 'Wind & <sun> "quoted"\n\ttabbed\r'
+    handler.get_by_id('wind_0').name = name
+
+    assert handler.get_as_string() == lxml_tree_string(handler)
+
+    reloaded = EnergySystemHandler()
+    reloaded.load_from_string(handler.get_as_string())
+    assert reloaded.get_by_id('wind_0').name == name
+
+def test_without_pretty_print(handler):
+    compact = handler.get_as_string(pretty_print=False)
+
+    assert compact == lxml_tree_string(handler, pretty_print=False)
+    assert compact.count('\n') == 1
+
+def test_write_to_file_and_file_like_objects(handler, tmp_path):
+    path = tmp_path / 'hengelo.esdl'
+    handler.write(str(path))
+
+    stream = BytesIO()
+    handler.write(stream)
+
+    assert path.read_bytes() == stream.getvalue() == handler.get_as_string().encode('UTF-8')
+    assert not stream.closed
+
+def test_write_large_energy_systems_in_chunks(handler):
+    ''' The writer flushes its buffer to the stream every 64 kB '''
+    for index in range(2000):
+        handler.es.instance[0].area.asset.append(
+            handler.esdl.WindTurbine(id=f'extra_{index}', name=f'WindTurbine_{index}'))
+
+    class CountingStream(BytesIO):
+        writes = 0
+
+        def write(self, data):
+            self.writes += 1
+            return super().write(data)
+
+    stream = CountingStream()
+    handler.write(stream)
+
+    assert stream.writes > 1
+    assert stream.getvalue().decode('UTF-8') == lxml_tree_string(handler)
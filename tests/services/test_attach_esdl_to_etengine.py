@@ -1,7 +1,9 @@
 ''' Tests for the subclass of EtengineService, AttachEsdlToEtengine'''
+import gzip
 import pytest
 # pylint: disable=import-error disable=redefined-outer-name
-from app.services.attach_esdl_to_etengine import AttachEsdlToEtengine
+from app.helpers.energy_system_handler import EnergySystemHandler
+from app.services.attach_esdl_to_etengine import AttachEsdlToEtengine, MultipartUpload
 from app.services.etengine_service import EtengineService
 from app.services.service_result import ServiceResult
 from app.helpers.StringURI import StringURI
@@ -44,3 +46,70 @@ def test_call_with_empty_stream(app, empty_esdl_stream, requests_mock):
         response = service(empty_esdl_stream, 'default.esdl')
         assert isinstance(response, ServiceResult)
         assert not response.successful
+
+def uploaded(request):
+    ''' The body of the upload, decompressed when it's gzip encoded '''
+    body = b''.join(request.body)
+    if request.headers.get('Content-Encoding') == 'gzip':
+        body = gzip.decompress(body)
+    return body
+
+def test_streams_multipart_upload(app, esdl_stream, requests_mock):
+    bodies = []
+    requests_mock.put(
+        f'{app.config["ETENGINE"]["beta"]}/scenarios/12345/esdl_file',
+        text=lambda request, _context: bodies.append(uploaded(request)) or ''
+    )
+    with app.app_context():
+        AttachEsdlToEtengine('beta', 12345)(esdl_stream, 'default.esdl')
+
+    request = requests_mock.last_request
+    boundary = request.headers['Content-Type'].split('boundary=')[1]
+    assert int(request.headers['Content-Length']) == len(bodies[0])
+    assert 'Content-Encoding' not in request.headers
+    assert bodies[0].startswith(f'--{boundary}\r\n'.encode())
+    assert b'filename="default.esdl"\r\n' in bodies[0]
+    assert bodies[0].endswith(f'\r\nbla\r\n--{boundary}--\r\n'.encode())
+
+def test_gzip_upload(app, requests_mock):
+    app.config['ETENGINE_GZIP_UPLOADS'] = ('beta',)
+    handler = EnergySystemHandler()
+    handler.load('tests/fixtures/hengelo.esdl')
+    bodies = []
+    requests_mock.put(
+        f'{app.config["ETENGINE"]["beta"]}/scenarios/12345/esdl_file',
+        text=lambda request, _context: bodies.append(uploaded(request)) or ''
+    )
+    with app.app_context():
+        AttachEsdlToEtengine('beta', 12345)(handler, 'hengelo.esdl')
+
+    assert requests_mock.last_request.headers['Content-Encoding'] == 'gzip'
+    assert handler.get_as_string().encode('UTF-8') in bodies[0]
+
+def test_retries_streamed_upload(app, esdl_stream, requests_mock):
+    requests_mock.put(
+        f'{app.config["ETENGINE"]["beta"]}/scenarios/12345/esdl_file',
+        [{'status_code': 503}, {'status_code': 204}]
+    )
+    with app.app_context():
+        response = AttachEsdlToEtengine('beta', 12345)(esdl_stream, 'default.esdl')
+
+    assert response.successful
+    assert requests_mock.call_count == 2
+
+def test_spools_to_disk():
+    with MultipartUpload('large.esdl', lambda output: output.write(b'x' * 2048), spool_size=1024) as body:
+        # pylint: disable=protected-access
+        assert body.spool._rolled
+        assert len(b''.join(body)) == len(body)
+        # It can be read again
+        assert len(b''.join(body)) == len(body)
+
+def test_escapes_the_filename():
+    with MultipartUpload('a "title"\r\nX-Injected: 1.esdl', lambda output: output.write(b'x')) as body:
+        head = b''.join(body).split(b'\r\n\r\n')[0]
+
+    assert head.split(b'\r\n')[1:] == [
+        b'Content-Disposition: form-data; name="file"; '
+        b'filename="a %22title%22%0D%0AX-Injected: 1.esdl"',
+        b'Content-Type: application/octet-stream']
@@ -0,0 +1,81 @@
+''' Tests for the subclass of EtengineService, BootstrapScenario'''
+import pytest
+# pylint: disable=import-error disable=redefined-outer-name
+from app.services.bootstrap_scenario import BootstrapScenario
+from app.services.etengine_service import run_concurrently
+
+USER_VALUES = {'input1': 1.0}
+
+def gquery_results(gqueries):
+    return {gquery: {'present': 1.0, 'future': 2.0} for gquery in gqueries}
+
+def test_create_with_gqueries(app, requests_mock):
+    creation = requests_mock.post(
+        f'{app.config["ETENGINE"]["beta"]}/scenarios',
+        json={'id': 12345, 'gqueries': gquery_results(['gquery1'])}
+    )
+
+    with app.app_context():
+        result = BootstrapScenario('beta')('title', 'nl', 2050, USER_VALUES, ['gquery1'])
+
+    assert result.successful
+    assert result.value['scenario_id'] == 12345
+    assert result.value['gqueries']['gquery1']['future'] == 2.0
+
+    # The sliders are set on creation, and the gqueries are answered as well
+    assert requests_mock.call_count == 1
+    assert creation.last_request.json()['scenario']['user_values'] == USER_VALUES
+
+def test_create_and_query_gqueries(app, requests_mock):
+    requests_mock.post(f'{app.config["ETENGINE"]["beta"]}/scenarios', json={'id': 12345})
+    query = requests_mock.put(
+        f'{app.config["ETENGINE"]["beta"]}/scenarios/12345',
+        json={'gqueries': gquery_results(['gquery1', 'gquery2'])}
+    )
+
+    with app.app_context():
+        result = BootstrapScenario('beta')('title', 'nl', 2050, USER_VALUES, ['gquery1', 'gquery2'])
+
+    assert result.successful
+    assert set(result.value['gqueries']) == {'gquery1', 'gquery2'}
+    assert requests_mock.call_count == 2
+    assert query.last_request.json()['gqueries'] == ['gquery1', 'gquery2']
+
+def test_create_without_gqueries(app, requests_mock):
+    requests_mock.post(f'{app.config["ETENGINE"]["beta"]}/scenarios', json={'id': 12345})
+
+    with app.app_context():
+        result = BootstrapScenario('beta')('title', 'nl', 2050, USER_VALUES)
+
+    assert result.successful
+    assert result.value['gqueries'] == {}
+    assert requests_mock.call_count == 1
+
+@pytest.mark.parametrize('response, errors', [
+    ({'json': {'errors': ['Input input1 does not exist']}}, ['Input input1 does not exist']),
+    ({'text': 'Internal server error'}, ['ETEngine returned a 422'])
+])
+def test_failing_creation(app, requests_mock, response, errors):
+    requests_mock.post(f'{app.config["ETENGINE"]["beta"]}/scenarios', status_code=422, **response)
+
+    with app.app_context():
+        result = BootstrapScenario('beta')('title', 'nl', 2050, USER_VALUES, ['gquery1'])
+
+    assert not result.successful
+    assert result.errors == errors
+
+def test_call_async(app, requests_mock):
+    requests_mock.post(f'{app.config["ETENGINE"]["beta"]}/scenarios', json={'id': 12345})
+    requests_mock.put(
+        f'{app.config["ETENGINE"]["beta"]}/scenarios/12345',
+        json={'gqueries': gquery_results(['gquery1'])}
+    )
+
+    with app.app_context():
+        result, = run_concurrently(
+            BootstrapScenario('beta').call_async('title', 'nl', 2050, USER_VALUES, ['gquery1']))
+
+    assert result.successful
+    assert result.value['scenario_id'] == 12345
+    assert result.value['gqueries']['gquery1']['future'] == 2.0
+    assert requests_mock.call_count == 2
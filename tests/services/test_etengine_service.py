@@ -2,9 +2,14 @@
 Tests for the basic etengine connection
 '''
 
+import time
+from io import BytesIO
 import requests
+import requests_mock
 # pylint: disable=import-error
-from app.services.etengine_service import EtengineService
+from app.services.etengine_service import EtengineService, etengine_client, run_concurrently
+from app.services.attach_esdl_to_etengine import AttachEsdlToEtengine
+from app.services.query_scenario import QueryScenario
 
 def test_environment(app):
     # we need the context to access the config variables
@@ -12,3 +17,50 @@ def test_environment(app):
         service = EtengineService('pro', 12345)
         assert isinstance(service.session, requests.Session)
         assert service.scenario_id == 12345
+
+def test_client_is_shared(app):
+    with app.app_context():
+        assert EtengineService('pro', 1).session is EtengineService('pro', 2).session
+        assert EtengineService('pro').session is not EtengineService('beta').session
+
+def test_client_settings(app):
+    app.config['ETENGINE_POOL_SIZE'] = 3
+    app.config['ETENGINE_TIMEOUT'] = (1, 2)
+
+    with app.app_context():
+        client = etengine_client('beta')
+
+        assert client.get_adapter('https://').poolmanager.connection_pool_kw['maxsize'] == 3
+
+        with requests_mock.Mocker() as mock:
+            mock.put(f'{app.config["ETENGINE"]["beta"]}/scenarios/1', json={'gqueries': {}})
+            QueryScenario('beta', 1)()
+
+            assert mock.last_request.timeout == (1, 2)
+            assert mock.last_request.headers['Connection'] == 'keep-alive'
+
+def test_run_concurrently(app, requests_mock, monkeypatch):
+    requests_mock.put(
+        f'{app.config["ETENGINE"]["beta"]}/scenarios/1',
+        json={'gqueries': {'gquery1': {'future': 1.0, 'present': 0.5}}})
+    requests_mock.put(f'{app.config["ETENGINE"]["beta"]}/scenarios/1/esdl_file', status_code=204)
+
+    with app.app_context():
+        # requests_mock handles one request at a time, so the latency is added before it
+        session = etengine_client('beta')
+        request = session.request
+        def slow_request(*args, **kwargs):
+            time.sleep(0.2)
+            return request(*args, **kwargs)
+        monkeypatch.setattr(session, 'request', slow_request)
+
+        start = time.perf_counter()
+        query, upload = run_concurrently(
+            QueryScenario('beta', 1).call_async('gquery1'),
+            AttachEsdlToEtengine('beta', 1).call_async(BytesIO(b'esdl'), 'test.esdl'))
+
+        assert query.value['gquery1']['future'] == 1.0
+        assert upload.successful
+        assert requests_mock.call_count == 2
+        # The calls overlapped, instead of taking 0.4 seconds in turn
+        assert time.perf_counter() - start < 0.35
@@ -0,0 +1,104 @@
+''' Tests for the gquery cache and CachedQueryScenario '''
+import time
+import pytest
+# pylint: disable=import-error disable=redefined-outer-name
+from app.helpers.ETM_API import ETM_API
+from app.services.gquery_cache import MemoryBackend, gquery_cache
+from app.services.query_scenario import CachedQueryScenario
+
+SCENARIO_URL = '{}/scenarios/12345'
+
+@pytest.fixture
+def etengine(app, requests_mock):
+    ''' Mocks the version and the queries of scenario 12345, every gquery has a future value of 2 '''
+    url = SCENARIO_URL.format(app.config['ETENGINE']['beta'])
+
+    def respond(request, _context):
+        return {'gqueries': {
+            gquery: {'present': 1.0, 'future': 2.0}
+            for gquery in request.json().get('gqueries', [])}}
+
+    version = requests_mock.get(url, json={'id': 12345, 'updated_at': '2021-06-01T12:00:00'})
+    query = requests_mock.put(url, json=respond)
+
+    return version, query
+
+def test_cached_query(app, etengine):
+    _, query = etengine
+
+    with app.app_context():
+        first = CachedQueryScenario('beta', 12345)('gquery1', 'gquery2')
+        second = CachedQueryScenario('beta', 12345)('gquery2', 'gquery1')
+
+        assert query.call_count == 1
+        assert first.value == second.value
+        assert list(second.value) == ['gquery2', 'gquery1']
+        assert gquery_cache().stats() == {'hits': 2, 'misses': 2}
+
+def test_only_missing_gqueries_are_queried(app, etengine):
+    _, query = etengine
+
+    with app.app_context():
+        CachedQueryScenario('beta', 12345)('gquery1')
+        result = CachedQueryScenario('beta', 12345)('gquery1', 'gquery2')
+
+        assert query.call_count == 2
+        assert query.last_request.json()['gqueries'] == ['gquery2']
+        assert set(result.value) == {'gquery1', 'gquery2'}
+
+def test_new_version_of_scenario(app, etengine, requests_mock):
+    _, query = etengine
+
+    with app.app_context():
+        CachedQueryScenario('beta', 12345)('gquery1')
+        requests_mock.get(
+            SCENARIO_URL.format(app.config['ETENGINE']['beta']),
+            json={'id': 12345, 'updated_at': '2021-06-02T12:00:00'})
+        CachedQueryScenario('beta', 12345)('gquery1')
+
+        assert query.call_count == 2
+
+def test_change_inputs_invalidates(app, etengine):
+    _, query = etengine
+
+    with app.app_context():
+        CachedQueryScenario('beta', 12345)('gquery1')
+        ETM_API('beta', 12345).change_inputs({'input1': 1.0})
+        CachedQueryScenario('beta', 12345)('gquery1')
+
+        # Once for the first query, once for the change and once for the query after
+        assert query.call_count == 3
+
+def test_unknown_version(app, etengine, requests_mock):
+    _, query = etengine
+    requests_mock.get(SCENARIO_URL.format(app.config['ETENGINE']['beta']), status_code=500)
+
+    with app.app_context():
+        CachedQueryScenario('beta', 12345)('gquery1')
+        result = CachedQueryScenario('beta', 12345)('gquery1')
+
+        assert query.call_count == 2
+        assert result.value['gquery1']['future'] == 2.0
+
+def test_shared_backend(app, etengine):
+    backend = MemoryBackend()
+    app.config['GQUERY_CACHE_BACKEND'] = backend
+
+    with app.app_context():
+        CachedQueryScenario('beta', 12345)('gquery1')
+
+        assert gquery_cache().backend is backend
+        assert backend.get_many([('beta', '12345', '2021-06-01T12:00:00', 'gquery1')])
+
+def test_memory_backend_is_bounded(monkeypatch):
+    backend = MemoryBackend(size=2, ttl=10)
+    backend.set_many({'a': 1, 'b': 2})
+    backend.get_many(['a'])
+    backend.set_many({'c': 3})
+
+    # b was used least recently
+    assert backend.get_many(['a', 'b', 'c']) == {'a': 1, 'c': 3}
+
+    now = time.monotonic()
+    monkeypatch.setattr('app.services.gquery_cache.time.monotonic', lambda: now + 11)
+    assert backend.get_many(['a', 'c']) == {}
@@ -0,0 +1,162 @@
+'''
+Tests for the jobs running in the background
+'''
+import json
+import subprocess
+import sys
+import threading
+import time
+from unittest import mock
+import pytest
+# pylint: disable=import-error
+from app.helpers.exceptions import EnergysystemParseError
+from app.services.jobs import FAILED, FINISHED, QUEUED, RUNNING, Job, JobQueue, job_queue
+
+def wait_for(job, timeout=5):
+    deadline = time.time() + timeout
+    while not job.done and time.time() < deadline:
+        time.sleep(0.01)
+    return job
+
+def test_runs_job(app):
+    with app.app_context():
+        job = wait_for(job_queue().submit(lambda value: {'value': value}, 1))
+
+        assert job.status == FINISHED
+        assert job_queue().get(job.id).to_dict() == {
+            'job_id': job.id, 'status': FINISHED, 'value': 1}
+
+def test_failed_job(app):
+    def fail():
+        raise EnergysystemParseError('Does not work')
+
+    with app.app_context():
+        job = wait_for(job_queue().submit(fail))
+
+    assert job.status == FAILED
+    assert job.to_dict()['errors'] == ['Does not work']
+
+def test_job_runs_in_app_context(app):
+    def environments():
+        from flask import current_app # pylint: disable=import-outside-toplevel
+        return current_app.config['ETENGINE']
+
+    with app.app_context():
+        job = wait_for(job_queue().submit(environments))
+
+    assert job.result == app.config['ETENGINE']
+
+def test_backpressure(app):
+    app.config['JOBS_WORKERS'] = 1
+    app.config['JOBS_QUEUE_SIZE'] = 1
+    release = threading.Event()
+
+    with app.app_context():
+        running = job_queue().submit(release.wait)
+        queued = job_queue().submit(release.wait)
+
+        with pytest.raises(EnergysystemParseError) as error:
+            job_queue().submit(release.wait)
+
+        release.set()
+        wait_for(running)
+        wait_for(queued)
+
+        # There is room again
+        assert wait_for(job_queue().submit(lambda: None)).status == FINISHED
+
+    assert error.value.status_code == 503
+
+def test_expires_finished_jobs(app):
+    app.config['JOBS_TTL'] = 0
+
+    with app.app_context():
+        job = wait_for(job_queue().submit(lambda: None))
+        job_queue().submit(lambda: None)
+
+        assert job_queue().get(job.id) is None
+
+def test_polls_jobs_of_other_processes(app, tmpdir):
+    app.config['JOBS_DIR'] = str(tmpdir)
+
+    with app.app_context():
+        job = wait_for(job_queue().submit(lambda value: {'value': value}, 1))
+
+        # Another process has a queue of its own, which reads the job from the directory
+        other = JobQueue(1, 1, app.config['JOBS_TTL'], str(tmpdir))
+
+        assert other.get(job.id).to_dict() == {'job_id': job.id, 'status': FINISHED, 'value': 1}
+        assert other.get('0' * 32) is None
+        assert other.get('../secrets') is None
+
+def test_expires_stored_jobs(app, tmpdir):
+    app.config['JOBS_DIR'] = str(tmpdir)
+    app.config['JOBS_TTL'] = 0
+
+    with app.app_context():
+        job = wait_for(job_queue().submit(lambda: None))
+        job_queue().submit(lambda: None)
+
+    assert not tmpdir.join(f'{job.id}.json').exists()
+
+def store(directory, **job):
+    ''' Stores a job of another process in the directory, returns its id '''
+    stored = Job(**job)
+    with open(directory.join(f'{stored.id}.json'), 'w') as job_file:
+        json.dump(stored.to_file(), job_file)
+    return stored.id
+
+def test_jobs_of_a_stopped_process_fail(app, tmpdir):
+    process = subprocess.run([sys.executable, '-c', 'import os; print(os.getpid())'],
+                             capture_output=True, check=True, text=True)
+    job_id = store(tmpdir, status=RUNNING, pid=int(process.stdout))
+
+    with app.app_context():
+        job = JobQueue(1, 1, 60, str(tmpdir)).get(job_id)
+
+        assert job.status == FAILED
+        assert job.errors == ['The job stopped unexpectedly']
+        # Stored as failed, so it expires like any other job
+        assert JobQueue(1, 1, 60, str(tmpdir)).get(job_id).finished_at == job.finished_at
+
+def test_jobs_with_missed_heartbeats_fail(app, tmpdir):
+    alive = store(tmpdir, status=RUNNING, host='other', heartbeat=time.time())
+    missed = store(tmpdir, status=QUEUED, host='other', heartbeat=time.time() - 31)
+
+    with app.app_context():
+        queue = JobQueue(1, 1, 60, str(tmpdir), heartbeat=10)
+
+        assert queue.get(alive).status == RUNNING
+        assert queue.get(missed).status == FAILED
+
+def test_heartbeat(app, tmpdir):
+    app.config['JOBS_DIR'] = str(tmpdir)
+    app.config['JOBS_HEARTBEAT'] = 0.05
+    release = threading.Event()
+
+    with app.app_context():
+        job = job_queue().submit(release.wait)
+        started = job.heartbeat
+        time.sleep(0.2)
+
+        with open(tmpdir.join(f'{job.id}.json')) as job_file:
+            assert json.load(job_file)['heartbeat'] > started
+
+        release.set()
+        wait_for(job)
+
+def test_refused_submission_frees_its_slot(app, monkeypatch):
+    app.config['JOBS_WORKERS'] = 1
+    app.config['JOBS_QUEUE_SIZE'] = 0
+
+    with app.app_context():
+        queue = job_queue()
+        submit = queue.executor.submit
+        monkeypatch.setattr(queue.executor, 'submit', mock.Mock(side_effect=RuntimeError))
+
+        with pytest.raises(RuntimeError):
+            queue.submit(lambda: None)
+        assert not queue.jobs
+
+        monkeypatch.setattr(queue.executor, 'submit', submit)
+        assert wait_for(queue.submit(lambda: None)).status == FINISHED
@@ -0,0 +1,40 @@
+''' Tests for the process pool of the bulk conversions'''
+import os
+import time
+# pylint: disable=import-error
+from app.services.process_pool import pool_size, process_pool, run_in_processes
+
+def convert(name):
+    ''' Converts the item in a process of the pool, the item named crash stops its process '''
+    if name == 'crash':
+        # Gives the other items the time to start
+        time.sleep(0.5)
+        os._exit(1) # pylint: disable=protected-access
+
+    return name.upper()
+
+def test_run_in_processes(app):
+    app.config['BULK_PROCESSES'] = 2
+
+    with app.app_context():
+        assert run_in_processes(convert, [('a',), ('b',), ('c',)]) == ['A', 'B', 'C']
+
+def test_crashed_item_does_not_affect_the_others(app):
+    app.config['BULK_PROCESSES'] = 2
+
+    with app.app_context():
+        pool = process_pool()
+        results = run_in_processes(convert, [('a',), ('crash',), ('b',), ('c',)])
+
+        assert results == ['A', {'errors': ['The conversion stopped unexpectedly']}, 'B', 'C']
+        # The crashed pool is replaced
+        assert process_pool() is not pool
+        assert run_in_processes(convert, [('d',)]) == ['D']
+
+def test_pool_size(app, monkeypatch):
+    monkeypatch.setattr(os, 'cpu_count', lambda: 8)
+
+    assert pool_size({'BULK_PROCESSES': 3, 'SERVER_WORKERS': 4}) == 3
+    # The cores of the host are divided among the server workers
+    assert pool_size({'BULK_PROCESSES': None, 'SERVER_WORKERS': 4}) == 2
+    assert pool_size({'BULK_PROCESSES': None, 'SERVER_WORKERS': 16}) == 1
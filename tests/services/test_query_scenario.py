@@ -2,7 +2,7 @@
 import pytest
 # pylint: disable=import-error disable=redefined-outer-name
 from app.services.query_scenario import QueryScenario
-from app.services.etengine_service import EtengineService
+from app.services.etengine_service import EtengineService, run_concurrently
 from app.services.service_result import ServiceResult
 
 def test_instance(app):
@@ -74,3 +74,25 @@ def test_call_with_etengine_failing(app, requests_mock):
         result = service('gquery1')
         assert not result.successful
         assert 'ETEngine returned a 500' in  result.errors
+
+def test_call_async(app, requests_mock):
+    requests_mock.put(
+        f'{app.config["ETENGINE"]["beta"]}/scenarios/12345',
+        json={'gqueries': {'gquery1': {'future': 1, 'present': 0.5}}},
+        status_code=200
+    )
+    requests_mock.put(
+        f'{app.config["ETENGINE"]["beta"]}/scenarios/54321',
+        json={'errors': ['Scenario not found']},
+        status_code=404
+    )
+
+    with app.app_context():
+        found, not_found = run_concurrently(
+            QueryScenario('beta', 12345).call_async('gquery1'),
+            QueryScenario('beta', 54321).call_async('gquery1'))
+
+        assert found.successful
+        assert found.value['gquery1']['future'] == 1
+        assert not not_found.successful
+        assert 'Scenario not found' in not_found.errors
@@ -0,0 +1,184 @@
+'''
+Tests for the timeouts, retries and circuit breaker of the upstream clients
+'''
+import pytest
+import requests
+# pylint: disable=import-error disable=redefined-outer-name
+from app.helpers.exceptions import EnergysystemParseError
+from app.services.etengine_service import etengine_client
+from app.services.query_scenario import QueryScenario
+from app.services.resilience import CircuitBreaker
+
+@pytest.fixture
+def scenario_url(app):
+    return f'{app.config["ETENGINE"]["beta"]}/scenarios/1'
+
+def gqueries():
+    return {'json': {'gqueries': {'gquery1': {'future': 1.0}}}}
+
+def test_endpoint_timeouts(app, requests_mock, scenario_url):
+    app.config['ETENGINE_TIMEOUTS'] = {'scenario': (1, 2)}
+    requests_mock.get(scenario_url, json={})
+
+    with app.app_context():
+        etengine_client('beta').get('/scenarios/1')
+        assert requests_mock.last_request.timeout == (1, 2)
+
+        etengine_client('beta').get('/scenarios/1', timeout=3)
+        assert requests_mock.last_request.timeout == 3
+
+def test_retries_idempotent_requests(app, requests_mock, scenario_url):
+    requests_mock.put(scenario_url, [{'status_code': 503}, {'status_code': 502}, gqueries()])
+
+    with app.app_context():
+        result = QueryScenario('beta', 1)('gquery1')
+
+    assert result.successful
+    assert requests_mock.call_count == 3
+
+def test_retries_are_bounded(app, requests_mock, scenario_url):
+    app.config['ETENGINE_RETRIES'] = 1
+    requests_mock.put(scenario_url, status_code=503)
+
+    with app.app_context():
+        result = QueryScenario('beta', 1)('gquery1')
+
+    assert not result.successful
+    assert requests_mock.call_count == 2
+
+def test_does_not_retry_posts(app, requests_mock):
+    requests_mock.post(f'{app.config["ETENGINE"]["beta"]}/scenarios', status_code=503)
+
+    with app.app_context():
+        assert etengine_client('beta').post('/scenarios', json={}).status_code == 503
+
+    assert requests_mock.call_count == 1
+
+def test_unreachable(app, requests_mock, scenario_url):
+    requests_mock.put(scenario_url, exc=requests.ConnectionError)
+
+    with app.app_context(), pytest.raises(EnergysystemParseError) as error:
+        QueryScenario('beta', 1)('gquery1')
+
+    assert error.value.status_code == 503
+    assert requests_mock.call_count == app.config['ETENGINE_RETRIES'] + 1
+
+def test_timed_out(app, requests_mock, scenario_url):
+    app.config['ETENGINE_RETRIES'] = 0
+    requests_mock.put(scenario_url, exc=requests.ReadTimeout)
+
+    with app.app_context(), pytest.raises(EnergysystemParseError) as error:
+        QueryScenario('beta', 1)('gquery1')
+
+    assert error.value.status_code == 504
+
+def test_circuit_breaker_fails_fast(app, requests_mock, scenario_url):
+    app.config['ETENGINE_RETRIES'] = 0
+    app.config['ETENGINE_BREAKER_FAILURES'] = 2
+    requests_mock.put(scenario_url, status_code=503)
+
+    with app.app_context():
+        QueryScenario('beta', 1)('gquery1')
+        QueryScenario('beta', 1)('gquery1')
+
+        with pytest.raises(EnergysystemParseError) as error:
+            QueryScenario('beta', 1)('gquery1')
+
+        # The other environment is not affected
+        requests_mock.put(f'{app.config["ETENGINE"]["pro"]}/scenarios/1', **gqueries())
+        assert QueryScenario('pro', 1)('gquery1').successful
+
+    assert error.value.status_code == 503
+    assert requests_mock.call_count == 3
+
+def test_circuit_breaker_resets(monkeypatch):
+    now = [100.]
+    monkeypatch.setattr('app.services.resilience.time.monotonic', lambda: now[0])
+    breaker = CircuitBreaker(failures=1, reset_after=30)
+
+    breaker.failed()
+    assert not breaker.allow()
+
+    # One trial request after the reset time
+    now[0] += 30
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.succeeded()
+    assert breaker.allow()
+    assert not breaker.is_open
+
+def test_circuit_breaker_reopens(monkeypatch):
+    now = [100.]
+    monkeypatch.setattr('app.services.resilience.time.monotonic', lambda: now[0])
+    breaker = CircuitBreaker(failures=3, reset_after=30)
+
+    for _ in range(3):
+        breaker.failed()
+
+    now[0] += 30
+    assert breaker.allow()
+    breaker.failed()
+
+    assert not breaker.allow()
+
+def test_unreadable_response(app, requests_mock, scenario_url):
+    requests_mock.get(scenario_url, exc=requests.exceptions.ChunkedEncodingError)
+
+    with app.app_context(), pytest.raises(EnergysystemParseError) as error:
+        etengine_client('beta').get('/scenarios/1')
+
+    assert error.value.status_code == 502
+    # Only errors that mean ETEngine is unavailable are retried
+    assert requests_mock.call_count == 1
+
+def test_circuit_breaker_release(monkeypatch):
+    now = [100.]
+    monkeypatch.setattr('app.services.resilience.time.monotonic', lambda: now[0])
+    breaker = CircuitBreaker(failures=1, reset_after=30)
+
+    breaker.failed()
+    now[0] += 30
+    assert breaker.allow()
+
+    # The trial ends without an outcome: the breaker stays open, and allows another trial
+    breaker.release()
+    assert breaker.is_open
+    assert breaker.allow()
+
+def test_other_errors_are_not_failures_of_the_upstream(app, requests_mock, scenario_url):
+    app.config['ETENGINE_BREAKER_FAILURES'] = 1
+    requests_mock.get(scenario_url, exc=KeyError)
+
+    with app.app_context():
+        session = etengine_client('beta')
+        with pytest.raises(KeyError):
+            session.get('/scenarios/1')
+
+        assert not session.breaker.is_open
+
+def test_circuit_breaker_recovers_from_other_errors_of_a_trial(
+        app, requests_mock, scenario_url, monkeypatch):
+    now = [100.]
+    monkeypatch.setattr('app.services.resilience.time.monotonic', lambda: now[0])
+    app.config['ETENGINE_RETRIES'] = 0
+    app.config['ETENGINE_BREAKER_FAILURES'] = 1
+    app.config['ETENGINE_BREAKER_RESET'] = 30
+
+    with app.app_context():
+        session = etengine_client('beta')
+
+        requests_mock.get(scenario_url, exc=requests.ConnectionError)
+        with pytest.raises(EnergysystemParseError):
+            session.get('/scenarios/1')
+
+        # The trial request fails with an error that is not a failure of ETEngine: another trial
+        # is allowed right away
+        now[0] += 30
+        requests_mock.get(scenario_url, exc=KeyError)
+        with pytest.raises(KeyError):
+            session.get('/scenarios/1')
+
+        requests_mock.get(scenario_url, json={'id': 1})
+        assert session.get('/scenarios/1').json() == {'id': 1}
+        assert not session.breaker.is_open
@@ -0,0 +1,128 @@
+''' End-to-end tests of the app against the local ETEngine and EDR stand-in (lib/stand_in) '''
+import gzip
+import io
+import zipfile
+from urllib.parse import quote
+import pytest
+# pylint: disable=import-error disable=redefined-outer-name
+from app.helpers.edr import EnergyDataRepository
+from lib.stand_in.server import Schedule, StandIn
+
+@pytest.fixture
+def stand_in(app):
+    server = StandIn().start()
+    app.config['ETENGINE'] = {'beta': f'{server.url}/api/v3'}
+    app.config['EDR_URL'] = f'{server.url}/store'
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def create_scenario(client):
+    with open('app/data/input/S1b_B_BodemWP_Hengelo.esdl') as esdl_file:
+        return client.post('/api/v1/create_scenario/', data={
+            'energy_system': quote(esdl_file.read()),
+            'environment': 'beta'
+        })
+
+def test_create_and_export(client, stand_in):
+    response = create_scenario(client)
+    scenario_id = response.json['scenario_id']
+
+    assert response.status_code == 200
+    assert stand_in.requests == {'create': 1, 'query': 1, 'upload': 1}
+    assert stand_in.scenarios[scenario_id]['user_values']
+
+    response = client.post('/api/v1/export_esdl/', data={
+        'environment': 'beta',
+        'session_id': scenario_id
+    })
+
+    assert response.status_code == 200
+    assert 'total_costs' in response.json['energy_system']
+    # Downloading the ESDL, its version for the cache and one query
+    assert stand_in.requests == {
+        'create': 1, 'query': 2, 'upload': 1, 'download': 1, 'scenario': 1}
+
+@pytest.mark.parametrize('encoding', ['identity', 'gzip'])
+def test_export_streamed_xml(client, stand_in, encoding):
+    scenario_id = create_scenario(client).json['scenario_id']
+
+    response = client.post('/api/v1/export_esdl/', data={
+        'environment': 'beta',
+        'session_id': scenario_id,
+        'format': 'xml'
+    }, headers={'Accept-Encoding': encoding})
+
+    assert response.status_code == 200
+    assert response.mimetype == 'application/xml'
+    assert response.is_streamed
+
+    content = response.get_data()
+    if encoding == 'gzip':
+        assert response.headers['Content-Encoding'] == 'gzip'
+        content = gzip.decompress(content)
+    else:
+        assert 'Content-Encoding' not in response.headers
+
+    assert content.startswith(b"<?xml version='1.0' encoding='UTF-8'?>")
+    assert b'total_costs' in content
+
+def test_create_with_gzip_upload(app, client, stand_in):
+    app.config['ETENGINE_GZIP_UPLOADS'] = ('beta',)
+    response = create_scenario(client)
+
+    assert response.status_code == 200
+    filename, content = stand_in.scenarios[response.json['scenario_id']]['esdl_file']
+    assert filename == 'original.esdl'
+    assert 'total_costs' in content
+
+def test_injected_errors(client, stand_in):
+    stand_in.schedule = Schedule.parse(errors=['upload=1:413'])
+
+    response = create_scenario(client)
+
+    assert response.status_code == 422
+    assert response.json['message'] == 'File is too large'
+
+def test_edr(app, stand_in):
+    with app.app_context():
+        asset = EnergyDataRepository().get_asset('b68cb054-44ee-46cb-a32b-ef1b7830f0e1')
+
+    assert asset.power == 3e6
+    assert stand_in.requests['edr'] == 1
+
+def test_edr_revalidates(app, stand_in):
+    app.config['EDR_CACHE_MAX_AGE'] = 0
+
+    with app.app_context():
+        first = EnergyDataRepository().get_asset('b68cb054-44ee-46cb-a32b-ef1b7830f0e1')
+        second = EnergyDataRepository().get_asset('b68cb054-44ee-46cb-a32b-ef1b7830f0e1')
+
+    # The stand-in answered the second request with a 304, so the parsed asset is reused
+    assert second is first
+    assert stand_in.requests['edr'] == 2
+
+def test_create_scenarios(app, client, stand_in):
+    app.config['BULK_PROCESSES'] = 2
+    with open('app/data/input/S1b_B_BodemWP_Hengelo.esdl', 'rb') as esdl_file:
+        esdl = esdl_file.read()
+
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, 'w') as zipped:
+        zipped.writestr('region/hengelo.esdl', esdl)
+        zipped.writestr('region/readme.txt', 'Not an energy system')
+
+    response = client.post('/api/v1/create_scenarios/', data={
+        'environment': 'beta',
+        'energy_system': [quote(esdl), 'not ESDL'],
+        'archive': (io.BytesIO(archive.getvalue()), 'region.zip')
+    })
+    scenarios = response.json['scenarios']
+
+    assert response.status_code == 200
+    assert [scenario['energy_system_title'] for scenario in scenarios] == [
+        'energy_system_1.esdl', 'energy_system_2.esdl', 'hengelo.esdl']
+    # The energy system that could not be read does not affect the others
+    assert scenarios[1]['errors'][0].startswith('could not load ESDL')
+    assert {scenarios[0]['scenario_id'], scenarios[2]['scenario_id']} == set(stand_in.scenarios)
+    assert stand_in.scenarios[scenarios[2]['scenario_id']]['esdl_file'][0] == 'hengelo.esdl'
@@ -0,0 +1,30 @@
+''' Tests that the startup of the app does not load more than it needs '''
+import subprocess
+import sys
+
+def imported_after(code):
+    '''Runs the code in a fresh process, returns the names of all modules imported by then'''
+    result = subprocess.run(
+        [sys.executable, '-c', f'import sys\n{code}\nprint(" ".join(sys.modules))'],
+        capture_output=True, check=True, text=True)
+    return result.stdout.split()
+
+def test_create_app_does_not_load_the_generated_esdl_package():
+    modules = imported_after('from app import create_app\ncreate_app(testing=True)')
+
+    assert 'app.esdl.esdl' not in modules
+    assert 'app.esdl._package' not in modules
+
+def test_generated_esdl_package_is_loaded_on_first_use():
+    assert 'app.esdl.esdl' not in imported_after('import app.esdl')
+    assert 'app.esdl.esdl' in imported_after('import app.esdl\napp.esdl.WindTurbine')
+
+def test_generated_esdl_package_classifiers():
+    # pylint: disable=import-outside-toplevel
+    import app.esdl
+    from app.esdl import WindTurbine
+
+    assert WindTurbine is app.esdl.esdl.WindTurbine
+    assert app.esdl.getEClassifier('WindTurbine') is WindTurbine
+    assert app.esdl.eClass.nsURI == app.esdl.nsURI
+    assert 'WindTurbine' in dir(app.esdl)
@@ -0,0 +1,43 @@
+''' Tests for the production entry point and the settings of gunicorn '''
+import json
+import os
+import subprocess
+import sys
+
+def run(code, environment='test'):
+    '''Runs the code in a fresh process (FLASK_ENV=environment), returns what it printed'''
+    result = subprocess.run(
+        [sys.executable, '-c', code], capture_output=True, check=True, text=True,
+        env=dict(os.environ, FLASK_ENV=environment))
+    return result.stdout.strip().splitlines()[-1]
+
+def test_preloads_the_metamodel_and_the_constants():
+    loaded = json.loads(run(
+        'import gc, json, sys\n'
+        'import wsgi\n'
+        'from app.helpers.esdl_metamodel import _metamodels\n'
+        'print(json.dumps({"metamodels": list(_metamodels), "frozen": gc.get_freeze_count(),\n'
+        '    "kpis": "app.constants.kpis" in sys.modules}))'))
+
+    assert loaded['metamodels'] == ['dynamic']
+    assert loaded['kpis']
+    assert loaded['frozen'] > 0
+
+def test_gunicorn_settings_per_environment():
+    code = (
+        'import runpy\n'
+        'settings = runpy.run_path("gunicorn.conf.py")\n'
+        'print(settings["workers"], settings["threads"], settings["preload_app"])')
+
+    assert run(code, 'production') == '4 4 True'
+    assert run(code, 'staging') == '2 4 True'
+
+def test_gunicorn_graceful_timeout():
+    code = (
+        'import runpy\n'
+        'settings = runpy.run_path("gunicorn.conf.py")\n'
+        'print(settings["timeout"], settings["graceful_timeout"])')
+
+    # Creating the scenario, querying it and uploading the ESDL, each tried three times for up to
+    # 5 + 120 seconds, with up to 2 seconds of backoff between the tries
+    assert run(code, 'production') == '30 1137'
@@ -0,0 +1,35 @@
+'''
+Entry point of the production server: gunicorn --config gunicorn.conf.py (or pipenv run serve).
+
+The app is created and preloaded once, in the master process of gunicorn, before it forks its
+workers. The workers share the pages of everything loaded by then (copy-on-write), instead of each
+loading their own copy on their first request.
+'''
+
+import gc
+import importlib
+import pkgutil
+
+from app import constants, create_app
+from app.helpers.esdl_metamodel import get_metamodel
+
+
+def preload(flask_app):
+    '''
+    Loads what every request needs: the configured ESDL metamodel (the generated app/esdl package
+    in static mode) and the constants
+    '''
+    with flask_app.app_context():
+        get_metamodel()
+
+    for module in pkgutil.iter_modules(constants.__path__):
+        importlib.import_module(f'{constants.__name__}.{module.name}')
+
+    # Move everything loaded so far out of reach of the garbage collector, so it does not write
+    # to (and thereby copy) the shared pages when a worker collects
+    gc.collect()
+    gc.freeze()
+
+
+app = create_app()
+preload(app)